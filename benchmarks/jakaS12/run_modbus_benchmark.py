@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""Compare the synchronous `ModbusTCP` sucker client with the pooled `AsyncModbusTCP` client.
+
+Both clients talk to a local pymodbus server (`tests.fixtures.modbus_simulator`),
+so no hardware is required. For each client the script reports the latency of
+a coil read as seen by the control loop, the read throughput, and how many
+requests actually reached the server. Run it from the repository root:
+
+    python benchmarks/jakaS12/run_modbus_benchmark.py --reads 2000 --cache-ttl-s 0.02
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from lerobot.robots.jakaS12 import AsyncModbusTCP, ModbusTCP
+from tests.fixtures.modbus_simulator import ModbusSimulator
+
+COIL_ADDRESS = 8
+
+
+def measure_reads(client, reads: int, period_s: float) -> np.ndarray:
+    latencies = np.empty(reads)
+    for i in range(reads):
+        start = time.perf_counter()
+        client.read(COIL_ADDRESS)
+        latencies[i] = time.perf_counter() - start
+        # Emulate a control loop that does other work between ticks
+        if period_s > 0:
+            time.sleep(period_s)
+    return latencies * 1e3
+
+
+def report(name: str, latencies_ms: np.ndarray, requests: int):
+    print(
+        f"{name:<26} mean {latencies_ms.mean():7.3f} ms | "
+        f"p50 {np.percentile(latencies_ms, 50):7.3f} ms | "
+        f"p99 {np.percentile(latencies_ms, 99):7.3f} ms | "
+        f"{1e3 / latencies_ms.mean():9.0f} reads/s | "
+        f"{requests:6d} server requests"
+    )
+
+
+def main(reads: int, cache_ttl_s: float, pool_size: int, period_ms: float):
+    period_s = period_ms / 1e3
+    with ModbusSimulator() as simulator:
+        sync_client = ModbusTCP(ip=simulator.host, port=simulator.port)
+        sync_client.connect()
+        requests = simulator.requests
+        latencies = measure_reads(sync_client, reads, period_s)
+        report("ModbusTCP", latencies, simulator.requests - requests)
+        sync_client.disconnect()
+
+        for ttl in (0.0, cache_ttl_s):
+            async_client = AsyncModbusTCP(
+                ip=simulator.host,
+                port=simulator.port,
+                coils_address=COIL_ADDRESS,
+                pool_size=pool_size,
+                cache_ttl_s=ttl,
+            )
+            async_client.connect()
+            requests = simulator.requests
+            latencies = measure_reads(async_client, reads, period_s)
+            report(f"AsyncModbusTCP ttl={ttl * 1e3:g}ms", latencies, simulator.requests - requests)
+            async_client.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reads", type=int, default=2000, help="Number of coil reads per client.")
+    parser.add_argument(
+        "--cache-ttl-s", type=float, default=0.02, help="Coil cache TTL of the cached AsyncModbusTCP run."
+    )
+    parser.add_argument("--pool-size", type=int, default=2, help="Connections in the AsyncModbusTCP pool.")
+    parser.add_argument(
+        "--period-ms", type=float, default=0.0, help="Sleep between reads to emulate a control loop period."
+    )
+    args = parser.parse_args()
+    main(**vars(args))
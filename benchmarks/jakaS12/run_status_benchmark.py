@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""Compare the per-tick state read latency of JakaS12 with and without the batched status read.
+
+The legacy path needs three SDK round trips per tick (`get_joint_position`,
+`get_tcp_position` and `get_robot_status` for the end-effector torque), the
+batched path takes everything from one `get_robot_status` payload through
+`JakaS12StatusReader`. The robot is replaced by `FakeRC`, a `jkrc.RC` stand-in
+that sleeps for a configurable round trip time, so no hardware is needed.
+
+    python benchmarks/jakaS12/run_status_benchmark.py --round-trip-ms 2 --ticks 500
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from lerobot.robots.jakaS12.robot_status import (
+    STATUS_CART_POSITION_INDEX,
+    STATUS_JOINT_POSITION_INDEX,
+    STATUS_TORQUE_SENSOR_INDEX,
+    TORQUE_SENSOR_ACTUAL_FORCE_INDEX,
+    JakaS12StatusReader,
+)
+
+
+class FakeRC:
+    """Minimal `jkrc.RC` stand-in whose every call costs one simulated round trip."""
+
+    def __init__(self, round_trip_s: float):
+        self._round_trip_s = round_trip_s
+        self._joint_position = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6)
+        self._cart_position = (400.0, 10.0, 300.0, 3.14, 0.0, 1.57)
+        self._force = (1.0, 2.0, 3.0, 0.1, 0.2, 0.3)
+
+    def _round_trip(self):
+        deadline = time.perf_counter() + self._round_trip_s
+        while time.perf_counter() < deadline:
+            pass
+
+    def get_joint_position(self):
+        self._round_trip()
+        return (0, self._joint_position)
+
+    def get_tcp_position(self):
+        self._round_trip()
+        return (0, self._cart_position)
+
+    def get_robot_status(self):
+        self._round_trip()
+        torque_sensor = [None] * (TORQUE_SENSOR_ACTUAL_FORCE_INDEX + 2)
+        torque_sensor[TORQUE_SENSOR_ACTUAL_FORCE_INDEX] = list(self._force)
+        status = [0] * 25
+        status[STATUS_CART_POSITION_INDEX] = list(self._cart_position)
+        status[STATUS_JOINT_POSITION_INDEX] = list(self._joint_position)
+        status[STATUS_TORQUE_SENSOR_INDEX] = torque_sensor
+        return (0, tuple(status))
+
+
+def three_call_tick(robot: FakeRC):
+    joint_position = robot.get_joint_position()[1]
+    cart_position = robot.get_tcp_position()[1]
+    robot_status = robot.get_robot_status()[1]
+    EE_torque = robot_status[STATUS_TORQUE_SENSOR_INDEX][TORQUE_SENSOR_ACTUAL_FORCE_INDEX]
+    return tuple(joint_position), tuple(cart_position), tuple(EE_torque)
+
+
+def batched_tick(reader: JakaS12StatusReader):
+    status = reader.refresh()
+    return status.joint_position, status.cart_position, status.EE_torque
+
+
+def measure(fn, ticks: int) -> np.ndarray:
+    latencies = np.empty(ticks)
+    for i in range(ticks):
+        start = time.perf_counter()
+        fn()
+        latencies[i] = time.perf_counter() - start
+    return latencies * 1e3
+
+
+def report(name: str, latencies_ms: np.ndarray):
+    print(
+        f"{name:<12} mean {latencies_ms.mean():7.3f} ms | "
+        f"p50 {np.percentile(latencies_ms, 50):7.3f} ms | "
+        f"p95 {np.percentile(latencies_ms, 95):7.3f} ms | "
+        f"max loop rate {1e3 / latencies_ms.mean():8.1f} Hz"
+    )
+
+
+def main(round_trip_ms: float, ticks: int):
+    robot = FakeRC(round_trip_ms / 1e3)
+    reader = JakaS12StatusReader(robot)
+
+    # Both paths must decode the same state
+    assert three_call_tick(robot) == batched_tick(reader)
+
+    report("three-call", measure(lambda: three_call_tick(robot), ticks))
+    report("batched", measure(lambda: batched_tick(reader), ticks))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--round-trip-ms",
+        type=float,
+        default=2.0,
+        help="Simulated SDK round trip time of a single call.",
+    )
+    parser.add_argument("--ticks", type=int, default=500, help="Number of control ticks to time.")
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""Measure the per-step latency of the gym_manipulator environment processor.
+
+The pipeline is built by `gym_manipulator.make_processors` for a robot with three
+cameras, with image cropping and resizing enabled. It is timed twice on the same
+observations: with a per-image crop and resize (the previous implementation of
+`ImageCropResizeProcessorStep`), then with the batched step.
+
+Run it from the repository root:
+
+    python benchmarks/processor/run_image_crop_resize_benchmark.py --steps 500 --device cpu
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import numpy as np
+import torch
+import torchvision.transforms.functional as F  # noqa: N812
+
+from lerobot.envs.configs import HILSerlProcessorConfig, HILSerlRobotEnvConfig, ImagePreprocessingConfig
+from lerobot.processor import ImageCropResizeProcessorStep
+from lerobot.processor.converters import create_transition
+from lerobot.rl.gym_manipulator import make_processors
+from lerobot.utils.constants import OBS_IMAGES
+
+CAMERAS = ("front", "side", "wrist")
+MOTORS = ("joint_1", "joint_2", "joint_3", "joint_4", "joint_5", "joint_6", "gripper")
+
+
+@dataclass
+class PerImageCropResizeProcessorStep(ImageCropResizeProcessorStep):
+    """Crops and resizes the images one by one, with fresh allocations."""
+
+    def observation(self, observation: dict) -> dict:
+        new_observation = dict(observation)
+        for key in observation:
+            if "image" not in key:
+                continue
+            image = observation[key]
+            device = image.device
+            if self.device is not None:
+                image = image.to(self.device)
+            if self.crop_params_dict is not None and key in self.crop_params_dict:
+                image = F.crop(image, *self.crop_params_dict[key])
+            image = F.resize(image, self.resize_size).clamp(0.0, 1.0)
+            new_observation[key] = image if self.device is not None else image.to(device)
+        return new_observation
+
+
+def make_observations(count: int, height: int, width: int) -> list[dict]:
+    return [
+        {
+            "pixels": {
+                camera: np.random.randint(0, 256, size=(height, width, 3), dtype=np.uint8)
+                for camera in CAMERAS
+            },
+            "agent_pos": np.random.randn(len(MOTORS)).astype(np.float32),
+        }
+        for _ in range(count)
+    ]
+
+
+def synchronize(device: str):
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def bench(env_processor, observations: list[dict], device: str) -> np.ndarray:
+    latencies = np.empty(len(observations))
+    for _ in range(10):
+        env_processor(create_transition(observation=observations[0]))
+    for i, observation in enumerate(observations):
+        start = time.perf_counter()
+        env_processor(create_transition(observation=observation))
+        synchronize(device)
+        latencies[i] = time.perf_counter() - start
+    return latencies * 1e3
+
+
+def report(name: str, latencies_ms: np.ndarray):
+    print(
+        f"{name:<24} mean {latencies_ms.mean():7.3f} ms | "
+        f"p50 {np.percentile(latencies_ms, 50):7.3f} ms | p99 {np.percentile(latencies_ms, 99):7.3f} ms"
+    )
+
+
+def main(steps: int, height: int, width: int, resize: int, output_buffers: int, device: str):
+    crop = (height // 8, width // 8, 3 * height // 4, 3 * width // 4)
+    cfg = HILSerlRobotEnvConfig(
+        processor=HILSerlProcessorConfig(
+            image_preprocessing=ImagePreprocessingConfig(
+                crop_params_dict={f"{OBS_IMAGES}.{camera}": crop for camera in CAMERAS},
+                resize_size=(resize, resize),
+                output_buffers=output_buffers,
+            ),
+            max_gripper_pos=None,
+        ),
+    )
+    # Only the motor names of the robot and the events of the teleoperator are used to build the
+    # processors, the action processor is not measured
+    env = SimpleNamespace(robot=SimpleNamespace(bus=SimpleNamespace(motors=dict.fromkeys(MOTORS))))
+    teleop_device = SimpleNamespace(get_teleop_events=dict)
+    env_processor, _ = make_processors(env, teleop_device, cfg, device=device)
+
+    observations = make_observations(steps, height, width)
+    print(f"{len(CAMERAS)} cameras {height}x{width} cropped to {crop[2:]} and resized to {resize}, {device=}")
+
+    batched = next(step for step in env_processor.steps if isinstance(step, ImageCropResizeProcessorStep))
+    index = env_processor.steps.index(batched)
+    env_processor.steps[index] = PerImageCropResizeProcessorStep(**batched.get_config())
+    report("per-image (before)", bench(env_processor, observations, device))
+    env_processor.steps[index] = batched
+    report(f"batched (after, {output_buffers} buf)", bench(env_processor, observations, device))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=500, help="Environment steps measured per variant.")
+    parser.add_argument("--height", type=int, default=480, help="Height of the camera images.")
+    parser.add_argument("--width", type=int, default=640, help="Width of the camera images.")
+    parser.add_argument("--resize", type=int, default=128, help="Side of the resized square images.")
+    parser.add_argument(
+        "--output-buffers", type=int, default=2, help="Preallocated outputs of the batched step, 0 allocates."
+    )
+    parser.add_argument("--device", type=str, default="cuda" if torch.cuda.is_available() else "cpu")
+    args = parser.parse_args()
+    main(**vars(args))
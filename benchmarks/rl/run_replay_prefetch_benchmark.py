@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""Compare the replay buffer iterators on SAC-sized batches with two cameras.
+
+For each iterator (synchronous, threaded `async_prefetch` and the `DevicePrefetcher`),
+the script reports the batches/s a learner gets, optionally simulating the time a
+training step keeps the device busy so that prefetching can overlap with it.
+
+Run it from the repository root, on a CUDA machine to measure the pinned-memory path:
+
+    python benchmarks/rl/run_replay_prefetch_benchmark.py --batch-size 256 --image-size 128 --device cuda
+"""
+
+import argparse
+import time
+
+import torch
+
+from lerobot.rl.buffer import ReplayBuffer
+from lerobot.utils.constants import OBS_IMAGES, OBS_STATE
+
+CAMERAS = (f"{OBS_IMAGES}.front", f"{OBS_IMAGES}.wrist")
+
+
+def make_buffer(
+    capacity: int, image_size: int, device: str, uint8_images: bool, use_drq: bool
+) -> ReplayBuffer:
+    buffer = ReplayBuffer(
+        capacity=capacity,
+        device=device,
+        state_keys=[*CAMERAS, OBS_STATE],
+        use_drq=use_drq,
+        optimize_memory=True,
+        image_storage_dtype=torch.uint8 if uint8_images else torch.float32,
+    )
+    for _ in range(capacity):
+        state = {key: torch.rand(3, image_size, image_size) for key in CAMERAS}
+        state[OBS_STATE] = torch.randn(18)
+        buffer.add(state, torch.randn(7), 0.0, None, False, False)
+    return buffer
+
+
+def synchronize(device: str):
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def bench(buffer: ReplayBuffer, batch_size: int, batches: int, step_ms: float, device: str, **kwargs):
+    iterator = buffer.get_iterator(batch_size=batch_size, queue_size=3, **kwargs)
+    # Warm up the staging buffers, the allocator and the compiled augmentation
+    for _ in range(3):
+        next(iterator)
+    synchronize(device)
+
+    start = time.perf_counter()
+    for _ in range(batches):
+        batch = next(iterator)
+        # Consume the batch on the device like a training step would
+        batch["state"][CAMERAS[0]].sum()
+        if step_ms:
+            time.sleep(step_ms / 1e3)
+    synchronize(device)
+    elapsed = time.perf_counter() - start
+    iterator.close()
+    return batches / elapsed
+
+
+def main(
+    capacity: int,
+    batch_size: int,
+    image_size: int,
+    batches: int,
+    step_ms: float,
+    device: str,
+    uint8_images: bool,
+    no_drq: bool,
+):
+    buffer = make_buffer(capacity, image_size, device, uint8_images, use_drq=not no_drq)
+    print(
+        f"{batch_size=} {image_size=} cameras={len(CAMERAS)} {device=} "
+        f"uint8_images={uint8_images} drq={not no_drq} step={step_ms}ms"
+    )
+    iterators = {
+        "synchronous": {"async_prefetch": False},
+        "async_prefetch": {"async_prefetch": True},
+        "device_prefetch": {"device_prefetch": True},
+    }
+    for name, kwargs in iterators.items():
+        rate = bench(buffer, batch_size, batches, step_ms, device, **kwargs)
+        print(f"{name:<16} {rate:8.1f} batches/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--capacity", type=int, default=2048, help="Transitions in the replay buffer.")
+    parser.add_argument("--batch-size", type=int, default=256, help="Transitions per batch.")
+    parser.add_argument("--image-size", type=int, default=128, help="Side of the square camera images.")
+    parser.add_argument("--batches", type=int, default=100, help="Batches measured per iterator.")
+    parser.add_argument(
+        "--step-ms", type=float, default=0.0, help="Simulated training step time, overlapped by prefetching."
+    )
+    parser.add_argument("--device", type=str, default="cuda" if torch.cuda.is_available() else "cpu")
+    parser.add_argument("--uint8-images", action="store_true", help="Store the images as uint8.")
+    parser.add_argument("--no-drq", action="store_true", help="Disable the DrQ augmentation.")
+    args = parser.parse_args()
+    main(**vars(args))
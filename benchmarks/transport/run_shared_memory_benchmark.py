@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+"""Compare the gRPC and shared-memory actor/learner transports on one host.
+
+For each backend the script measures:
+- transitions/s: an actor thread pushes batches of transitions (two cameras plus
+  a low-dimensional state) while the learner side drains them;
+- parameter-sync latency: the time from the learner publishing a policy state
+  dict to the actor holding it in its own module.
+
+Both ends run as threads of this process. Run it from the repository root:
+
+    python benchmarks/transport/run_shared_memory_benchmark.py --transitions 1024 --batch-size 16
+"""
+
+import argparse
+import threading
+import time
+import uuid
+from concurrent import futures
+from queue import Empty, Queue
+from threading import Event
+
+import grpc
+import numpy as np
+import torch
+from torch import nn
+
+from lerobot.rl.learner_service import LearnerService
+from lerobot.rl.shared_memory_transport import ActorSharedMemoryTransport, LearnerSharedMemoryTransport
+from lerobot.transport import services_pb2, services_pb2_grpc
+from lerobot.transport.utils import (
+    MAX_MESSAGE_SIZE,
+    bytes_to_state_dict,
+    bytes_to_transitions,
+    receive_bytes_in_chunks,
+    send_bytes_in_chunks,
+    state_to_bytes,
+    transitions_to_bytes,
+)
+from lerobot.utils.transition import Transition
+
+
+def make_observation(image_size: int) -> dict[str, torch.Tensor]:
+    return {
+        "observation.images.front": torch.rand(1, 3, image_size, image_size),
+        "observation.images.wrist": torch.rand(1, 3, image_size, image_size),
+        "observation.state": torch.randn(1, 18),
+    }
+
+
+def make_transition(image_size: int) -> Transition:
+    return Transition(
+        state=make_observation(image_size),
+        action=torch.randn(1, 7),
+        reward=0.0,
+        done=False,
+        truncated=False,
+        next_state=make_observation(image_size),
+        complementary_info={"discrete_penalty": torch.tensor([0.0])},
+    )
+
+
+def make_policy(hidden: int) -> nn.Module:
+    return nn.Sequential(nn.Linear(256, hidden), nn.ReLU(), nn.Linear(hidden, hidden), nn.ReLU(), nn.Linear(hidden, 7))
+
+
+def report(name: str, transitions_per_s: float, latencies_ms: np.ndarray):
+    print(
+        f"{name:<14} {transitions_per_s:10.0f} transitions/s | "
+        f"param sync p50 {np.percentile(latencies_ms, 50):7.2f} ms | "
+        f"p99 {np.percentile(latencies_ms, 99):7.2f} ms"
+    )
+
+
+def bench_grpc(transitions, batch_size, learner_policy, actor_policy, syncs) -> tuple[float, np.ndarray]:
+    shutdown_event = Event()
+    parameters_queue, transition_queue, interaction_queue = Queue(), Queue(), Queue()
+    service = LearnerService(
+        shutdown_event=shutdown_event,
+        parameters_queue=parameters_queue,
+        seconds_between_pushes=0.0,
+        transition_queue=transition_queue,
+        interaction_message_queue=interaction_queue,
+        queue_get_timeout=0.01,
+    )
+    options = [
+        ("grpc.max_receive_message_length", MAX_MESSAGE_SIZE),
+        ("grpc.max_send_message_length", MAX_MESSAGE_SIZE),
+    ]
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4), options=options)
+    services_pb2_grpc.add_LearnerServiceServicer_to_server(service, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}", options=options)
+    stub = services_pb2_grpc.LearnerServiceStub(channel)
+
+    # Transitions: actor encodes and streams, learner decodes
+    def transitions_stream():
+        for start in range(0, len(transitions), batch_size):
+            yield from send_bytes_in_chunks(
+                transitions_to_bytes(transitions[start : start + batch_size]), services_pb2.Transition
+            )
+
+    start = time.perf_counter()
+    sender = threading.Thread(target=lambda: stub.SendTransitions(transitions_stream()))
+    sender.start()
+    received = 0
+    while received < len(transitions):
+        received += len(bytes_to_transitions(transition_queue.get()))
+    throughput = len(transitions) / (time.perf_counter() - start)
+    sender.join()
+
+    # Parameters: learner pushes, actor receives and loads
+    actor_queue = Queue()
+    receiver = threading.Thread(
+        target=receive_bytes_in_chunks,
+        args=(stub.StreamParameters(services_pb2.Empty()), actor_queue, shutdown_event),
+        daemon=True,
+    )
+    receiver.start()
+    latencies = np.empty(syncs)
+    for i in range(syncs):
+        start = time.perf_counter()
+        parameters_queue.put(state_to_bytes({"policy": learner_policy.state_dict()}))
+        while True:
+            try:
+                message = actor_queue.get(timeout=5.0)
+                break
+            except Empty:
+                continue
+        actor_policy.load_state_dict(bytes_to_state_dict(message)["policy"])
+        latencies[i] = time.perf_counter() - start
+
+    shutdown_event.set()
+    server.stop(None).wait()
+    receiver.join(timeout=1.0)
+    channel.close()
+    return throughput, latencies * 1e3
+
+
+def bench_shared_memory(transitions, batch_size, learner_policy, actor_policy, syncs, slots):
+    name = f"lerobot_bench_{uuid.uuid4().hex[:8]}"
+    actor = ActorSharedMemoryTransport(name, transition_slots=slots, modules={"policy": actor_policy})
+    learner = LearnerSharedMemoryTransport(name)
+
+    def push_all():
+        for start in range(0, len(transitions), batch_size):
+            actor.push_transitions(transitions[start : start + batch_size], timeout=30.0)
+
+    start = time.perf_counter()
+    sender = threading.Thread(target=push_all)
+    sender.start()
+    received = 0
+    while received < len(transitions):
+        popped = len(learner.pop_transitions())
+        received += popped
+        if not popped:
+            # Do not starve the actor thread of the GIL
+            time.sleep(0.0001)
+    throughput = len(transitions) / (time.perf_counter() - start)
+    sender.join()
+
+    latencies = np.empty(syncs)
+    for i in range(syncs):
+        start = time.perf_counter()
+        learner.push_parameters({"policy": learner_policy.state_dict()})
+        while not actor.update_parameters():
+            time.sleep(0.0001)
+        latencies[i] = time.perf_counter() - start
+
+    actor.close()
+    learner.close()
+    return throughput, latencies * 1e3
+
+
+def main(transitions: int, batch_size: int, image_size: int, hidden: int, syncs: int, slots: int):
+    # Every batch holds distinct transitions (torch.save would deduplicate shared tensors),
+    # the batches reuse the same objects to keep memory bounded
+    pool = [make_transition(image_size) for _ in range(batch_size)]
+    stream = [pool[i % batch_size] for i in range(transitions)]
+    learner_policy, actor_policy = make_policy(hidden), make_policy(hidden)
+    size_mb = sum(p.numel() * p.element_size() for p in learner_policy.parameters()) / 2**20
+    print(f"{transitions} transitions in batches of {batch_size}, {size_mb:.1f} MB of parameters")
+
+    report("gRPC", *bench_grpc(stream, batch_size, learner_policy, actor_policy, syncs))
+    report("shared memory", *bench_shared_memory(stream, batch_size, learner_policy, actor_policy, syncs, slots))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transitions", type=int, default=1024, help="Transitions sent per backend.")
+    parser.add_argument("--batch-size", type=int, default=16, help="Transitions per actor push.")
+    parser.add_argument("--image-size", type=int, default=128, help="Side of the square camera images.")
+    parser.add_argument("--hidden", type=int, default=1024, help="Hidden size of the synthetic policy.")
+    parser.add_argument("--syncs", type=int, default=20, help="Parameter syncs measured per backend.")
+    parser.add_argument("--slots", type=int, default=128, help="Slots of the shared memory transition ring.")
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""Compare the torch.save and columnar wire formats of actor -> learner transitions.
+
+Transitions mimic a real setup (two 128x128 cameras plus a low-dimensional
+state). For every batch size the script reports the message size and the
+encode and decode times of each format, optionally with per-column compression:
+
+    python benchmarks/transport/run_transition_benchmark.py --batch-sizes 1 16 128 --compression lz4
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from lerobot.transport.utils import (
+    bytes_to_transitions,
+    transitions_to_bytes,
+    transitions_to_columnar_bytes,
+)
+from lerobot.utils.transition import Transition
+
+
+def make_observation(image_size: int) -> dict[str, torch.Tensor]:
+    return {
+        "observation.images.front": torch.rand(1, 3, image_size, image_size),
+        "observation.images.wrist": torch.rand(1, 3, image_size, image_size),
+        "observation.state": torch.randn(1, 18),
+    }
+
+
+def make_transitions(num_transitions: int, image_size: int) -> list[Transition]:
+    return [
+        Transition(
+            state=make_observation(image_size),
+            action=torch.randn(1, 7),
+            reward=float(i),
+            done=False,
+            truncated=False,
+            next_state=make_observation(image_size),
+            complementary_info={"discrete_penalty": torch.tensor([0.0])},
+        )
+        for i in range(num_transitions)
+    ]
+
+
+def measure(fn, repeats: int) -> np.ndarray:
+    timings = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings[i] = time.perf_counter() - start
+    return timings * 1e3
+
+
+def report(name: str, message: bytes, encode_ms: np.ndarray, decode_ms: np.ndarray):
+    print(
+        f"  {name:<18} {len(message) / 2**20:8.2f} MB | "
+        f"encode {np.median(encode_ms):8.2f} ms | "
+        f"decode {np.median(decode_ms):8.3f} ms"
+    )
+
+
+def main(batch_sizes: list[int], image_size: int, repeats: int, compression: str | None):
+    for batch_size in batch_sizes:
+        print(f"{batch_size} transition(s) per message")
+        transitions = make_transitions(batch_size, image_size)
+
+        message = transitions_to_bytes(transitions)
+        report(
+            "torch.save",
+            message,
+            measure(lambda: transitions_to_bytes(transitions), repeats),
+            measure(lambda: bytes_to_transitions(message), repeats),
+        )
+
+        codecs = [None] if compression is None else [None, compression]
+        for codec in codecs:
+            message = transitions_to_columnar_bytes(transitions, compression=codec)
+            report(
+                f"columnar {codec or 'raw'}",
+                message,
+                measure(lambda: transitions_to_columnar_bytes(transitions, compression=codec), repeats),  # noqa: B023
+                measure(lambda: bytes_to_transitions(message), repeats),  # noqa: B023
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 128])
+    parser.add_argument("--image-size", type=int, default=128, help="Side of the square camera images.")
+    parser.add_argument("--repeats", type=int, default=10, help="Timed repetitions per measurement.")
+    parser.add_argument(
+        "--compression", choices=["lz4", "zstd"], default=None, help="Also run the compressed columnar format."
+    )
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""Find the video encoding options with which the cameras of a robot can be recorded in real time on
+this machine, and print the Pareto frontier of encoding throughput, video size, random access decoding
+latency and quality.
+
+The sample frames are taken from an episode of a dataset, or are synthetic when no dataset is given.
+With `--write-profile`, the chosen options are written to the info of the dataset (given by `--root`),
+so that the next episodes recorded into it are encoded with them.
+
+Run it from the repository root:
+
+    python benchmarks/video/run_encoder_tuning.py --repo-id lerobot/pusht --num-cameras 2 --fps 30
+"""
+
+import argparse
+import logging
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from lerobot.datasets.lerobot_dataset import LeRobotDataset, LeRobotDatasetMetadata
+from lerobot.datasets.video_tuning import make_search_space, pareto_frontier, tune_video_encoding
+
+
+def make_frames(num_frames: int, height: int, width: int) -> np.ndarray:
+    """Smooth moving gradients, which encode like camera images rather than noise."""
+    y, x = np.mgrid[0:height, 0:width]
+    frames = np.empty((num_frames, height, width, 3), dtype=np.uint8)
+    for i in range(num_frames):
+        for c in range(3):
+            frames[i, :, :, c] = 127.5 * (1 + np.sin((x + 2 * i) / 17 + (y - i) / 23 + 2 * c))
+    return frames
+
+
+def load_frames(
+    repo_id: str,
+    root: Path | None,
+    episode: int,
+    camera_key: str | None,
+    num_frames: int,
+    backend: str | None,
+) -> np.ndarray:
+    dataset = LeRobotDataset(repo_id, root=root, episodes=[episode], video_backend=backend)
+    camera_key = camera_key or dataset.meta.camera_keys[0]
+    frames = [dataset[i][camera_key] for i in range(min(num_frames, dataset.num_frames))]
+    # Channel-first float images in [0, 1] to channel-last uint8 ones
+    return (np.stack(frames).transpose(0, 2, 3, 1) * 255).round().astype(np.uint8)
+
+
+def main(
+    repo_id: str | None,
+    root: Path | None,
+    episode: int,
+    camera_key: str | None,
+    num_frames: int,
+    height: int,
+    width: int,
+    fps: int | None,
+    num_cameras: int | None,
+    codecs: list[str] | None,
+    gop_sizes: list[int] | None,
+    min_psnr: float,
+    backend: str | None,
+    output_csv: Path | None,
+    write_profile: bool,
+):
+    meta = None
+    if repo_id is not None:
+        meta = LeRobotDatasetMetadata(repo_id, root=root)
+        fps = fps or meta.fps
+        num_cameras = num_cameras or len(meta.video_keys)
+        frames = load_frames(repo_id, root, episode, camera_key, num_frames, backend)
+    else:
+        frames = make_frames(num_frames, height, width)
+    fps = fps or 30
+    num_cameras = num_cameras or 1
+
+    trials = make_search_space(codecs, gop_sizes, num_cameras=num_cameras)
+    height, width = frames.shape[1:3]
+    print(
+        f"Trying {len(trials)} encoding options on {len(frames)} frames of {width}x{height} "
+        f"for {num_cameras} camera(s) at {fps} fps"
+    )
+    profile, trials = tune_video_encoding(
+        frames, fps, num_cameras=num_cameras, trials=trials, min_psnr=min_psnr, backend=backend
+    )
+
+    results = pd.DataFrame([asdict(trial) for trial in trials])
+    if output_csv is not None:
+        results.to_csv(output_csv, index=False)
+        print(f"Results written to {output_csv}")
+
+    frontier = pd.DataFrame([asdict(trial) for trial in pareto_frontier(trials)])
+    frontier = frontier.astype({"threads": "Int64"}).sort_values("encode_fps", ascending=False)
+    print("\nPareto frontier:")
+    print(frontier.to_string(index=False, float_format=lambda value: f"{value:.2f}"))
+    print(f"\nChosen profile: {profile}")
+
+    if write_profile:
+        if meta is None:
+            raise ValueError("--write-profile requires a dataset, given by --repo-id and --root.")
+        meta.update_video_encoding(profile)
+        print(f"Profile written to {meta.root / 'meta/info.json'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--repo-id", type=str, default=None, help="Dataset of the sample frames, synthetic ones if None."
+    )
+    parser.add_argument("--root", type=Path, default=None, help="Local directory of the dataset.")
+    parser.add_argument("--episode", type=int, default=0, help="Episode of the sample frames.")
+    parser.add_argument(
+        "--camera-key", type=str, default=None, help="Camera of the sample frames, the first one if None."
+    )
+    parser.add_argument("--num-frames", type=int, default=90, help="Number of sample frames.")
+    parser.add_argument("--height", type=int, default=480, help="Height of the synthetic frames.")
+    parser.add_argument("--width", type=int, default=640, help="Width of the synthetic frames.")
+    parser.add_argument(
+        "--fps", type=int, default=None, help="Frame rate to record at, the one of the dataset if None."
+    )
+    parser.add_argument(
+        "--num-cameras",
+        type=int,
+        default=None,
+        help="Number of cameras encoded at the same time, those of the dataset if None.",
+    )
+    parser.add_argument("--codecs", type=str, nargs="*", default=None, help="Video codecs to try.")
+    parser.add_argument("--gop-sizes", type=int, nargs="*", default=None, help="GOP sizes to try.")
+    parser.add_argument(
+        "--min-psnr", type=float, default=35.0, help="Minimum PSNR in dB of the chosen options."
+    )
+    parser.add_argument("--backend", type=str, default=None, help="Video decoding backend.")
+    parser.add_argument("--output-csv", type=Path, default=None, help="CSV file of all the trials.")
+    parser.add_argument(
+        "--write-profile",
+        action="store_true",
+        help="Write the chosen options to the info of the dataset, to record its next episodes with them.",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    main(**vars(args))
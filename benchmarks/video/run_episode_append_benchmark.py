@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""Compare the per-episode save time of datasets whose episodes are concatenated to the video files
+(remuxing the whole file every episode) and of datasets with fragmented videos (appending the episode).
+
+The script records synthetic episodes into a single video file for each mode, writes the save time of
+every episode to a CSV file, plots them when matplotlib is installed, and measures the random access
+decoding latency of the resulting videos.
+
+Run it from the repository root:
+
+    python benchmarks/video/run_episode_append_benchmark.py --output-dir outputs/append_benchmark
+"""
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.video_utils import decode_video_frames, get_safe_default_codec
+from lerobot.utils.constants import OBS_IMAGES
+
+CAMERA = f"{OBS_IMAGES}.front"
+MODES = {"concatenate": False, "fragmented": True}
+
+
+def make_frames(num_frames: int, height: int, width: int, seed: int) -> np.ndarray:
+    """Smooth moving gradients, which encode like camera images rather than noise."""
+    y, x = np.mgrid[0:height, 0:width]
+    phase = np.random.default_rng(seed).uniform(0, 2 * np.pi, size=3)
+    frames = np.empty((num_frames, height, width, 3), dtype=np.uint8)
+    for i in range(num_frames):
+        for c in range(3):
+            frames[i, :, :, c] = 127.5 * (1 + np.sin((x + 2 * i) / 17 + (y - i) / 23 + phase[c]))
+    return frames
+
+
+def record(root: Path, fragmented: bool, episodes: int, frames: np.ndarray, streaming: bool) -> list[float]:
+    features = {
+        CAMERA: {"dtype": "video", "shape": frames.shape[1:], "names": ["height", "width", "channels"]},
+        "action": {"dtype": "float32", "shape": (6,), "names": None},
+    }
+    dataset = LeRobotDataset.create(
+        repo_id="benchmark/append",
+        fps=30,
+        features=features,
+        root=root,
+        image_writer_threads=0 if streaming else 4,
+        streaming_encoding=streaming,
+        fragmented_videos=fragmented,
+    )
+    # Keep every episode in the same video file
+    dataset.meta.update_chunk_settings(video_files_size_in_mb=100_000)
+
+    save_s = []
+    action = np.zeros(6, dtype=np.float32)
+    for ep_idx in range(episodes):
+        for frame in frames:
+            dataset.add_frame({CAMERA: frame, "action": action, "task": "Benchmark"})
+        start = time.perf_counter()
+        dataset.save_episode()
+        save_s.append(time.perf_counter() - start)
+        if (ep_idx + 1) % 20 == 0:
+            print(f"  episode {ep_idx + 1}: {save_s[-1] * 1e3:.1f} ms")
+    dataset.stop_image_writer()
+    dataset.finalize()
+    return save_s
+
+
+def decode_latency_ms(video_path: Path, duration_s: float, backend: str, queries: int = 100) -> float:
+    timestamps = [round(random.uniform(0, duration_s - 0.1) * 30) / 30 for _ in range(queries)]
+    start = time.perf_counter()
+    for ts in timestamps:
+        decode_video_frames(video_path, [ts], tolerance_s=1e-3, backend=backend)
+    return (time.perf_counter() - start) / queries * 1e3
+
+
+def plot(results: pd.DataFrame, path: Path):
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib is not installed, skipping the plot")
+        return
+    fig, ax = plt.subplots(figsize=(8, 4))
+    for mode, group in results.groupby("mode"):
+        ax.plot(group["episode"], group["save_ms"], label=mode)
+    ax.set_xlabel("episode")
+    ax.set_ylabel("save_episode time (ms)")
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    print(f"Plot written to {path}")
+
+
+def main(
+    episodes: int,
+    episode_frames: int,
+    height: int,
+    width: int,
+    streaming_encoding: bool,
+    backend: str | None,
+    output_dir: Path,
+):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    frames = make_frames(episode_frames, height, width, seed=0)
+    backend = backend or get_safe_default_codec()
+    random.seed(0)
+
+    results = []
+    for mode, fragmented in MODES.items():
+        root = output_dir / mode
+        print(f"Recording {episodes} episodes ({mode})")
+        save_s = record(root, fragmented, episodes, frames, streaming_encoding)
+        results += [{"mode": mode, "episode": i, "save_ms": s * 1e3} for i, s in enumerate(save_s)]
+
+        video_path = next((root / "videos").rglob("*.mp4"))
+        latency = decode_latency_ms(video_path, episodes * episode_frames / 30, backend)
+        print(
+            f"{mode:<12} first 10: {np.mean(save_s[:10]) * 1e3:7.1f} ms/episode | "
+            f"last 10: {np.mean(save_s[-10:]) * 1e3:7.1f} ms/episode | total {sum(save_s):6.1f} s | "
+            f"video {video_path.stat().st_size / 2**20:.1f} MiB | decode {latency:.1f} ms/frame ({backend})"
+        )
+
+    results = pd.DataFrame(results)
+    results.to_csv(output_dir / "save_times.csv", index=False)
+    plot(results, output_dir / "save_times.png")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--episodes", type=int, default=200, help="Episodes recorded in each mode.")
+    parser.add_argument("--episode-frames", type=int, default=30, help="Frames per episode.")
+    parser.add_argument("--height", type=int, default=240, help="Height of the camera frames.")
+    parser.add_argument("--width", type=int, default=320, help="Width of the camera frames.")
+    parser.add_argument(
+        "--streaming-encoding", action="store_true", help="Encode the frames while they are added."
+    )
+    parser.add_argument("--backend", type=str, default=None, help="Video decoding backend.")
+    parser.add_argument(
+        "--output-dir", type=Path, required=True, help="Directory of the datasets, CSV and plot."
+    )
+    args = parser.parse_args()
+    main(**vars(args))
@@ -509,24 +509,22 @@ def compute_episode_stats(
             continue
 
         if features[key]["dtype"] in ["image", "video"]:
-            ep_ft_array = sample_images(data)
-            axes_to_reduce = (0, 2, 3)
-            keepdims = True
+            ep_stats[key] = compute_image_stats(sample_images(data), quantile_list=quantile_list)
         else:
-            ep_ft_array = data
-            axes_to_reduce = 0
-            keepdims = data.ndim == 1
+            ep_stats[key] = get_feature_stats(
+                data, axis=0, keepdims=data.ndim == 1, quantile_list=quantile_list
+            )
 
-        ep_stats[key] = get_feature_stats(
-            ep_ft_array, axis=axes_to_reduce, keepdims=keepdims, quantile_list=quantile_list
-        )
+    return ep_stats
 
-        if features[key]["dtype"] in ["image", "video"]:
-            ep_stats[key] = {
-                k: v if k == "count" else np.squeeze(v / 255.0, axis=0) for k, v in ep_stats[key].items()
-            }
 
-    return ep_stats
+def compute_image_stats(images: np.ndarray, quantile_list: list[float] | None = None) -> dict:
+    """Per-channel statistics of uint8 images of shape (N, C, H, W), normalized to [0, 1].
+
+    The statistics have shape (3, 1, 1), apart from the count.
+    """
+    stats = get_feature_stats(images, axis=(0, 2, 3), keepdims=True, quantile_list=quantile_list)
+    return {k: v if k == "count" else np.squeeze(v / 255.0, axis=0) for k, v in stats.items()}
 
 
 def _validate_stat_value(value: np.ndarray, key: str, feature_key: str) -> None:
@@ -21,22 +21,34 @@ This module provides utilities for:
 - Splitting datasets into multiple smaller datasets
 - Adding/removing features from datasets
 - Merging datasets (wrapper around aggregate functionality)
+- Resampling datasets to a lower frame rate
 """
 
+import io
 import logging
 import shutil
+import time
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import datasets
 import numpy as np
 import pandas as pd
+import PIL.Image
+import pyarrow as pa
 import pyarrow.parquet as pq
 import torch
 from tqdm import tqdm
 
 from lerobot.datasets.aggregate import aggregate_datasets
-from lerobot.datasets.compute_stats import aggregate_stats
+from lerobot.datasets.compute_stats import (
+    aggregate_stats,
+    auto_downsample_height_width,
+    compute_episode_stats,
+    compute_image_stats,
+    sample_indices,
+)
 from lerobot.datasets.lerobot_dataset import LeRobotDataset, LeRobotDatasetMetadata
 from lerobot.datasets.utils import (
     DATA_DIR,
@@ -44,6 +56,7 @@ from lerobot.datasets.utils import (
     DEFAULT_DATA_FILE_SIZE_IN_MB,
     DEFAULT_DATA_PATH,
     DEFAULT_EPISODES_PATH,
+    flatten_dict,
     get_parquet_file_size_in_mb,
     load_episodes,
     update_chunk_file_indices,
@@ -51,6 +64,7 @@ from lerobot.datasets.utils import (
     write_stats,
     write_tasks,
 )
+from lerobot.datasets.video_utils import encode_frames_to_video, get_video_info
 from lerobot.utils.constants import HF_LEROBOT_HOME
 
 
@@ -125,7 +139,7 @@ def delete_episodes(
 
     data_metadata = _copy_and_reindex_data(dataset, new_meta, episode_mapping)
 
-    _copy_and_reindex_episodes_metadata(dataset, new_meta, episode_mapping, data_metadata, video_metadata)
+    copy_and_reindex_episodes_metadata(dataset, new_meta, episode_mapping, data_metadata, video_metadata)
 
     new_dataset = LeRobotDataset(
         repo_id=repo_id,
@@ -215,7 +229,7 @@ def split_dataset(
 
         data_metadata = _copy_and_reindex_data(dataset, new_meta, episode_mapping)
 
-        _copy_and_reindex_episodes_metadata(dataset, new_meta, episode_mapping, data_metadata, video_metadata)
+        copy_and_reindex_episodes_metadata(dataset, new_meta, episode_mapping, data_metadata, video_metadata)
 
         new_dataset = LeRobotDataset(
             repo_id=split_repo_id,
@@ -440,6 +454,172 @@ def remove_feature(
     )
 
 
+def resample_dataset(
+    dataset: LeRobotDataset,
+    target_fps: int,
+    output_dir: str | Path | None = None,
+    repo_id: str | None = None,
+    num_workers: int = 4,
+    vcodec: str | None = None,
+    pix_fmt: str | None = None,
+) -> LeRobotDataset:
+    """Resample a LeRobotDataset to a lower frame rate by keeping one frame every stride.
+
+    The stride is `round(dataset.fps / target_fps)`. Frames are never loaded one by one: each
+    data file is filtered with pyarrow and its indices and timestamps rewritten in place, each
+    video file is decoded once and the kept frames encoded at the target rate. Data and video
+    files are processed in parallel worker processes, which also compute the episode stats.
+
+    Args:
+        dataset: The source LeRobotDataset.
+        target_fps: Frame rate of the new dataset.
+        output_dir: Directory to save the new dataset. If None, uses default location.
+        repo_id: Repository ID for the new dataset. If None, appends "_{target_fps}fps" to original.
+        num_workers: Number of worker processes.
+        vcodec: Video codec of the resampled videos, the one of `dataset.meta.video_encoding` if None.
+        pix_fmt: Pixel format of the resampled videos, the one of `dataset.meta.video_encoding` if None.
+
+    Returns:
+        New dataset at target_fps.
+    """
+    stride = max(1, round(dataset.meta.fps / target_fps))
+    if stride == 1:
+        raise ValueError(f"Target fps {target_fps} does not reduce the dataset fps {dataset.meta.fps}")
+
+    if repo_id is None:
+        repo_id = f"{dataset.repo_id}_{target_fps}fps"
+    output_dir = Path(output_dir) if output_dir is not None else HF_LEROBOT_HOME / repo_id
+    if output_dir.resolve() == dataset.root.resolve():
+        raise ValueError("The resampled dataset can not be written over the source dataset")
+
+    new_meta = LeRobotDatasetMetadata.create(
+        repo_id=repo_id,
+        fps=target_fps,
+        features=dataset.meta.features,
+        robot_type=dataset.meta.robot_type,
+        root=output_dir,
+        use_videos=len(dataset.meta.video_keys) > 0,
+    )
+    if dataset.meta.episodes is None:
+        dataset.meta.episodes = load_episodes(dataset.meta.root)
+    episodes = dataset.meta.episodes
+
+    # Episodes keep their frames 0, stride, 2 * stride, ...
+    lengths = (np.asarray(episodes["length"]) + stride - 1) // stride
+    from_indices = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+
+    data_files = sorted({(ep["data/chunk_index"], ep["data/file_index"]) for ep in episodes})
+    video_files = {}
+    for key in dataset.meta.video_keys:
+        for ep in episodes:
+            file = (key, ep[f"videos/{key}/chunk_index"], ep[f"videos/{key}/file_index"])
+            video_files.setdefault(file, []).append(
+                (ep["episode_index"], ep[f"videos/{key}/from_timestamp"], ep["length"])
+            )
+
+    # Videos are encoded like the episodes recorded into the dataset
+    video_encoding = dict(dataset.meta.video_encoding)
+    if vcodec is not None:
+        video_encoding["vcodec"] = vcodec
+    if pix_fmt is not None:
+        video_encoding["pix_fmt"] = pix_fmt
+
+    logging.info(f"Resampling dataset from {dataset.meta.fps} to {target_fps} fps (stride {stride})")
+    start = time.perf_counter()
+    episode_stats = [{} for _ in range(len(episodes))]
+    video_metadata = [{} for _ in range(len(episodes))]
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        jobs = {}
+        for chunk_idx, file_idx in data_files:
+            path = DEFAULT_DATA_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
+            job = executor.submit(
+                _resample_data_file,
+                dataset.root / path,
+                output_dir / path,
+                stride,
+                target_fps,
+                from_indices,
+                dataset.meta.features,
+            )
+            jobs[job] = None
+        for (key, chunk_idx, file_idx), file_episodes in video_files.items():
+            path = dataset.meta.video_path.format(video_key=key, chunk_index=chunk_idx, file_index=file_idx)
+            job = executor.submit(
+                _resample_video_file,
+                dataset.root / path,
+                output_dir / path,
+                sorted(file_episodes, key=lambda ep: ep[1]),
+                dataset.meta.fps,
+                stride,
+                target_fps,
+                video_encoding,
+            )
+            jobs[job] = (key, chunk_idx, file_idx)
+
+        for job in tqdm(as_completed(jobs), total=len(jobs), desc="Resampling files"):
+            video_file = jobs[job]
+            for ep_idx, result in job.result().items():
+                if video_file is None:
+                    episode_stats[ep_idx].update(result)
+                    continue
+                key, chunk_idx, file_idx = video_file
+                episode_stats[ep_idx][key] = result.pop("stats")
+                video_metadata[ep_idx].update(
+                    {
+                        f"videos/{key}/chunk_index": chunk_idx,
+                        f"videos/{key}/file_index": file_idx,
+                        **{f"videos/{key}/{name}": value for name, value in result.items()},
+                    }
+                )
+
+    if dataset.meta.tasks is not None:
+        write_tasks(dataset.meta.tasks, new_meta.root)
+        new_meta.tasks = dataset.meta.tasks.copy()
+
+    for ep_idx, ep in enumerate(episodes):
+        episode_dict = {
+            "episode_index": ep_idx,
+            "tasks": ep["tasks"],
+            "length": int(lengths[ep_idx]),
+            "data/chunk_index": ep["data/chunk_index"],
+            "data/file_index": ep["data/file_index"],
+            "dataset_from_index": int(from_indices[ep_idx]),
+            "dataset_to_index": int(from_indices[ep_idx] + lengths[ep_idx]),
+            **video_metadata[ep_idx],
+        }
+        episode_dict.update(flatten_dict({"stats": episode_stats[ep_idx]}))
+        new_meta._save_episode_metadata(episode_dict)
+    new_meta._close_writer()
+
+    for key in new_meta.video_keys:
+        video_path = output_dir / new_meta.video_path.format(video_key=key, chunk_index=0, file_index=0)
+        new_meta.info["features"][key]["info"] = get_video_info(video_path)
+    new_meta.info.update(
+        {
+            "total_episodes": len(episodes),
+            "total_frames": int(lengths.sum()),
+            "total_tasks": len(new_meta.tasks) if new_meta.tasks is not None else 0,
+            "splits": {"train": f"0:{len(episodes)}"},
+        }
+    )
+    write_info(new_meta.info, new_meta.root)
+    write_stats(aggregate_stats(episode_stats), new_meta.root)
+
+    elapsed = time.perf_counter() - start
+    logging.info(
+        f"Resampled {dataset.meta.total_frames} frames into {int(lengths.sum())} in {elapsed:.1f}s "
+        f"({dataset.meta.total_frames / elapsed:.0f} frames/s)"
+    )
+
+    return LeRobotDataset(
+        repo_id=repo_id,
+        root=output_dir,
+        image_transforms=dataset.image_transforms,
+        tolerance_s=dataset.tolerance_s,
+        video_backend=dataset.video_backend,
+    )
+
+
 def _fractions_to_episode_indices(
     total_episodes: int,
     splits: dict[str, float],
@@ -799,12 +979,13 @@ def _copy_and_reindex_videos(
     return episodes_video_metadata
 
 
-def _copy_and_reindex_episodes_metadata(
+def copy_and_reindex_episodes_metadata(
     src_dataset: LeRobotDataset,
     dst_meta: LeRobotDatasetMetadata,
     episode_mapping: dict[int, int],
     data_metadata: dict[int, dict],
     video_metadata: dict[int, dict] | None = None,
+    stats_overrides: dict[int, dict] | None = None,
 ) -> None:
     """Copy and reindex episodes metadata using provided data and video metadata.
 
@@ -814,9 +995,8 @@ def _copy_and_reindex_episodes_metadata(
         episode_mapping: Mapping from old episode indices to new indices
         data_metadata: Dict mapping new episode index to its data file metadata
         video_metadata: Optional dict mapping new episode index to its video metadata
+        stats_overrides: Optional dict mapping new episode index to feature stats replacing the source ones
     """
-    from lerobot.datasets.utils import flatten_dict
-
     if src_dataset.meta.episodes is None:
         src_dataset.meta.episodes = load_episodes(src_dataset.meta.root)
 
@@ -868,6 +1048,9 @@ def _copy_and_reindex_episodes_metadata(
 
                     episode_stats[feature_name][stat_name] = value
 
+        if stats_overrides and new_idx in stats_overrides:
+            episode_stats.update(stats_overrides[new_idx])
+
         all_stats.append(episode_stats)
 
         episode_dict = {
@@ -1083,3 +1266,136 @@ def _copy_episodes_metadata_and_stats(
     else:
         if src_dataset.meta.stats:
             write_stats(src_dataset.meta.stats, dst_meta.root)
+
+
+def _column_to_numpy(column: pa.ChunkedArray) -> np.ndarray:
+    array = column.combine_chunks()
+    if pa.types.is_list(array.type) or pa.types.is_fixed_size_list(array.type):
+        return array.flatten().to_numpy().reshape(len(array), -1)
+    return array.to_numpy()
+
+
+def _resample_data_file(
+    src_path: Path,
+    dst_path: Path,
+    stride: int,
+    target_fps: int,
+    from_indices: np.ndarray,
+    features: dict,
+) -> dict[int, dict]:
+    """Keep one row every stride of a data file and compute the stats of its episodes.
+
+    Args:
+        src_path: Source parquet file.
+        dst_path: Destination parquet file.
+        stride: Number of source frames per kept frame.
+        target_fps: Frame rate of the new timestamps.
+        from_indices: New global index of the first frame of each episode.
+        features: Features of the dataset.
+
+    Returns:
+        dict mapping the episode indices of the file to their stats
+    """
+    table = pq.read_table(src_path)
+    frame_index = table["frame_index"].to_numpy()
+    keep = frame_index % stride == 0
+    table = table.filter(pa.array(keep))
+    frame_index = frame_index[keep] // stride
+    episode_index = table["episode_index"].to_numpy()
+
+    columns = {
+        "frame_index": frame_index,
+        "index": from_indices[episode_index] + frame_index,
+        "timestamp": frame_index / target_fps,
+    }
+    for name, values in columns.items():
+        i = table.schema.get_field_index(name)
+        table = table.set_column(i, table.schema.field(i), pa.array(values).cast(table.schema.field(i).type))
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, dst_path)
+
+    numeric = {
+        key: _column_to_numpy(table[key])
+        for key, ft in features.items()
+        if ft["dtype"] not in ["image", "video", "string"] and key in table.column_names
+    }
+    images = [key for key, ft in features.items() if ft["dtype"] == "image"]
+
+    stats = {}
+    boundaries = np.flatnonzero(np.diff(episode_index)) + 1
+    for start, end in zip(np.r_[0, boundaries], np.r_[boundaries, len(episode_index)], strict=True):
+        episode_data = {key: values[start:end] for key, values in numeric.items()}
+        ep_stats = compute_episode_stats(episode_data, features)
+        for key in images:
+            encoded = table[key].combine_chunks().field("bytes")
+            sampled = [
+                auto_downsample_height_width(
+                    np.asarray(PIL.Image.open(io.BytesIO(encoded[start + i].as_py())).convert("RGB"))
+                    .transpose(2, 0, 1)
+                )
+                for i in sample_indices(end - start)
+            ]
+            ep_stats[key] = compute_image_stats(np.stack(sampled))
+        stats[int(episode_index[start])] = ep_stats
+    return stats
+
+
+def _resample_video_file(
+    src_path: Path,
+    dst_path: Path,
+    episodes: list[tuple[int, float, int]],
+    fps: int,
+    stride: int,
+    target_fps: int,
+    video_encoding: dict | None = None,
+) -> dict[int, dict]:
+    """Keep one frame every stride of each episode of a video file in a single decoding pass.
+
+    Args:
+        src_path: Source video file.
+        dst_path: Destination video file.
+        episodes: (episode_index, from_timestamp, length) of the episodes of the file, by timestamp.
+        fps: Frame rate of the source video.
+        stride: Number of source frames per kept frame.
+        target_fps: Frame rate of the destination video.
+        video_encoding: Options of `encode_frames_to_video`, its defaults if None.
+
+    Returns:
+        dict mapping the episode indices to their new from_timestamp, to_timestamp and stats
+    """
+    import av
+
+    results = {}
+
+    def kept_frames(in_container):
+        frame_count = 0
+        ep_pos = -1
+        for frame in in_container.decode(video=0):
+            frame_time = float(frame.pts * frame.time_base) if frame.pts is not None else 0.0
+            # Move to the episode holding the frame, frames of the source are 1/fps apart
+            while ep_pos + 1 < len(episodes) and frame_time >= episodes[ep_pos + 1][1] - 0.5 / fps:
+                ep_pos += 1
+                ep_idx, from_timestamp, length = episodes[ep_pos]
+                kept_length = (length + stride - 1) // stride
+                sampled = set(sample_indices(kept_length))
+                results[ep_idx] = {"from_timestamp": frame_count / target_fps, "images": []}
+            if ep_pos < 0:
+                continue
+            ep_idx, from_timestamp, length = episodes[ep_pos]
+            local_index = round((frame_time - from_timestamp) * fps)
+            if local_index >= length or local_index % stride != 0:
+                continue
+
+            if local_index // stride in sampled:
+                image = frame.to_ndarray(format="rgb24").transpose(2, 0, 1)
+                results[ep_idx]["images"].append(auto_downsample_height_width(image))
+            yield frame
+            frame_count += 1
+            results[ep_idx]["to_timestamp"] = frame_count / target_fps
+
+    with av.open(str(src_path)) as in_container:
+        encode_frames_to_video(kept_frames(in_container), dst_path, target_fps, **(video_encoding or {}))
+
+    for ep_idx, result in results.items():
+        result["stats"] = compute_image_stats(np.stack(result.pop("images")))
+    return results
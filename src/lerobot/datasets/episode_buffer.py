@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import datasets
+import numpy as np
+import pyarrow as pa
+import torch
+from datasets.arrow_writer import TypedSequence
+
+from lerobot.datasets.utils import validate_feature_dtype_and_shape, validate_features_presence
+from lerobot.utils.utils import is_valid_numpy_dtype_string
+
+# Features set by `LeRobotDataset.save_episode` for the whole episode
+EPISODE_FEATURES = ["index", "episode_index", "task_index"]
+# Features of every frame added by `LeRobotDataset.add_frame` itself
+FRAME_FEATURES = ["timestamp", "frame_index"]
+
+
+class EpisodeBuffer(Mapping):
+    """Frames of an episode being recorded, stored by feature.
+
+    Numerical features are written in place in preallocated arrays of `capacity` frames, whose capacity
+    doubles when they are full. Saving the episode then uses these arrays as they are, instead of stacking
+    the arrays of every frame. Images and videos (paths of their temporary images) and strings are kept
+    in lists.
+
+    The buffer reads like a dict with the "size" and "task" keys and a key per feature, the numerical
+    features being arrays of the frames added so far. The features of the first frame are expected to
+    have been validated, the next frames are only checked to have the same features and shapes.
+
+    Args:
+        features: Features of the dataset.
+        episode_index: Index of the episode.
+        capacity: Number of frames the arrays are initially allocated for.
+    """
+
+    def __init__(self, features: dict, episode_index: int, capacity: int = 1024):
+        self.features = features
+        self.episode_index = episode_index
+        self.size = 0
+        self.tasks: list[str] = []
+        self._capacity = max(capacity, 1)
+        self._frame_keys: set[str] | None = None
+        self._arrays: dict[str, np.ndarray] = {}
+        self._lists: dict[str, list] = {}
+        for key, ft in features.items():
+            if key == "episode_index":
+                continue
+            if key in EPISODE_FEATURES or ft["dtype"] in ["image", "video", "string"]:
+                self._lists[key] = []
+            else:
+                # Scalars are stored as such, like the timestamps and frame indices
+                shape = () if key in FRAME_FEATURES else tuple(ft["shape"])
+                self._arrays[key] = np.empty((self._capacity, *shape), dtype=ft["dtype"])
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "size":
+            return self.size
+        if key == "task":
+            return self.tasks
+        if key == "episode_index":
+            return self.episode_index
+        if key in self._arrays:
+            return self._arrays[key][: self.size]
+        return self._lists[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from ["size", "task"]
+        yield from self.features
+
+    def __len__(self) -> int:
+        return len(self.features) + 2
+
+    def add(self, frame: dict, timestamp: float, task: str) -> None:
+        """Adds the numerical and string features of a frame.
+
+        The images and videos of the frame are not added, their paths are appended to their lists.
+        """
+        if self._frame_keys is None:
+            self._frame_keys = set(frame)
+        elif frame.keys() != self._frame_keys:
+            raise ValueError(validate_features_presence(set(frame), self._frame_keys))
+
+        if self.size == self._capacity:
+            self._grow()
+
+        self._arrays["timestamp"][self.size] = timestamp
+        self._arrays["frame_index"][self.size] = self.size
+        for key, value in frame.items():
+            if key in self._arrays:
+                if isinstance(value, torch.Tensor):
+                    value = value.numpy()
+                # Values of another shape would be broadcast instead of rejected by the assignment
+                if np.shape(value) != self._arrays[key].shape[1:]:
+                    raise ValueError(validate_feature_dtype_and_shape(key, self.features[key], value))
+                self._arrays[key][self.size] = value
+            elif self.features[key]["dtype"] == "string":
+                self._lists[key].append(value)
+        self.tasks.append(task)
+        self.size += 1
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for key, array in self._arrays.items():
+            grown = np.empty((self._capacity, *array.shape[1:]), dtype=array.dtype)
+            grown[: self.size] = array[: self.size]
+            self._arrays[key] = grown
+
+
+def _numpy_to_arrow(array: np.ndarray, feature: Any, arrow_type: pa.DataType) -> pa.Array | None:
+    """Arrow array of a feature sharing the memory of `array`, or None when it can not be shared."""
+    if not isinstance(array, np.ndarray) or not array.flags.c_contiguous or array.dtype == np.bool_:
+        # Booleans are bit-packed by Arrow
+        return None
+    values_feature = feature.feature if isinstance(feature, datasets.Sequence) else feature
+    dtype = getattr(values_feature, "dtype", None)
+    if not isinstance(dtype, str) or not is_valid_numpy_dtype_string(dtype) or array.dtype != dtype:
+        return None
+
+    values = pa.array(array.reshape(-1))
+    if isinstance(feature, datasets.Value):
+        return values if array.shape[1:] in [(), (1,)] else None
+    if isinstance(feature, datasets.Sequence):
+        if not isinstance(feature.feature, datasets.Value) or array.shape[1:] != (feature.length,):
+            return None
+        return pa.FixedSizeListArray.from_arrays(values, feature.length)
+    if isinstance(feature, (datasets.Array2D, datasets.Array3D, datasets.Array4D, datasets.Array5D)):
+        if array.shape[1:] != tuple(feature.shape):
+            return None
+        # The storage of the array features are nested lists, of which only the offsets are created
+        for dim in reversed(feature.shape):
+            offsets = pa.array(np.arange(0, len(values) + 1, dim, dtype=np.int32))
+            values = pa.ListArray.from_arrays(offsets, values)
+        return pa.ExtensionArray.from_storage(arrow_type, values)
+    return None
+
+
+def episode_to_arrow(episode: dict[str, Any], features: datasets.Features) -> pa.Table:
+    """Converts the columns of an episode to an Arrow table of the given features.
+
+    Numerical columns that are contiguous arrays of the dtype and shape of their feature are not copied:
+    the table shares their memory. The others, like lists of image paths or strings, are converted.
+    """
+    schema = features.arrow_schema
+    columns = []
+    for key, feature in features.items():
+        column = _numpy_to_arrow(episode[key], feature, schema.field(key).type)
+        if column is None:
+            column = pa.array(TypedSequence(features.encode_column(episode[key], key), type=feature))
+        columns.append(column)
+    return pa.Table.from_arrays(columns, schema=schema)
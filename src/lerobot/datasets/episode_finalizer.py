@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import concurrent.futures
+import threading
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+
+class EpisodeFinalizer:
+    """Finalizes the saved episodes of a dataset in a background thread, in the order they were saved.
+
+    At most `max_pending_episodes` episodes wait for or are being finalized: submitting another episode
+    blocks until the oldest one is done, which bounds the memory held by the buffers of the pending
+    episodes. Once an episode fails to be finalized, the next ones are not finalized either, since their
+    indices would not follow the episodes of the dataset anymore.
+
+    Args:
+        max_pending_episodes: Number of episodes that can be pending before `submit` blocks.
+    """
+
+    def __init__(self, max_pending_episodes: int = 2):
+        if max_pending_episodes < 1:
+            raise ValueError(f"max_pending_episodes must be at least 1, got {max_pending_episodes}.")
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="episode_finalizer"
+        )
+        self._slots = threading.Semaphore(max_pending_episodes)
+        self._futures: deque[concurrent.futures.Future] = deque()
+        self._error: BaseException | None = None
+        self.last_episode_index: int | None = None
+
+    def submit(self, episode_index: int, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        """Finalizes an episode with `fn(*args, **kwargs)` once the previous episodes are finalized.
+
+        Raises:
+            Exception: The error of a previous episode that failed to be finalized.
+        """
+        self._raise_error()
+        self._slots.acquire()
+        future = self._executor.submit(self._run, fn, *args, **kwargs)
+        future.add_done_callback(lambda _: self._slots.release())
+        while self._futures and self._futures[0].done():
+            self._futures.popleft()
+        self._futures.append(future)
+        self.last_episode_index = episode_index
+        return future
+
+    def _run(self, fn: Callable, *args, **kwargs) -> Any:
+        if self._error is not None:
+            raise RuntimeError("A previous episode failed to be finalized.") from self._error
+        try:
+            return fn(*args, **kwargs)
+        except BaseException as e:
+            self._error = e
+            raise
+
+    def wait(self) -> None:
+        """Waits for the submitted episodes to be finalized.
+
+        Raises:
+            Exception: The error of the first episode that failed to be finalized.
+        """
+        concurrent.futures.wait(list(self._futures))
+        self._futures.clear()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def shutdown(self) -> None:
+        """Waits for the submitted episodes to be finalized and stops the background thread."""
+        concurrent.futures.wait(list(self._futures))
+        self._futures.clear()
+        self._executor.shutdown()
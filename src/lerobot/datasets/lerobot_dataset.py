@@ -30,10 +30,13 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 import torch
 import torch.utils
+from datasets.table import embed_table_storage
 from huggingface_hub import HfApi, snapshot_download
 from huggingface_hub.errors import RevisionNotFoundError
 
 from lerobot.datasets.compute_stats import aggregate_stats, compute_episode_stats
+from lerobot.datasets.episode_buffer import EpisodeBuffer, episode_to_arrow
+from lerobot.datasets.episode_finalizer import EpisodeFinalizer
 from lerobot.datasets.image_writer import AsyncImageWriter, write_image
 from lerobot.datasets.utils import (
     DEFAULT_EPISODES_PATH,
@@ -45,7 +48,6 @@ from lerobot.datasets.utils import (
     check_version_compatibility,
     create_empty_dataset_info,
     create_lerobot_dataset_card,
-    embed_images,
     flatten_dict,
     get_delta_indices,
     get_file_size_in_mb,
@@ -67,7 +69,10 @@ from lerobot.datasets.utils import (
     write_tasks,
 )
 from lerobot.datasets.video_utils import (
+    VIDEO_ENCODING_OPTIONS,
+    StreamingVideoEncoder,
     VideoFrame,
+    append_fragmented_video,
     concatenate_video_files,
     decode_video_frames,
     encode_video_frames,
@@ -293,6 +298,11 @@ class LeRobotDatasetMetadata:
         """Max size of video file in mega bytes."""
         return self.info["video_files_size_in_mb"]
 
+    @property
+    def video_encoding(self) -> dict:
+        """Options of `encode_video_frames` the videos are encoded with, the defaults when empty."""
+        return self.info.get("video_encoding", {})
+
     def get_task_index(self, task: str) -> int | None:
         """
         Given a task in natural language, returns its task_index if the task already exists in the dataset,
@@ -469,6 +479,31 @@ class LeRobotDatasetMetadata:
         # Update the info file on disk
         write_info(self.info, self.root)
 
+    def update_video_encoding(self, video_encoding: dict | None) -> None:
+        """Set the options the next videos of the dataset are encoded with.
+
+        The options are those of `encode_video_frames` ("vcodec", "pix_fmt", "g", "crf", "preset",
+        "threads" and "fast_decode"), like the profile returned by `tune_video_encoding`. Options that
+        are not given keep their default value. The episodes are appended to the video files of the
+        previous ones, so the options should be set before recording the first episode.
+
+        Args:
+            video_encoding: Options of the encoder. If None, the default options are used again.
+        """
+        video_encoding = dict(video_encoding or {})
+        unknown = set(video_encoding) - set(VIDEO_ENCODING_OPTIONS)
+        if unknown:
+            raise ValueError(
+                f"Unknown video encoding options {sorted(unknown)}, expected some of {VIDEO_ENCODING_OPTIONS}"
+            )
+        if video_encoding:
+            self.info["video_encoding"] = video_encoding
+        else:
+            self.info.pop("video_encoding", None)
+
+        # Update the info file on disk
+        write_info(self.info, self.root)
+
     def get_chunk_settings(self) -> dict[str, int]:
         """Get current chunk and file size settings.
 
@@ -540,11 +575,20 @@ class LeRobotDatasetMetadata:
         return obj
 
 
-def _encode_video_worker(video_key: str, episode_index: int, root: Path, fps: int) -> Path:
+def _encode_video_worker(
+    video_key: str,
+    episode_index: int,
+    root: Path,
+    fps: int,
+    fragmented: bool = False,
+    video_encoding: dict | None = None,
+) -> Path:
     temp_path = Path(tempfile.mkdtemp(dir=root)) / f"{video_key}_{episode_index:03d}.mp4"
     fpath = DEFAULT_IMAGE_PATH.format(image_key=video_key, episode_index=episode_index, frame_index=0)
     img_dir = (root / fpath).parent
-    encode_video_frames(img_dir, temp_path, fps, overwrite=True)
+    encode_video_frames(
+        img_dir, temp_path, fps, overwrite=True, fragmented=fragmented, **(video_encoding or {})
+    )
     shutil.rmtree(img_dir)
     return temp_path
 
@@ -563,6 +607,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
         download_videos: bool = True,
         video_backend: str | None = None,
         batch_encoding_size: int = 1,
+        streaming_encoding: bool = False,
+        fragmented_videos: bool = False,
+        async_finalization: bool = False,
+        max_pending_episodes: int = 2,
     ):
         """
         2 modes are available for instantiating this class, depending on 2 different use cases:
@@ -675,6 +723,18 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 You can also use the 'pyav' decoder used by Torchvision, which used to be the default option, or 'video_reader' which is another decoder of Torchvision.
             batch_encoding_size (int, optional): Number of episodes to accumulate before batch encoding videos.
                 Set to 1 for immediate encoding (default), or higher for batched encoding. Defaults to 1.
+            streaming_encoding (bool, optional): Encode the frames of the video features as they are added
+                with 'add_frame', in a worker process per camera, instead of writing them as temporary PNG
+                images encoded in 'save_episode'. Takes precedence over batch_encoding_size. Defaults to
+                False.
+            fragmented_videos (bool, optional): Encode the episodes as fragmented MP4, so that they are
+                appended to the video files by only writing their own bytes, instead of remuxing the whole
+                files. Defaults to False.
+            async_finalization (bool, optional): Finalize the saved episodes (stats, parquet data, videos and
+                metadata) in a background thread, so that 'save_episode' returns before they are written.
+                Defaults to False.
+            max_pending_episodes (int, optional): With async_finalization, number of saved episodes that can
+                wait to be finalized before 'save_episode' blocks. Defaults to 2.
         """
         super().__init__()
         self.repo_id = repo_id
@@ -688,6 +748,13 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self.delta_indices = None
         self.batch_encoding_size = batch_encoding_size
         self.episodes_since_last_encoding = 0
+        self.streaming_encoding = streaming_encoding
+        self.fragmented_videos = fragmented_videos
+        self.async_finalization = async_finalization
+        self.max_pending_episodes = max_pending_episodes
+        self._streaming_encoders = {}
+        self._episode_finalizer = None
+        self._video_encoding_pool = None
 
         # Unused attributes
         self.image_writer = None
@@ -1067,19 +1134,42 @@ class LeRobotDataset(torch.utils.data.Dataset):
         """
         Close the parquet writers. This function needs to be called after data collection/conversion, else footer metadata won't be written to the parquet files.
         The dataset won't be valid and can't be loaded as ds = LeRobotDataset(repo_id=repo, root=HF_LEROBOT_HOME.joinpath(repo))
+
+        The episodes still being finalized with async_finalization are waited for first.
         """
-        self._close_writer()
-        self.meta._close_writer()
-
-    def create_episode_buffer(self, episode_index: int | None = None) -> dict:
-        current_ep_idx = self.meta.total_episodes if episode_index is None else episode_index
-        ep_buffer = {}
-        # size and task are special cases that are not in self.features
-        ep_buffer["size"] = 0
-        ep_buffer["task"] = []
-        for key in self.features:
-            ep_buffer[key] = current_ep_idx if key == "episode_index" else []
-        return ep_buffer
+        try:
+            self.wait_for_episodes()
+        finally:
+            if self._episode_finalizer is not None:
+                self._episode_finalizer.shutdown()
+                self._episode_finalizer = None
+            if self._video_encoding_pool is not None:
+                self._video_encoding_pool.shutdown()
+                self._video_encoding_pool = None
+            self._close_streaming_encoders()
+            self._close_writer()
+            self.meta._close_writer()
+
+    @property
+    def next_episode_index(self) -> int:
+        """Index of the next episode to save, counting the episodes still being finalized."""
+        if self._episode_finalizer is not None and self._episode_finalizer.last_episode_index is not None:
+            return self._episode_finalizer.last_episode_index + 1
+        return self.meta.total_episodes
+
+    def wait_for_episodes(self) -> None:
+        """Waits for the episodes saved with async_finalization to be finalized.
+
+        Raises:
+            Exception: The error of the first episode that failed to be finalized.
+        """
+        if self._episode_finalizer is not None:
+            self._episode_finalizer.wait()
+
+    def create_episode_buffer(self, episode_index: int | None = None) -> EpisodeBuffer:
+        current_ep_idx = self.next_episode_index if episode_index is None else episode_index
+        # Allocated for a minute of frames at first
+        return EpisodeBuffer(self.features, current_ep_idx, capacity=self.fps * 60)
 
     # TODO(Steven): consider move this to utils
     def _get_image_file_path(self, episode_index: int, image_key: str, frame_index: int) -> Path:
@@ -1104,34 +1194,45 @@ class LeRobotDataset(torch.utils.data.Dataset):
     def add_frame(self, frame: dict) -> None:
         """
         This function only adds the frame to the episode_buffer. Apart from images — which are written in a
-        temporary directory — nothing is written to disk. To save those frames, the 'save_episode()' method
-        then needs to be called.
+        temporary directory, or streamed to the video encoders with `streaming_encoding` — nothing is
+        written to disk. To save those frames, the 'save_episode()' method then needs to be called.
         """
-        # Convert torch to numpy if needed
-        for name in frame:
-            if isinstance(frame[name], torch.Tensor):
-                frame[name] = frame[name].numpy()
-
-        validate_frame(frame, self.features)
-
         if self.episode_buffer is None:
             self.episode_buffer = self.create_episode_buffer()
 
+        # The features of the frames are validated once per episode, the next frames are only checked to
+        # have the same features and shapes by the episode buffer
+        if self.episode_buffer.size == 0:
+            for name in frame:
+                if isinstance(frame[name], torch.Tensor):
+                    frame[name] = frame[name].numpy()
+            validate_frame(frame, self.features)
+
         # Automatically add frame_index and timestamp to episode buffer
-        frame_index = self.episode_buffer["size"]
+        frame_index = self.episode_buffer.size
         timestamp = frame.pop("timestamp") if "timestamp" in frame else frame_index / self.fps
-        self.episode_buffer["frame_index"].append(frame_index)
-        self.episode_buffer["timestamp"].append(timestamp)
-        self.episode_buffer["task"].append(frame.pop("task"))  # Remove task from frame after processing
-
-        # Add frame features to episode_buffer
-        for key in frame:
-            if key not in self.features:
-                raise ValueError(
-                    f"An element of the frame is not in the features. '{key}' not in '{self.features.keys()}'."
-                )
+        task = frame.pop("task")  # Remove task from frame after processing
 
-            if self.features[key]["dtype"] in ["image", "video"]:
+        # Images are written to disk or streamed, the other features are added to the episode buffer
+        for key in self.meta.camera_keys:
+            if key not in frame:
+                continue
+            if isinstance(frame[key], torch.Tensor):
+                frame[key] = frame[key].numpy()
+
+            if self.features[key]["dtype"] == "video" and self.streaming_encoding:
+                # The encoder of each camera is kept for all the episodes, a video is started per episode
+                if key not in self._streaming_encoders:
+                    self._streaming_encoders[key] = StreamingVideoEncoder(self.fps)
+                encoder = self._streaming_encoders[key]
+                if encoder.video_path is None:
+                    episode_index = self.episode_buffer["episode_index"]
+                    video_path = Path(tempfile.mkdtemp(dir=self.root)) / f"{key}_{episode_index:03d}.mp4"
+                    encoder.start_video(
+                        video_path, fragmented=self.fragmented_videos, **self.meta.video_encoding
+                    )
+                encoder.add_frame(frame[key])
+            elif self.features[key]["dtype"] in ["image", "video"]:
                 img_path = self._get_image_file_path(
                     episode_index=self.episode_buffer["episode_index"], image_key=key, frame_index=frame_index
                 )
@@ -1140,22 +1241,26 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 compress_level = 1 if self.features[key]["dtype"] == "video" else 6
                 self._save_image(frame[key], img_path, compress_level)
                 self.episode_buffer[key].append(str(img_path))
-            else:
-                self.episode_buffer[key].append(frame[key])
 
-        self.episode_buffer["size"] += 1
+        self.episode_buffer.add(frame, timestamp, task)
 
     def save_episode(
         self,
         episode_data: dict | None = None,
         parallel_encoding: bool = True,
-    ) -> None:
+    ) -> concurrent.futures.Future | None:
         """
         This will save to disk the current episode in self.episode_buffer.
 
         Video encoding is handled automatically based on batch_encoding_size:
         - If batch_encoding_size == 1: Videos are encoded immediately after each episode
         - If batch_encoding_size > 1: Videos are encoded in batches.
+        - With streaming_encoding, the videos of the frames added with 'add_frame' are already encoded and
+          only need to be flushed.
+
+        With async_finalization, only the images of the episode still being written are waited for. The
+        episode is then finalized (stats, parquet data, videos and metadata) in a background thread, while
+        the frames of the next episode can be added. 'finalize()' waits for all the episodes to be saved.
 
         Args:
             episode_data (dict | None, optional): Dict containing the episode data to save. If None, this will
@@ -1163,10 +1268,60 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 None.
             parallel_encoding (bool, optional): If True, encode videos in parallel using ProcessPoolExecutor.
                 Defaults to True on Linux, False on macOS as it tends to use all the CPU available already.
+
+        Returns:
+            concurrent.futures.Future | None: With async_finalization, the future of the finalization of the
+                episode. None otherwise, the episode being saved when this returns.
         """
         episode_buffer = episode_data if episode_data is not None else self.episode_buffer
 
-        validate_episode_buffer(episode_buffer, self.meta.total_episodes, self.features)
+        validate_episode_buffer(episode_buffer, self.next_episode_index, self.features)
+        episode_index = episode_buffer["episode_index"]
+
+        # Wait for image writer to end, so that episode stats over images can be computed
+        self._wait_image_writer()
+        streamed_videos = {}
+        if episode_data is None:
+            # The frames of the next episode are added to a new buffer and streamed to new videos, while
+            # the encoders flush the videos of this one
+            streamed_videos = {
+                key: (encoder.video_path, encoder.finish_video())
+                for key, encoder in self._streaming_encoders.items()
+                if encoder.video_path is not None
+            }
+            self.episode_buffer = self.create_episode_buffer(episode_index + 1)
+        # Clean up temporary images (if not already deleted during video encoding) of recorded episodes
+        delete_images = episode_data is None and len(self.meta.image_keys) > 0
+
+        if not self.async_finalization:
+            self._finalize_episode(episode_buffer, streamed_videos, parallel_encoding, delete_images)
+            return None
+
+        if self._episode_finalizer is None:
+            self._episode_finalizer = EpisodeFinalizer(self.max_pending_episodes)
+        return self._episode_finalizer.submit(
+            episode_index,
+            self._finalize_episode,
+            episode_buffer,
+            streamed_videos,
+            parallel_encoding,
+            delete_images,
+        )
+
+    def _finalize_episode(
+        self,
+        episode_buffer: dict,
+        streamed_videos: dict[str, tuple[Path, int]],
+        parallel_encoding: bool,
+        delete_images: bool,
+    ) -> None:
+        """Saves the data, videos and metadata of an episode, after the previous episodes were saved.
+
+        `streamed_videos` maps the video keys encoded with streaming_encoding to the path of their video
+        and its index in their encoder.
+        """
+        # The columns of the episode are replaced below, the episode buffer itself is left untouched
+        episode_buffer = dict(episode_buffer)
 
         # size and task are special cases that won't be added to hf_dataset
         episode_length = episode_buffer.pop("size")
@@ -1188,42 +1343,60 @@ class LeRobotDataset(torch.utils.data.Dataset):
             # are processed separately by storing image path and frame info as meta data
             if key in ["index", "episode_index", "task_index"] or ft["dtype"] in ["image", "video"]:
                 continue
-            episode_buffer[key] = np.stack(episode_buffer[key])
-
-        # Wait for image writer to end, so that episode stats over images can be computed
-        self._wait_image_writer()
-        ep_stats = compute_episode_stats(episode_buffer, self.features)
+            # The numerical features of the episode buffer are already arrays
+            if not isinstance(episode_buffer[key], np.ndarray):
+                episode_buffer[key] = np.stack(episode_buffer[key])
+
+        # Wait for the streaming encoders to flush the videos, they computed the stats of their frames
+        streamed_stats = {
+            video_key: self._streaming_encoders[video_key].get_video_stats(video_index)
+            for video_key, (_, video_index) in streamed_videos.items()
+        }
+        ep_stats = compute_episode_stats(
+            {key: value for key, value in episode_buffer.items() if key not in streamed_videos}, self.features
+        )
+        ep_stats.update(streamed_stats)
 
         ep_metadata = self._save_episode_data(episode_buffer)
         has_video_keys = len(self.meta.video_keys) > 0
-        use_batched_encoding = self.batch_encoding_size > 1
+        use_batched_encoding = self.batch_encoding_size > 1 and not streamed_videos
 
-        if has_video_keys and not use_batched_encoding:
+        if has_video_keys and streamed_videos:
+            for video_key in self.meta.video_keys:
+                video_path, _ = streamed_videos[video_key]
+                ep_metadata.update(self._save_episode_video(video_key, episode_index, temp_path=video_path))
+        elif has_video_keys and not use_batched_encoding:
             num_cameras = len(self.meta.video_keys)
             if parallel_encoding and num_cameras > 1:
                 # TODO(Steven): Ideally we would like to control the number of threads per encoding such that:
                 # num_cameras * num_threads = (total_cpu -1)
-                with concurrent.futures.ProcessPoolExecutor(max_workers=num_cameras) as executor:
-                    future_to_key = {
-                        executor.submit(
-                            _encode_video_worker,
-                            video_key,
-                            episode_index,
-                            self.root,
-                            self.fps,
-                        ): video_key
-                        for video_key in self.meta.video_keys
-                    }
-
-                    results = {}
-                    for future in concurrent.futures.as_completed(future_to_key):
-                        video_key = future_to_key[future]
-                        try:
-                            temp_path = future.result()
-                            results[video_key] = temp_path
-                        except Exception as exc:
-                            logging.error(f"Video encoding failed for {video_key}: {exc}")
-                            raise exc
+                # The encoding processes are reused by the next episodes, until `finalize`
+                if self._video_encoding_pool is None:
+                    self._video_encoding_pool = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=num_cameras
+                    )
+                future_to_key = {
+                    self._video_encoding_pool.submit(
+                        _encode_video_worker,
+                        video_key,
+                        episode_index,
+                        self.root,
+                        self.fps,
+                        self.fragmented_videos,
+                        self.meta.video_encoding,
+                    ): video_key
+                    for video_key in self.meta.video_keys
+                }
+
+                results = {}
+                for future in concurrent.futures.as_completed(future_to_key):
+                    video_key = future_to_key[future]
+                    try:
+                        temp_path = future.result()
+                        results[video_key] = temp_path
+                    except Exception as exc:
+                        logging.error(f"Video encoding failed for {video_key}: {exc}")
+                        raise exc
 
                 for video_key in self.meta.video_keys:
                     temp_path = results[video_key]
@@ -1246,9 +1419,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 self._batch_save_episode_video(start_ep, end_ep)
                 self.episodes_since_last_encoding = 0
 
-        if not episode_data:
-            # Reset episode buffer and clean up temporary images (if not already deleted during video encoding)
-            self.clear_episode_buffer(delete_images=len(self.meta.image_keys) > 0)
+        if delete_images:
+            self._delete_episode_images(episode_index)
 
     def _batch_save_episode_video(self, start_episode: int, end_episode: int | None = None) -> None:
         """
@@ -1316,11 +1488,12 @@ class LeRobotDataset(torch.utils.data.Dataset):
         - `datasets` relies on a memory mapping from pyarrow (no RAM). It either converts parquet files to a pyarrow cache on disk,
           or loads directly from pyarrow cache.
         """
-        # Convert buffer into HF Dataset
+        # Convert buffer into an Arrow table, sharing the memory of its arrays
         ep_dict = {key: episode_buffer[key] for key in self.hf_features}
-        ep_dataset = datasets.Dataset.from_dict(ep_dict, features=self.hf_features, split="train")
-        ep_dataset = embed_images(ep_dataset)
-        ep_num_frames = len(ep_dataset)
+        table = episode_to_arrow(ep_dict, self.hf_features)
+        if len(self.meta.image_keys) > 0:
+            table = embed_table_storage(table)
+        ep_num_frames = table.num_rows
 
         if self.latest_episode is None:
             # Initialize indices and frame count for a new dataset made of the first episode data
@@ -1372,7 +1545,6 @@ class LeRobotDataset(torch.utils.data.Dataset):
         path = self.root / self.meta.data_path.format(chunk_index=chunk_idx, file_index=file_idx)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        table = ep_dataset.with_format("arrow")[:]
         if not self.writer:
             self.writer = pq.ParquetWriter(
                 path, schema=table.schema, compression="snappy", use_dictionary=True
@@ -1455,11 +1627,15 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 shutil.move(str(ep_path), str(new_path))
                 latest_duration_in_s = 0.0
             else:
-                # Update latest video file
-                concatenate_video_files(
-                    [latest_path, ep_path],
-                    latest_path,
-                )
+                # Update latest video file, only writing the episode at its end when both are fragmented
+                appended = self.fragmented_videos and append_fragmented_video(ep_path, latest_path)
+                if self.fragmented_videos and not appended:
+                    logging.warning(f"Could not append {ep_path} to {latest_path}, concatenating them.")
+                if not appended:
+                    concatenate_video_files(
+                        [latest_path, ep_path],
+                        latest_path,
+                    )
 
         # Remove temporary directory
         shutil.rmtree(str(ep_path.parent))
@@ -1479,21 +1655,41 @@ class LeRobotDataset(torch.utils.data.Dataset):
         return metadata
 
     def clear_episode_buffer(self, delete_images: bool = True) -> None:
+        self._cancel_streaming_encoders()
+
         # Clean up image files for the current episode buffer
+        if self.episode_buffer is None:
+            self.episode_buffer = self.create_episode_buffer()
+        episode_index = self.episode_buffer["episode_index"]
         if delete_images:
             # Wait for the async image writer to finish
             if self.image_writer is not None:
                 self._wait_image_writer()
-            episode_index = self.episode_buffer["episode_index"]
-            if isinstance(episode_index, np.ndarray):
-                episode_index = episode_index.item() if episode_index.size == 1 else episode_index[0]
-            for cam_key in self.meta.camera_keys:
-                img_dir = self._get_image_file_dir(episode_index, cam_key)
-                if img_dir.is_dir():
-                    shutil.rmtree(img_dir)
+            self._delete_episode_images(episode_index)
 
         # Reset the buffer
-        self.episode_buffer = self.create_episode_buffer()
+        self.episode_buffer = self.create_episode_buffer(episode_index)
+
+    def _delete_episode_images(self, episode_index: int) -> None:
+        for cam_key in self.meta.camera_keys:
+            img_dir = self._get_image_file_dir(episode_index, cam_key)
+            if img_dir.is_dir():
+                shutil.rmtree(img_dir)
+
+    def _cancel_streaming_encoders(self) -> None:
+        """Stop encoding the videos of the current episode and delete them, the encoders are kept."""
+        for encoder in self._streaming_encoders.values():
+            video_path = encoder.video_path
+            if video_path is not None:
+                encoder.cancel_video()
+                shutil.rmtree(video_path.parent, ignore_errors=True)
+
+    def _close_streaming_encoders(self) -> None:
+        """Stop the workers of the streaming encoders, and delete the videos of an unsaved episode."""
+        self._cancel_streaming_encoders()
+        for encoder in self._streaming_encoders.values():
+            encoder.close()
+        self._streaming_encoders = {}
 
     def start_image_writer(self, num_processes: int = 0, num_threads: int = 4) -> None:
         if isinstance(self.image_writer, AsyncImageWriter):
@@ -1526,7 +1722,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         Note: `encode_video_frames` is a blocking call. Making it asynchronous shouldn't speedup encoding,
         since video encoding with ffmpeg is already using multithreading.
         """
-        return _encode_video_worker(video_key, episode_index, self.root, self.fps)
+        return _encode_video_worker(
+            video_key, episode_index, self.root, self.fps, self.fragmented_videos, self.meta.video_encoding
+        )
 
     @classmethod
     def create(
@@ -1542,6 +1740,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
         image_writer_threads: int = 0,
         video_backend: str | None = None,
         batch_encoding_size: int = 1,
+        streaming_encoding: bool = False,
+        fragmented_videos: bool = False,
+        async_finalization: bool = False,
+        max_pending_episodes: int = 2,
     ) -> "LeRobotDataset":
         """Create a LeRobot Dataset from scratch in order to record data."""
         obj = cls.__new__(cls)
@@ -1560,6 +1762,13 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.image_writer = None
         obj.batch_encoding_size = batch_encoding_size
         obj.episodes_since_last_encoding = 0
+        obj.streaming_encoding = streaming_encoding
+        obj.fragmented_videos = fragmented_videos
+        obj.async_finalization = async_finalization
+        obj.max_pending_episodes = max_pending_episodes
+        obj._streaming_encoders = {}
+        obj._episode_finalizer = None
+        obj._video_encoding_pool = None
 
         if image_writer_processes or image_writer_threads:
             obj.start_image_writer(image_writer_processes, image_writer_threads)
@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Finds the video encoding options suited to the machine recording a dataset.
+
+The best options of `encode_video_frames` depend on the CPU: a slow preset may compress the videos
+well on a workstation but not encode the episodes of every camera in real time on a small computer.
+`tune_video_encoding` encodes sample frames with combinations of codecs, presets, GOP sizes, CRF values
+and thread counts, measures the encoding throughput, the size of the videos and their random access
+decoding latency, and chooses the options to record with:
+
+    profile, trials = tune_video_encoding(frames, fps=30, num_cameras=2)
+    dataset.meta.update_video_encoding(profile)
+"""
+
+import concurrent.futures
+import itertools
+import logging
+import math
+import os
+import random
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import av
+import numpy as np
+
+from lerobot.datasets.image_writer import write_image
+from lerobot.datasets.video_utils import decode_video_frames, encode_video_frames, get_safe_default_codec
+
+# Presets and CRF values tried for each codec, from the fastest to the most compressing presets
+DEFAULT_SEARCH_SPACE = {
+    "libsvtav1": {"preset": [12, 8], "crf": [30, 40]},
+    "h264": {"preset": ["ultrafast", "veryfast", "medium"], "crf": [23, 30]},
+    "hevc": {"preset": ["ultrafast", "medium"], "crf": [28, 34]},
+}
+DEFAULT_GOP_SIZES = [2, 10]
+
+
+@dataclass
+class EncodingTrial:
+    """Options of `encode_video_frames` tried by `tune_video_encoding`, and their measurements.
+
+    `encode_fps` is the number of frames per second encoded for each camera while the videos of all the
+    cameras are encoded in parallel, and `realtime` tells whether it keeps up with the frame rate of the
+    dataset. `psnr` compares the decoded frames to the sample frames, in dB. The decoding latency is
+    infinite when the video could not be decoded.
+    """
+
+    vcodec: str
+    preset: int | str | None
+    g: int
+    crf: int
+    threads: int | None
+    encode_fps: float = 0.0
+    size_kib_per_frame: float = 0.0
+    decode_latency_ms: float = 0.0
+    psnr: float = 0.0
+    realtime: bool = False
+
+    @property
+    def profile(self) -> dict:
+        """Options to give to `encode_video_frames` or `LeRobotDatasetMetadata.update_video_encoding`."""
+        profile = {"vcodec": self.vcodec, "g": self.g, "crf": self.crf}
+        if self.preset is not None:
+            profile["preset"] = self.preset
+        if self.threads is not None:
+            profile["threads"] = self.threads
+        return profile
+
+    def dominates(self, other: "EncodingTrial") -> bool:
+        """Whether the trial is at least as good as `other` on every measurement, and better on one."""
+        at_least = (
+            self.encode_fps >= other.encode_fps
+            and self.size_kib_per_frame <= other.size_kib_per_frame
+            and self.decode_latency_ms <= other.decode_latency_ms
+            and self.psnr >= other.psnr
+        )
+        better = (
+            self.encode_fps > other.encode_fps
+            or self.size_kib_per_frame < other.size_kib_per_frame
+            or self.decode_latency_ms < other.decode_latency_ms
+            or self.psnr > other.psnr
+        )
+        return at_least and better
+
+
+def get_available_codecs(codecs: list[str] | None = None) -> list[str]:
+    """Codecs of `codecs` (by default those of `DEFAULT_SEARCH_SPACE`) that PyAV can encode with."""
+    available = []
+    for codec in codecs or list(DEFAULT_SEARCH_SPACE):
+        try:
+            av.codec.Codec(codec, "w")
+        except Exception:
+            logging.info(f"Video codec {codec} is not available for encoding, skipping it.")
+            continue
+        available.append(codec)
+    return available
+
+
+def make_search_space(
+    codecs: list[str] | None = None,
+    gop_sizes: list[int] | None = None,
+    threads: list[int | None] | None = None,
+    num_cameras: int = 1,
+) -> list[EncodingTrial]:
+    """Combinations of encoding options to try, from `DEFAULT_SEARCH_SPACE` for the available codecs.
+
+    By default, the encoders either choose their number of threads, run on a single thread, or share the
+    CPUs between the cameras.
+    """
+    if threads is None:
+        threads = list(dict.fromkeys([None, 1, max(1, (os.cpu_count() or 1) // num_cameras)]))
+    trials = []
+    for vcodec in get_available_codecs(codecs):
+        space = DEFAULT_SEARCH_SPACE.get(vcodec, {"preset": [None], "crf": [30]})
+        for preset, g, crf, num_threads in itertools.product(
+            space["preset"], gop_sizes or DEFAULT_GOP_SIZES, space["crf"], threads
+        ):
+            trials.append(EncodingTrial(vcodec, preset, g, crf, num_threads))
+    return trials
+
+
+def pareto_frontier(trials: list[EncodingTrial]) -> list[EncodingTrial]:
+    """Trials that no other trial dominates: each is the best trade-off for some preference between
+    encoding throughput, video size, decoding latency and quality. Videos that could not be decoded are
+    left out."""
+    trials = [trial for trial in trials if math.isfinite(trial.decode_latency_ms)]
+    return [trial for trial in trials if not any(other.dominates(trial) for other in trials)]
+
+
+def _psnr(decoded: np.ndarray, original: np.ndarray) -> float:
+    mse = np.mean((decoded.astype(np.float64) - original.astype(np.float64)) ** 2)
+    return float("inf") if mse == 0 else float(10 * np.log10(255**2 / mse))
+
+
+def _measure_decoding(
+    video_path: Path, frames: np.ndarray, fps: int, backend: str, num_queries: int
+) -> tuple[float, float]:
+    """Mean latency in ms of decoding a random frame of the video, and PSNR of the decoded frames."""
+    indices = [random.randrange(len(frames)) for _ in range(num_queries)]
+    decoded_frames = []
+    start = time.perf_counter()
+    for idx in indices:
+        decoded_frames.append(
+            decode_video_frames(video_path, [idx / fps], tolerance_s=1e-4, backend=backend)
+        )
+    latency_ms = (time.perf_counter() - start) / num_queries * 1e3
+
+    psnrs = [
+        _psnr((decoded[0] * 255).round().permute(1, 2, 0).numpy(), frames[idx])
+        for decoded, idx in zip(decoded_frames, indices, strict=True)
+    ]
+    return latency_ms, float(np.mean(psnrs))
+
+
+def _start_worker() -> None:
+    # Unpickling this function imports the encoding functions, and the other workers start meanwhile
+    time.sleep(0.1)
+
+
+def run_trial(
+    trial: EncodingTrial,
+    imgs_dir: Path,
+    frames: np.ndarray,
+    fps: int,
+    num_cameras: int,
+    output_dir: Path,
+    pool: concurrent.futures.Executor | None,
+    backend: str,
+    num_queries: int = 20,
+) -> EncodingTrial:
+    """Encodes the sample frames of `imgs_dir` once per camera, in parallel, and fills the measurements
+    of the trial."""
+    video_paths = [output_dir / f"camera_{camera}.mp4" for camera in range(num_cameras)]
+    start = time.perf_counter()
+    if pool is None:
+        encode_video_frames(imgs_dir, video_paths[0], fps, overwrite=True, **trial.profile)
+    else:
+        futures = [
+            pool.submit(encode_video_frames, imgs_dir, path, fps, overwrite=True, **trial.profile)
+            for path in video_paths
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+    duration_s = time.perf_counter() - start
+
+    trial.encode_fps = len(frames) / duration_s
+    trial.realtime = trial.encode_fps >= fps
+    trial.size_kib_per_frame = video_paths[0].stat().st_size / len(frames) / 1024
+    try:
+        trial.decode_latency_ms, trial.psnr = _measure_decoding(
+            video_paths[0], frames, fps, backend, num_queries
+        )
+    except Exception as e:
+        # Like videos whose frame timestamps do not match the frame rate
+        logging.warning(f"Decoding the video encoded with {trial.profile} failed, skipping it: {e!r}")
+        trial.decode_latency_ms, trial.psnr = math.inf, 0.0
+    return trial
+
+
+def select_profile(trials: list[EncodingTrial], min_psnr: float = 35.0) -> EncodingTrial:
+    """Chooses the trial to record with.
+
+    Among the trials encoding in real time with a PSNR of at least `min_psnr`, the one with the smallest
+    sum of its video size and decoding latency, both relative to the smallest ones, is chosen. When no
+    trial is fast and good enough, the fastest one is chosen. Videos that could not be decoded are left
+    out.
+    """
+    trials = [trial for trial in trials if math.isfinite(trial.decode_latency_ms)]
+    if not trials:
+        raise ValueError("None of the videos encoded with the video encoding options could be decoded.")
+    feasible = [trial for trial in trials if trial.realtime and trial.psnr >= min_psnr]
+    if not feasible:
+        logging.warning(
+            f"No video encoding options encode in real time with a PSNR of at least {min_psnr} dB, "
+            "choosing the fastest ones."
+        )
+        return max(trials, key=lambda trial: trial.encode_fps)
+
+    min_size = min(trial.size_kib_per_frame for trial in feasible)
+    min_latency = min(trial.decode_latency_ms for trial in feasible)
+    return min(
+        feasible,
+        key=lambda trial: trial.size_kib_per_frame / min_size + trial.decode_latency_ms / min_latency,
+    )
+
+
+def tune_video_encoding(
+    frames: np.ndarray,
+    fps: int,
+    num_cameras: int = 1,
+    trials: list[EncodingTrial] | None = None,
+    min_psnr: float = 35.0,
+    backend: str | None = None,
+    num_queries: int = 20,
+) -> tuple[dict, list[EncodingTrial]]:
+    """Finds the video encoding options with which `num_cameras` cameras can be recorded in real time.
+
+    The sample frames are encoded with `encode_video_frames` once per camera in parallel, like the
+    episodes of a dataset, for each combination of options. The videos are then decoded at random
+    frames with `decode_video_frames`.
+
+    Args:
+        frames: Sample frames of a camera, uint8 channel-last images, like `(num_frames, h, w, 3)`.
+        fps: Frame rate of the dataset.
+        num_cameras: Number of cameras whose videos are encoded at the same time.
+        trials: Options to try, `make_search_space(num_cameras=num_cameras)` by default.
+        min_psnr: Minimum PSNR of the decoded frames in dB for the options to be chosen.
+        backend: Video decoding backend, the default one of the datasets when None.
+        num_queries: Number of random frames decoded to measure the decoding latency.
+
+    Returns:
+        The chosen options of `encode_video_frames`, to give to
+        `LeRobotDatasetMetadata.update_video_encoding`, and all the trials with their measurements.
+    """
+    if frames.ndim != 4 or frames.shape[-1] != 3 or frames.dtype != np.uint8:
+        raise ValueError(f"Expected uint8 frames of shape (num_frames, h, w, 3), got {frames.shape}.")
+    if trials is None:
+        trials = make_search_space(num_cameras=num_cameras)
+    if not trials:
+        raise ValueError("No video encoding options to try.")
+    backend = backend or get_safe_default_codec()
+
+    pool = None
+    if num_cameras > 1:
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=num_cameras)
+        # Start the workers before timing the first trial
+        concurrent.futures.wait([pool.submit(_start_worker) for _ in range(num_cameras)])
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            imgs_dir = Path(tmp_dir) / "images"
+            imgs_dir.mkdir()
+            for frame_index, frame in enumerate(frames):
+                write_image(frame, imgs_dir / f"frame-{frame_index:06d}.png")
+
+            for trial_index, trial in enumerate(trials):
+                output_dir = Path(tmp_dir) / f"trial_{trial_index}"
+                output_dir.mkdir()
+                run_trial(trial, imgs_dir, frames, fps, num_cameras, output_dir, pool, backend, num_queries)
+                logging.info(
+                    f"{trial.profile}: {trial.encode_fps:.1f} fps, {trial.size_kib_per_frame:.1f} KiB/frame, "
+                    f"decoding {trial.decode_latency_ms:.1f} ms, PSNR {trial.psnr:.1f} dB"
+                )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return select_profile(trials, min_psnr).profile, trials
@@ -15,23 +15,37 @@
 # limitations under the License.
 import glob
 import importlib
+import io
 import logging
+import multiprocessing
+import queue
 import shutil
+import struct
 import tempfile
 import warnings
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from fractions import Fraction
+from multiprocessing import shared_memory
 from pathlib import Path
 from threading import Lock
-from typing import Any, ClassVar
+from typing import Any, BinaryIO, ClassVar
 
 import av
 import fsspec
+import numpy as np
 import pyarrow as pa
 import torch
 import torchvision
 from datasets.features.features import register_feature
 from PIL import Image
 
+from lerobot.datasets.compute_stats import (
+    auto_downsample_height_width,
+    compute_image_stats,
+    estimate_num_samples,
+)
+
 
 def get_safe_default_codec():
     if importlib.util.find_spec("torchcodec"):
@@ -300,6 +314,61 @@ def decode_video_frames_torchcodec(
     return closest_frames
 
 
+# Muxer options writing fragmented MP4 files whose fragments can be appended to another file with
+# `append_fragmented_video`: the samples are in a single fragment, cut when the file is closed, whose
+# data offsets are relative to itself, after a moov without samples and without trailing index.
+FRAGMENTED_MP4_OPTIONS = {"movflags": "frag_custom+empty_moov+default_base_moof+skip_trailer"}
+# Options of `encode_video_frames` that can be set in the info of a dataset, see `update_video_encoding`
+VIDEO_ENCODING_OPTIONS = ["vcodec", "pix_fmt", "g", "crf", "preset", "threads", "fast_decode"]
+
+
+def _get_video_encoder_options(
+    vcodec: str,
+    pix_fmt: str,
+    g: int | None,
+    crf: int | None,
+    fast_decode: int,
+    preset: int | str | None,
+    threads: int | None = None,
+) -> tuple[str, dict[str, str]]:
+    """Checks the codec, and returns the pixel format and the codec options to encode with."""
+    # Check encoder availability
+    if vcodec not in ["h264", "hevc", "libsvtav1"]:
+        raise ValueError(f"Unsupported video codec: {vcodec}. Supported codecs are: h264, hevc, libsvtav1.")
+
+    # Encoders/pixel formats incompatibility check
+    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
+        logging.warning(
+            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
+        )
+        pix_fmt = "yuv420p"
+
+    # Define video codec options
+    video_options = {}
+
+    if g is not None:
+        video_options["g"] = str(g)
+
+    if crf is not None:
+        video_options["crf"] = str(crf)
+
+    if fast_decode:
+        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
+        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
+        video_options[key] = value
+
+    if vcodec == "libsvtav1":
+        video_options["preset"] = str(preset) if preset is not None else "12"
+    elif preset is not None:
+        # Named presets of x264 and x265, like "veryfast"
+        video_options["preset"] = str(preset)
+
+    if threads is not None:
+        video_options["threads"] = str(threads)
+
+    return pix_fmt, video_options
+
+
 def encode_video_frames(
     imgs_dir: Path | str,
     video_path: Path | str,
@@ -311,12 +380,19 @@ def encode_video_frames(
     fast_decode: int = 0,
     log_level: int | None = av.logging.ERROR,
     overwrite: bool = False,
-    preset: int | None = None,
+    preset: int | str | None = None,
+    fragmented: bool = False,
+    threads: int | None = None,
 ) -> None:
-    """More info on ffmpeg arguments tuning on `benchmark/video/README.md`"""
-    # Check encoder availability
-    if vcodec not in ["h264", "hevc", "libsvtav1"]:
-        raise ValueError(f"Unsupported video codec: {vcodec}. Supported codecs are: h264, hevc, libsvtav1.")
+    """More info on ffmpeg arguments tuning on `benchmark/video/README.md`
+
+    With `fragmented`, the video is written as a fragmented MP4 that can be appended to another one
+    with `append_fragmented_video`. `threads` is the number of threads of the encoder, chosen by the
+    encoder when None. The settings suited to a machine can be found with `tune_video_encoding`.
+    """
+    pix_fmt, video_options = _get_video_encoder_options(
+        vcodec, pix_fmt, g, crf, fast_decode, preset, threads
+    )
 
     video_path = Path(video_path)
     imgs_dir = Path(imgs_dir)
@@ -327,13 +403,6 @@ def encode_video_frames(
 
     video_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Encoders/pixel formats incompatibility check
-    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
-        logging.warning(
-            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
-        )
-        pix_fmt = "yuv420p"
-
     # Get input frames
     template = "frame-" + ("[0-9]" * 6) + ".png"
     input_list = sorted(
@@ -346,30 +415,13 @@ def encode_video_frames(
     with Image.open(input_list[0]) as dummy_image:
         width, height = dummy_image.size
 
-    # Define video codec options
-    video_options = {}
-
-    if g is not None:
-        video_options["g"] = str(g)
-
-    if crf is not None:
-        video_options["crf"] = str(crf)
-
-    if fast_decode:
-        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
-        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
-        video_options[key] = value
-
-    if vcodec == "libsvtav1":
-        video_options["preset"] = str(preset) if preset is not None else "12"
-
     # Set logging level
     if log_level is not None:
         # "While less efficient, it is generally preferable to modify logging with Python's logging"
         logging.getLogger("libav").setLevel(log_level)
 
     # Create and open output file (overwrite by default)
-    with av.open(str(video_path), "w") as output:
+    with av.open(str(video_path), "w", options=FRAGMENTED_MP4_OPTIONS if fragmented else {}) as output:
         output_stream = output.add_stream(vcodec, fps, options=video_options)
         output_stream.pix_fmt = pix_fmt
         output_stream.width = width
@@ -397,6 +449,341 @@ def encode_video_frames(
         raise OSError(f"Video encoding did not work. File not found: {video_path}.")
 
 
+def encode_frames_to_video(
+    frames: Iterable[np.ndarray | av.VideoFrame],
+    video_path: Path | str,
+    fps: int,
+    vcodec: str = "libsvtav1",
+    pix_fmt: str = "yuv420p",
+    g: int | None = 2,
+    crf: int | None = 30,
+    fast_decode: int = 0,
+    preset: int | str | None = None,
+    threads: int | None = None,
+) -> int:
+    """Encodes frames into a video file as they are produced, like frames edited while decoding a video.
+
+    The frames are uint8 channel-last RGB images or decoded `av.VideoFrame`, all of the size of the
+    first one. The options are those of `encode_video_frames`, like `LeRobotDatasetMetadata.video_encoding`.
+
+    Returns:
+        The number of encoded frames.
+    """
+    pix_fmt, video_options = _get_video_encoder_options(
+        vcodec, pix_fmt, g, crf, fast_decode, preset, threads
+    )
+    video_path = Path(video_path)
+    video_path.parent.mkdir(parents=True, exist_ok=True)
+
+    time_base = Fraction(1, fps)
+    num_frames = 0
+    with av.open(str(video_path), "w") as output:
+        output_stream = None
+        for frame in frames:
+            if not isinstance(frame, av.VideoFrame):
+                frame = av.VideoFrame.from_ndarray(frame, format="rgb24")
+            if output_stream is None:
+                output_stream = output.add_stream(vcodec, fps, options=video_options)
+                output_stream.pix_fmt = pix_fmt
+                output_stream.width, output_stream.height = frame.width, frame.height
+                output_stream.time_base = time_base
+
+            frame = frame.reformat(format=pix_fmt)
+            frame.pts = num_frames
+            frame.time_base = time_base
+            output.mux(output_stream.encode(frame))
+            num_frames += 1
+
+        if output_stream is None:
+            raise ValueError(f"No frames to encode into {video_path}.")
+        # Flush the encoder
+        output.mux(output_stream.encode())
+    return num_frames
+
+
+class _FrameSampler:
+    """Uniform subsample of a stream of frames of unknown length, to compute their statistics.
+
+    Every `stride`-th frame is kept, downsampled like in `sample_images`. The stride doubles
+    whenever twice the number of samples `compute_episode_stats` would use is reached.
+    """
+
+    def __init__(self):
+        self.num_frames = 0
+        self.stride = 1
+        self.samples: list[np.ndarray] = []
+
+    def add(self, frame: np.ndarray) -> None:
+        if self.num_frames % self.stride == 0:
+            image = auto_downsample_height_width(frame.transpose(2, 0, 1))
+            self.samples.append(np.ascontiguousarray(image))
+            if len(self.samples) >= 2 * estimate_num_samples(self.num_frames + 1):
+                self.samples = self.samples[::2]
+                self.stride *= 2
+        self.num_frames += 1
+
+    def get_statistics(self) -> dict[str, np.ndarray]:
+        num_samples = min(estimate_num_samples(self.num_frames), len(self.samples))
+        indices = np.round(np.linspace(0, len(self.samples) - 1, num_samples)).astype(int)
+        return compute_image_stats(np.stack([self.samples[idx] for idx in indices]))
+
+
+def _streaming_encoder_worker(
+    shm_name: str,
+    frame_shape: tuple[int, int, int],
+    num_slots: int,
+    fps: int,
+    messages: multiprocessing.Queue,
+    free_slots: multiprocessing.Semaphore,
+    results: multiprocessing.Queue,
+) -> None:
+    """Encodes the videos of a `StreamingVideoEncoder` one after the other, until it is closed.
+
+    The messages are `("open", (video_index, video_path, vcodec, pix_fmt, video_options, container_options))`,
+    `("frame", slot)`, `("finish", None)` and `("cancel", None)`. Every opened video gets a result:
+    the stats of its frames, an exception if it could not be encoded, or None once it was canceled.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray((num_slots, *frame_shape), dtype=np.uint8, buffer=shm.buf)
+    output = output_stream = sampler = error = None
+    video_index = video_path = None
+    try:
+        while (message := messages.get()) is not None:
+            command, arg = message
+            if command == "frame":
+                input_frame = None
+                if error is None:
+                    try:
+                        input_frame = av.VideoFrame.from_ndarray(frames[arg], format="rgb24")
+                        sampler.add(frames[arg])
+                    except Exception as e:
+                        error = e
+                # The frame has been copied, its slot can be reused
+                free_slots.release()
+                if input_frame is not None:
+                    try:
+                        output.mux(output_stream.encode(input_frame))
+                    except Exception as e:
+                        error = e
+            elif command == "open":
+                video_index, video_path, vcodec, pix_fmt, video_options, container_options = arg
+                sampler, error = _FrameSampler(), None
+                try:
+                    output = av.open(str(video_path), "w", options=container_options)
+                    output_stream = output.add_stream(vcodec, fps, options=video_options)
+                    output_stream.pix_fmt = pix_fmt
+                    output_stream.height, output_stream.width = frame_shape[:2]
+                except Exception as e:
+                    error = e
+            else:
+                try:
+                    if output is not None:
+                        if command == "finish" and error is None:
+                            # Flush the encoder
+                            output.mux(output_stream.encode())
+                        output.close()
+                except Exception as e:
+                    error = error or e
+                output = output_stream = None
+                if command == "cancel":
+                    Path(video_path).unlink(missing_ok=True)
+                    results.put((video_index, None))
+                elif error is not None:
+                    error = RuntimeError(f"Streaming encoding of {video_path} failed: {error!r}")
+                    results.put((video_index, error))
+                else:
+                    results.put((video_index, sampler.get_statistics()))
+    finally:
+        if output is not None:
+            output.close()
+        del frames
+        shm.close()
+
+
+class StreamingVideoEncoder:
+    """
+    Encodes videos as their frames are added, instead of writing them as images first and encoding
+    them afterwards with `encode_video_frames`.
+
+    The frames are copied into a ring of shared memory slots, encoded with PyAV by a worker process.
+    Adding a frame thus only costs a copy (it waits when all the slots are still being encoded), and
+    a video is complete shortly after its last frame. The worker also computes the statistics of
+    the frames, sampled like in `compute_episode_stats`.
+
+    The worker and its slots are kept for all the videos encoded one after the other, like the
+    episodes of a camera: `start_video` begins a new video file, `finish_video` has the worker flush
+    it while the frames of the next video are added, and `get_video_stats` waits for it to be
+    complete. The worker is started with the first frame, which sets the size of the frames of all
+    the videos, and stopped by `close`. The frames are uint8 images or float images in [0, 1],
+    channel-first or channel-last, like in `add_frame`.
+
+    Args:
+        fps: Frame rate of the videos.
+        num_slots: Number of frames that can wait to be encoded before `add_frame` blocks.
+    """
+
+    def __init__(self, fps: int, num_slots: int = 16):
+        self.fps = fps
+        self.num_slots = num_slots
+        # Video being encoded, and its number of frames
+        self.video_path: Path | None = None
+        self.num_frames = 0
+        self._num_videos = 0
+        self._open_message = None
+        self._next_slot = 0
+        self._process = None
+        self._shm = None
+        self._slots = None
+        self._results_lock = Lock()
+        self._video_results = {}
+
+    def start_video(
+        self,
+        video_path: Path | str,
+        vcodec: str = "libsvtav1",
+        pix_fmt: str = "yuv420p",
+        g: int | None = 2,
+        crf: int | None = 30,
+        fast_decode: int = 0,
+        preset: int | str | None = None,
+        fragmented: bool = False,
+        threads: int | None = None,
+    ) -> None:
+        """Starts a new video, the options are those of `encode_video_frames`."""
+        if self.video_path is not None:
+            raise RuntimeError(f"The video {self.video_path} is still being encoded.")
+        pix_fmt, video_options = _get_video_encoder_options(
+            vcodec, pix_fmt, g, crf, fast_decode, preset, threads
+        )
+        container_options = FRAGMENTED_MP4_OPTIONS if fragmented else {}
+        self.video_path = Path(video_path)
+        self.video_path.parent.mkdir(parents=True, exist_ok=True)
+        self.num_frames = 0
+        # Sent to the worker with the first frame of the video
+        self._open_message = (
+            "open",
+            (self._num_videos, self.video_path, vcodec, pix_fmt, video_options, container_options),
+        )
+        self._num_videos += 1
+
+    def _start(self, frame_shape: tuple[int, ...]) -> None:
+        if len(frame_shape) != 3 or frame_shape[-1] != 3:
+            raise ValueError(f"Expected RGB images, got frames of shape {frame_shape}.")
+        frame_size = int(np.prod(frame_shape))
+        self._shm = shared_memory.SharedMemory(create=True, size=self.num_slots * frame_size)
+        self._slots = np.ndarray((self.num_slots, *frame_shape), dtype=np.uint8, buffer=self._shm.buf)
+        self._messages = multiprocessing.Queue()
+        self._free_slots = multiprocessing.Semaphore(self.num_slots)
+        self._results = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_streaming_encoder_worker,
+            args=(
+                self._shm.name,
+                tuple(frame_shape),
+                self.num_slots,
+                self.fps,
+                self._messages,
+                self._free_slots,
+                self._results,
+            ),
+        )
+        self._process.daemon = True
+        self._process.start()
+
+    def _check_worker(self) -> None:
+        if not self._process.is_alive():
+            raise RuntimeError(f"The streaming encoder of {self.video_path} exited unexpectedly.")
+
+    def add_frame(self, frame: np.ndarray | Image.Image) -> None:
+        if self.video_path is None:
+            raise RuntimeError("No video was started with `start_video`.")
+        if isinstance(frame, Image.Image):
+            frame = np.asarray(frame.convert("RGB"))
+        if frame.ndim == 3 and frame.shape[0] == 3:
+            # Transpose from pytorch convention (C, H, W) to (H, W, C)
+            frame = frame.transpose(1, 2, 0)
+        if self._process is None:
+            self._start(frame.shape)
+        elif frame.shape != self._slots.shape[1:]:
+            raise ValueError(
+                f"Expected frames of shape {self._slots.shape[1:]} like the first one, got {frame.shape}."
+            )
+        if self._open_message is not None:
+            self._messages.put(self._open_message)
+            self._open_message = None
+
+        # Wait for a free slot, the encoder is lagging behind when there is none
+        while not self._free_slots.acquire(timeout=1.0):
+            self._check_worker()
+        slot_index = self._next_slot % self.num_slots
+        slot = self._slots[slot_index]
+        if frame.dtype == np.uint8:
+            slot[...] = frame
+        else:
+            np.multiply(frame, 255, out=slot, casting="unsafe")
+        self._messages.put(("frame", slot_index))
+        self._next_slot += 1
+        self.num_frames += 1
+
+    def finish_video(self) -> int:
+        """Has the worker flush the video and close its file, returns its index for `get_video_stats`.
+
+        The next video can be started right away.
+        """
+        if self.video_path is None or self._open_message is not None:
+            raise RuntimeError(f"No frame was added to {self.video_path}.")
+        self._messages.put(("finish", None))
+        self.video_path = None
+        return self._num_videos - 1
+
+    def get_video_stats(self, video_index: int) -> dict[str, np.ndarray]:
+        """Waits for a finished video to be complete, returns the statistics of its frames."""
+        result = self._wait_result(video_index)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def _wait_result(self, video_index: int) -> dict[str, np.ndarray] | BaseException | None:
+        # The results may be waited for from several threads, like the one finalizing episodes
+        while True:
+            with self._results_lock:
+                if video_index in self._video_results:
+                    return self._video_results.pop(video_index)
+                try:
+                    index, result = self._results.get(timeout=0.1)
+                    self._video_results[index] = result
+                except queue.Empty:
+                    self._check_worker()
+
+    def cancel_video(self) -> None:
+        """Stops encoding the current video and deletes its file."""
+        if self.video_path is None:
+            return
+        video_path, self.video_path = self.video_path, None
+        if self._open_message is not None:
+            # The worker never heard of the video
+            self._open_message = None
+            return
+        self._messages.put(("cancel", None))
+        self._wait_result(self._num_videos - 1)
+        video_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Stops the worker, the finished videos must have been waited for with `get_video_stats`."""
+        self.cancel_video()
+        if self._process is None:
+            return
+        self._messages.put(None)
+        self._process.join()
+        self._messages.close()
+        self._results.close()
+        self._slots = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+        self._process = None
+
+
 def concatenate_video_files(
     input_video_paths: list[Path | str], output_video_path: Path, overwrite: bool = True
 ):
@@ -480,6 +867,248 @@ def concatenate_video_files(
     Path(tmp_concatenate_path).unlink()
 
 
+def _read_mp4_boxes(f: BinaryIO, start: int, end: int) -> list[tuple[str, int, int, int]]:
+    """Type, offset, header size and size of the boxes between two offsets of an MP4 stream."""
+    boxes = []
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        size, box_type = struct.unpack(">I4s", f.read(8))
+        header_size = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size or offset + size > end:
+            raise ValueError(f"Invalid MP4 box '{box_type}' of size {size} at offset {offset}.")
+        boxes.append((box_type.decode("latin-1"), offset, header_size, size))
+        offset += size
+    return boxes
+
+
+def _find_mp4_box(f: BinaryIO, box_path: list[str], start: int, end: int) -> tuple[int, int] | None:
+    """Payload start and end offsets of the first box at the given path, e.g. ["moov", "mvex", "trex"]."""
+    for box_type, offset, header_size, size in _read_mp4_boxes(f, start, end):
+        if box_type == box_path[0]:
+            if len(box_path) == 1:
+                return offset + header_size, offset + size
+            return _find_mp4_box(f, box_path[1:], offset + header_size, offset + size)
+    return None
+
+
+def _read_fragmented_mp4(f: BinaryIO) -> dict | None:
+    """Reads the layout of a fragmented MP4 of a single track, returns None for other files.
+
+    Returns its ftyp and moov boxes, the (offset, size) of its sidx and free boxes if any, and the
+    (type, offset, size) of its moof and mdat boxes.
+    """
+    size = f.seek(0, io.SEEK_END)
+    boxes = _read_mp4_boxes(f, 0, size)
+    box_types = [box[0] for box in boxes]
+    if box_types[:2] != ["ftyp", "moov"] or not set(box_types[2:]) <= {"sidx", "free", "moof", "mdat"}:
+        return None
+    header_size = boxes[1][1] + boxes[1][3]
+    f.seek(0)
+    header = f.read(header_size)
+    moov = io.BytesIO(header[boxes[1][1] :])
+    num_tracks = sum(box[0] == "trak" for box in _read_mp4_boxes(moov, 8, boxes[1][3]))
+    if num_tracks != 1 or _find_mp4_box(moov, ["moov", "mvex", "trex"], 0, boxes[1][3]) is None:
+        return None
+
+    video = {"header": header, "moov": moov.getvalue(), "sidx": None, "free": None}
+    for box_type in ("sidx", "free"):
+        if box_type in box_types:
+            video[box_type] = boxes[box_types.index(box_type)][1::2]
+    video["fragments"] = [(box[0], box[1], box[3]) for box in boxes if box[0] in ("moof", "mdat")]
+    return video
+
+
+def _parse_moof(moof: bytes, default_duration: int) -> dict[str, int]:
+    """Offsets of the sequence number and decode time of a single track moof, and its duration."""
+    f = io.BytesIO(moof)
+    mfhd = _find_mp4_box(f, ["moof", "mfhd"], 0, len(moof))
+    traf = _find_mp4_box(f, ["moof", "traf"], 0, len(moof))
+    tfhd = _find_mp4_box(f, ["tfhd"], *traf)
+    tfdt = _find_mp4_box(f, ["tfdt"], *traf)
+    if tfdt is None:
+        raise ValueError("The fragment has no decode time.")
+
+    # tfhd: version and flags, track id and optional fields
+    tfhd_flags = struct.unpack_from(">I", moof, tfhd[0])[0] & 0xFFFFFF
+    offset = tfhd[0] + 8 + (8 if tfhd_flags & 0x01 else 0) + (4 if tfhd_flags & 0x02 else 0)
+    if tfhd_flags & 0x08:
+        (default_duration,) = struct.unpack_from(">I", moof, offset)
+
+    duration = 0
+    for box_type, box_offset, header_size, _ in _read_mp4_boxes(f, *traf):
+        if box_type != "trun":
+            continue
+        trun_flags, sample_count = struct.unpack_from(">II", moof, box_offset + header_size)
+        trun_flags &= 0xFFFFFF
+        if not trun_flags & 0x100:
+            duration += sample_count * default_duration
+            continue
+        # Skip the optional data offset and first sample flags
+        offset = box_offset + header_size + 8 + 4 * bin(trun_flags & 0x05).count("1")
+        sample_size = 4 * bin(trun_flags & 0xF00).count("1")
+        for _ in range(sample_count):
+            duration += struct.unpack_from(">I", moof, offset)[0]
+            offset += sample_size
+
+    return {
+        "sequence_offset": mfhd[0] + 4,
+        "sequence": struct.unpack_from(">I", moof, mfhd[0] + 4)[0],
+        "decode_time_offset": tfdt[0] + 4,
+        "decode_time_version": moof[tfdt[0]],
+        "decode_time": struct.unpack_from(">Q" if moof[tfdt[0]] == 1 else ">I", moof, tfdt[0] + 4)[0],
+        "duration": duration,
+    }
+
+
+def _write_fragment_index(
+    track_id: int, timescale: int, earliest_time: int, references: list[tuple[int, int]], capacity: int
+) -> bytes:
+    """sidx box of the (size, duration) of the fragments that follow it, then a free box reserving room for
+    `capacity` references, so that its size only depends on the capacity."""
+    free_size = 8 + 12 * (capacity - len(references))
+    # Version 1, reference id, timescale, earliest presentation time, offset of the first fragment from
+    # the end of the box (after the free box), reserved and reference count
+    sidx = struct.pack(">IIIQQHH", 1 << 24, track_id, timescale, earliest_time, free_size, 0, len(references))
+    # Every fragment starts with a key frame
+    sidx += b"".join(struct.pack(">III", size, duration, 1 << 31) for size, duration in references)
+    free = struct.pack(">I4s", free_size, b"free") + bytes(free_size - 8)
+    return struct.pack(">I4s", 8 + len(sidx), b"sidx") + sidx + free
+
+
+def _read_fragment_index(sidx: bytes) -> tuple[int, list[list[int]]] | None:
+    """Earliest presentation time and (size, duration) references of a sidx box written by
+    `_write_fragment_index`, None for other versions."""
+    if sidx[8] != 1:
+        return None
+    earliest_time, _, _, count = struct.unpack_from(">QQHH", sidx, 20)
+    references = []
+    for i in range(count):
+        size, duration, _ = struct.unpack_from(">III", sidx, 40 + 12 * i)
+        references.append([size & 0x7FFFFFFF, duration])
+    return earliest_time, references
+
+
+def append_fragmented_video(input_video_path: Path | str, output_video_path: Path | str) -> bool:
+    """
+    Append a fragmented MP4 video to another one, without remuxing the latter.
+
+    Only the bytes of the input video are written: its fragments are copied at the end of the output
+    video, with their decode times shifted to follow the output video and renumbered. Both videos must
+    have been written with `FRAGMENTED_MP4_OPTIONS` and the same encoding settings.
+
+    The output video also gets an index of its fragments (a sidx box updated in place, with room for
+    more references), so that decoders do not read all the fragments when opening it.
+
+    Args:
+        input_video_path: Path of the video to append.
+        output_video_path: Path of the video to append to.
+
+    Returns:
+        False, leaving the output video untouched, when the videos are not both fragmented MP4 of a
+        single track with identical headers. They can be concatenated with `concatenate_video_files`.
+    """
+    with open(input_video_path, "rb") as f:
+        input_video = _read_fragmented_mp4(f)
+        if input_video is None:
+            return False
+        fragments = []
+        for _, offset, size in input_video["fragments"]:
+            f.seek(offset)
+            fragments.append(bytearray(f.read(size)))
+
+    with open(output_video_path, "r+b") as f:
+        output_video = _read_fragmented_mp4(f)
+        if output_video is None or output_video["moov"] != input_video["moov"]:
+            return False
+        output_fragments = output_video["fragments"]
+        moofs = [(offset, size) for box_type, offset, size in output_fragments if box_type == "moof"]
+        if not moofs:
+            return False
+
+        moov = output_video["moov"]
+        trex = _find_mp4_box(io.BytesIO(moov), ["moov", "mvex", "trex"], 0, len(moov))
+        mdhd = _find_mp4_box(io.BytesIO(moov), ["moov", "trak", "mdia", "mdhd"], 0, len(moov))
+        # trex: version and flags, track id, default sample description index and duration
+        track_id, _, default_duration = struct.unpack_from(">III", moov, trex[0] + 4)
+        # mdhd: version and flags, creation and modification times, timescale
+        (timescale,) = struct.unpack_from(">I", moov, mdhd[0] + (20 if moov[mdhd[0]] == 1 else 12))
+
+        # (size, duration) of the fragments (a moof and the following mdat boxes) of the output video,
+        # read from its index unless fragments were added without updating it
+        index = None
+        if output_video["sidx"] is not None:
+            f.seek(output_video["sidx"][0])
+            index = _read_fragment_index(f.read(output_video["sidx"][1]))
+        if index is not None and len(index[1]) == len(moofs):
+            earliest_time, references = index
+        else:
+            references = []
+            for box_type, offset, size in output_fragments:
+                f.seek(offset)
+                if box_type == "mdat":
+                    references[-1][0] += size
+                    continue
+                moof = _parse_moof(f.read(size), default_duration)
+                references.append([size, moof["duration"]])
+                if len(references) == 1:
+                    earliest_time = moof["decode_time"]
+
+        # The input fragments start where the last fragment of the output video ends
+        f.seek(moofs[-1][0])
+        moof = _parse_moof(f.read(moofs[-1][1]), default_duration)
+        sequence = moof["sequence"]
+        decode_time = moof["decode_time"] + moof["duration"]
+        for fragment in fragments:
+            if fragment[4:8] != b"moof":
+                references[-1][0] += len(fragment)
+                continue
+            moof = _parse_moof(fragment, default_duration)
+            references.append([len(fragment), moof["duration"]])
+            sequence += 1
+            struct.pack_into(">I", fragment, moof["sequence_offset"], sequence)
+            new_decode_time = decode_time + moof["decode_time"]
+            if moof["decode_time_version"] == 0 and new_decode_time >= 2**32:
+                return False
+            struct.pack_into(
+                ">Q" if moof["decode_time_version"] == 1 else ">I",
+                fragment,
+                moof["decode_time_offset"],
+                new_decode_time,
+            )
+
+        index_size = output_fragments[0][1] - len(output_video["header"])
+        capacity = (index_size - 48) // 12 if output_video["sidx"] is not None else 0
+        if len(references) <= capacity:
+            # Write after the last fragment, then index the new fragments
+            f.seek(sum(output_fragments[-1][1:]))
+            for fragment in fragments:
+                f.write(fragment)
+            f.truncate()
+            f.seek(len(output_video["header"]))
+            f.write(_write_fragment_index(track_id, timescale, earliest_time, references, capacity))
+            return True
+
+        # Move the fragments after a larger index, doubling its capacity so that it seldom happens
+        capacity = max(64, 2 * len(references))
+        with tempfile.NamedTemporaryFile(dir=Path(output_video_path).parent, delete=False) as tmp_file:
+            tmp_file.write(output_video["header"])
+            tmp_file.write(_write_fragment_index(track_id, timescale, earliest_time, references, capacity))
+            f.seek(output_fragments[0][1])
+            shutil.copyfileobj(f, tmp_file)
+            for fragment in fragments:
+                tmp_file.write(fragment)
+    # The temporary file is only readable by its owner, keep the permissions of the video instead
+    shutil.copymode(output_video_path, tmp_file.name)
+    shutil.move(tmp_file.name, output_video_path)
+    return True
+
+
 @dataclass
 class VideoFrame:
     # TODO(rcadene, lhoestq): move to Hugging Face `datasets` repo
@@ -632,6 +1261,14 @@ class VideoEncodingManager:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        # Wait for the episodes saved in the background, which may still have to be batch encoded
+        try:
+            self.dataset.wait_for_episodes()
+        except Exception:
+            if exc_type is None:
+                raise
+            logging.exception("An episode failed to be saved while handling another exception")
+
         # Handle any remaining episodes that haven't been batch encoded
         if self.dataset.episodes_since_last_encoding > 0:
             if exc_type is not None:
@@ -652,6 +1289,7 @@ class VideoEncodingManager:
 
         # Clean up episode images if recording was interrupted
         if exc_type is not None:
+            self.dataset._cancel_streaming_encoders()
             interrupted_episode_index = self.dataset.num_episodes
             for key in self.dataset.meta.video_keys:
                 img_dir = self.dataset._get_image_file_path(
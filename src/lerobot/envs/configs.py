@@ -162,6 +162,9 @@ class PushtEnv(EnvConfig):
 class ImagePreprocessingConfig:
     crop_params_dict: dict[str, tuple[int, int, int, int]] | None = None
     resize_size: tuple[int, int] | None = None
+    # Preallocated image outputs reused in turn across steps, 0 allocates them at every step.
+    # Only safe when the processed observations are not kept longer than that many steps.
+    output_buffers: int = 0
 
 
 @dataclass
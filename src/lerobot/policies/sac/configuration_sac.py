@@ -21,6 +21,7 @@ from lerobot.configs.policies import PreTrainedConfig
 from lerobot.configs.types import NormalizationMode
 from lerobot.optim.optimizers import MultiAdamConfig
 from lerobot.utils.constants import ACTION, OBS_IMAGE, OBS_STATE
+from lerobot.utils.import_utils import is_package_available
 
 
 def is_image_feature(key: str) -> bool:
@@ -53,6 +54,40 @@ class ActorLearnerConfig:
     learner_port: int = 50051
     policy_parameters_push_frequency: int = 4
     queue_get_timeout: float = 2
+    # Wire format of actor -> learner transitions: "torch" (torch.save) or "columnar"
+    transitions_wire_format: str = "torch"
+    # Per-column compression of the columnar format: None, "lz4" or "zstd", requires the
+    # `transitions-compression` extra
+    transitions_compression: str | None = None
+    # Policy parameter broadcast: "full" state dicts or "delta" (changed tensors only)
+    parameters_sync: str = "full"
+    # Dtype of the "delta" differences: "float32", "float16", "bfloat16" or "int8"
+    parameters_delta_dtype: str = "float16"
+    # In "delta" mode, every n-th parameter message is a full keyframe
+    parameters_keyframe_interval: int = 20
+    # Transport of transitions and parameters: "grpc", or "shared_memory" when the actor
+    # and the learner run on the same host (interaction messages always use gRPC)
+    transport: str = "grpc"
+    # Prefix of the shared memory segment names, must match between actor and learner
+    shared_memory_name: str = "lerobot_rl"
+    # Transitions the shared memory ring can hold before the actor has to wait
+    shared_memory_transition_slots: int = 128
+
+    def __post_init__(self):
+        compression_packages = {"lz4": "lz4", "zstd": "zstandard"}
+        if self.transitions_compression is None:
+            return
+        if self.transitions_compression not in compression_packages:
+            raise ValueError(
+                f"Unsupported transitions_compression '{self.transitions_compression}', "
+                f"expected None or one of {list(compression_packages)}"
+            )
+        package = compression_packages[self.transitions_compression]
+        if not is_package_available(package):
+            raise ImportError(
+                f"transitions_compression='{self.transitions_compression}' requires the '{package}' package, "
+                "install it with `pip install 'lerobot[transitions-compression]'`"
+            )
 
 
 @dataclass
@@ -141,10 +176,41 @@ class SACConfig(PreTrainedConfig):
     online_steps: int = 1000000
     # Capacity of the online replay buffer
     online_buffer_capacity: int = 100000
+    # Keep the online replay buffer in memory-mapped files of the output directory: it can
+    # exceed the RAM, and resuming reopens it instead of converting it from a dataset
+    persistent_online_buffer: bool = False
     # Capacity of the offline replay buffer
     offline_buffer_capacity: int = 100000
+    # Directory caching the offline replay buffer built from the dataset, for near-instant restarts
+    offline_buffer_cache_dir: str | None = None
     # Whether to use asynchronous prefetching for the buffers
     async_prefetch: bool = False
+    # Prefetch batches onto the device through pinned staging buffers and a side CUDA
+    # stream, takes precedence over async_prefetch
+    device_prefetch: bool = False
+    # Sample the batches of the utd_ratio updates of an optimization step at once (one index
+    # draw, gather, transfer and concatenation), each update using a slice of that batch
+    fused_utd_sampling: bool = False
+    # Sample the online buffer proportionally to the TD errors (prioritized experience replay)
+    prioritized_replay: bool = False
+    # Prioritization exponent, 0 being uniform sampling
+    priority_alpha: float = 0.6
+    # Importance-sampling correction exponent, 1 fully compensates the prioritization
+    priority_beta: float = 0.4
+    # Added to the absolute TD errors so that every transition keeps a chance to be sampled
+    priority_eps: float = 1e-6
+    # Number of steps of the returns bootstrapped by the critics
+    n_step: int = 1
+    # Store the camera images of the replay buffers as uint8 instead of float32, for 4x
+    # more transitions in the same memory. They are converted back to float on the device.
+    uint8_image_storage: bool = False
+    # Store the features of the frozen pretrained vision encoder in the replay buffers, computed
+    # once per transition, instead of encoding the images of every sampled batch. The features
+    # are not augmented (DrQ).
+    replay_image_features: bool = False
+    # With replay_image_features, the online buffer does not store the images themselves.
+    # Requires persistent_online_buffer, the buffer can not be saved as a dataset anymore.
+    replay_features_only: bool = False
     # Number of steps before learning starts
     online_step_before_learning: int = 100
     # Frequency of policy updates
@@ -200,6 +266,13 @@ class SACConfig(PreTrainedConfig):
     def __post_init__(self):
         super().__post_init__()
         # Any validation specific to SAC configuration
+        frozen_pretrained_encoder = self.vision_encoder_name is not None and self.freeze_vision_encoder
+        if self.replay_image_features and not frozen_pretrained_encoder:
+            raise ValueError("replay_image_features requires a frozen pretrained vision encoder")
+        if self.replay_features_only and not (self.replay_image_features and self.persistent_online_buffer):
+            raise ValueError(
+                "replay_features_only requires replay_image_features and persistent_online_buffer"
+            )
 
     def get_optimizer_preset(self) -> MultiAdamConfig:
         return MultiAdamConfig(
@@ -153,6 +153,8 @@ class SACPolicy(
                 - done: Done mask tensor
                 - observation_feature: Optional pre-computed observation features
                 - next_observation_feature: Optional pre-computed next observation features
+                - weight: Optional importance-sampling weights (prioritized replay)
+                - discount: Optional per-sample discount of the bootstrapped value (n-step replay)
             model: Which model to compute the loss for ("actor", "critic", "discrete_critic", or "temperature")
 
         Returns:
@@ -170,7 +172,7 @@ class SACPolicy(
             done: Tensor = batch["done"]
             next_observation_features: Tensor = batch.get("next_observation_feature")
 
-            loss_critic = self.compute_loss_critic(
+            loss_critic, td_error = self.compute_loss_critic(
                 observations=observations,
                 actions=actions,
                 rewards=rewards,
@@ -178,9 +180,12 @@ class SACPolicy(
                 done=done,
                 observation_features=observation_features,
                 next_observation_features=next_observation_features,
+                weights=batch.get("weight"),
+                discounts=batch.get("discount"),
+                return_td_error=True,
             )
 
-            return {"loss_critic": loss_critic}
+            return {"loss_critic": loss_critic, "td_error": td_error}
 
         if model == "discrete_critic" and self.config.num_discrete_actions is not None:
             # Extract critic-specific components
@@ -198,6 +203,8 @@ class SACPolicy(
                 observation_features=observation_features,
                 next_observation_features=next_observation_features,
                 complementary_info=complementary_info,
+                weights=batch.get("weight"),
+                discounts=batch.get("discount"),
             )
             return {"loss_discrete_critic": loss_discrete_critic}
         if model == "actor":
@@ -252,7 +259,19 @@ class SACPolicy(
         done,
         observation_features: Tensor | None = None,
         next_observation_features: Tensor | None = None,
-    ) -> Tensor:
+        weights: Tensor | None = None,
+        discounts: Tensor | None = None,
+        return_td_error: bool = False,
+    ) -> Tensor | tuple[Tensor, Tensor]:
+        """TD loss of the critic ensemble.
+
+        `weights` are importance-sampling weights of the samples (prioritized replay) and
+        `discounts` replace `config.discount` per sample (n-step replay). With
+        `return_td_error`, the TD errors averaged over the ensemble are returned as well,
+        detached, to update the replay priorities.
+        """
+        if discounts is None:
+            discounts = self.config.discount
         with torch.no_grad():
             next_action_preds, next_log_probs, _ = self.actor(next_observations, next_observation_features)
 
@@ -276,7 +295,7 @@ class SACPolicy(
             if self.config.use_backup_entropy:
                 min_q = min_q - (self.temperature * next_log_probs)
 
-            td_target = rewards + (1 - done) * self.config.discount * min_q
+            td_target = rewards + (1 - done) * discounts * min_q
 
         # 3- compute predicted qs
         if self.config.num_discrete_actions is not None:
@@ -295,13 +314,16 @@ class SACPolicy(
         # Compute state-action value loss (TD loss) for all of the Q functions in the ensemble.
         td_target_duplicate = einops.repeat(td_target, "b -> e b", e=q_preds.shape[0])
         # You compute the mean loss of the batch for each critic and then to compute the final loss you sum them up
-        critics_loss = (
-            F.mse_loss(
-                input=q_preds,
-                target=td_target_duplicate,
-                reduction="none",
-            ).mean(dim=1)
-        ).sum()
+        td_losses = F.mse_loss(
+            input=q_preds,
+            target=td_target_duplicate,
+            reduction="none",
+        )
+        if weights is not None:
+            td_losses = td_losses * weights
+        critics_loss = td_losses.mean(dim=1).sum()
+        if return_td_error:
+            return critics_loss, (td_target_duplicate - q_preds).detach().mean(dim=0)
         return critics_loss
 
     def compute_loss_discrete_critic(
@@ -314,6 +336,8 @@ class SACPolicy(
         observation_features=None,
         next_observation_features=None,
         complementary_info=None,
+        weights=None,
+        discounts=None,
     ):
         # NOTE: We only want to keep the discrete action part
         # In the buffer we have the full action space (continuous + discrete)
@@ -322,6 +346,9 @@ class SACPolicy(
         actions_discrete = torch.round(actions_discrete)
         actions_discrete = actions_discrete.long()
 
+        if discounts is None:
+            discounts = self.config.discount
+
         discrete_penalties: Tensor | None = None
         if complementary_info is not None:
             discrete_penalties: Tensor | None = complementary_info.get("discrete_penalty")
@@ -349,7 +376,7 @@ class SACPolicy(
             rewards_discrete = rewards
             if discrete_penalties is not None:
                 rewards_discrete = rewards + discrete_penalties
-            target_discrete_q = rewards_discrete + (1 - done) * self.config.discount * target_next_discrete_q
+            target_discrete_q = rewards_discrete + (1 - done) * discounts * target_next_discrete_q
 
         # Get predicted Q-values for current observations
         predicted_discrete_qs = self.discrete_critic_forward(
@@ -360,8 +387,10 @@ class SACPolicy(
         predicted_discrete_q = torch.gather(predicted_discrete_qs, dim=1, index=actions_discrete).squeeze(-1)
 
         # Compute MSE loss between predicted and target Q-values
-        discrete_critic_loss = F.mse_loss(input=predicted_discrete_q, target=target_discrete_q)
-        return discrete_critic_loss
+        if weights is None:
+            return F.mse_loss(input=predicted_discrete_q, target=target_discrete_q)
+        discrete_critic_loss = F.mse_loss(input=predicted_discrete_q, target=target_discrete_q, reduction="none")
+        return (discrete_critic_loss * weights).mean()
 
     def compute_loss_temperature(self, observations, observation_features: Tensor | None = None) -> Tensor:
         """Compute the temperature loss"""
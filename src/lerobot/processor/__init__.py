@@ -74,6 +74,7 @@ from .policy_robot_bridge import (
     PolicyActionToRobotActionProcessorStep,
     RobotActionToPolicyActionProcessorStep,
 )
+from .profiler import PipelineProfiler, profile_pipelines
 from .rename_processor import RenameObservationsProcessorStep
 from .tokenizer_processor import TokenizerProcessorStep
 
@@ -108,6 +109,8 @@ __all__ = [
     "PolicyAction",
     "PolicyActionProcessorStep",
     "PolicyProcessorPipeline",
+    "PipelineProfiler",
+    "profile_pipelines",
     "ProcessorKwargs",
     "ProcessorStep",
     "ProcessorStepRegistry",
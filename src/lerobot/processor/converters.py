@@ -16,7 +16,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from functools import singledispatch
 from typing import Any
 
@@ -209,6 +209,13 @@ def create_transition(
     }
 
 
+def _to_robot_observation(observation: Any) -> Any:
+    # Read-only observation views, like array-backed robot observations, become a dict the steps can update
+    if isinstance(observation, Mapping) and not isinstance(observation, dict):
+        return dict(observation)
+    return observation
+
+
 def robot_action_observation_to_transition(
     action_observation: tuple[RobotAction, RobotObservation],
 ) -> EnvTransition:
@@ -226,6 +233,7 @@ def robot_action_observation_to_transition(
         raise ValueError("action_observation should be a tuple type with an action and observation")
 
     action, observation = action_observation
+    observation = _to_robot_observation(observation)
 
     if action is not None and not isinstance(action, dict):
         raise ValueError(f"Action should be a RobotAction type got {type(action)}")
@@ -261,6 +269,7 @@ def observation_to_transition(observation: RobotObservation) -> EnvTransition:
     Returns:
         An `EnvTransition` containing the formatted observation.
     """
+    observation = _to_robot_observation(observation)
     if not isinstance(observation, dict):
         raise ValueError(f"Observation should be a RobotObservation type got {type(observation)}")
     return create_transition(observation=observation)
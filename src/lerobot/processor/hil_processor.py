@@ -180,14 +180,31 @@ class ImageCropResizeProcessorStep(ObservationProcessorStep):
     the specified transformations. It handles device placement, moving tensors to the
     CPU if necessary for operations not supported on certain accelerators like MPS.
 
+    The cameras whose crops have the same shape are resized together into one output
+    tensor. On accelerators, their crops are stacked into a staging buffer reused across
+    steps and resized by a single interpolation call.
+
     Attributes:
         crop_params_dict: A dictionary mapping image keys to cropping parameters
                           (top, left, height, width).
         resize_size: A tuple (height, width) to resize all images to.
+        device: Device the images are cropped and resized on (and returned on), e.g. the
+                device of the pipeline. If None, the images stay on their device.
+        output_buffers: Number of preallocated output buffers used in turn across steps. The
+                        images of an observation are then overwritten `output_buffers` steps
+                        later, so they must not be kept longer. If 0, outputs are allocated
+                        at every step.
     """
 
     crop_params_dict: dict[str, tuple[int, int, int, int]] | None = None
     resize_size: tuple[int, int] | None = None
+    device: str | None = None
+    output_buffers: int = 0
+
+    def __post_init__(self):
+        self._staging: dict[tuple, torch.Tensor] = {}
+        self._outputs: dict[tuple, list[torch.Tensor]] = {}
+        self._step = 0
 
     def observation(self, observation: dict) -> dict:
         """
@@ -203,6 +220,8 @@ class ImageCropResizeProcessorStep(ObservationProcessorStep):
             return observation
 
         new_observation = dict(observation)
+        # Cropped images to resize, grouped by shape, dtype and device
+        groups: dict[tuple, list[tuple[str, torch.Tensor]]] = {}
 
         # Process all image keys in the observation
         for key in observation:
@@ -210,7 +229,8 @@ class ImageCropResizeProcessorStep(ObservationProcessorStep):
                 continue
 
             image = observation[key]
-            device = image.device
+            device = image.device if self.device is None else torch.device(self.device)
+            image = image.to(device, non_blocking=True)
             # NOTE (maractingi): No mps kernel for crop and resize, so we need to move to cpu
             if device.type == "mps":
                 image = image.cpu()
@@ -218,13 +238,59 @@ class ImageCropResizeProcessorStep(ObservationProcessorStep):
             if self.crop_params_dict is not None and key in self.crop_params_dict:
                 crop_params = self.crop_params_dict[key]
                 image = F.crop(image, *crop_params)
+            if self.resize_size is not None and image.is_floating_point() and image.ndim >= 3:
+                groups.setdefault((tuple(image.shape), image.dtype, image.device, device), []).append(
+                    (key, image)
+                )
+                continue
             if self.resize_size is not None:
                 image = F.resize(image, self.resize_size)
                 image = image.clamp(0.0, 1.0)
             new_observation[key] = image.to(device)
 
+        for (_, _, _, device), images in groups.items():
+            resized = self._resize([image for _, image in images])
+            for (key, _), image in zip(images, resized, strict=True):
+                new_observation[key] = image.to(device)
+
+        self._step += 1
         return new_observation
 
+    def _resize(self, images: list[torch.Tensor]) -> torch.Tensor:
+        """Resizes same-shape images with antialiased bilinear interpolation, like `F.resize`."""
+        shape = (len(images), *images[0].shape)
+        group = (shape, images[0].dtype, images[0].device)
+        output_shape = (*shape[:-2], *self.resize_size)
+        if self.output_buffers > 0:
+            if group not in self._outputs:
+                self._outputs[group] = [images[0].new_empty(output_shape) for _ in range(self.output_buffers)]
+            output = self._outputs[group][self._step % self.output_buffers]
+        else:
+            output = images[0].new_empty(output_shape)
+
+        # Same interpolation as F.resize, copied into the output buffer
+        def resize_into(image: torch.Tensor, out: torch.Tensor):
+            resized = torch.nn.functional.interpolate(
+                image.reshape(-1, *image.shape[-3:]),
+                size=self.resize_size,
+                mode="bilinear",
+                align_corners=False,
+                antialias=True,
+            )
+            out.view(-1, *out.shape[-3:]).copy_(resized)
+
+        if images[0].device.type == "cpu":
+            # CPU kernels gain nothing from batching, skip the copy into the staging buffer
+            for image, out in zip(images, output, strict=True):
+                resize_into(image, out)
+        else:
+            staging = self._staging.get(group)
+            if staging is None:
+                staging = self._staging[group] = images[0].new_empty(shape)
+            torch.stack(images, out=staging)
+            resize_into(staging, output)
+        return output.clamp_(0.0, 1.0)
+
     def get_config(self) -> dict[str, Any]:
         """
         Returns the configuration of the step for serialization.
@@ -235,6 +301,8 @@ class ImageCropResizeProcessorStep(ObservationProcessorStep):
         return {
             "crop_params_dict": self.crop_params_dict,
             "resize_size": self.resize_size,
+            "device": self.device,
+            "output_buffers": self.output_buffers,
         }
 
     def transform_features(
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per-step latency profiler for `DataProcessorPipeline`.
+
+The profiler attaches to pipelines through their before/after step hooks, so pipelines
+that are not profiled run exactly as before. For every step call it records:
+- the CPU wall time;
+- the GPU time between two CUDA events, when CUDA is in use;
+- the bytes of the tensors the step allocated (tensors of its output whose storage was
+  not in its input).
+
+It keeps rolling p50/p95/p99 of the last calls of every step and exports all the calls
+as a Chrome trace, to open in https://ui.perfetto.dev or chrome://tracing.
+
+Example:
+    with profile_pipelines("trace.json", {"preprocessor": preprocessor}):
+        for batch in batches:
+            preprocessor(batch)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import torch
+
+from .core import EnvTransition
+from .pipeline import DataProcessorPipeline
+
+
+def _tensors(value: Any) -> Iterator[torch.Tensor]:
+    if isinstance(value, torch.Tensor):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _tensors(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _tensors(item)
+
+
+def _storages(transition: EnvTransition) -> set[int]:
+    return {tensor.untyped_storage().data_ptr() for tensor in _tensors(transition)}
+
+
+class PipelineProfiler:
+    """Times every step of the attached pipelines.
+
+    Args:
+        window: Number of last calls of every step the rolling percentiles are computed on.
+        max_trace_events: Number of last step calls kept for the Chrome trace.
+    """
+
+    def __init__(self, window: int = 1000, max_trace_events: int = 1_000_000):
+        self.window = window
+        self._wall_ms: dict[str, deque[float]] = {}
+        self._cuda_ms: dict[str, deque[float]] = {}
+        self._alloc_bytes: dict[str, deque[int]] = {}
+        self._events: deque[dict] = deque(maxlen=max_trace_events)
+        # Step calls whose CUDA events have not completed yet
+        self._pending: deque[tuple[str, dict, torch.cuda.Event, torch.cuda.Event]] = deque()
+        # Step calls in progress, by pipeline and thread
+        self._open: dict[tuple[int, int], tuple] = {}
+        self._tracks: dict[tuple[int, int], int] = {}
+        self._track_names: dict[int, str] = {}
+        self._hooks: list[tuple[DataProcessorPipeline, Any, Any]] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def attach(self, pipeline: DataProcessorPipeline, name: str | None = None) -> None:
+        """Profiles the steps of a pipeline, until `detach`."""
+        name = name or pipeline.name
+        step_names = [f"{name}/{idx}:{type(step).__name__}" for idx, step in enumerate(pipeline.steps)]
+
+        def before_step(idx: int, transition: EnvTransition):
+            cuda_start = None
+            if torch.cuda.is_available() and torch.cuda.is_initialized():
+                cuda_start = torch.cuda.Event(enable_timing=True)
+                cuda_start.record()
+            storages = _storages(transition)
+            key = (id(pipeline), threading.get_ident())
+            self._open[key] = (storages, cuda_start, time.perf_counter_ns())
+
+        def after_step(idx: int, transition: EnvTransition):
+            end_ns = time.perf_counter_ns()
+            key = (id(pipeline), threading.get_ident())
+            if key not in self._open:
+                # Attached while the step was running
+                return
+            storages, cuda_start, start_ns = self._open.pop(key)
+            cuda_end = None
+            if cuda_start is not None:
+                cuda_end = torch.cuda.Event(enable_timing=True)
+                cuda_end.record()
+            output_storages = {
+                tensor.untyped_storage().data_ptr(): tensor.untyped_storage().nbytes()
+                for tensor in _tensors(transition)
+            }
+            alloc_bytes = sum(
+                nbytes for data_ptr, nbytes in output_storages.items() if data_ptr not in storages
+            )
+            self._record(step_names[idx], key, name, start_ns, end_ns, alloc_bytes, cuda_start, cuda_end)
+
+        pipeline.register_before_step_hook(before_step)
+        pipeline.register_after_step_hook(after_step)
+        self._hooks.append((pipeline, before_step, after_step))
+
+    def detach(self) -> None:
+        """Stops profiling all the attached pipelines."""
+        for pipeline, before_step, after_step in self._hooks:
+            pipeline.unregister_before_step_hook(before_step)
+            pipeline.unregister_after_step_hook(after_step)
+        self._hooks.clear()
+
+    def _record(self, step_name, key, pipeline_name, start_ns, end_ns, alloc_bytes, cuda_start, cuda_end):
+        with self._lock:
+            if key not in self._tracks:
+                self._tracks[key] = len(self._tracks)
+                self._track_names[self._tracks[key]] = f"{pipeline_name} ({threading.current_thread().name})"
+            event = {
+                "name": step_name.split(":", 1)[1],
+                "cat": pipeline_name,
+                "ph": "X",
+                "ts": (start_ns - self._origin_ns) / 1e3,
+                "dur": (end_ns - start_ns) / 1e3,
+                "pid": os.getpid(),
+                "tid": self._tracks[key],
+                "args": {"step": step_name, "alloc_bytes": alloc_bytes},
+            }
+            self._events.append(event)
+            self._wall_ms.setdefault(step_name, deque(maxlen=self.window)).append((end_ns - start_ns) / 1e6)
+            self._alloc_bytes.setdefault(step_name, deque(maxlen=self.window)).append(alloc_bytes)
+            if cuda_start is not None:
+                self._pending.append((step_name, event, cuda_start, cuda_end))
+            self._resolve_cuda_events(wait=False)
+
+    def _resolve_cuda_events(self, wait: bool) -> None:
+        # Reading the GPU time of a step requires its events to have completed, so it is done
+        # lazily instead of synchronizing at every step
+        while self._pending:
+            step_name, event, cuda_start, cuda_end = self._pending[0]
+            if wait:
+                cuda_end.synchronize()
+            elif not cuda_end.query():
+                return
+            self._pending.popleft()
+            cuda_ms = cuda_start.elapsed_time(cuda_end)
+            event["args"]["cuda_ms"] = cuda_ms
+            self._cuda_ms.setdefault(step_name, deque(maxlen=self.window)).append(cuda_ms)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Rolling statistics of every step: wall and CUDA time percentiles in ms, mean allocations."""
+        with self._lock:
+            self._resolve_cuda_events(wait=True)
+            summary = {}
+            for step_name, wall_ms in self._wall_ms.items():
+                wall = np.asarray(wall_ms)
+                stats = {
+                    "calls": len(wall),
+                    "p50_ms": float(np.percentile(wall, 50)),
+                    "p95_ms": float(np.percentile(wall, 95)),
+                    "p99_ms": float(np.percentile(wall, 99)),
+                    "mean_alloc_bytes": float(np.mean(self._alloc_bytes[step_name])),
+                }
+                if step_name in self._cuda_ms:
+                    cuda = np.asarray(self._cuda_ms[step_name])
+                    stats.update(
+                        {
+                            "cuda_p50_ms": float(np.percentile(cuda, 50)),
+                            "cuda_p95_ms": float(np.percentile(cuda, 95)),
+                            "cuda_p99_ms": float(np.percentile(cuda, 99)),
+                        }
+                    )
+                summary[step_name] = stats
+            return summary
+
+    def log_summary(self) -> None:
+        for step_name, stats in self.summary().items():
+            cuda = f" | cuda p50 {stats['cuda_p50_ms']:.3f} ms" if "cuda_p50_ms" in stats else ""
+            logging.info(
+                f"{step_name}: p50 {stats['p50_ms']:.3f} ms | p95 {stats['p95_ms']:.3f} ms | "
+                f"p99 {stats['p99_ms']:.3f} ms{cuda} | alloc {stats['mean_alloc_bytes'] / 2**20:.2f} MiB"
+            )
+
+    def dump_chrome_trace(self, path: str | Path) -> None:
+        """Writes the recorded step calls as a Chrome trace JSON file."""
+        with self._lock:
+            self._resolve_cuda_events(wait=True)
+            metadata = [
+                {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+                for tid, name in self._track_names.items()
+            ]
+            trace = {"traceEvents": metadata + list(self._events), "displayTimeUnit": "ms"}
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(trace, f)
+        logging.info(f"Processor trace written to {path}")
+
+
+@contextmanager
+def profile_pipelines(
+    trace_path: str | Path | None, pipelines: dict[str, DataProcessorPipeline | None]
+) -> Iterator[PipelineProfiler | None]:
+    """Profiles pipelines within the context, then logs the step latencies and writes the trace.
+
+    Nothing is attached to the pipelines when `trace_path` is None.
+
+    Args:
+        trace_path: Path of the Chrome trace JSON file, or None to disable profiling.
+        pipelines: Pipelines to profile by name, None values are skipped.
+    """
+    if trace_path is None:
+        yield None
+        return
+
+    profiler = PipelineProfiler()
+    for name, pipeline in pipelines.items():
+        if pipeline is not None:
+            profiler.attach(pipeline, name)
+    try:
+        yield profiler
+    finally:
+        profiler.detach()
+        profiler.log_summary()
+        profiler.dump_chrome_trace(trace_path)
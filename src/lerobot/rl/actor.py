@@ -64,8 +64,10 @@ from lerobot.configs.train import TrainRLServerPipelineConfig
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
 from lerobot.processor import TransitionKey, UnnormalizerProcessorStep
+from lerobot.rl.parameter_sync import ParameterDeltaDecoder
 from lerobot.rl.process import ProcessSignalHandler
-from lerobot.rl.queue import get_last_item_from_queue
+from lerobot.rl.queue import get_all_items_from_queue, get_last_item_from_queue
+from lerobot.rl.shared_memory_transport import ActorSharedMemoryTransport
 from lerobot.robots import so100_follower  # noqa: F401
 from lerobot.teleoperators import gamepad, so101_leader  # noqa: F401
 from lerobot.teleoperators.utils import TeleopEvents
@@ -77,6 +79,7 @@ from lerobot.transport.utils import (
     receive_bytes_in_chunks,
     send_bytes_in_chunks,
     transitions_to_bytes,
+    transitions_to_columnar_bytes,
 )
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.robot_utils import precise_sleep
@@ -276,6 +279,19 @@ def act_with_policy(
     policy = policy.eval()
     assert isinstance(policy, nn.Module)
 
+    parameter_decoder = None
+    if cfg.policy.actor_learner_config.parameters_sync == "delta":
+        parameter_decoder = ParameterDeltaDecoder(policy_parameter_modules(policy))
+
+    # Same-host deployments exchange transitions and parameters through shared memory
+    shared_transport = None
+    if cfg.policy.actor_learner_config.transport == "shared_memory":
+        shared_transport = ActorSharedMemoryTransport(
+            name=cfg.policy.actor_learner_config.shared_memory_name,
+            transition_slots=cfg.policy.actor_learner_config.shared_memory_transition_slots,
+            modules=policy_parameter_modules(policy),
+        )
+
     obs, info = online_env.reset()
     env_processor.reset()
     action_processor.reset()
@@ -298,6 +314,8 @@ def act_with_policy(
         start_time = time.perf_counter()
         if shutdown_event.is_set():
             logging.info("[ACTOR] Shutting down act_with_policy")
+            if shared_transport is not None:
+                shared_transport.close()
             return
 
         observation = {
@@ -398,15 +416,28 @@ def act_with_policy(
             list_len=len(list_transition_to_send_to_learner)
             logger.debug(f"lenth of list_transition_to_send_to_learner: {list_len}")
             
-            update_policy_parameters(policy=policy,
-                                     parameters_queue=parameters_queue,
-                                     device=device)
+            if shared_transport is not None:
+                if shared_transport.update_parameters():
+                    logging.info("[ACTOR] Load new parameters from Learner.")
+            else:
+                update_policy_parameters(policy=policy,
+                                         parameters_queue=parameters_queue,
+                                         device=device,
+                                         parameter_decoder=parameter_decoder)
 
             if len(list_transition_to_send_to_learner) > 0:
-                push_transitions_to_transport_queue(
-                    transitions=list_transition_to_send_to_learner,
-                    transitions_queue=transitions_queue,
-                )
+                if shared_transport is not None:
+                    shared_transport.push_transitions(
+                        list_transition_to_send_to_learner)
+                else:
+                    push_transitions_to_transport_queue(
+                        transitions=list_transition_to_send_to_learner,
+                        transitions_queue=transitions_queue,
+                        wire_format=cfg.policy.actor_learner_config.
+                        transitions_wire_format,
+                        compression=cfg.policy.actor_learner_config.
+                        transitions_compression,
+                    )
                 list_transition_to_send_to_learner = []
 
             stats = get_frequency_stats(policy_timer)
@@ -454,6 +485,9 @@ def act_with_policy(
             dt_time = time.perf_counter() - start_time
             precise_sleep(1 / cfg.env.fps - dt_time)
 
+    if shared_transport is not None:
+        shared_transport.close()
+
 
 #  Communication Functions - Group all gRPC/messaging functions
 
@@ -705,8 +739,27 @@ def interactions_stream(
 #  Policy functions
 
 
-def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue,
-                             device):
+def policy_parameter_modules(policy: SACPolicy) -> dict[str, nn.Module]:
+    """Modules the learner sends parameters for, keyed like its state dicts."""
+    modules = {"policy": policy.actor}
+    if getattr(policy, "discrete_critic", None) is not None:
+        modules["discrete_critic"] = policy.discrete_critic
+    return modules
+
+
+def update_policy_parameters(policy: SACPolicy,
+                             parameters_queue: Queue,
+                             device,
+                             parameter_decoder: ParameterDeltaDecoder
+                             | None = None):
+    if parameter_decoder is not None:
+        # Deltas build on each other: apply every message, in order, in place
+        for bytes_message in get_all_items_from_queue(parameters_queue):
+            if parameter_decoder.apply(bytes_to_state_dict(bytes_message)):
+                logging.info(
+                    f"[ACTOR] Applied parameters {parameter_decoder.seq} from Learner.")
+        return
+
     bytes_state_dict = get_last_item_from_queue(parameters_queue, block=False)
     if bytes_state_dict is not None:
         logging.info("[ACTOR] Load new parameters from Learner.")
@@ -740,14 +793,30 @@ def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue,
 #  Utilities functions
 
 
-def push_transitions_to_transport_queue(transitions: list, transitions_queue):
+def push_transitions_to_transport_queue(transitions: list,
+                                        transitions_queue,
+                                        wire_format: str = "torch",
+                                        compression: str | None = None):
     """Send transitions to learner in smaller chunks to avoid network issues.
 
     Args:
         transitions: List of transitions to send
         message_queue: Queue to send messages to learner
-        chunk_size: Size of each chunk to send
+        wire_format: "torch" to pickle with torch.save, "columnar" to stack
+            every key and send raw tensor buffers
+        compression: Optional per-column compression of the columnar format
     """
+    if wire_format == "columnar":
+        # Stacking does one device-to-host copy and one NaN check per key
+        transitions_queue.put(
+            transitions_to_columnar_bytes(transitions,
+                                          compression=compression,
+                                          check_nan=True))
+        return
+    if wire_format != "torch":
+        raise ValueError(
+            f"Unknown transitions wire format '{wire_format}', expected 'torch' or 'columnar'")
+
     transition_to_send_to_learner = []
     for transition in transitions:
         tr = move_transition_to_device(transition=transition, device="cpu")
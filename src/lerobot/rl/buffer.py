@@ -15,19 +15,37 @@
 # limitations under the License.
 
 import functools
+import hashlib
+import json
+import os
+import queue
+import threading
 from collections.abc import Callable, Sequence
 from contextlib import suppress
+from pathlib import Path
 from typing import TypedDict
 from loguru import logger
 
 import torch
 import torch.nn.functional as F  # noqa: N812
 from tqdm import tqdm
+from typing_extensions import NotRequired
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.online_buffer import _make_memmap_safe
+from lerobot.datasets.utils import hf_transform_to_torch
+from lerobot.datasets.video_utils import decode_video_frames
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, REWARD
 from lerobot.utils.transition import Transition
 
+# Header of a replay buffer stored in memory-mapped files, see `ReplayBuffer.flush`
+STORAGE_HEADER = "header.json"
+STORAGE_HEADER_VERSION = 1
+# States encoded at once by the feature encoder when loading a dataset
+FEATURE_ENCODING_BATCH_SIZE = 256
+# Camera frames decoded at once when loading a dataset, bounds the float frames held in memory
+DATASET_DECODING_BATCH_SIZE = 256
+
 
 class BatchTransition(TypedDict):
     state: dict[str, torch.Tensor]
@@ -37,6 +55,77 @@ class BatchTransition(TypedDict):
     done: torch.Tensor
     truncated: torch.Tensor
     complementary_info: dict[str, torch.Tensor | float | int] | None = None
+    # Prioritized replay only: importance-sampling weights and the sampled storage
+    # indices, to pass back to `ReplayBuffer.update_priorities`
+    weight: NotRequired[torch.Tensor]
+    index: NotRequired[torch.Tensor]
+    # n-step replay only: discount of the bootstrapped value, gamma ** steps
+    discount: NotRequired[torch.Tensor]
+    # With a feature encoder only: the stored image features of state and next_state
+    observation_feature: NotRequired[dict[str, torch.Tensor]]
+    next_observation_feature: NotRequired[dict[str, torch.Tensor]]
+
+
+class SumTree:
+    """Binary segment tree over `capacity` priorities for O(log N) prioritized sampling.
+
+    Every node holds the sum and the minimum of the priorities below it. Updates and
+    sampling walk the tree level by level for the whole batch at once, so a batch
+    costs O(log N) vectorized operations instead of a Python loop per element.
+    """
+
+    def __init__(self, capacity: int, device: str = "cpu"):
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0.")
+        self.capacity = capacity
+        self.depth = max(0, (capacity - 1).bit_length())
+        self._num_leaves = 1 << self.depth
+        self._sums = torch.zeros(2 * self._num_leaves, dtype=torch.float64, device=device)
+        self._mins = torch.full((2 * self._num_leaves,), float("inf"), dtype=torch.float64, device=device)
+
+    @property
+    def total(self) -> float:
+        return self._sums[1].item()
+
+    @property
+    def min(self) -> float:
+        """Smallest non-zero priority."""
+        return self._mins[1].item()
+
+    def update(self, indices: torch.Tensor, priorities: torch.Tensor):
+        """Set the priorities of `indices`, then refresh their ancestors."""
+        nodes = indices.to(self._sums.device, torch.long) + self._num_leaves
+        priorities = priorities.to(self._sums.device, torch.float64)
+        self._sums[nodes] = priorities
+        # Zero-priority leaves can not be sampled, they do not count for the minimum
+        self._mins[nodes] = torch.where(priorities > 0, priorities, torch.inf)
+
+        for _ in range(self.depth):
+            nodes = torch.unique(nodes // 2)
+            self._sums[nodes] = self._sums[2 * nodes] + self._sums[2 * nodes + 1]
+            self._mins[nodes] = torch.minimum(self._mins[2 * nodes], self._mins[2 * nodes + 1])
+
+    def sample(self, batch_size: int, num_batches: int = 1) -> tuple[torch.Tensor, torch.Tensor]:
+        """Draw `batch_size` indices proportionally to their priority, stratified over the total.
+
+        With `num_batches` above 1, that many batches are drawn one after the other, each
+        stratified over the whole total. Returns the indices and their priorities.
+        """
+        device = self._sums.device
+        segment = self._sums[1] / batch_size
+        strata = torch.arange(batch_size, device=device).repeat(num_batches)
+        targets = (strata + torch.rand(batch_size * num_batches, device=device)) * segment
+
+        nodes = torch.ones(batch_size * num_batches, dtype=torch.long, device=device)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            left_sums = self._sums[left]
+            # Never step into an empty subtree, rounding could otherwise reach unused leaves
+            go_right = (targets >= left_sums) & (self._sums[left + 1] > 0)
+            targets = torch.where(go_right, targets - left_sums, targets)
+            nodes = left + go_right
+
+        return nodes - self._num_leaves, self._sums[nodes]
 
 
 def random_crop_vectorized(images: torch.Tensor, output_size: tuple) -> torch.Tensor:
@@ -88,6 +177,18 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        prioritized: bool = False,
+        priority_alpha: float = 0.6,
+        priority_beta: float = 0.4,
+        priority_eps: float = 1e-6,
+        n_step: int = 1,
+        gamma: float = 0.99,
+        image_keys: Sequence[str] | None = None,
+        image_storage_dtype: torch.dtype = torch.float32,
+        storage_dir: str | Path | None = None,
+        persist_interval: int = 1000,
+        feature_encoder: Callable[[dict[str, torch.Tensor]], dict[str, torch.Tensor]] | None = None,
+        keep_encoded_images: bool = True,
     ):
         """
         Replay buffer for storing transitions.
@@ -105,9 +206,39 @@ class ReplayBuffer:
                 Using "cpu" can help save GPU memory.
             optimize_memory (bool): If True, optimizes memory by not storing duplicate next_states when
                 they can be derived from states. This is useful for large datasets where next_state[i] = state[i+1].
+            prioritized (bool): Sample transitions proportionally to their priority (PER) instead of
+                uniformly. Batches then carry importance-sampling `weight`s and the sampled `index`es,
+                to be passed to `update_priorities` with the TD errors.
+            priority_alpha (float): How much prioritization is used, 0 being uniform.
+            priority_beta (float): Exponent of the importance-sampling correction, 1 fully compensates.
+            priority_eps (float): Added to the absolute TD errors so no transition gets a zero priority.
+            n_step (int): Number of steps of the discounted returns computed at sample time. Above 1,
+                batches carry the `discount` (gamma ** steps) to apply to the bootstrapped value.
+            gamma (float): Discount factor of the n-step returns.
+            image_keys (List[str]): The state keys holding camera images. Defaults to the keys
+                starting with `observation.image`.
+            image_storage_dtype (torch.dtype): dtype of the stored images. With `torch.uint8`, images
+                in [0, 1] are quantized to 8 bits (4x less memory and host to device traffic), and
+                converted back to float32 on `device` when sampling.
+            storage_dir (str | Path | None): Directory of memory-mapped files holding the storage, instead
+                of process memory. The buffer can then be larger than the RAM, and survives a restart:
+                a buffer created on a directory of a previous one reopens it. Requires a CPU storage
+                device. Priorities are not persisted, reopened transitions get the maximal priority.
+            persist_interval (int): With `storage_dir`, `flush` is called every `persist_interval`
+                added transitions. Transitions added since the last flush are lost on a crash.
+            feature_encoder (Optional[Callable]): A frozen image encoder, mapping a batch of states to
+                features per image key (e.g. `SACObservationEncoder.get_cached_image_features`). The
+                images are encoded once when they are added, and batches carry the stored features in
+                `observation_feature` and `next_observation_feature`. The features are not augmented.
+            keep_encoded_images (bool): With a `feature_encoder`, also store the encoded images. Without
+                them, the buffer is much smaller but can not be converted to a dataset anymore.
         """
         if capacity <= 0:
             raise ValueError("Capacity must be greater than 0.")
+        if n_step < 1:
+            raise ValueError("n_step must be greater than or equal to 1.")
+        if image_storage_dtype not in (torch.float32, torch.uint8):
+            raise ValueError(f"Unsupported image_storage_dtype {image_storage_dtype}, use float32 or uint8.")
 
         self.capacity = capacity
         self.device = device
@@ -123,6 +254,16 @@ class ReplayBuffer:
         # If no state_keys provided, default to an empty list
         self.state_keys = state_keys if state_keys is not None else []
 
+        self.image_keys = image_keys
+        self.image_storage_dtype = image_storage_dtype
+        # State keys stored as uint8, known once the storage is initialized
+        self.uint8_keys: set[str] = set()
+
+        self.feature_encoder = feature_encoder
+        self.keep_encoded_images = keep_encoded_images
+        # Image keys with stored features, known once the storage is initialized
+        self.feature_keys: list[str] = []
+
         self.image_augmentation_function = image_augmentation_function
 
         if image_augmentation_function is None:
@@ -130,6 +271,34 @@ class ReplayBuffer:
             self.image_augmentation_function = torch.compile(base_function)
         self.use_drq = use_drq
 
+        self.n_step = n_step
+        self.gamma = gamma
+
+        self.prioritized = prioritized
+        self.priority_alpha = priority_alpha
+        self.priority_beta = priority_beta
+        self.priority_eps = priority_eps
+        if prioritized:
+            self.priority_tree = SumTree(capacity, device=storage_device)
+            # New transitions get the largest priority seen so far
+            self.max_priority = 1.0
+            # The sampler may run in a prefetch thread while the learner updates priorities
+            self._priority_lock = threading.Lock()
+            # With optimize_memory, the newest transition waits for its next state
+            self._pending_index: int | None = None
+            self._pending_priority = 0.0
+
+        self.storage_dir = Path(storage_dir) if storage_dir is not None else None
+        self.persist_interval = persist_interval
+        self._adds_since_flush = 0
+        self._memmaps = []
+        if self.storage_dir is not None:
+            if torch.device(storage_device).type != "cpu":
+                raise ValueError("A replay buffer in a storage_dir must use the 'cpu' storage_device.")
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            if (self.storage_dir / STORAGE_HEADER).exists():
+                self._reopen_storage()
+
     def _initialize_storage(
         self,
         state: dict[str, torch.Tensor],
@@ -138,52 +307,161 @@ class ReplayBuffer:
     ):
         """Initialize the storage tensors based on the first transition."""
         # Determine shapes from the first transition
-        state_shapes = {key: val.squeeze(0).shape for key, val in state.items()}
-        action_shape = action.squeeze(0).shape
+        state_shapes = {key: tuple(val.squeeze(0).shape) for key, val in state.items()}
+        action_shape = tuple(action.squeeze(0).shape)
+
+        if self.image_storage_dtype == torch.uint8:
+            image_keys = self.image_keys
+            if image_keys is None:
+                image_keys = [key for key in state if key.startswith(OBS_IMAGE)]
+            self.uint8_keys = {key for key in image_keys if key in state}
+
+        # Shape of one transition and dtype of every storage tensor
+        layout = {}
+        if self.feature_encoder is not None:
+            for key, value in self._encode_features(_as_batch_of_one(state)).items():
+                layout[f"feature.{key}"] = (tuple(value.shape[1:]), torch.float32)
+                if not self.optimize_memory:
+                    layout[f"next_feature.{key}"] = (tuple(value.shape[1:]), torch.float32)
+                if not self.keep_encoded_images:
+                    del state_shapes[key]
+        for key, shape in state_shapes.items():
+            dtype = torch.uint8 if key in self.uint8_keys else torch.float32
+            layout[f"state.{key}"] = (shape, dtype)
+            if not self.optimize_memory:
+                # Standard approach: store states and next_states separately
+                layout[f"next_state.{key}"] = (shape, dtype)
+        layout["action"] = (action_shape, torch.float32)
+        layout["reward"] = ((), torch.float32)
+        layout["done"] = ((), torch.bool)
+        layout["truncated"] = ((), torch.bool)
+
+        if complementary_info is not None:
+            for key, value in complementary_info.items():
+                if isinstance(value, torch.Tensor):
+                    layout[f"complementary_info.{key}"] = (tuple(value.squeeze(0).shape), torch.float32)
+                elif isinstance(value, (int | float)):
+                    # Handle scalar values similar to reward
+                    layout[f"complementary_info.{key}"] = ((), torch.float32)
+                else:
+                    raise ValueError(f"Unsupported type {type(value)} for complementary_info[{key}]")
 
-        # Pre-allocate tensors for storage
-        self.states = {
-            key: torch.empty((self.capacity, *shape), device=self.storage_device)
-            for key, shape in state_shapes.items()
-        }
-        self.actions = torch.empty((self.capacity, *action_shape), device=self.storage_device)
-        self.rewards = torch.empty((self.capacity,), device=self.storage_device)
+        self._allocate_storage(layout, has_complementary_info=complementary_info is not None)
 
+    def _allocate_storage(
+        self,
+        layout: dict[str, tuple[tuple[int, ...], torch.dtype]],
+        has_complementary_info: bool,
+        reopen: bool = False,
+    ):
+        """Pre-allocate the storage tensors described by `layout`, in memory or in `storage_dir`."""
+        storage = {}
+        self._memmaps = []
+        for name, (shape, dtype) in layout.items():
+            if self.storage_dir is None:
+                storage[name] = torch.empty((self.capacity, *shape), dtype=dtype, device=self.storage_device)
+                continue
+            array = _make_memmap_safe(
+                filename=self.storage_dir / f"{name}.bin",
+                dtype=torch.empty(0, dtype=dtype).numpy().dtype,
+                mode="r+" if reopen else "w+",
+                shape=(self.capacity, *shape),
+            )
+            self._memmaps.append(array)
+            storage[name] = torch.from_numpy(array)
+        self._storage_layout = layout
+
+        self.states = {name[len("state.") :]: t for name, t in storage.items() if name.startswith("state.")}
         if not self.optimize_memory:
-            # Standard approach: store states and next_states separately
-            self.next_states = {
-                key: torch.empty((self.capacity, *shape), device=self.storage_device)
-                for key, shape in state_shapes.items()
-            }
+            self.next_states = {key: storage[f"next_state.{key}"] for key in self.states}
         else:
             # Memory-optimized approach: don't allocate next_states buffer
             # Just create a reference to states for consistent API
             self.next_states = self.states  # Just a reference for API consistency
+        self.features = {
+            name[len("feature.") :]: t for name, t in storage.items() if name.startswith("feature.")
+        }
+        if not self.optimize_memory:
+            self.next_features = {key: storage[f"next_feature.{key}"] for key in self.features}
+        else:
+            self.next_features = self.features
+        self.feature_keys = list(self.features)
+        self.actions = storage["action"]
+        self.rewards = storage["reward"]
+        self.dones = storage["done"]
+        self.truncateds = storage["truncated"]
+
+        # Storage for complementary_info
+        self.has_complementary_info = has_complementary_info
+        prefix = "complementary_info."
+        self.complementary_info = {
+            name[len(prefix) :]: tensor for name, tensor in storage.items() if name.startswith(prefix)
+        }
+        self.complementary_info_keys = list(self.complementary_info)
 
-        self.dones = torch.empty((self.capacity,), dtype=torch.bool, device=self.storage_device)
-        self.truncateds = torch.empty((self.capacity,), dtype=torch.bool, device=self.storage_device)
+        self.initialized = True
 
-        # Initialize storage for complementary_info
-        self.has_complementary_info = complementary_info is not None
-        self.complementary_info_keys = []
-        self.complementary_info = {}
+    def flush(self):
+        """Make the stored transitions durable when the buffer lives in `storage_dir`.
 
-        if self.has_complementary_info:
-            self.complementary_info_keys = list(complementary_info.keys())
-            # Pre-allocate tensors for each key in complementary_info
-            for key, value in complementary_info.items():
-                if isinstance(value, torch.Tensor):
-                    value_shape = value.squeeze(0).shape
-                    self.complementary_info[key] = torch.empty(
-                        (self.capacity, *value_shape), device=self.storage_device
-                    )
-                elif isinstance(value, (int | float)):
-                    # Handle scalar values similar to reward
-                    self.complementary_info[key] = torch.empty((self.capacity,), device=self.storage_device)
-                else:
-                    raise ValueError(f"Unsupported type {type(value)} for complementary_info[{key}]")
+        The memory-mapped files are synced first, then the header recording the layout,
+        `position` and `size` is replaced atomically: after a crash, the buffer reopens
+        in the state of its last flush.
+        """
+        self._adds_since_flush = 0
+        if self.storage_dir is None or not self.initialized:
+            return
+
+        for array in self._memmaps:
+            array.flush()
+        header = {
+            "version": STORAGE_HEADER_VERSION,
+            "capacity": self.capacity,
+            "optimize_memory": self.optimize_memory,
+            "position": self.position,
+            "size": self.size,
+            "has_complementary_info": self.has_complementary_info,
+            "uint8_keys": sorted(self.uint8_keys),
+            "layout": {
+                name: {"shape": list(shape), "dtype": str(dtype).removeprefix("torch.")}
+                for name, (shape, dtype) in self._storage_layout.items()
+            },
+        }
+        tmp_path = self.storage_dir / f"{STORAGE_HEADER}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(header, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.storage_dir / STORAGE_HEADER)
+
+    def _reopen_storage(self):
+        """Map the storage files of a previous buffer back, as recorded by its last `flush`."""
+        with open(self.storage_dir / STORAGE_HEADER) as f:
+            header = json.load(f)
+        if header["version"] != STORAGE_HEADER_VERSION:
+            raise ValueError(f"Unsupported replay buffer storage version {header['version']}.")
+        if header["capacity"] != self.capacity or header["optimize_memory"] != self.optimize_memory:
+            raise ValueError(
+                f"The replay buffer in {self.storage_dir} was created with capacity={header['capacity']} "
+                f"and optimize_memory={header['optimize_memory']}."
+            )
 
-        self.initialized = True
+        self.uint8_keys = set(header["uint8_keys"])
+        layout = {
+            name: (tuple(spec["shape"]), getattr(torch, spec["dtype"]))
+            for name, spec in header["layout"].items()
+        }
+        has_features = any(name.startswith("feature.") for name in layout)
+        if has_features != (self.feature_encoder is not None):
+            raise ValueError(
+                f"The replay buffer in {self.storage_dir} was created "
+                f"{'with' if has_features else 'without'} a feature_encoder."
+            )
+        self._allocate_storage(layout, has_complementary_info=header["has_complementary_info"], reopen=True)
+        self.position = header["position"]
+        self.size = header["size"]
+        if self.prioritized and self.size > 0:
+            self._reset_priorities()
 
     def __len__(self):
         return self.size
@@ -205,11 +483,18 @@ class ReplayBuffer:
 
         # Store the transition in pre-allocated tensors
         for key in self.states:
-            self.states[key][self.position].copy_(state[key].squeeze(dim=0))
+            self.states[key][self.position].copy_(self._encode_state(key, state[key].squeeze(dim=0)))
 
             if not self.optimize_memory:
                 # Only store next_states if not optimizing memory
-                self.next_states[key][self.position].copy_(next_state[key].squeeze(dim=0))
+                self.next_states[key][self.position].copy_(
+                    self._encode_state(key, next_state[key].squeeze(dim=0))
+                )
+
+        if self.feature_keys:
+            self._store_features(_as_batch_of_one(state), self.features, self.position)
+            if not self.optimize_memory:
+                self._store_features(_as_batch_of_one(next_state), self.next_features, self.position)
 
         self.actions[self.position].copy_(action.squeeze(dim=0))
         self.rewards[self.position] = reward
@@ -227,38 +512,289 @@ class ReplayBuffer:
                     elif isinstance(value, (int | float)):
                         self.complementary_info[key][self.position] = value
 
+        if self.prioritized:
+            self._add_priority(self.position)
+
         self.position = (self.position + 1) % self.capacity
         self.size = min(self.size + 1, self.capacity)
 
-    def sample(self, batch_size: int) -> BatchTransition:
-        """Sample a random batch of transitions and collate them into batched tensors."""
-        if not self.initialized:
-            raise RuntimeError("Cannot sample from an empty buffer. Add transitions first.")
+        if self.storage_dir is not None:
+            self._adds_since_flush += 1
+            if self._adds_since_flush >= self.persist_interval:
+                self.flush()
 
-        batch_size = min(batch_size, self.size)
-        high = max(0, self.size - 1) if self.optimize_memory and self.size < self.capacity else self.size
+    def add_batch(
+        self,
+        state: dict[str, torch.Tensor],
+        action: torch.Tensor,
+        reward: torch.Tensor,
+        next_state: dict[str, torch.Tensor],
+        done: torch.Tensor,
+        truncated: torch.Tensor,
+        complementary_info: dict[str, torch.Tensor] | None = None,
+    ):
+        """Saves consecutive transitions given as columns, like the ones stacked by the columnar
+        transition messages.
 
-        # Random indices for sampling - create on the same device as storage
-        idx = torch.randint(low=0, high=high, size=(batch_size,), device=self.storage_device)
+        Every tensor holds the values `add` would receive for each transition, stacked along a
+        new first dimension. Each column is written with a single slice copy, two when the
+        transitions wrap around the end of the storage.
+        """
+        num_transitions = len(action)
+        if num_transitions == 0:
+            return
+        if not self.initialized:
+            self._initialize_storage(
+                state={key: value[0] for key, value in state.items()},
+                action=action[0],
+                complementary_info=(
+                    {key: value[0] for key, value in complementary_info.items()}
+                    if complementary_info is not None
+                    else None
+                ),
+            )
 
-        # Identify image keys that need augmentation
-        image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if self.use_drq else []
+        # Only the newest transitions fit in the buffer
+        first = max(0, num_transitions - self.capacity)
+        while first < num_transitions:
+            count = min(num_transitions - first, self.capacity - self.position)
+            rows = slice(first, first + count)
+            dest = slice(self.position, self.position + count)
+            for key in self.states:
+                stored = self.states[key][dest]
+                stored.copy_(self._encode_state(key, state[key][rows].reshape(stored.shape)))
+                if not self.optimize_memory:
+                    stored = self.next_states[key][dest]
+                    stored.copy_(self._encode_state(key, next_state[key][rows].reshape(stored.shape)))
+
+            if self.feature_keys:
+                self._store_features(_as_batch(state, rows), self.features, self.position)
+                if not self.optimize_memory:
+                    self._store_features(_as_batch(next_state, rows), self.next_features, self.position)
+
+            self.actions[dest].copy_(action[rows].reshape(self.actions[dest].shape))
+            self.rewards[dest].copy_(reward[rows].reshape(count))
+            self.dones[dest].copy_(done[rows].reshape(count))
+            self.truncateds[dest].copy_(truncated[rows].reshape(count))
+            if complementary_info is not None and self.has_complementary_info:
+                for key in self.complementary_info_keys:
+                    if key in complementary_info:
+                        stored = self.complementary_info[key][dest]
+                        stored.copy_(complementary_info[key][rows].reshape(stored.shape))
+
+            if self.prioritized:
+                self._add_priorities(self.position, count)
+
+            self.position = (self.position + count) % self.capacity
+            self.size = min(self.size + count, self.capacity)
+            first += count
+
+        if self.storage_dir is not None:
+            self._adds_since_flush += num_transitions
+            if self._adds_since_flush >= self.persist_interval:
+                self.flush()
+
+    def _encode_state(self, key: str, value: torch.Tensor) -> torch.Tensor:
+        """Quantize float images in [0, 1] of the uint8 keys, other values are stored as is."""
+        if key not in self.uint8_keys or value.dtype == torch.uint8:
+            return value
+        return value.mul(255).round_().clamp_(0, 255)
+
+    def _decode_state(self, key: str, value: torch.Tensor) -> torch.Tensor:
+        """Back to float32 in [0, 1], meant to run on `device` after the transfer of the uint8 data."""
+        if key not in self.uint8_keys:
+            return value
+        return value.float().div_(255)
+
+    def _encode_features(self, state: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        """Image features of a batch of float states, from the frozen `feature_encoder`."""
+        with torch.no_grad():
+            return self.feature_encoder(state)
+
+    def _store_features(self, state: dict[str, torch.Tensor], storage: dict[str, torch.Tensor], start: int):
+        """Encode a batch of consecutive states and write their features from index `start`.
+
+        Large batches (whole episodes when loading a dataset) are encoded in chunks.
+        """
+        num_states = next(iter(state.values())).shape[0]
+        for offset in range(0, num_states, FEATURE_ENCODING_BATCH_SIZE):
+            end = offset + FEATURE_ENCODING_BATCH_SIZE
+            chunk = {key: value[offset:end] for key, value in state.items()}
+            for key, value in self._encode_features(chunk).items():
+                storage[key][start + offset : start + offset + len(value)].copy_(value)
+
+    def _add_priority(self, index: int):
+        priority = self.max_priority**self.priority_alpha
+        with self._priority_lock:
+            if not self.optimize_memory:
+                self.priority_tree.update(torch.tensor([index]), torch.tensor([priority]))
+                return
+
+            # The newest transition has no next state yet: it only becomes sampleable
+            # once the next one is added, like in uniform sampling
+            indices, priorities = [index], [0.0]
+            if self._pending_index is not None and self._pending_index != index:
+                indices.append(self._pending_index)
+                priorities.append(self._pending_priority)
+            self.priority_tree.update(torch.tensor(indices), torch.tensor(priorities))
+            self._pending_index, self._pending_priority = index, priority
+
+    def _add_priorities(self, start: int, count: int):
+        """`_add_priority` for the `count` transitions stored from `start`, in one tree update."""
+        priority = self.max_priority**self.priority_alpha
+        indices = torch.arange(start, start + count)
+        priorities = torch.full((count,), priority, dtype=torch.float64)
+        with self._priority_lock:
+            if not self.optimize_memory:
+                self.priority_tree.update(indices, priorities)
+                return
 
-        # Create batched state and next_state
-        batch_state = {}
-        batch_next_state = {}
+            # Only the newest transition is left without a next state, see `_add_priority`
+            priorities[-1] = 0.0
+            if self._pending_index is not None and not start <= self._pending_index < start + count:
+                indices = torch.cat([indices, torch.tensor([self._pending_index])])
+                pending_priority = torch.tensor([self._pending_priority], dtype=torch.float64)
+                priorities = torch.cat([priorities, pending_priority])
+            self.priority_tree.update(indices, priorities)
+            self._pending_index, self._pending_priority = start + count - 1, priority
 
-        # First pass: load all state tensors to target device
-        for key in self.states:
-            batch_state[key] = self.states[key][idx].to(self.device)
+    def update_priorities(self, indices: torch.Tensor, td_errors: torch.Tensor):
+        """Set the priorities of sampled transitions from their TD errors.
 
+        Args:
+            indices: The `index` of a batch returned by `sample`.
+            td_errors: One TD error per index, e.g. averaged over the critic ensemble.
+        """
+        if not self.prioritized:
+            raise RuntimeError("update_priorities requires a prioritized replay buffer.")
+
+        errors = td_errors.detach().abs().to(self.storage_device, torch.float64).flatten() + self.priority_eps
+        indices = indices.to(self.storage_device, torch.long).flatten()
+        with self._priority_lock:
+            self.max_priority = max(self.max_priority, errors.max().item())
+            priorities = errors**self.priority_alpha
+            if self._pending_index is not None:
+                # Keep the newest transition out of reach until its next state exists
+                pending = indices == self._pending_index
+                if pending.any():
+                    self._pending_priority = priorities[pending][-1].item()
+                    indices, priorities = indices[~pending], priorities[~pending]
+            self.priority_tree.update(indices, priorities)
+
+    def _sample_indices(
+        self, batch_size: int, num_batches: int = 1
+    ) -> tuple[torch.Tensor, torch.Tensor | None]:
+        """Storage indices of `num_batches` batches to sample, one after the other, and their
+        importance-sampling weights if prioritized."""
+        if not self.prioritized:
+            high = max(0, self.size - 1) if self.optimize_memory and self.size < self.capacity else self.size
+            # Random indices for sampling - create on the same device as storage
+            idx = torch.randint(
+                low=0, high=high, size=(batch_size * num_batches,), device=self.storage_device
+            )
+            return idx, None
+
+        with self._priority_lock:
+            # Each batch is stratified over all the priorities, not over a slice of them
+            idx, priorities = self.priority_tree.sample(batch_size, num_batches)
+            min_priority = self.priority_tree.min
+        # (N * P(i)) ** -beta, normalized by its largest value (the smallest priority)
+        weights = (min_priority / priorities) ** self.priority_beta
+        return idx, weights.float()
+
+    def _n_step_returns(self, idx: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Discounted n-step returns of the transitions at `idx`, read from the circular storage.
+
+        Accumulation stops at the end of an episode (done or truncated) and at the newest
+        transition. Returns the returns, the storage index of the last step whose next
+        state, done and truncated flags are used, and gamma ** steps.
+        """
+        steps = torch.arange(self.n_step, device=idx.device)
+        window = (idx.unsqueeze(1) + steps) % self.capacity  # (B, n)
+
+        # Transitions stored after idx, the last one also needs its next state with optimize_memory
+        newer = (self.position - 1 - idx) % self.capacity
+        if self.optimize_memory:
+            newer = newer - 1
+        in_storage = steps.unsqueeze(0) <= newer.unsqueeze(1)
+
+        ends = self.dones[window] | self.truncateds[window]
+        # A step counts if no episode ended at any of the previous steps
+        not_ended_before = torch.ones_like(ends)
+        not_ended_before[:, 1:] = torch.cumprod(~ends[:, :-1], dim=1).bool()
+        valid = not_ended_before & in_storage
+        valid[:, 0] = True
+
+        discounts = self.gamma**steps.to(self.rewards.dtype)
+        returns = (self.rewards[window] * discounts * valid).sum(dim=1)
+        num_steps = valid.sum(dim=1)
+        last_idx = window.gather(1, (num_steps - 1).unsqueeze(1)).squeeze(1)
+        return returns, last_idx, self.gamma ** num_steps.to(self.rewards.dtype)
+
+    def _sample_columns(
+        self, batch_size: int, num_batches: int = 1
+    ) -> tuple[dict[str, tuple[torch.Tensor, torch.Tensor]], dict[str, torch.Tensor]]:
+        """Draw a batch of indices and describe the batch as flat columns, without copying any data.
+
+        Returns the gathered columns as `name: (storage, indices)` pairs, and the columns
+        computed at sample time (n-step returns, importance-sampling weights, ...). Both live
+        on the storage device, in the storage dtypes. The indices of `num_batches` batches
+        are drawn at once, one batch after the other.
+        """
+        idx, weights = self._sample_indices(min(batch_size, self.size), num_batches)
+
+        # Index of the transition providing next_state, done and truncated
+        last_idx = idx
+        computed = {}
+        if self.n_step > 1:
+            computed["reward"], last_idx, computed["discount"] = self._n_step_returns(idx)
+        if self.prioritized:
+            computed["weight"] = weights
+
+        gathered = {}
+        next_idx = (last_idx + 1) % self.capacity
+        for key in self.states:
+            gathered[f"state/{key}"] = (self.states[key], idx)
             if not self.optimize_memory:
                 # Standard approach - load next_states directly
-                batch_next_state[key] = self.next_states[key][idx].to(self.device)
+                gathered[f"next_state/{key}"] = (self.next_states[key], last_idx)
             else:
                 # Memory-optimized approach - get next_state from the next index
-                next_idx = (idx + 1) % self.capacity
-                batch_next_state[key] = self.states[key][next_idx].to(self.device)
+                gathered[f"next_state/{key}"] = (self.states[key], next_idx)
+        for key in self.feature_keys:
+            gathered[f"feature/{key}"] = (self.features[key], idx)
+            if not self.optimize_memory:
+                gathered[f"next_feature/{key}"] = (self.next_features[key], last_idx)
+            else:
+                gathered[f"next_feature/{key}"] = (self.features[key], next_idx)
+
+        gathered["action"] = (self.actions, idx)
+        if "reward" not in computed:
+            gathered["reward"] = (self.rewards, idx)
+        gathered["done"] = (self.dones, last_idx)
+        gathered["truncated"] = (self.truncateds, last_idx)
+        if self.has_complementary_info:
+            for key in self.complementary_info_keys:
+                gathered[f"complementary_info/{key}"] = (self.complementary_info[key], idx)
+        return gathered, computed
+
+    def _collate(self, columns: dict[str, torch.Tensor], index: torch.Tensor) -> BatchTransition:
+        """Build a batch from flat columns: move them to `device`, decode uint8 images and augment.
+
+        The columns may already be on `device`, then nothing is copied.
+        """
+        columns = {name: value.to(self.device) for name, value in columns.items()}
+        batch_size = columns["action"].shape[0]
+
+        # Create batched state and next_state, uint8 images are converted to float only once on device
+        batch_state = {}
+        batch_next_state = {}
+        for key in self.states:
+            batch_state[key] = self._decode_state(key, columns[f"state/{key}"])
+            batch_next_state[key] = self._decode_state(key, columns[f"next_state/{key}"])
+
+        # Identify image keys that need augmentation
+        image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if self.use_drq else []
 
         # Apply image augmentation in a batched way if needed
         if self.use_drq and image_keys:
@@ -281,34 +817,56 @@ class ReplayBuffer:
                 # Next states start after the states at index (i*2+1)*batch_size and also take up batch_size slots
                 batch_next_state[key] = augmented_images[(i * 2 + 1) * batch_size : (i + 1) * 2 * batch_size]
 
-        # Sample other tensors
-        batch_actions = self.actions[idx].to(self.device)
-        batch_rewards = self.rewards[idx].to(self.device)
-        batch_dones = self.dones[idx].to(self.device).float()
-        batch_truncateds = self.truncateds[idx].to(self.device).float()
-
         # Sample complementary_info if available
         batch_complementary_info = None
         if self.has_complementary_info:
             batch_complementary_info = {}
             for key in self.complementary_info_keys:
-                batch_complementary_info[key] = self.complementary_info[key][idx].to(self.device)
+                batch_complementary_info[key] = columns[f"complementary_info/{key}"]
 
-        return BatchTransition(
+        batch = BatchTransition(
             state=batch_state,
-            action=batch_actions,
-            reward=batch_rewards,
+            action=columns["action"],
+            reward=columns["reward"],
             next_state=batch_next_state,
-            done=batch_dones,
-            truncated=batch_truncateds,
+            done=columns["done"].float(),
+            truncated=columns["truncated"].float(),
             complementary_info=batch_complementary_info,
         )
+        if self.prioritized:
+            batch["weight"] = columns["weight"]
+            # Indices stay on the storage device, for `update_priorities`
+            batch["index"] = index
+        if self.n_step > 1:
+            batch["discount"] = columns["discount"]
+        if self.feature_keys:
+            batch["observation_feature"] = {key: columns[f"feature/{key}"] for key in self.feature_keys}
+            batch["next_observation_feature"] = {
+                key: columns[f"next_feature/{key}"] for key in self.feature_keys
+            }
+        return batch
+
+    def sample(self, batch_size: int, num_batches: int = 1) -> BatchTransition:
+        """Sample a random batch of transitions and collate them into batched tensors.
+
+        With `num_batches` above 1, that many batches are sampled in one pass (one draw, one
+        gather and one transfer per column), returned as a single batch of `num_batches *
+        batch_size` transitions to be split with `split_batch_transitions`.
+        """
+        if not self.initialized:
+            raise RuntimeError("Cannot sample from an empty buffer. Add transitions first.")
+
+        gathered, computed = self._sample_columns(batch_size, num_batches)
+        columns = {name: storage[indices] for name, (storage, indices) in gathered.items()}
+        return self._collate(columns | computed, index=gathered["action"][1])
 
     def get_iterator(
         self,
         batch_size: int,
         async_prefetch: bool = True,
         queue_size: int = 2,
+        device_prefetch: bool = False,
+        num_batches: int = 1,
     ):
         """
         Creates an infinite iterator that yields batches of transitions.
@@ -318,22 +876,28 @@ class ReplayBuffer:
             batch_size (int): Size of batches to sample
             async_prefetch (bool): Whether to use asynchronous prefetching with threads (default: True)
             queue_size (int): Number of batches to prefetch (default: 2)
+            device_prefetch (bool): Prefetch with a `DevicePrefetcher` (pinned staging buffers and
+                copies on a side CUDA stream), takes precedence over `async_prefetch` (default: False)
+            num_batches (int): Batches sampled at once and yielded together, see `sample` (default: 1)
 
         Yields:
             BatchTransition: Batched transitions
         """
+        kwargs = {"batch_size": batch_size, "queue_size": queue_size, "num_batches": num_batches}
         while True:  # Create an infinite loop
-            if async_prefetch:
+            if device_prefetch:
+                iterator = self._get_device_prefetch_iterator(**kwargs)
+            elif async_prefetch:
                 # Get the standard iterator
-                iterator = self._get_async_iterator(queue_size=queue_size, batch_size=batch_size)
+                iterator = self._get_async_iterator(**kwargs)
             else:
-                iterator = self._get_naive_iterator(batch_size=batch_size, queue_size=queue_size)
+                iterator = self._get_naive_iterator(**kwargs)
 
             # Yield all items from the iterator
             with suppress(StopIteration):
                 yield from iterator
 
-    def _get_async_iterator(self, batch_size: int, queue_size: int = 2):
+    def _get_async_iterator(self, batch_size: int, queue_size: int = 2, num_batches: int = 1):
         """
         Create an iterator that continuously yields prefetched batches in a
         background thread. The design is intentionally simple and avoids busy
@@ -343,6 +907,7 @@ class ReplayBuffer:
             batch_size (int): Size of batches to sample.
             queue_size (int): Maximum number of prefetched batches to keep in
                 memory.
+            num_batches (int): Batches sampled at once, see `sample`.
 
         Yields:
             BatchTransition: A batch sampled from the replay buffer.
@@ -357,7 +922,7 @@ class ReplayBuffer:
             """Continuously put sampled batches into the queue until shutdown."""
             while not shutdown_event.is_set():
                 try:
-                    batch = self.sample(batch_size)
+                    batch = self.sample(batch_size, num_batches)
                     # The timeout ensures the thread unblocks if the queue is full
                     # and the shutdown event gets set meanwhile.
                     data_queue.put(batch, block=True, timeout=0.5)
@@ -387,13 +952,34 @@ class ReplayBuffer:
             # Give the producer thread a bit of time to finish.
             producer_thread.join(timeout=1.0)
 
-    def _get_naive_iterator(self, batch_size: int, queue_size: int = 2):
+    def _get_device_prefetch_iterator(self, batch_size: int, queue_size: int = 2, num_batches: int = 1):
+        """
+        Yields batches prefetched by a `DevicePrefetcher`, stopped when the iterator is closed.
+
+        Args:
+            batch_size (int): Size of batches to sample.
+            queue_size (int): Number of staging buffers, i.e. batches prefetched ahead.
+            num_batches (int): Batches sampled at once, see `sample`.
+
+        Yields:
+            BatchTransition: A batch sampled from the replay buffer, already on `device`.
+        """
+        prefetcher = DevicePrefetcher(
+            self, batch_size=batch_size, num_slots=queue_size, num_batches=num_batches
+        )
+        try:
+            yield from prefetcher
+        finally:
+            prefetcher.close()
+
+    def _get_naive_iterator(self, batch_size: int, queue_size: int = 2, num_batches: int = 1):
         """
         Creates a simple non-threaded iterator that yields batches.
 
         Args:
             batch_size (int): Size of batches to sample
             queue_size (int): Number of initial batches to prefetch
+            num_batches (int): Batches sampled at once, see `sample`
 
         Yields:
             BatchTransition: Batch transitions
@@ -404,7 +990,7 @@ class ReplayBuffer:
 
         def enqueue(n):
             for _ in range(n):
-                data = self.sample(batch_size)
+                data = self.sample(batch_size, num_batches)
                 queue.append(data)
 
         enqueue(queue_size)
@@ -423,6 +1009,17 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        prioritized: bool = False,
+        priority_alpha: float = 0.6,
+        priority_beta: float = 0.4,
+        priority_eps: float = 1e-6,
+        n_step: int = 1,
+        gamma: float = 0.99,
+        image_keys: Sequence[str] | None = None,
+        image_storage_dtype: torch.dtype = torch.float32,
+        cache_dir: str | Path | None = None,
+        feature_encoder: Callable[[dict[str, torch.Tensor]], dict[str, torch.Tensor]] | None = None,
+        keep_encoded_images: bool = True,
     ) -> "ReplayBuffer":
         """
         Convert a LeRobotDataset into a ReplayBuffer.
@@ -438,6 +1035,19 @@ class ReplayBuffer:
             use_drq (bool): Whether to use DrQ image augmentation when sampling.
             storage_device (str): Device for storing tensor data. Using "cpu" saves GPU memory.
             optimize_memory (bool): If True, reduces memory usage by not duplicating state data.
+            prioritized (bool): Use prioritized sampling, see `ReplayBuffer`.
+            priority_alpha (float): How much prioritization is used, 0 being uniform.
+            priority_beta (float): Exponent of the importance-sampling correction.
+            priority_eps (float): Added to the absolute TD errors so no transition gets a zero priority.
+            n_step (int): Number of steps of the returns computed at sample time.
+            gamma (float): Discount factor of the n-step returns.
+            image_keys (Sequence[str] | None): The state keys holding camera images.
+            image_storage_dtype (torch.dtype): dtype of the stored images, float32 or uint8.
+            cache_dir (str | Path | None): Directory where the converted storage tensors are cached.
+                Converting the same dataset again then only loads them back. Not used with a
+                `feature_encoder`, the features depend on its weights.
+            feature_encoder (Callable | None): Frozen image encoder of the features, see `ReplayBuffer`.
+            keep_encoded_images (bool): With a `feature_encoder`, also store the encoded images.
 
         Returns:
             ReplayBuffer: The replay buffer with dataset transitions.
@@ -459,52 +1069,19 @@ class ReplayBuffer:
             use_drq=use_drq,
             storage_device=storage_device,
             optimize_memory=optimize_memory,
+            prioritized=prioritized,
+            priority_alpha=priority_alpha,
+            priority_beta=priority_beta,
+            priority_eps=priority_eps,
+            n_step=n_step,
+            gamma=gamma,
+            image_keys=image_keys,
+            image_storage_dtype=image_storage_dtype,
+            feature_encoder=feature_encoder,
+            keep_encoded_images=keep_encoded_images,
         )
 
-        # Convert dataset to transitions
-        list_transition = cls._lerobotdataset_to_transitions(dataset=lerobot_dataset, state_keys=state_keys)
-
-        # Initialize the buffer with the first transition to set up storage tensors
-        if list_transition:
-            first_transition = list_transition[0]
-            first_state = {k: v.to(device) for k, v in first_transition["state"].items()}
-            first_action = first_transition[ACTION].to(device)
-
-            # Get complementary info if available
-            first_complementary_info = None
-            if (
-                "complementary_info" in first_transition
-                and first_transition["complementary_info"] is not None
-            ):
-                first_complementary_info = {
-                    k: v.to(device) for k, v in first_transition["complementary_info"].items()
-                }
-
-            replay_buffer._initialize_storage(
-                state=first_state, action=first_action, complementary_info=first_complementary_info
-            )
-
-        # Fill the buffer with all transitions
-        for data in list_transition:
-            for k, v in data.items():
-                if isinstance(v, dict):
-                    for key, tensor in v.items():
-                        v[key] = tensor.to(storage_device)
-                elif isinstance(v, torch.Tensor):
-                    data[k] = v.to(storage_device)
-
-            action = data[ACTION]
-
-            replay_buffer.add(
-                state=data["state"],
-                action=action,
-                reward=data["reward"],
-                next_state=data["next_state"],
-                done=data["done"],
-                truncated=False,  # NOTE: Truncation are not supported yet in lerobot dataset
-                complementary_info=data.get("complementary_info", None),
-            )
-
+        replay_buffer._load_lerobot_dataset(lerobot_dataset, state_keys=state_keys, cache_dir=cache_dir)
         return replay_buffer
 
     def to_lerobot_dataset(
@@ -519,6 +1096,8 @@ class ReplayBuffer:
         """
         if self.size == 0:
             raise ValueError("The replay buffer is empty. Cannot convert to a dataset.")
+        if not self.keep_encoded_images and self.feature_keys:
+            raise ValueError("The replay buffer does not store its images, only their features.")
 
         # Create features dictionary for the dataset
         features = {
@@ -575,7 +1154,7 @@ class ReplayBuffer:
 
             # Fill the data for state keys
             for key in self.states:
-                frame_dict[key] = self.states[key][actual_idx].cpu()
+                frame_dict[key] = self._decode_state(key, self.states[key][actual_idx].cpu())
 
             # Fill action, reward, done
             frame_dict[ACTION] = self.actions[actual_idx].cpu()
@@ -612,6 +1191,213 @@ class ReplayBuffer:
 
         return lerobot_dataset
 
+    def _load_lerobot_dataset(
+        self,
+        dataset: LeRobotDataset,
+        state_keys: Sequence[str] | None,
+        cache_dir: str | Path | None = None,
+    ):
+        """Fill the empty buffer with a whole dataset, column by column.
+
+        Non-camera columns are read at once from the parquet data, camera frames are decoded
+        sequentially, `DATASET_DECODING_BATCH_SIZE` frames of an episode at a time, and each
+        batch is written into the preallocated storage before the next one is decoded.
+
+        The states, actions, rewards and done flags are those of `_lerobotdataset_to_transitions`:
+        the next state is the next frame of the episode, or the frame itself at `done` and at the
+        end of an episode. Like when its transitions were added one by one, `truncated` is always
+        False, datasets do not record truncations.
+        """
+        if state_keys is None:
+            raise ValueError("State keys must be provided when converting LeRobotDataset to Transitions.")
+
+        if cache_dir is not None and self.feature_encoder is not None:
+            logger.info("Not caching the replay buffer, the stored features depend on the feature encoder")
+            cache_dir = None
+
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = Path(cache_dir) / f"{self._dataset_cache_key(dataset, state_keys)}.pt"
+            if cache_path.exists():
+                logger.info(f"Loading the replay buffer from its cache {cache_path}")
+                self._load_storage_cache(torch.load(cache_path, mmap=True, weights_only=True))
+                return
+
+        # Datasets being recorded load their parquet data lazily
+        dataset._ensure_hf_dataset_loaded()
+        hf_dataset = dataset.hf_dataset
+        num_frames = len(hf_dataset)
+        if num_frames == 0:
+            return
+
+        camera_keys = [key for key in state_keys if key in dataset.meta.camera_keys]
+        info_prefix = "complementary_info."
+        complementary_info_keys = [key for key in hf_dataset.column_names if key.startswith(info_prefix)]
+        columns = [
+            key
+            for key in (*state_keys, ACTION, REWARD, DONE, "episode_index", "timestamp")
+            if key in hf_dataset.column_names and key not in camera_keys
+        ] + complementary_info_keys
+        table = hf_dataset.with_format("torch", columns=columns)[:]
+
+        # Episode boundaries
+        episode_index = table["episode_index"].reshape(num_frames)
+        same_episode_next = torch.zeros(num_frames, dtype=torch.bool)
+        same_episode_next[:-1] = episode_index[1:] == episode_index[:-1]
+        if DONE in table:
+            done = table[DONE].reshape(num_frames).bool()
+        else:
+            logger.info("'next.done' key not found in dataset. Inferring from episode boundaries...")
+            done = ~same_episode_next
+        # Next state: the next frame of the same episode, the frame itself otherwise
+        frame_index = torch.arange(num_frames)
+        next_index = torch.where(same_episode_next & ~done, frame_index + 1, frame_index)
+
+        episode_starts = [0, *(torch.nonzero(~same_episode_next[:-1])[:, 0] + 1).tolist()]
+        episode_ends = [*episode_starts[1:], num_frames]
+
+        complementary_info = {key[len(info_prefix) :]: table[key] for key in complementary_info_keys}
+        batches = [
+            (int(episode_index[start]), batch_start, min(batch_start + DATASET_DECODING_BATCH_SIZE, end))
+            for start, end in zip(episode_starts, episode_ends, strict=True)
+            for batch_start in range(start, end, DATASET_DECODING_BATCH_SIZE)
+        ]
+        for episode, start, end in tqdm(batches):
+            frames = {
+                key: self._decode_dataset_frames(dataset, key, episode, start, end, table)
+                for key in camera_keys
+            }
+            if not self.initialized:
+                first_state = {key: (frames[key] if key in frames else table[key])[:1] for key in state_keys}
+                self._initialize_storage(
+                    state=first_state,
+                    action=table[ACTION][:1],
+                    complementary_info={key: value[:1] for key, value in complementary_info.items()} or None,
+                )
+            for key, value in frames.items():
+                if key in self.states:
+                    self.states[key][start:end].copy_(self._encode_state(key, value))
+            if self.feature_keys:
+                self._store_features(frames, self.features, start)
+
+        for key in state_keys:
+            if key not in camera_keys:
+                self.states[key][:num_frames].copy_(self._encode_state(key, table[key]))
+        self.actions[:num_frames].copy_(table[ACTION].reshape(num_frames, *self.actions.shape[1:]))
+        self.rewards[:num_frames].copy_(table[REWARD].reshape(num_frames))
+        self.dones[:num_frames].copy_(done)
+        # NOTE: Truncation are not supported yet in lerobot dataset
+        self.truncateds[:num_frames] = False
+        for key, value in complementary_info.items():
+            storage = self.complementary_info[key][:num_frames]
+            storage.copy_(value.reshape(storage.shape))
+
+        self._finish_bulk_load(num_frames, next_index)
+
+        if cache_path is not None:
+            self._save_storage_cache(cache_path, num_frames, next_index)
+
+    def _finish_bulk_load(self, num_frames: int, next_index: torch.Tensor):
+        """Derive next_states and priorities after `num_frames` transitions were written from index 0."""
+        if not self.optimize_memory:
+            for key in self.states:
+                torch.index_select(
+                    self.states[key][:num_frames], 0, next_index, out=self.next_states[key][:num_frames]
+                )
+            for key in self.feature_keys:
+                torch.index_select(
+                    self.features[key][:num_frames], 0, next_index, out=self.next_features[key][:num_frames]
+                )
+
+        self.position = num_frames % self.capacity
+        self.size = num_frames
+        if self.prioritized:
+            self._reset_priorities()
+        self.flush()
+
+    def _reset_priorities(self):
+        """Give every stored transition the maximal priority, after they were stored in bulk."""
+        newest = (self.position - 1) % self.capacity
+        indices = torch.arange(self.size)
+        indices = indices[indices != newest]
+        priorities = torch.full((len(indices),), self.max_priority**self.priority_alpha)
+        with self._priority_lock:
+            self.priority_tree.update(indices, priorities)
+        # The newest transition goes through the regular path, pending with optimize_memory
+        self._add_priority(newest)
+
+    @staticmethod
+    def _decode_dataset_frames(
+        dataset: LeRobotDataset, key: str, episode_index: int, start: int, end: int, table: dict
+    ) -> torch.Tensor:
+        """Camera frames start:end of an episode, as float (C, H, W) images in [0, 1]."""
+        if key in dataset.meta.video_keys:
+            # Episodes are stored sequentially in the video files, shift to this episode
+            from_timestamp = dataset.meta.episodes[episode_index][f"videos/{key}/from_timestamp"]
+            timestamps = (table["timestamp"][start:end].reshape(-1) + from_timestamp).tolist()
+            video_path = dataset.root / dataset.meta.get_video_file_path(episode_index, key)
+            frames = decode_video_frames(video_path, timestamps, dataset.tolerance_s, dataset.video_backend)
+        else:
+            images = dataset.hf_dataset.select_columns([key]).with_transform(hf_transform_to_torch)
+            frames = torch.stack(images[start:end][key])
+
+        if dataset.image_transforms is not None:
+            frames = torch.stack([dataset.image_transforms(frame) for frame in frames])
+        return frames
+
+    def _dataset_cache_key(self, dataset: LeRobotDataset, state_keys: Sequence[str]) -> str:
+        """Hash of everything the converted storage depends on, including the dataset files."""
+        files = []
+        for path in sorted(dataset.get_episodes_file_paths()):
+            stat = (dataset.root / path).stat()
+            files.append([path, stat.st_size, stat.st_mtime_ns])
+        key = {
+            "repo_id": dataset.repo_id,
+            "root": str(Path(dataset.root).resolve()),
+            "episodes": dataset.episodes,
+            "files": files,
+            "image_transforms": repr(dataset.image_transforms),
+            "state_keys": list(state_keys),
+            "image_keys": None if self.image_keys is None else list(self.image_keys),
+            "image_storage_dtype": str(self.image_storage_dtype),
+        }
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+
+    def _save_storage_cache(self, path: Path, num_frames: int, next_index: torch.Tensor):
+        cache = {
+            "states": {key: value[:num_frames] for key, value in self.states.items()},
+            "actions": self.actions[:num_frames],
+            "rewards": self.rewards[:num_frames],
+            "dones": self.dones[:num_frames],
+            "truncateds": self.truncateds[:num_frames],
+            "complementary_info": {key: value[:num_frames] for key, value in self.complementary_info.items()},
+            "next_index": next_index,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, an interrupted save never leaves a truncated cache behind
+        tmp_path = path.with_suffix(".tmp")
+        torch.save(cache, tmp_path)
+        os.replace(tmp_path, path)
+
+    def _load_storage_cache(self, cache: dict):
+        num_frames = len(cache["actions"])
+        if num_frames == 0:
+            return
+        self._initialize_storage(
+            state={key: value[:1] for key, value in cache["states"].items()},
+            action=cache["actions"][:1],
+            complementary_info={key: value[:1] for key, value in cache["complementary_info"].items()} or None,
+        )
+        for key, value in cache["states"].items():
+            self.states[key][:num_frames].copy_(value)
+        self.actions[:num_frames].copy_(cache["actions"])
+        self.rewards[:num_frames].copy_(cache["rewards"])
+        self.dones[:num_frames].copy_(cache["dones"])
+        self.truncateds[:num_frames].copy_(cache["truncateds"])
+        for key, value in cache["complementary_info"].items():
+            self.complementary_info[key][:num_frames].copy_(value)
+        self._finish_bulk_load(num_frames, cache["next_index"])
+
     @staticmethod
     def _lerobotdataset_to_transitions(
         dataset: LeRobotDataset,
@@ -737,6 +1523,180 @@ class ReplayBuffer:
 
 
 # Utility function to guess shapes/dtypes from a tensor
+class DevicePrefetcher:
+    """Prefetches batches of a `ReplayBuffer` onto its sampling device ahead of the learner.
+
+    A background thread draws the indices, gathers the rows with `index_select` straight
+    into preallocated pinned staging buffers and issues non-blocking host to device copies
+    on a side CUDA stream. The uint8 image decoding and the DrQ augmentation run on the
+    device on that stream too. With `num_slots` staging buffers (double or triple
+    buffering), the next batch is already resident when the learner asks for it.
+
+    Without a copy to a CUDA device (CPU-only machines, or storage already on the sampling
+    device), the rows are gathered by index directly into the batch, without staging.
+
+    Args:
+        buffer: The replay buffer to sample from.
+        batch_size: Size of the batches.
+        num_slots: Number of staging buffers, i.e. batches prefetched ahead.
+        num_batches: Batches sampled at once and yielded together, see `ReplayBuffer.sample`.
+    """
+
+    def __init__(self, buffer: ReplayBuffer, batch_size: int, num_slots: int = 2, num_batches: int = 1):
+        if not buffer.initialized:
+            raise RuntimeError("Cannot sample from an empty buffer. Add transitions first.")
+        if num_slots < 1:
+            raise ValueError("num_slots must be greater than or equal to 1.")
+
+        self.buffer = buffer
+        self.batch_size = batch_size
+        self.num_slots = num_slots
+        self.num_batches = num_batches
+
+        self.device = torch.device(buffer.device)
+        self.use_cuda = (
+            self.device.type == "cuda"
+            and torch.device(buffer.storage_device).type == "cpu"
+            and torch.cuda.is_available()
+        )
+        self._stream = torch.cuda.Stream(device=self.device) if self.use_cuda else None
+        self._staging: list[dict[str, torch.Tensor]] = [{} for _ in range(num_slots)]
+        # Recorded after the copies out of each staging slot, before reusing it
+        self._copy_done: list[torch.cuda.Event | None] = [None] * num_slots
+
+        self._queue: queue.Queue = queue.Queue(maxsize=num_slots)
+        self._shutdown_event = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> BatchTransition:
+        while True:
+            if self._shutdown_event.is_set() and self._queue.empty():
+                raise StopIteration
+            try:
+                item = self._queue.get(timeout=0.5)
+                break
+            except queue.Empty:
+                continue
+
+        if isinstance(item, Exception):
+            self.close()
+            raise item
+
+        batch, ready = item
+        if ready is not None:
+            stream = torch.cuda.current_stream(self.device)
+            stream.wait_event(ready)
+            # The batch was allocated on the side stream: keep its memory alive for the consumer stream
+            _record_stream(batch, stream)
+        return batch
+
+    def _produce(self):
+        slot = 0
+        while not self._shutdown_event.is_set():
+            try:
+                item = self._load(slot)
+            except Exception as e:
+                # Surfaced by __next__
+                item = e
+                self._shutdown_event.set()
+            slot = (slot + 1) % self.num_slots
+
+            while True:
+                try:
+                    # The timeout ensures the thread unblocks if the queue is full
+                    # and the shutdown event gets set meanwhile.
+                    self._queue.put(item, timeout=0.5)
+                    break
+                except queue.Full:
+                    if self._shutdown_event.is_set():
+                        return
+
+    def _load(self, slot: int) -> tuple[BatchTransition, torch.cuda.Event | None]:
+        gathered, computed = self.buffer._sample_columns(self.batch_size, self.num_batches)
+        index = gathered["action"][1]
+        if not self.use_cuda:
+            columns = {
+                name: torch.index_select(storage, 0, indices) for name, (storage, indices) in gathered.items()
+            }
+            return self.buffer._collate(columns | computed, index=index), None
+
+        staged = self._stage(slot, gathered, computed)
+        with torch.cuda.stream(self._stream):
+            columns = {name: value.to(self.device, non_blocking=True) for name, value in staged.items()}
+            copy_done = torch.cuda.Event()
+            copy_done.record(self._stream)
+            self._copy_done[slot] = copy_done
+
+            batch = self.buffer._collate(columns, index=index)
+            ready = torch.cuda.Event()
+            ready.record(self._stream)
+        return batch, ready
+
+    def _stage(
+        self,
+        slot: int,
+        gathered: dict[str, tuple[torch.Tensor, torch.Tensor]],
+        computed: dict[str, torch.Tensor],
+    ) -> dict[str, torch.Tensor]:
+        """Gather the batch into the pinned buffers of `slot`."""
+        # The copies of the previous batch staged in this slot must be done reading it
+        if self._copy_done[slot] is not None:
+            self._copy_done[slot].synchronize()
+
+        staging = self._staging[slot]
+
+        def buffer_for(name: str, like: torch.Tensor, rows: int) -> torch.Tensor:
+            shape = (rows, *like.shape[1:])
+            out = staging.get(name)
+            # Batches are smaller than batch_size while the replay buffer is filling up
+            if out is None or out.shape != shape or out.dtype != like.dtype:
+                out = staging[name] = torch.empty(shape, dtype=like.dtype, pin_memory=True)
+            return out
+
+        staged = {}
+        for name, (storage, indices) in gathered.items():
+            out = buffer_for(name, storage, len(indices))
+            staged[name] = torch.index_select(storage, 0, indices, out=out)
+        for name, value in computed.items():
+            staged[name] = buffer_for(name, value, len(value)).copy_(value)
+        return staged
+
+    def close(self):
+        self._shutdown_event.set()
+        # Drain the queue quickly to help the thread exit if it's blocked on `put`.
+        while not self._queue.empty():
+            with suppress(queue.Empty):
+                self._queue.get_nowait()
+        self._thread.join(timeout=1.0)
+
+
+def _as_batch_of_one(state: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+    """One state, with or without its batch dimension, as a batch of one state."""
+    return {key: value.squeeze(0).unsqueeze(0) for key, value in state.items()}
+
+
+def _as_batch(states: dict[str, torch.Tensor], rows: slice) -> dict[str, torch.Tensor]:
+    """Rows of stacked states, each with or without its batch dimension, as a batch of states."""
+    # Like `_as_batch_of_one` applied to every state
+    return {
+        key: value[rows].squeeze(1) if value.dim() > 1 and value.shape[1] == 1 else value[rows]
+        for key, value in states.items()
+    }
+
+
+def _record_stream(value, stream: torch.cuda.Stream):
+    if isinstance(value, torch.Tensor):
+        if value.is_cuda:
+            value.record_stream(stream)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _record_stream(item, stream)
+
+
 def guess_feature_info(t, name: str):
     """
     Return a dictionary with the 'dtype' and 'shape' for a given tensor or scalar value.
@@ -760,7 +1720,7 @@ def guess_feature_info(t, name: str):
 
 
 def concatenate_batch_transitions(
-    left_batch_transitions: BatchTransition, right_batch_transition: BatchTransition
+    left_batch_transitions: BatchTransition, right_batch_transition: BatchTransition, num_splits: int = 1
 ) -> BatchTransition:
     """
     Concatenates two BatchTransition objects into one.
@@ -773,6 +1733,9 @@ def concatenate_batch_transitions(
         left_batch_transitions (BatchTransition): The first batch to concatenate and the one
             that will be modified in place.
         right_batch_transition (BatchTransition): The second batch to append to the first one.
+        num_splits (int): For batches sampled with `num_batches=num_splits`: their batches are
+            concatenated pairwise instead, so that `split_batch_transitions` gives the concatenated
+            batches as views.
 
     Returns:
         BatchTransition: The concatenated batch (same object as left_batch_transitions).
@@ -780,41 +1743,69 @@ def concatenate_batch_transitions(
     Warning:
         This function modifies the left_batch_transitions object in place.
     """
+    left_size = left_batch_transitions["done"].shape[0]
+    right_size = right_batch_transition["done"].shape[0]
+
+    def cat(left: torch.Tensor, right: torch.Tensor) -> torch.Tensor:
+        if num_splits == 1:
+            return torch.cat([left, right], dim=0)
+        # (num_splits, rows, ...) on both sides, each split followed by its right counterpart
+        return torch.cat(
+            [left.unflatten(0, (num_splits, -1)), right.unflatten(0, (num_splits, -1))], dim=1
+        ).flatten(0, 1)
+
     # Concatenate state fields
     left_batch_transitions["state"] = {
-        key: torch.cat(
-            [left_batch_transitions["state"][key], right_batch_transition["state"][key]],
-            dim=0,
-        )
+        key: cat(left_batch_transitions["state"][key], right_batch_transition["state"][key])
         for key in left_batch_transitions["state"]
     }
 
     # Concatenate basic fields
-    left_batch_transitions[ACTION] = torch.cat(
-        [left_batch_transitions[ACTION], right_batch_transition[ACTION]], dim=0
-    )
-    left_batch_transitions["reward"] = torch.cat(
-        [left_batch_transitions["reward"], right_batch_transition["reward"]], dim=0
-    )
+    left_batch_transitions[ACTION] = cat(left_batch_transitions[ACTION], right_batch_transition[ACTION])
+    left_batch_transitions["reward"] = cat(left_batch_transitions["reward"], right_batch_transition["reward"])
 
     # Concatenate next_state fields
     left_batch_transitions["next_state"] = {
-        key: torch.cat(
-            [left_batch_transitions["next_state"][key], right_batch_transition["next_state"][key]],
-            dim=0,
-        )
+        key: cat(left_batch_transitions["next_state"][key], right_batch_transition["next_state"][key])
         for key in left_batch_transitions["next_state"]
     }
 
     # Concatenate done and truncated fields
-    left_batch_transitions["done"] = torch.cat(
-        [left_batch_transitions["done"], right_batch_transition["done"]], dim=0
-    )
-    left_batch_transitions["truncated"] = torch.cat(
-        [left_batch_transitions["truncated"], right_batch_transition["truncated"]],
-        dim=0,
+    left_batch_transitions["done"] = cat(left_batch_transitions["done"], right_batch_transition["done"])
+    left_batch_transitions["truncated"] = cat(
+        left_batch_transitions["truncated"], right_batch_transition["truncated"]
     )
 
+    # Prioritized replay: a batch without weights counts as uniformly sampled. The
+    # indices are kept as they are, they refer to the first rows (the left batch)
+    left_weight = left_batch_transitions.get("weight")
+    right_weight = right_batch_transition.get("weight")
+    if left_weight is not None or right_weight is not None:
+        if left_weight is None:
+            left_weight = torch.ones(left_size, device=right_weight.device)
+        if right_weight is None:
+            right_weight = torch.ones(right_size, device=left_weight.device)
+        left_batch_transitions["weight"] = cat(left_weight, right_weight)
+
+    # n-step replay
+    left_discount = left_batch_transitions.get("discount")
+    right_discount = right_batch_transition.get("discount")
+    if (left_discount is None) != (right_discount is None):
+        raise ValueError("Cannot concatenate n-step and 1-step batches, use the same n_step in both buffers")
+    if left_discount is not None:
+        left_batch_transitions["discount"] = cat(left_discount, right_discount)
+
+    # Stored image features. The states of a buffer without its images only keep the other keys.
+    for name in ("observation_feature", "next_observation_feature"):
+        left_features = left_batch_transitions.get(name)
+        right_features = right_batch_transition.get(name)
+        if (left_features is None) != (right_features is None):
+            raise ValueError("Cannot concatenate batches with and without image features")
+        if left_features is not None:
+            left_batch_transitions[name] = {
+                key: cat(left_features[key], right_features[key]) for key in left_features
+            }
+
     # Handle complementary_info
     left_info = left_batch_transitions.get("complementary_info")
     right_info = right_batch_transition.get("complementary_info")
@@ -828,8 +1819,36 @@ def concatenate_batch_transitions(
             # Concatenate each field
             for key in right_info:
                 if key in left_info:
-                    left_info[key] = torch.cat([left_info[key], right_info[key]], dim=0)
+                    left_info[key] = cat(left_info[key], right_info[key])
                 else:
                     left_info[key] = right_info[key]
 
     return left_batch_transitions
+
+
+def split_batch_transitions(batch: BatchTransition, num_splits: int) -> list[BatchTransition]:
+    """
+    Splits a batch sampled with `num_batches=num_splits` back into its batches.
+
+    The batches are views of the sampled one, nothing is copied. The `index` of a prioritized
+    batch is split too, each batch keeps the indices of its own rows.
+
+    Args:
+        batch (BatchTransition): The batch to split, of `num_splits` equally sized batches.
+        num_splits (int): Number of batches.
+
+    Returns:
+        list[BatchTransition]: The batches, in sampling order.
+    """
+
+    def split(value):
+        if isinstance(value, dict):
+            parts = {key: split(item) for key, item in value.items()}
+            return [{key: part[i] for key, part in parts.items()} for i in range(num_splits)]
+        if isinstance(value, torch.Tensor):
+            return value.unflatten(0, (num_splits, -1)).unbind(0)
+        # Not batched (e.g. a missing complementary_info), shared by every batch
+        return [value] * num_splits
+
+    parts = {key: split(value) for key, value in batch.items()}
+    return [BatchTransition(**{key: part[i] for key, part in parts.items()}) for i in range(num_splits)]
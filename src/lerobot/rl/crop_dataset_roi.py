@@ -15,16 +15,29 @@
 # limitations under the License.
 
 import argparse
+import io
 import json
+import logging
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from copy import deepcopy
 from pathlib import Path
 
 import cv2
+import numpy as np
+import PIL.Image
+import pyarrow as pa
+import pyarrow.parquet as pq
 import torch
 import torchvision.transforms.functional as F  # type: ignore  # noqa: N812
 from tqdm import tqdm  # type: ignore
 
-from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.compute_stats import auto_downsample_height_width, compute_image_stats, sample_indices
+from lerobot.datasets.dataset_tools import copy_and_reindex_episodes_metadata
+from lerobot.datasets.lerobot_dataset import LeRobotDataset, LeRobotDatasetMetadata
+from lerobot.datasets.utils import DEFAULT_DATA_PATH, load_episodes, write_tasks
+from lerobot.datasets.video_utils import encode_frames_to_video, get_video_info
 from lerobot.utils.constants import DONE, REWARD
 
 
@@ -244,6 +257,268 @@ def convert_lerobot_dataset_to_cropped_lerobot_dataset(
     return new_dataset
 
 
+def crop_resize_images(
+    images: torch.Tensor, crop_params: tuple[int, int, int, int], resize_size: tuple[int, int]
+) -> torch.Tensor:
+    """Crop and resize a (N, C, H, W) uint8 batch of images at once, returns uint8 images."""
+    top, left, height, width = crop_params
+    cropped = F.crop(images, top, left, height, width)
+    return F.resize(cropped.float(), list(resize_size), antialias=True).round_().clamp_(0, 255).byte()
+
+
+def _sampled_frames_stats(episode_frames: dict[int, list[np.ndarray]]) -> dict[int, dict]:
+    return {ep_idx: compute_image_stats(np.stack(frames)) for ep_idx, frames in episode_frames.items()}
+
+
+def _crop_data_file(
+    src_path: Path,
+    dst_path: Path,
+    crop_params_dict: dict[str, tuple[int, int, int, int]],
+    resize_size: tuple[int, int],
+    batch_size: int,
+) -> dict[int, dict]:
+    """Crop the embedded images of a data file, the other columns are copied untouched.
+
+    Returns:
+        dict mapping the episode indices of the file to the stats of the cropped images
+    """
+    table = pq.read_table(src_path)
+    episode_index = table["episode_index"].to_numpy()
+    stats = {}
+    for key, crop_params in crop_params_dict.items():
+        column = table[key].combine_chunks()
+        encoded = column.field("bytes").to_pylist()
+        cropped = []
+        for start in range(0, len(encoded), batch_size):
+            chunk = encoded[start : start + batch_size]
+            images = np.stack([np.asarray(PIL.Image.open(io.BytesIO(b)).convert("RGB")) for b in chunk])
+            batch = crop_resize_images(torch.from_numpy(images).permute(0, 3, 1, 2), crop_params, resize_size)
+            cropped.extend(batch.permute(0, 2, 3, 1).numpy())
+
+        png = []
+        for image in cropped:
+            buffer = io.BytesIO()
+            PIL.Image.fromarray(image).save(buffer, format="png")
+            png.append(buffer.getvalue())
+        i = table.schema.get_field_index(key)
+        images = pa.StructArray.from_arrays(
+            [pa.array(png, type=pa.binary()), column.field("path")], names=["bytes", "path"]
+        )
+        table = table.set_column(i, table.schema.field(i), images.cast(table.schema.field(i).type))
+
+        episode_frames = {}
+        boundaries = np.flatnonzero(np.diff(episode_index)) + 1
+        for start, end in zip(np.r_[0, boundaries], np.r_[boundaries, len(episode_index)], strict=True):
+            episode_frames[int(episode_index[start])] = [
+                cropped[start + j].transpose(2, 0, 1) for j in sample_indices(end - start)
+            ]
+        for ep_idx, ep_stats in _sampled_frames_stats(episode_frames).items():
+            stats.setdefault(ep_idx, {})[key] = ep_stats
+
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, dst_path)
+    return stats
+
+
+def _crop_video_file(
+    src_path: Path,
+    dst_path: Path,
+    crop_params: tuple[int, int, int, int],
+    resize_size: tuple[int, int],
+    episodes: list[tuple[int, float, int]],
+    fps: int,
+    batch_size: int,
+    video_encoding: dict | None = None,
+) -> dict[int, dict]:
+    """Decode a video file sequentially, crop and resize its frames by batches and encode them.
+
+    Args:
+        episodes: (episode_index, from_timestamp, length) of the episodes of the file.
+        video_encoding: Options of `encode_frames_to_video`, its defaults if None.
+
+    Returns:
+        dict mapping the episode indices of the file to the stats of the cropped frames
+    """
+    import av
+
+    # Frames of the file sampled for the stats of their episode
+    sampled = {}
+    for ep_idx, from_timestamp, length in episodes:
+        first_frame = round(from_timestamp * fps)
+        sampled.update({first_frame + i: ep_idx for i in sample_indices(length)})
+
+    episode_frames = {}
+
+    def crop(frames: list[np.ndarray], frame_count: int):
+        images = torch.from_numpy(np.stack(frames)).permute(0, 3, 1, 2)
+        batch = crop_resize_images(images, crop_params, resize_size)
+        for image in batch.permute(0, 2, 3, 1).numpy():
+            if frame_count in sampled:
+                episode_frames.setdefault(sampled[frame_count], []).append(
+                    auto_downsample_height_width(image.transpose(2, 0, 1))
+                )
+            yield image
+            frame_count += 1
+
+    def cropped_frames(in_container):
+        frames = []
+        frame_count = 0
+        for frame in in_container.decode(video=0):
+            frames.append(frame.to_ndarray(format="rgb24"))
+            if len(frames) == batch_size:
+                yield from crop(frames, frame_count)
+                frame_count += len(frames)
+                frames = []
+        if frames:
+            yield from crop(frames, frame_count)
+
+    with av.open(str(src_path)) as in_container:
+        encode_frames_to_video(cropped_frames(in_container), dst_path, fps, **(video_encoding or {}))
+    return _sampled_frames_stats(episode_frames)
+
+
+def crop_lerobot_dataset(
+    original_dataset: LeRobotDataset,
+    crop_params_dict: dict[str, tuple[int, int, int, int]],
+    new_repo_id: str,
+    new_dataset_root: str | Path,
+    resize_size: tuple[int, int] = (128, 128),
+    num_workers: int = 4,
+    batch_size: int = 64,
+    push_to_hub: bool = False,
+) -> LeRobotDataset:
+    """
+    Pipelined version of `convert_lerobot_dataset_to_cropped_lerobot_dataset`, working file by file
+    instead of frame by frame.
+
+    Each video file of a cropped camera is decoded sequentially, its frames cropped and resized by
+    batches and encoded again in a worker process, the files of all the cameras being processed in
+    parallel. Data files are copied as they are, unless they embed cropped images. Episodes keep
+    their tasks, only the stats of the cropped cameras are recomputed.
+
+    Args:
+        original_dataset (LeRobotDataset): The source dataset.
+        crop_params_dict (Dict[str, Tuple[int, int, int, int]]):
+            A dictionary mapping observation keys to crop parameters (top, left, height, width).
+        new_repo_id (str): Repository id for the new dataset.
+        new_dataset_root (str): The root directory where the new dataset will be written.
+        resize_size (Tuple[int, int], optional): The target size (height, width) after cropping.
+            Defaults to (128, 128).
+        num_workers (int, optional): Number of worker processes. Defaults to 4.
+        batch_size (int, optional): Number of frames cropped and resized at once. Defaults to 64.
+
+    Returns:
+        LeRobotDataset: A new LeRobotDataset where the specified image observations have been cropped
+                        and resized.
+    """
+    src_meta = original_dataset.meta
+    new_dataset_root = Path(new_dataset_root)
+    if src_meta.episodes is None:
+        src_meta.episodes = load_episodes(src_meta.root)
+    episodes = src_meta.episodes
+    video_crops = {key: crop for key, crop in crop_params_dict.items() if key in src_meta.video_keys}
+    image_crops = {key: crop for key, crop in crop_params_dict.items() if key in src_meta.image_keys}
+
+    new_meta = LeRobotDatasetMetadata.create(
+        repo_id=new_repo_id,
+        fps=src_meta.fps,
+        features=src_meta.features,
+        robot_type=src_meta.robot_type,
+        root=new_dataset_root,
+        use_videos=len(src_meta.video_keys) > 0,
+    )
+    write_tasks(src_meta.tasks, new_meta.root)
+    new_meta.tasks = src_meta.tasks.copy()
+
+    start = time.perf_counter()
+    stats = {ep_idx: {} for ep_idx in range(len(episodes))}
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        jobs = {}
+        data_files = sorted({(ep["data/chunk_index"], ep["data/file_index"]) for ep in episodes})
+        for chunk_idx, file_idx in data_files:
+            path = DEFAULT_DATA_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
+            (new_meta.root / path).parent.mkdir(parents=True, exist_ok=True)
+            if not image_crops:
+                shutil.copy(src_meta.root / path, new_meta.root / path)
+                continue
+            job = executor.submit(
+                _crop_data_file,
+                src_meta.root / path,
+                new_meta.root / path,
+                image_crops,
+                resize_size,
+                batch_size,
+            )
+            jobs[job] = None
+
+        for key in src_meta.video_keys:
+            video_files = {}
+            for ep in episodes:
+                file = (ep[f"videos/{key}/chunk_index"], ep[f"videos/{key}/file_index"])
+                video_files.setdefault(file, []).append(
+                    (ep["episode_index"], ep[f"videos/{key}/from_timestamp"], ep["length"])
+                )
+            for (chunk_idx, file_idx), file_episodes in video_files.items():
+                path = src_meta.video_path.format(video_key=key, chunk_index=chunk_idx, file_index=file_idx)
+                (new_meta.root / path).parent.mkdir(parents=True, exist_ok=True)
+                if key not in video_crops:
+                    shutil.copy(src_meta.root / path, new_meta.root / path)
+                    continue
+                job = executor.submit(
+                    _crop_video_file,
+                    src_meta.root / path,
+                    new_meta.root / path,
+                    video_crops[key],
+                    resize_size,
+                    file_episodes,
+                    src_meta.fps,
+                    batch_size,
+                    src_meta.video_encoding,
+                )
+                jobs[job] = key
+
+        for job in tqdm(as_completed(jobs), total=len(jobs), desc="Cropping files"):
+            video_key = jobs[job]
+            for ep_idx, ep_stats in job.result().items():
+                stats[ep_idx].update(ep_stats if video_key is None else {video_key: ep_stats})
+
+    # Cropped frames keep their timestamps, the data and video files their episodes
+    data_keys = ("data/chunk_index", "data/file_index", "dataset_from_index", "dataset_to_index")
+    data_metadata, video_metadata = {}, {}
+    for ep_idx, ep in enumerate(episodes):
+        data_metadata[ep_idx] = {key: ep[key] for key in data_keys}
+        video_metadata[ep_idx] = {key: ep[key] for key in ep if key.startswith("videos/")}
+
+    for key in crop_params_dict:
+        if key in new_meta.info["features"]:
+            new_meta.info["features"][key]["shape"] = [3] + list(resize_size)
+    for key in video_crops:
+        video_path = new_meta.root / new_meta.video_path.format(video_key=key, chunk_index=0, file_index=0)
+        new_meta.info["features"][key]["info"] = get_video_info(video_path)
+
+    copy_and_reindex_episodes_metadata(
+        original_dataset,
+        new_meta,
+        {ep_idx: ep_idx for ep_idx in range(len(episodes))},
+        data_metadata,
+        video_metadata,
+        stats_overrides=stats,
+    )
+    elapsed = time.perf_counter() - start
+    logging.info(
+        f"Cropped {src_meta.total_frames} frames in {elapsed:.1f}s "
+        f"({src_meta.total_frames / elapsed:.0f} frames/s)"
+    )
+
+    new_dataset = LeRobotDataset(
+        repo_id=new_repo_id, root=new_dataset_root, video_backend=original_dataset.video_backend
+    )
+    if push_to_hub:
+        new_dataset.push_to_hub()
+
+    return new_dataset
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Crop rectangular ROIs from a LeRobot dataset.")
     parser.add_argument(
@@ -273,7 +548,7 @@ if __name__ == "__main__":
         "--task",
         type=str,
         default="",
-        help="The natural language task to describe the dataset.",
+        help="The natural language task to describe the dataset, replacing its tasks. Kept if not provided.",
     )
     parser.add_argument(
         "--new-repo-id",
@@ -281,6 +556,12 @@ if __name__ == "__main__":
         default=None,
         help="The repository id for the new cropped and resized dataset. If not provided, it defaults to `repo_id` + '_cropped_resized'.",
     )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=4,
+        help="Number of processes cropping the dataset files in parallel.",
+    )
     args = parser.parse_args()
 
     dataset = LeRobotDataset(repo_id=args.repo_id, root=args.root)
@@ -309,15 +590,27 @@ if __name__ == "__main__":
     else:
         new_dataset_root = Path(str(dataset.root) + "_cropped_resized")
 
-    cropped_resized_dataset = convert_lerobot_dataset_to_cropped_lerobot_dataset(
-        original_dataset=dataset,
-        crop_params_dict=rois,
-        new_repo_id=new_repo_id,
-        new_dataset_root=new_dataset_root,
-        resize_size=(128, 128),
-        push_to_hub=args.push_to_hub,
-        task=args.task,
-    )
+    if args.task:
+        # Replacing the task of every frame goes through the frame by frame conversion
+        cropped_resized_dataset = convert_lerobot_dataset_to_cropped_lerobot_dataset(
+            original_dataset=dataset,
+            crop_params_dict=rois,
+            new_repo_id=new_repo_id,
+            new_dataset_root=new_dataset_root,
+            resize_size=(128, 128),
+            push_to_hub=args.push_to_hub,
+            task=args.task,
+        )
+    else:
+        cropped_resized_dataset = crop_lerobot_dataset(
+            original_dataset=dataset,
+            crop_params_dict=rois,
+            new_repo_id=new_repo_id,
+            new_dataset_root=new_dataset_root,
+            resize_size=(128, 128),
+            num_workers=args.num_workers,
+            push_to_hub=args.push_to_hub,
+        )
 
     meta_dir = new_dataset_root / "meta"
     meta_dir.mkdir(exist_ok=True)
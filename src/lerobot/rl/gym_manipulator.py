@@ -53,6 +53,7 @@ from lerobot.processor import (
     TransitionKey,
     VanillaObservationProcessorStep,
     create_transition,
+    profile_pipelines,
 )
 from lerobot.processor.converters import identity_transition
 from lerobot.robots import (  # noqa: F401
@@ -102,6 +103,8 @@ class GymManipulatorConfig:
     dataset: DatasetConfig
     mode: str | None = None  # Either "record", "replay", None
     device: str = "cpu"
+    # Profile every step of the processor pipelines, and write their Chrome trace to this path
+    processor_trace_path: str | None = None
 
 
 def reset_follower_position(robot_arm: Robot,
@@ -499,6 +502,9 @@ def make_processors(
                 crop_params_dict=cfg.processor.image_preprocessing.
                 crop_params_dict,
                 resize_size=cfg.processor.image_preprocessing.resize_size,
+                device=device,
+                output_buffers=cfg.processor.image_preprocessing.
+                output_buffers,
             ))
 
     # Add time limit processor if reset config exists
@@ -1077,17 +1083,23 @@ def main(cfg: GymManipulatorConfig) -> None:
     print("Environment processor:", env_processor)
     print("Action processor:", action_processor)
 
-    if cfg.mode == "replay":
-        replay_trajectory(env, action_processor, cfg)
-        exit()
-
-    if RECORD_MODE == 0:
-        control_loop_for_binary_classifier(env, env_processor,
-                                           action_processor, teleop_device,
-                                           cfg)
-
-    if RECORD_MODE == 1:
-        control_loop(env, env_processor, action_processor, teleop_device, cfg)
+    pipelines = {
+        "env_processor": env_processor,
+        "action_processor": action_processor
+    }
+    with profile_pipelines(cfg.processor_trace_path, pipelines):
+        if cfg.mode == "replay":
+            replay_trajectory(env, action_processor, cfg)
+            return
+
+        if RECORD_MODE == 0:
+            control_loop_for_binary_classifier(env, env_processor,
+                                               action_processor,
+                                               teleop_device, cfg)
+
+        if RECORD_MODE == 1:
+            control_loop(env, env_processor, action_processor, teleop_device,
+                         cfg)
 
 
 if __name__ == "__main__":
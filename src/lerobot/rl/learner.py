@@ -48,6 +48,7 @@ import logging
 import os
 import shutil
 import time
+from collections.abc import Callable, Iterator
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pprint import pformat
@@ -63,12 +64,20 @@ from torch.optim.optimizer import Optimizer
 from lerobot.cameras import opencv  # noqa: F401
 from lerobot.configs import parser
 from lerobot.configs.train import TrainRLServerPipelineConfig
+from lerobot.configs.types import FeatureType
 from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
-from lerobot.rl.buffer import ReplayBuffer, concatenate_batch_transitions
+from lerobot.rl.buffer import (
+    BatchTransition,
+    ReplayBuffer,
+    concatenate_batch_transitions,
+    split_batch_transitions,
+)
+from lerobot.rl.parameter_sync import PARAMETER_SYNC_KEY, ParameterDeltaEncoder, frozen_parameter_names
 from lerobot.rl.process import ProcessSignalHandler
+from lerobot.rl.shared_memory_transport import LearnerSharedMemoryTransport
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.robots import so100_follower  # noqa: F401
 from lerobot.teleoperators import gamepad, so101_leader  # noqa: F401
@@ -78,6 +87,8 @@ from lerobot.transport.utils import (
     MAX_MESSAGE_SIZE,
     bytes_to_python_object,
     bytes_to_transitions,
+    columnar_bytes_to_batch,
+    is_columnar_bytes,
     state_to_bytes,
 )
 from lerobot.utils.constants import (
@@ -293,9 +304,31 @@ def add_actor_information_and_train(
     save_freq = cfg.save_freq
     policy_update_freq = cfg.policy.policy_update_freq
     policy_parameters_push_frequency = cfg.policy.actor_learner_config.policy_parameters_push_frequency
+    # Frozen parameters never change, delta sync and shared memory do not need to resend them
+    exclude_frozen = (
+        cfg.policy.actor_learner_config.parameters_sync == "delta"
+        or cfg.policy.actor_learner_config.transport == "shared_memory"
+    )
+
+    # Same-host deployments exchange transitions and parameters through shared memory
+    shared_transport = None
+    if cfg.policy.actor_learner_config.transport == "shared_memory":
+        shared_transport = LearnerSharedMemoryTransport(
+            name=cfg.policy.actor_learner_config.shared_memory_name
+        )
+    # Deltas are encoded once here, every actor stream sends the same messages
+    parameters_encoder = None
+    if cfg.policy.actor_learner_config.parameters_sync == "delta" and shared_transport is None:
+        parameters_encoder = ParameterDeltaEncoder(
+            delta_dtype=cfg.policy.actor_learner_config.parameters_delta_dtype,
+            keyframe_interval=cfg.policy.actor_learner_config.parameters_keyframe_interval,
+        )
     saving_checkpoint = cfg.save_checkpoint
     online_steps = cfg.policy.online_steps
     async_prefetch = cfg.policy.async_prefetch
+    device_prefetch = cfg.policy.device_prefetch
+    # Batches of one optimization step sampled at once, see `iterate_utd_batches`
+    num_fused_batches = utd_ratio if cfg.policy.fused_utd_sampling else 1
 
     # Initialize logging for multiprocessing
     if not use_threads(cfg):
@@ -316,7 +349,13 @@ def add_actor_information_and_train(
 
     policy.train()
 
-    push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+    push_actor_policy_to_queue(
+        parameters_queue=parameters_queue,
+        policy=policy,
+        exclude_frozen=exclude_frozen,
+        shared_transport=shared_transport,
+        encoder=parameters_encoder,
+    )
 
     last_time_policy_pushed = time.time()
 
@@ -327,7 +366,8 @@ def add_actor_information_and_train(
 
     log_training_info(cfg=cfg, policy=policy)
 
-    replay_buffer = initialize_replay_buffer(cfg, device, storage_device)
+    feature_encoder = make_replay_feature_encoder(cfg=cfg, policy=policy, device=device)
+    replay_buffer = initialize_replay_buffer(cfg, device, storage_device, feature_encoder=feature_encoder)
     batch_size = cfg.batch_size
     offline_replay_buffer = None
 
@@ -336,6 +376,7 @@ def add_actor_information_and_train(
             cfg=cfg,
             device=device,
             storage_device=storage_device,
+            feature_encoder=feature_encoder,
         )
         batch_size: int = batch_size // 2  # We will sample from both replay buffer
 
@@ -357,6 +398,8 @@ def add_actor_information_and_train(
         # Exit the training loop if shutdown is requested
         if shutdown_event is not None and shutdown_event.is_set():
             logging.info("[LEARNER] Shutdown signal received. Exiting...")
+            if shared_transport is not None:
+                shared_transport.close()
             break
 
         # Process all available transitions to the replay buffer, send by the actor server
@@ -367,6 +410,7 @@ def add_actor_information_and_train(
             device=device,
             dataset_repo_id=dataset_repo_id,
             shutdown_event=shutdown_event,
+            shared_transport=shared_transport,
         )
 
         # Process all available interaction messages sent by the actor server
@@ -383,24 +427,27 @@ def add_actor_information_and_train(
 
         if online_iterator is None:
             online_iterator = replay_buffer.get_iterator(
-                batch_size=batch_size, async_prefetch=async_prefetch, queue_size=2
+                batch_size=batch_size,
+                async_prefetch=async_prefetch,
+                queue_size=2,
+                device_prefetch=device_prefetch,
+                num_batches=num_fused_batches,
             )
 
         if offline_replay_buffer is not None and offline_iterator is None:
             offline_iterator = offline_replay_buffer.get_iterator(
-                batch_size=batch_size, async_prefetch=async_prefetch, queue_size=2
+                batch_size=batch_size,
+                async_prefetch=async_prefetch,
+                queue_size=2,
+                device_prefetch=device_prefetch,
+                num_batches=num_fused_batches,
             )
 
         time_for_one_optimization_step = time.time()
+        utd_batches = iterate_utd_batches(online_iterator, offline_iterator, utd_ratio, num_fused_batches)
         for _ in range(utd_ratio - 1):
             # Sample from the iterators
-            batch = next(online_iterator)
-
-            if dataset_repo_id is not None:
-                batch_offline = next(offline_iterator)
-                batch = concatenate_batch_transitions(
-                    left_batch_transitions=batch, right_batch_transition=batch_offline
-                )
+            batch = next(utd_batches)
 
             actions = batch[ACTION]
             rewards = batch["reward"]
@@ -410,7 +457,7 @@ def add_actor_information_and_train(
             check_nan_in_transition(observations=observations, actions=actions, next_state=next_observations)
 
             observation_features, next_observation_features = get_observation_features(
-                policy=policy, observations=observations, next_observations=next_observations
+                policy=policy, observations=observations, next_observations=next_observations, batch=batch
             )
 
             # Create a batch dictionary with all required elements for the forward method
@@ -423,10 +470,13 @@ def add_actor_information_and_train(
                 "observation_feature": observation_features,
                 "next_observation_feature": next_observation_features,
                 "complementary_info": batch["complementary_info"],
+                "weight": batch.get("weight"),
+                "discount": batch.get("discount"),
             }
 
             # Use the forward method for critic loss
             critic_output = policy.forward(forward_batch, model="critic")
+            update_replay_priorities(replay_buffer, batch, critic_output["td_error"])
 
             # Main critic optimization
             loss_critic = critic_output["loss_critic"]
@@ -452,13 +502,7 @@ def add_actor_information_and_train(
             policy.update_target_networks()
 
         # Sample for the last update in the UTD ratio
-        batch = next(online_iterator)
-
-        if dataset_repo_id is not None:
-            batch_offline = next(offline_iterator)
-            batch = concatenate_batch_transitions(
-                left_batch_transitions=batch, right_batch_transition=batch_offline
-            )
+        batch = next(utd_batches)
 
         actions = batch[ACTION]
         rewards = batch["reward"]
@@ -469,7 +513,7 @@ def add_actor_information_and_train(
         check_nan_in_transition(observations=observations, actions=actions, next_state=next_observations)
 
         observation_features, next_observation_features = get_observation_features(
-            policy=policy, observations=observations, next_observations=next_observations
+            policy=policy, observations=observations, next_observations=next_observations, batch=batch
         )
 
         # Create a batch dictionary with all required elements for the forward method
@@ -481,9 +525,12 @@ def add_actor_information_and_train(
             "done": done,
             "observation_feature": observation_features,
             "next_observation_feature": next_observation_features,
+            "weight": batch.get("weight"),
+            "discount": batch.get("discount"),
         }
 
         critic_output = policy.forward(forward_batch, model="critic")
+        update_replay_priorities(replay_buffer, batch, critic_output["td_error"])
 
         loss_critic = critic_output["loss_critic"]
         optimizers["critic"].zero_grad()
@@ -551,7 +598,13 @@ def add_actor_information_and_train(
 
         # Push policy to actors if needed
         if time.time() - last_time_policy_pushed > policy_parameters_push_frequency:
-            push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+            push_actor_policy_to_queue(
+                parameters_queue=parameters_queue,
+                policy=policy,
+                exclude_frozen=exclude_frozen,
+                shared_transport=shared_transport,
+                encoder=parameters_encoder,
+            )
             last_time_policy_pushed = time.time()
 
         # Update target networks (main and discrete)
@@ -647,6 +700,7 @@ def start_learner(
         transition_queue=transition_queue,
         interaction_message_queue=interaction_message_queue,
         queue_get_timeout=cfg.policy.actor_learner_config.queue_get_timeout,
+        parameters_sync=cfg.policy.actor_learner_config.parameters_sync,
     )
 
     server = grpc.server(
@@ -695,7 +749,7 @@ def save_training_checkpoint(
     2. Saves the policy model, configuration, and optimizer states
     3. Saves the current interaction step for resuming training
     4. Updates the "last" checkpoint symlink to point to this checkpoint
-    5. Saves the replay buffer as a dataset for later use
+    5. Saves the replay buffer as a dataset for later use, or flushes it if it is persistent
     6. If an offline replay buffer exists, saves it as a separate dataset
 
     Args:
@@ -736,17 +790,21 @@ def save_training_checkpoint(
     # Update the "last" symlink
     update_last_checkpoint(checkpoint_dir)
 
-    # TODO : temporary save replay buffer here, remove later when on the robot
-    # We want to control this with the keyboard inputs
-    dataset_dir = os.path.join(cfg.output_dir, "dataset")
-    if os.path.exists(dataset_dir) and os.path.isdir(dataset_dir):
-        shutil.rmtree(dataset_dir)
-
-    # Save dataset
-    # NOTE: Handle the case where the dataset repo id is not specified in the config
-    # eg. RL training without demonstrations data
-    repo_id_buffer_save = cfg.env.task if dataset_repo_id is None else dataset_repo_id
-    replay_buffer.to_lerobot_dataset(repo_id=repo_id_buffer_save, fps=fps, root=dataset_dir)
+    if replay_buffer.storage_dir is not None:
+        # The persistent buffer only needs its memory-mapped files synced, nothing to re-encode
+        replay_buffer.flush()
+    else:
+        # TODO : temporary save replay buffer here, remove later when on the robot
+        # We want to control this with the keyboard inputs
+        dataset_dir = os.path.join(cfg.output_dir, "dataset")
+        if os.path.exists(dataset_dir) and os.path.isdir(dataset_dir):
+            shutil.rmtree(dataset_dir)
+
+        # Save dataset
+        # NOTE: Handle the case where the dataset repo id is not specified in the config
+        # eg. RL training without demonstrations data
+        repo_id_buffer_save = cfg.env.task if dataset_repo_id is None else dataset_repo_id
+        replay_buffer.to_lerobot_dataset(repo_id=repo_id_buffer_save, fps=fps, root=dataset_dir)
 
     if offline_replay_buffer is not None:
         dataset_offline_dir = os.path.join(cfg.output_dir, "dataset_offline")
@@ -934,19 +992,41 @@ def log_training_info(cfg: TrainRLServerPipelineConfig, policy: nn.Module) -> No
 
 
 def initialize_replay_buffer(
-    cfg: TrainRLServerPipelineConfig, device: str, storage_device: str
+    cfg: TrainRLServerPipelineConfig,
+    device: str,
+    storage_device: str,
+    feature_encoder: Callable | None = None,
 ) -> ReplayBuffer:
     """
     Initialize a replay buffer, either empty or from a dataset if resuming.
+    A persistent buffer (`persistent_online_buffer`) is reopened from its files instead.
 
     Args:
         cfg (TrainRLServerPipelineConfig): Training configuration
         device (str): Device to store tensors on
         storage_device (str): Device for storage optimization
+        feature_encoder (Callable | None): Frozen image encoder of the stored features, see
+            `make_replay_feature_encoder`
 
     Returns:
         ReplayBuffer: Initialized replay buffer
     """
+    buffer_kwargs = replay_buffer_kwargs(
+        cfg, prioritized=cfg.policy.prioritized_replay, feature_encoder=feature_encoder
+    )
+    if cfg.policy.persistent_online_buffer:
+        # Reopens the buffer of the previous run when resuming
+        return ReplayBuffer(
+            capacity=cfg.policy.online_buffer_capacity,
+            device=device,
+            state_keys=cfg.policy.input_features.keys(),
+            storage_device=storage_device,
+            optimize_memory=True,
+            storage_dir=os.path.join(cfg.output_dir, "replay_buffer"),
+            keep_encoded_images=not cfg.policy.replay_features_only,
+            **buffer_kwargs,
+        )
+
     if not cfg.resume:
         return ReplayBuffer(
             capacity=cfg.policy.online_buffer_capacity,
@@ -954,6 +1034,7 @@ def initialize_replay_buffer(
             state_keys=cfg.policy.input_features.keys(),
             storage_device=storage_device,
             optimize_memory=True,
+            **buffer_kwargs,
         )
 
     logging.info("Resume training load the online dataset")
@@ -973,6 +1054,7 @@ def initialize_replay_buffer(
         device=device,
         state_keys=cfg.policy.input_features.keys(),
         optimize_memory=True,
+        **buffer_kwargs,
     )
 
 
@@ -980,6 +1062,7 @@ def initialize_offline_replay_buffer(
     cfg: TrainRLServerPipelineConfig,
     device: str,
     storage_device: str,
+    feature_encoder: Callable | None = None,
 ) -> ReplayBuffer:
     """
     Initialize an offline replay buffer from a dataset.
@@ -988,6 +1071,8 @@ def initialize_offline_replay_buffer(
         cfg (TrainRLServerPipelineConfig): Training configuration
         device (str): Device to store tensors on
         storage_device (str): Device for storage optimization
+        feature_encoder (Callable | None): Frozen image encoder of the stored features. The offline
+            buffer keeps its images, it is saved as a dataset in the checkpoints.
 
     Returns:
         ReplayBuffer: Initialized offline replay buffer
@@ -1011,15 +1096,95 @@ def initialize_offline_replay_buffer(
         storage_device=storage_device,
         optimize_memory=True,
         capacity=cfg.policy.offline_buffer_capacity,
+        cache_dir=cfg.policy.offline_buffer_cache_dir,
+        # Priorities are only updated for the online buffer, whose samples come first in
+        # the concatenated batches. Both buffers need the same n-step returns though.
+        **replay_buffer_kwargs(cfg, prioritized=False, feature_encoder=feature_encoder),
     )
     return offline_replay_buffer
 
 
+def replay_buffer_kwargs(
+    cfg: TrainRLServerPipelineConfig, prioritized: bool, feature_encoder: Callable | None = None
+) -> dict:
+    """Sampling and storage arguments of a `ReplayBuffer` from the policy config."""
+    image_keys = [key for key, ft in cfg.policy.input_features.items() if ft.type is FeatureType.VISUAL]
+    return {
+        "image_keys": image_keys,
+        "feature_encoder": feature_encoder,
+        # The policy only sees the stored features, augmenting the images would be wasted work
+        "use_drq": feature_encoder is None,
+        "image_storage_dtype": torch.uint8 if cfg.policy.uint8_image_storage else torch.float32,
+        "prioritized": prioritized,
+        "priority_alpha": cfg.policy.priority_alpha,
+        "priority_beta": cfg.policy.priority_beta,
+        "priority_eps": cfg.policy.priority_eps,
+        "n_step": cfg.policy.n_step,
+        "gamma": cfg.policy.discount,
+    }
+
+
 # Utilities/Helpers functions
 
 
+def iterate_utd_batches(
+    online_iterator: Iterator[BatchTransition],
+    offline_iterator: Iterator[BatchTransition] | None,
+    utd_ratio: int,
+    num_fused_batches: int = 1,
+) -> Iterator[BatchTransition]:
+    """
+    Yield the batches of the `utd_ratio` updates of one optimization step, with the offline
+    samples concatenated to the online ones.
+
+    With `num_fused_batches=utd_ratio`, the iterators yield all the batches of the step at once
+    (`ReplayBuffer.get_iterator(num_batches=...)`): they are concatenated once and the updates
+    get views into that single batch, instead of sampling, transferring and concatenating
+    each of them.
+
+    Args:
+        online_iterator: Iterator of the online replay buffer
+        offline_iterator: Iterator of the offline replay buffer, if any
+        utd_ratio (int): Number of updates of the optimization step
+        num_fused_batches (int): Batches yielded at once by the iterators, 1 or `utd_ratio`
+
+    Yields:
+        BatchTransition: The batch of each update
+    """
+    if num_fused_batches == 1:
+        for _ in range(utd_ratio):
+            batch = next(online_iterator)
+            if offline_iterator is not None:
+                batch = concatenate_batch_transitions(
+                    left_batch_transitions=batch, right_batch_transition=next(offline_iterator)
+                )
+            yield batch
+        return
+
+    batch = next(online_iterator)
+    if offline_iterator is not None:
+        batch = concatenate_batch_transitions(
+            left_batch_transitions=batch,
+            right_batch_transition=next(offline_iterator),
+            num_splits=num_fused_batches,
+        )
+    yield from split_batch_transitions(batch, num_fused_batches)
+
+
+def update_replay_priorities(replay_buffer: ReplayBuffer, batch: dict, td_error: torch.Tensor):
+    """Feed the TD errors of the sampled online transitions back to a prioritized buffer."""
+    if not replay_buffer.prioritized:
+        return
+    indices = batch["index"]
+    # With an offline dataset, the online samples are the first rows of the batch
+    replay_buffer.update_priorities(indices, td_error[: len(indices)])
+
+
 def get_observation_features(
-    policy: SACPolicy, observations: torch.Tensor, next_observations: torch.Tensor
+    policy: SACPolicy,
+    observations: torch.Tensor,
+    next_observations: torch.Tensor,
+    batch: dict | None = None,
 ) -> tuple[torch.Tensor | None, torch.Tensor | None]:
     """
     Get observation features from the policy encoder. It act as cache for the observation features.
@@ -1030,10 +1195,13 @@ def get_observation_features(
         policy: The policy model
         observations: The current observations
         next_observations: The next observations
+        batch: The sampled batch, whose features stored by the replay buffers are used if any
 
     Returns:
         tuple: observation_features, next_observation_features
     """
+    if batch is not None and "observation_feature" in batch:
+        return batch["observation_feature"], batch["next_observation_feature"]
 
     if policy.config.vision_encoder_name is None or not policy.config.freeze_vision_encoder:
         return None, None
@@ -1045,6 +1213,41 @@ def get_observation_features(
     return observation_features, next_observation_features
 
 
+def make_replay_feature_encoder(
+    cfg: TrainRLServerPipelineConfig, policy: SACPolicy, device: str
+) -> Callable[[dict[str, torch.Tensor]], dict[str, torch.Tensor]] | None:
+    """
+    Image encoder run once per transition by the replay buffers (`replay_image_features`), so
+    that the frozen vision encoder is not run again on every sampled batch.
+
+    Args:
+        cfg (TrainRLServerPipelineConfig): Training configuration
+        policy: The policy whose frozen vision encoder is used
+        device (str): Device running the encoder
+
+    Returns:
+        The encoder, mapping states to features per image key, or None if disabled
+    """
+    if not cfg.policy.replay_image_features:
+        return None
+
+    encoder = policy.actor.encoder
+
+    def encode(observations: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        images = {key: observations[key].to(device) for key in encoder.image_keys}
+        # Stored features must not depend on the batch they were computed in: use the
+        # inference statistics of the normalization layers, like the actor does
+        training = encoder.image_encoder.training
+        encoder.image_encoder.eval()
+        try:
+            with torch.no_grad():
+                return encoder.get_cached_image_features(images)
+        finally:
+            encoder.image_encoder.train(training)
+
+    return encode
+
+
 def use_threads(cfg: TrainRLServerPipelineConfig) -> bool:
     return cfg.policy.concurrency.learner == "threads"
 
@@ -1095,19 +1298,104 @@ def check_nan_in_transition(
     return nan_detected
 
 
-def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module):
-    logging.debug("[LEARNER] Pushing actor policy to the queue")
+def nan_transitions_in_batch(batch: dict) -> torch.Tensor:
+    """Mask of the transitions of a batch with NaN values in their state, next state or action.
+
+    Vectorized counterpart of `check_nan_in_transition`, for the stacked columns of
+    `columnar_bytes_to_batch`.
+    """
+    columns = [*batch["state"].values(), *batch["next_state"].values(), batch[ACTION]]
+    nan_detected = torch.zeros(len(batch[ACTION]), dtype=torch.bool)
+    for column in columns:
+        if column.is_floating_point():
+            nan_detected |= torch.isnan(column).reshape(len(column), -1).any(dim=1)
+    return nan_detected
+
+
+def _select_transitions(batch: dict, mask: torch.Tensor) -> dict:
+    """Transitions of a batch selected by a boolean mask."""
+    return {
+        key: _select_transitions(value, mask) if isinstance(value, dict) else value[mask]
+        for key, value in batch.items()
+    }
 
-    # Create a dictionary to hold all the state dicts
-    state_dicts = {"policy": move_state_dict_to_device(policy.actor.state_dict(), device="cpu")}
 
+def add_transition_batch(
+    buffer: bytes,
+    replay_buffer: ReplayBuffer,
+    offline_replay_buffer: ReplayBuffer,
+    dataset_repo_id: str | None,
+):
+    """Store the transitions of a columnar message column by column, without building transitions."""
+    num_transitions, batch = columnar_bytes_to_batch(buffer)
+    if num_transitions == 0:
+        return
+
+    # Skip transitions with NaN values
+    nan_detected = nan_transitions_in_batch(batch)
+    if nan_detected.any():
+        logging.warning(f"[LEARNER] NaN detected in {int(nan_detected.sum())} transitions, skipping them")
+        batch = _select_transitions(batch, ~nan_detected)
+
+    replay_buffer.add_batch(**batch)
+
+    # Add to offline buffer if it's an intervention
+    # The column names of the message are strings
+    is_intervention = batch.get("complementary_info", {}).get(TeleopEvents.IS_INTERVENTION.value)
+    if dataset_repo_id is not None and is_intervention is not None:
+        is_intervention = is_intervention.reshape(len(is_intervention), -1).bool().any(dim=1)
+        if is_intervention.any():
+            offline_replay_buffer.add_batch(**_select_transitions(batch, is_intervention))
+
+
+def push_actor_policy_to_queue(
+    parameters_queue: Queue,
+    policy: nn.Module,
+    exclude_frozen: bool = False,
+    shared_transport: LearnerSharedMemoryTransport | None = None,
+    encoder: ParameterDeltaEncoder | None = None,
+):
+    """Push the actor (and discrete critic) state dicts to the parameters queue.
+
+    With `exclude_frozen`, parameters that are not trained (e.g. a frozen vision
+    encoder) are left out, the actors already hold the same pretrained values.
+    With `shared_transport`, they are written to the shared parameter block instead.
+    With `encoder`, a delta message is pushed as `(header, bytes)`, for the learner
+    service to send to every actor.
+    """
+    logging.debug("[LEARNER] Pushing actor policy to the queue")
+
+    modules = {"policy": policy.actor}
     # Add discrete critic if it exists
     if hasattr(policy, "discrete_critic") and policy.discrete_critic is not None:
-        state_dicts["discrete_critic"] = move_state_dict_to_device(
-            policy.discrete_critic.state_dict(), device="cpu"
-        )
+        modules["discrete_critic"] = policy.discrete_critic
         logging.debug("[LEARNER] Including discrete critic in state dict push")
 
+    # Create a dictionary to hold all the state dicts
+    state_dicts = {}
+    for prefix, module in modules.items():
+        state_dict = module.state_dict()
+        if exclude_frozen:
+            for name in frozen_parameter_names(module):
+                state_dict.pop(name, None)
+        state_dicts[prefix] = state_dict
+
+    if shared_transport is not None:
+        # Copied straight from the training device into shared memory
+        shared_transport.push_parameters(state_dicts)
+        return
+
+    if encoder is not None:
+        # The encoder copies the tensors it needs to the CPU
+        message = encoder.encode(state_dicts)
+        parameters_queue.put((message[PARAMETER_SYNC_KEY], state_to_bytes(message)))
+        return
+
+    state_dicts = {
+        prefix: move_state_dict_to_device(state_dict, device="cpu")
+        for prefix, state_dict in state_dicts.items()
+    }
+
     state_bytes = state_to_bytes(state_dicts)
     parameters_queue.put(state_bytes)
 
@@ -1134,6 +1422,7 @@ def process_transitions(
     device: str,
     dataset_repo_id: str | None,
     shutdown_event: any,
+    shared_transport: LearnerSharedMemoryTransport | None = None,
 ):
     """Process all available transitions from the queue.
 
@@ -1144,11 +1433,21 @@ def process_transitions(
         device: Device to move transitions to
         dataset_repo_id: Repository ID for dataset
         shutdown_event: Event to signal shutdown
+        shared_transport: Shared memory transport to also drain transitions from
     """
-    while not transition_queue.empty() and not shutdown_event.is_set():
-        transition_list = transition_queue.get()
-        transition_list = bytes_to_transitions(buffer=transition_list)
 
+    def transition_lists():
+        if shared_transport is not None:
+            yield shared_transport.pop_transitions()
+        while not transition_queue.empty() and not shutdown_event.is_set():
+            buffer = transition_queue.get()
+            if is_columnar_bytes(buffer):
+                # Columnar messages go straight from their column buffers into the replay buffers
+                add_transition_batch(buffer, replay_buffer, offline_replay_buffer, dataset_repo_id)
+                continue
+            yield bytes_to_transitions(buffer=buffer)
+
+    for transition_list in transition_lists():
         for transition in transition_list:
             transition = move_transition_to_device(transition=transition, device=device)
 
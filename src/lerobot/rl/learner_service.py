@@ -16,10 +16,12 @@
 # limitations under the License.
 
 import logging
+import threading
 import time
 from multiprocessing import Event, Queue
 
-from lerobot.rl.queue import get_last_item_from_queue
+from lerobot.rl.parameter_sync import ParameterMessageLog
+from lerobot.rl.queue import get_all_items_from_queue, get_last_item_from_queue
 from lerobot.transport import services_pb2, services_pb2_grpc
 from lerobot.transport.utils import receive_bytes_in_chunks, send_bytes_in_chunks
 
@@ -42,19 +44,28 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
         transition_queue: Queue,
         interaction_message_queue: Queue,
         queue_get_timeout: float = 0.001,
+        parameters_sync: str = "full",
     ):
+        if parameters_sync not in ("full", "delta"):
+            raise ValueError(f"Unknown parameters sync mode '{parameters_sync}', expected 'full' or 'delta'")
+
         self.shutdown_event = shutdown_event
         self.parameters_queue = parameters_queue
         self.seconds_between_pushes = seconds_between_pushes
         self.transition_queue = transition_queue
         self.interaction_message_queue = interaction_message_queue
         self.queue_get_timeout = queue_get_timeout
+        self.parameters_sync = parameters_sync
+        # In "delta" mode, the queue holds `(header, bytes)` messages encoded once by the learner
+        self.parameter_log = ParameterMessageLog()
+        self._parameter_log_lock = threading.Lock()
 
     def StreamParameters(self, request, context):  # noqa: N802
         # TODO: authorize the request
         logging.info("[LEARNER] Received request to stream parameters from the Actor")
 
         last_push_time = 0
+        last_seq = None
 
         while not self.shutdown_event.is_set():
             time_since_last_push = time.time() - last_push_time
@@ -65,19 +76,28 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
                 continue
 
             logging.info("[LEARNER] Push parameters to the Actor")
-            buffer = get_last_item_from_queue(
-                self.parameters_queue, block=True, timeout=self.queue_get_timeout
-            )
-
-            if buffer is None:
-                continue
-
-            yield from send_bytes_in_chunks(
-                buffer,
-                services_pb2.Parameters,
-                log_prefix="[LEARNER] Sending parameters",
-                silent=True,
-            )
+            if self.parameters_sync == "delta":
+                messages = self._new_parameter_messages(last_seq)
+                if not messages:
+                    self.shutdown_event.wait(self.queue_get_timeout)
+                    continue
+                buffers = [data for _, data in messages]
+                last_seq = messages[-1][0]["seq"]
+            else:
+                buffer = get_last_item_from_queue(
+                    self.parameters_queue, block=True, timeout=self.queue_get_timeout
+                )
+                if buffer is None:
+                    continue
+                buffers = [buffer]
+
+            for buffer in buffers:
+                yield from send_bytes_in_chunks(
+                    buffer,
+                    services_pb2.Parameters,
+                    log_prefix="[LEARNER] Sending parameters",
+                    silent=True,
+                )
 
             last_push_time = time.time()
             logging.info("[LEARNER] Parameters sent")
@@ -85,6 +105,14 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
         logging.info("[LEARNER] Stream parameters finished")
         return services_pb2.Empty()
 
+    def _new_parameter_messages(self, last_seq: int | None) -> list[tuple[dict, bytes]]:
+        """Messages a stream that last sent `last_seq` has to send, oldest first."""
+        # Streams drain the queue in turn, so the log keeps the order of the learner
+        with self._parameter_log_lock:
+            for header, data in get_all_items_from_queue(self.parameters_queue):
+                self.parameter_log.add(header, data)
+        return self.parameter_log.since(last_seq)
+
     def SendTransitions(self, request_iterator, _context):  # noqa: N802
         # TODO: authorize the request
         logging.info("[LEARNER] Received request to receive transitions from the Actor")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Delta parameter synchronization between the learner and the actors.
+
+In "full" mode, the learner pushes serialized state dicts (e.g. `{"policy": ...,
+"discrete_critic": ...}`) to its parameters queue. In "delta" mode, the learner owns a
+single `ParameterDeltaEncoder` that turns its parameters into messages holding only the
+tensors that changed since the previous message, optionally as fp16/bf16 or
+int8-quantized differences, with a full keyframe every `keyframe_interval` messages.
+The encoder tracks the values the actors reconstruct, so quantization errors are
+carried over to the next difference instead of accumulating.
+
+Each message is serialized once and queued with its header. The `StreamParameters`
+streams share a `ParameterMessageLog` of the messages since the last keyframe, and
+send the same bytes to every actor: a stream starts at the last keyframe, then sends
+each new message in order.
+
+On the actor, a `ParameterDeltaDecoder` applies the messages in order, in place,
+into the live parameters and buffers of the policy modules.
+"""
+
+import logging
+import threading
+
+import torch
+from torch import nn
+
+PARAMETER_SYNC_KEY = "parameter_sync"
+PARAMETER_SYNC_VERSION = 1
+DELTA_DTYPES = ("float32", "float16", "bfloat16", "int8")
+
+
+def flatten_state_dicts(state_dicts: dict[str, dict[str, torch.Tensor]]) -> dict[str, torch.Tensor]:
+    """`{"policy": {"a.weight": t}}` -> `{"policy/a.weight": t}`."""
+    return {
+        f"{prefix}/{name}": tensor
+        for prefix, state_dict in state_dicts.items()
+        for name, tensor in state_dict.items()
+    }
+
+
+def frozen_parameter_names(module: nn.Module) -> set[str]:
+    """State dict names of the parameters that are not trained."""
+    return {name for name, param in module.named_parameters() if not param.requires_grad}
+
+
+class ParameterDeltaEncoder:
+    """Encodes successive state dict snapshots into delta messages for one actor.
+
+    Args:
+        delta_dtype: How differences are sent: "float32", "float16", "bfloat16" or
+            "int8" (per-tensor symmetric quantization).
+        keyframe_interval: Send every tensor in full every this many messages. The
+            first message, and any message whose keys changed, is always a keyframe.
+    """
+
+    def __init__(self, delta_dtype: str = "float16", keyframe_interval: int = 20):
+        if delta_dtype not in DELTA_DTYPES:
+            raise ValueError(f"Unsupported delta dtype '{delta_dtype}', expected one of {DELTA_DTYPES}")
+        if keyframe_interval < 1:
+            raise ValueError(f"keyframe_interval must be >= 1, got {keyframe_interval}")
+
+        self.delta_dtype = delta_dtype
+        self.keyframe_interval = keyframe_interval
+        # What the actor holds after applying every message sent so far
+        self._reference: dict[str, torch.Tensor] = {}
+        self._seq = 0
+        self._messages_since_keyframe = 0
+
+    def encode(self, state_dicts: dict[str, dict[str, torch.Tensor]]) -> dict:
+        """Encode a snapshot as a message to pass to `state_to_bytes`."""
+        flat = flatten_state_dicts(state_dicts)
+        keyframe = (
+            self._seq == 0
+            or self._messages_since_keyframe + 1 >= self.keyframe_interval
+            or flat.keys() != self._reference.keys()
+        )
+
+        tensors = {}
+        if keyframe:
+            self._reference = {name: value.detach().cpu().clone() for name, value in flat.items()}
+            tensors = {name: {"full": value} for name, value in self._reference.items()}
+            self._messages_since_keyframe = 0
+        else:
+            for name, value in flat.items():
+                payload = self._encode_tensor(self._reference[name], value.detach().cpu())
+                if payload is not None:
+                    tensors[name] = payload
+            self._messages_since_keyframe += 1
+
+        self._seq += 1
+        header = {
+            "version": PARAMETER_SYNC_VERSION,
+            "seq": self._seq,
+            "base_seq": self._seq - 1,
+            "keyframe": keyframe,
+        }
+        return {PARAMETER_SYNC_KEY: header, "tensors": tensors}
+
+    def _encode_tensor(self, reference: torch.Tensor, value: torch.Tensor) -> dict | None:
+        if not value.is_floating_point():
+            if torch.equal(reference, value):
+                return None
+            reference.copy_(value)
+            return {"full": reference.clone()}
+
+        diff = value - reference
+        if not diff.any():
+            # Unchanged, e.g. frozen or not yet updated
+            return None
+
+        if self.delta_dtype == "int8":
+            scale = diff.abs().max() / 127
+            quantized = torch.round(diff / scale).clamp_(-127, 127).to(torch.int8)
+            reference.add_(quantized.to(reference.dtype), alpha=scale.item())
+            return {"diff": quantized, "scale": scale.reshape(1)}
+
+        diff = diff.to(getattr(torch, self.delta_dtype))
+        reference.add_(diff.to(reference.dtype))
+        return {"diff": diff}
+
+
+class ParameterMessageLog:
+    """Serialized messages of a `ParameterDeltaEncoder` since its last keyframe.
+
+    Shared by the learner streams, which all send the same bytes to their actor.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._messages: list[tuple[dict, bytes]] = []
+
+    def add(self, header: dict, data: bytes):
+        """Add the serialized message `data` whose header is `header`."""
+        with self._lock:
+            if header["keyframe"]:
+                self._messages = []
+            elif not self._messages or header["base_seq"] != self._messages[-1][0]["seq"]:
+                logging.warning(
+                    f"[LEARNER] Dropping parameter delta {header['seq']} based on {header['base_seq']}, "
+                    "which is not the last message; waiting for a keyframe."
+                )
+                return
+            self._messages.append((header, data))
+
+    def since(self, seq: int | None) -> list[tuple[dict, bytes]]:
+        """Messages to send to a stream whose last sent message is `seq`, oldest first.
+
+        A stream that has not sent any message of this log yet starts at its keyframe.
+        """
+        with self._lock:
+            messages = self._messages
+        for index, (header, _) in enumerate(messages):
+            if header["seq"] == seq:
+                return messages[index + 1 :]
+        return messages
+
+
+class ParameterDeltaDecoder:
+    """Applies parameter sync messages in place into the parameters of `modules`.
+
+    Args:
+        modules: The modules to update, keyed like the learner state dicts
+            (e.g. `{"policy": policy.actor, "discrete_critic": policy.discrete_critic}`).
+    """
+
+    def __init__(self, modules: dict[str, nn.Module]):
+        # Live parameters and buffers, updated without reallocating
+        self._targets = flatten_state_dicts(
+            {prefix: module.state_dict(keep_vars=True) for prefix, module in modules.items()}
+        )
+        self._seq: int | None = None
+
+    @property
+    def seq(self) -> int | None:
+        """Sequence number of the last applied message."""
+        return self._seq
+
+    @torch.no_grad()
+    def apply(self, message: dict) -> bool:
+        """Apply a decoded message. Returns False if it had to be skipped.
+
+        A plain `{"policy": state_dict, ...}` message, as sent in "full" mode, is
+        applied like a keyframe. A delta whose base is not the last applied message
+        is skipped until the next keyframe resynchronizes the actor.
+        """
+        header = message.get(PARAMETER_SYNC_KEY)
+        if header is None:
+            tensors = {name: {"full": value} for name, value in flatten_state_dicts(message).items()}
+            header = {"seq": None, "base_seq": None, "keyframe": True}
+        else:
+            if header["version"] != PARAMETER_SYNC_VERSION:
+                raise ValueError(f"Unsupported parameter sync version {header['version']}")
+            tensors = message["tensors"]
+
+        if not header["keyframe"] and (self._seq is None or header["base_seq"] != self._seq):
+            logging.warning(
+                f"[ACTOR] Skipping parameter delta {header['seq']} based on {header['base_seq']}, "
+                f"last applied is {self._seq}; waiting for a keyframe."
+            )
+            return False
+
+        for name, payload in tensors.items():
+            target = self._targets.get(name)
+            if target is None:
+                logging.warning(f"[ACTOR] Ignoring unknown parameter {name}")
+                continue
+            if "full" in payload:
+                target.copy_(payload["full"])
+            elif "scale" in payload:
+                target.add_(payload["diff"].to(target.device, target.dtype), alpha=payload["scale"].item())
+            else:
+                target.add_(payload["diff"].to(target.device, target.dtype))
+
+        self._seq = header["seq"]
+        return True
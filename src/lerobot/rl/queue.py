@@ -50,3 +50,14 @@ def get_last_item_from_queue(queue: Queue, block=True, timeout: float = 0.1) ->
             item = queue.get_nowait()
 
     return item
+
+
+def get_all_items_from_queue(queue: Queue) -> list[Any]:
+    """Drain the queue without blocking and return every item, oldest first."""
+    items = []
+    try:
+        while True:
+            items.append(queue.get_nowait())
+    except Empty:
+        pass
+    return items
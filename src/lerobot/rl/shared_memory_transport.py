@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared-memory transport between an actor and a learner running on the same host.
+
+Selected with `actor_learner_config.transport="shared_memory"`. Transitions go
+through a `SharedTransitionRing` created by the actor, policy parameters through a
+`SharedParameterBlock` created by the learner. Each side attaches lazily to the
+segment created by the other, so the two programs can be started in any order, and
+attaches again when the other one restarts, even after a crash.
+Interaction messages keep using gRPC.
+"""
+
+import logging
+
+import torch
+from torch import nn
+
+from lerobot.rl.parameter_sync import flatten_state_dicts
+from lerobot.transport.shared_memory import SharedParameterBlock, SharedTransitionRing
+from lerobot.utils.transition import Transition
+
+
+def transitions_segment_name(name: str) -> str:
+    return f"{name}_transitions"
+
+
+def parameters_segment_name(name: str) -> str:
+    return f"{name}_parameters"
+
+
+class ActorSharedMemoryTransport:
+    """Actor side: pushes transitions into the ring and pulls parameters from the block.
+
+    Args:
+        name: Prefix of the shared memory segment names, shared with the learner.
+        transition_slots: Capacity of the transition ring.
+        modules: Policy modules updated in place, keyed like the learner state dicts.
+        stale_timeout: Seconds without parameter writes after which the actor checks
+            whether the learner restarted with a new block.
+    """
+
+    def __init__(
+        self, name: str, transition_slots: int, modules: dict[str, nn.Module], stale_timeout: float = 5.0
+    ):
+        self.name = name
+        self.transition_slots = transition_slots
+        self.stale_timeout = stale_timeout
+        self._targets = flatten_state_dicts(
+            {prefix: module.state_dict(keep_vars=True) for prefix, module in modules.items()}
+        )
+        self._ring: SharedTransitionRing | None = None
+        self._block: SharedParameterBlock | None = None
+        self._seq = 0
+
+    def push_transitions(self, transitions: list[Transition], timeout: float = 1.0):
+        if not transitions:
+            return
+        if self._ring is None:
+            # The slot layout is taken from the first transition
+            self._ring = SharedTransitionRing.create(
+                transitions_segment_name(self.name), example=transitions[0], capacity=self.transition_slots
+            )
+        for transition in transitions:
+            if not self._ring.push(transition, timeout=timeout):
+                logging.warning("[ACTOR] Shared transition ring is full, dropping transition")
+
+    def update_parameters(self) -> bool:
+        """Copy new parameters from the learner into the policy, returns True if any."""
+        if self._block is not None and self._block.is_orphaned(self.stale_timeout):
+            # The learner stopped or restarted, attach to its new block
+            self._block.close()
+            self._block = None
+            self._seq = 0
+        if self._block is None:
+            self._block = SharedParameterBlock.attach(parameters_segment_name(self.name))
+            if self._block is None:
+                return False
+
+        try:
+            seq = self._block.read_into(self._targets, last_seq=self._seq)
+        except TimeoutError:
+            # The learner kept writing, the policy is left as it was until the next update
+            logging.warning("[ACTOR] Could not read consistent parameters from the learner, retrying later")
+            return False
+        if seq is None:
+            return False
+        self._seq = seq
+        return True
+
+    def close(self):
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+        if self._block is not None:
+            self._block.close()
+            self._block = None
+
+
+class LearnerSharedMemoryTransport:
+    """Learner side: publishes parameters into the block and drains the transition ring.
+
+    Args:
+        name: Prefix of the shared memory segment names, shared with the actor.
+        stale_timeout: Seconds without transitions after which the learner checks
+            whether the actor restarted with a new ring.
+    """
+
+    def __init__(self, name: str, stale_timeout: float = 5.0):
+        self.name = name
+        self.stale_timeout = stale_timeout
+        self._ring: SharedTransitionRing | None = None
+        self._block: SharedParameterBlock | None = None
+
+    def push_parameters(self, state_dicts: dict[str, dict[str, torch.Tensor]]):
+        parameters = flatten_state_dicts(state_dicts)
+        if self._block is None:
+            self._block = SharedParameterBlock.create(parameters_segment_name(self.name), parameters)
+        self._block.write(parameters)
+
+    def pop_transitions(self) -> list[Transition]:
+        """Transitions pushed since the last call.
+
+        Their tensors are views into the shared ring, only valid until the next call:
+        they must be copied (e.g. added to the replay buffer) before that.
+        """
+        transitions = []
+        if self._ring is not None and self._ring.is_orphaned(self.stale_timeout):
+            # The actor stopped or restarted, keep what it pushed last and attach to its next ring
+            transitions = self._ring.pop_all(copy=True)
+            self._ring.close()
+            self._ring = None
+        if self._ring is None:
+            self._ring = SharedTransitionRing.attach(transitions_segment_name(self.name))
+            if self._ring is None:
+                return transitions
+        return transitions + self._ring.pop_all(copy=False)
+
+    def close(self):
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+        if self._block is not None:
+            self._block.close()
+            self._block = None
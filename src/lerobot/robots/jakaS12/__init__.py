@@ -1,4 +1,8 @@
 from .jakaS12 import JakaS12
 from .config_jakaS12 import JakaS12Config
 from .modbus_tcp import ModbusTCP
-from .jakaS12_bus import JakaS12Bus
\ No newline at end of file
+from .async_modbus_tcp import AsyncModbusTCP
+from .jakaS12_bus import JakaS12Bus
+from .state_poller import JakaS12StatePoller, JakaS12StateSnapshot
+from .servo_streamer import JakaS12ServoStreamer
+from .observation import JakaS12Observation, JakaS12ObservationLayout
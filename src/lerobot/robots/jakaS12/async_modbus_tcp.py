@@ -0,0 +1,270 @@
+import asyncio
+import itertools
+import threading
+import time
+
+from loguru import logger
+from pymodbus.client import AsyncModbusTcpClient
+
+
+class AsyncModbusTCP:
+    """Pooled asyncio Modbus TCP client with the same `read`/`write` interface as `ModbusTCP`.
+
+    The clients live on a private event loop running in a daemon thread, so the
+    synchronous `read`/`write` calls can be used from the control loop while
+    `read_coils_async`/`write_async` are available to asyncio code.
+
+    - Reads fetch `coils_count` coils starting at `coils_address` in one request
+      and cache them for `cache_ttl_s`; concurrent reads of the same block share
+      one in-flight request.
+    - Writes are skipped when the cache, filled by the reads and writes of the
+      last `cache_ttl_s`, shows the coil already holds the value. The device or
+      another client may change a coil, so older writes never suppress a new one.
+    - Failed requests drop the client and reconnect with exponential backoff
+      instead of exiting the process.
+    """
+
+    def __init__(self,
+                 ip: str = "192.168.1.8",
+                 port: int = 502,
+                 coils_address: int = 8,
+                 coils_count: int = 1,
+                 pool_size: int = 2,
+                 cache_ttl_s: float = 0.02,
+                 timeout_s: float = 1.0,
+                 max_retries: int = 3,
+                 reconnect_delay_s: float = 0.1,
+                 reconnect_delay_max_s: float = 5.0) -> None:
+        self._ip: str = ip
+        self._port: int = port
+        self._coils_address: int = coils_address
+        self._coils_count: int = coils_count
+        self._pool_size: int = pool_size
+        self._cache_ttl_s: float = cache_ttl_s
+        self._timeout_s: float = timeout_s
+        self._max_retries: int = max_retries
+        self._reconnect_delay_s: float = reconnect_delay_s
+        self._reconnect_delay_max_s: float = reconnect_delay_max_s
+
+        # Event loop
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+        # Client pool, one lock per client so each carries one request at a time
+        self._clients: list[AsyncModbusTcpClient] = []
+        self._client_locks: list[asyncio.Lock] = []
+        self._next_client = itertools.count()
+
+        # Coil state: address -> (value, perf_counter stamp)
+        self._coil_cache: dict[int, tuple[bool, float]] = {}
+        self._inflight: dict[tuple[int, int], asyncio.Future] = {}
+
+        self._is_connected: bool = False
+
+    @property
+    def is_connected(self) -> bool:
+        return self._is_connected
+
+    ##############################
+    ########Sync interface########
+    ##############################
+
+    def connect(self) -> None:
+        if self._is_connected:
+            return
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name="AsyncModbusTCP",
+                                        daemon=True)
+        self._thread.start()
+
+        try:
+            self._run(self._connect_pool())
+        except Exception:
+            self._stop_loop()
+            raise
+
+        self._is_connected = True
+        logger.info(
+            f"Connect to {self._ip}:{self._port} successfully ({self._pool_size} connections)"
+        )
+
+    def disconnect(self) -> None:
+        if self._loop is None:
+            return
+
+        self._run(self._close_pool())
+        self._stop_loop()
+        self._is_connected = False
+        logger.info("Disconnected from Modbus server.")
+
+    def read(self, coil_address: int) -> bool:
+        # Serve cache hits without a round trip through the event loop thread
+        cached = self._cached(coil_address)
+        if cached is not None:
+            return cached
+        return self._run(self.read_async(coil_address))
+
+    def read_coils(self, coil_address: int, count: int) -> list[bool]:
+        return self._run(self.read_coils_async(coil_address, count))
+
+    def write(self, coil_address: int, status_to_send: bool) -> None:
+        if self._cached(coil_address) is bool(status_to_send):
+            return
+        self._run(self.write_async(coil_address, status_to_send))
+
+    ###############################
+    ########Async interface########
+    ###############################
+
+    async def read_async(self, coil_address: int) -> bool:
+        cached = self._cached(coil_address)
+        if cached is not None:
+            return cached
+
+        # Fetch the whole configured block when the coil is part of it
+        start, count = coil_address, 1
+        block_end = self._coils_address + self._coils_count
+        if self._coils_address <= coil_address < block_end:
+            start, count = self._coils_address, self._coils_count
+
+        bits = await self._read_block(start, count)
+        return bits[coil_address - start]
+
+    async def read_coils_async(self, coil_address: int,
+                               count: int) -> list[bool]:
+        cached = [self._cached(coil_address + i) for i in range(count)]
+        if all(bit is not None for bit in cached):
+            return cached
+        return await self._read_block(coil_address, count)
+
+    async def write_async(self, coil_address: int,
+                          status_to_send: bool) -> None:
+        status_to_send = bool(status_to_send)
+        if self._cached(coil_address) is status_to_send:
+            return
+
+        result = await self._request(
+            lambda client: client.write_coil(coil_address, status_to_send))
+        if result.isError():
+            raise IOError(f"Failed to write to coil {coil_address}: {result}")
+
+        self._coil_cache[coil_address] = (status_to_send, time.perf_counter())
+        logger.debug(
+            f"Write to coil {coil_address} status {status_to_send} successfully!"
+        )
+
+    #############################
+    ########Custom method########
+    #############################
+
+    def _run(self, coro):
+        if self._loop is None:
+            coro.close()
+            raise ConnectionError("Modbus TCP not connected")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        # Leave room for every retry and its backoff before giving up
+        return future.result(timeout=(self._timeout_s +
+                                      self._reconnect_delay_max_s) *
+                             (self._max_retries + 1))
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=1.0)
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    def _cached(self, coil_address: int) -> bool | None:
+        entry = self._coil_cache.get(coil_address)
+        if entry is None or time.perf_counter(
+        ) - entry[1] > self._cache_ttl_s:
+            return None
+        return entry[0]
+
+    def _make_client(self) -> AsyncModbusTcpClient:
+        # Reconnection is handled here, so disable the client's own loop
+        return AsyncModbusTcpClient(host=self._ip,
+                                    port=self._port,
+                                    timeout=self._timeout_s,
+                                    retries=0,
+                                    reconnect_delay=0)
+
+    async def _connect_pool(self) -> None:
+        self._clients = [self._make_client() for _ in range(self._pool_size)]
+        self._client_locks = [asyncio.Lock() for _ in range(self._pool_size)]
+        await asyncio.gather(
+            *(self._reconnect(i) for i in range(self._pool_size)))
+
+    async def _close_pool(self) -> None:
+        for client in self._clients:
+            client.close()
+        self._clients = []
+        self._client_locks = []
+        self._coil_cache.clear()
+
+    async def _reconnect(self, index: int) -> None:
+        delay = self._reconnect_delay_s
+        for attempt in range(self._max_retries + 1):
+            self._clients[index].close()
+            self._clients[index] = self._make_client()
+            if await self._clients[index].connect():
+                return
+
+            logger.warning(
+                f"Connect to {self._ip}:{self._port} failed (attempt {attempt + 1}), retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._reconnect_delay_max_s)
+
+        raise ConnectionError(f"Could not connect to {self._ip}:{self._port}")
+
+    async def _request(self, call):
+        index = next(self._next_client) % self._pool_size
+        async with self._client_locks[index]:
+            for attempt in range(self._max_retries + 1):
+                try:
+                    if not self._clients[index].connected:
+                        await self._reconnect(index)
+                    return await call(self._clients[index])
+                except ConnectionError:
+                    raise
+                except Exception as e:
+                    logger.warning(
+                        f"Modbus TCP request failed (attempt {attempt + 1}): {e}"
+                    )
+                    # The peer may have reset the coils, forget their cached values
+                    self._coil_cache.clear()
+                    self._clients[index].close()
+            raise ConnectionError(
+                f"Modbus TCP request to {self._ip}:{self._port} failed after {self._max_retries + 1} attempts"
+            )
+
+    async def _read_block(self, coil_address: int, count: int) -> list[bool]:
+        key = (coil_address, count)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._request(
+                lambda client: client.read_coils(coil_address, count=count))
+            if result.isError():
+                raise IOError(f"Failed to read coil {coil_address}: {result}")
+
+            bits = [bool(bit) for bit in result.bits[:count]]
+            now = time.perf_counter()
+            for i, bit in enumerate(bits):
+                self._coil_cache[coil_address + i] = (bit, now)
+            future.set_result(bits)
+            return bits
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it, mark it retrieved for the owner
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
@@ -16,6 +16,29 @@ class JakaS12Config(RobotConfig):
     sucker_ip: str = "192.168.1.8"
     sucker_port: int = 502
     coils_address: int = 8
+    # "sync" uses ModbusTCP, "async" uses the pooled AsyncModbusTCP client
+    sucker_client: str = "sync"
+    sucker_pool_size: int = 2
+    sucker_coils_count: int = 1
+    sucker_cache_ttl_s: float = 0.02
+
+    # State polling: read joint/TCP/sucker state on a background thread and
+    # let get_observation() copy the latest snapshot instead of blocking on I/O
+    use_state_polling: bool = False
+    state_polling_fps: float = 100.0
+
+    # Read joints, TCP pose and end-effector torque from a single
+    # get_robot_status call per tick (also enables the EE torque feature)
+    use_robot_status: bool = False
+
+    # Servo streaming: send_action() posts the delta to a dedicated thread that
+    # streams it to the arm at servo_rate_hz, interpolating slow policies
+    use_servo_streaming: bool = False
+    servo_rate_hz: float = 125.0
+
+    # Return a JakaS12Observation: a read-only mapping with a fixed key schema
+    # whose values are read from a state vector filled in place every tick
+    use_array_observation: bool = False
 
     # Cameras
     cameras: dict[str, CameraConfig] = field(
@@ -8,10 +8,15 @@ from lerobot.Dav1nGen_utils.fps_monitor import FPSMonitor
 from loguru import logger
 
 from ..robot import Robot
+from .async_modbus_tcp import AsyncModbusTCP
 from .config_jakaS12 import JakaS12Config
 from .jaka_lib_2_3_0 import jkrc
 from .jakaS12_bus import JakaS12Bus
 from .modbus_tcp import ModbusTCP
+from .observation import JakaS12Observation, JakaS12ObservationLayout
+from .robot_status import JakaS12StatusReader
+from .servo_streamer import JakaS12ServoStreamer
+from .state_poller import JakaS12StatePoller
 
 
 class JakaS12(Robot):
@@ -32,6 +37,9 @@ class JakaS12(Robot):
         self._EE_torque: tuple = (0, 0, 0, 0, 0, 0)
         self._cartesian_space_position_diff: dict[str, float] = {}
         self._robot = jkrc.RC(self._arm_ip)
+        # Serializes the SDK calls of the control loop, the state poller and
+        # the servo streamer, which share the same SDK handle
+        self._sdk_lock = threading.Lock()
         # self._action_scale: list = [
         #     0.5, 0.5, 0.5, 0.05, 0.05, 0.05
         # ]
@@ -41,10 +49,51 @@ class JakaS12(Robot):
         self._sucker_ip: str = self._config.sucker_ip
         self._sucker_port: int = self._config.sucker_port
         self._coils_address: int = self._config.coils_address
-        self._sucker: ModbusTCP = ModbusTCP(ip=self._sucker_ip,
-                                            port=self._sucker_port)
+        self._sucker: ModbusTCP | AsyncModbusTCP
+        if self._config.sucker_client == "async":
+            self._sucker = AsyncModbusTCP(
+                ip=self._sucker_ip,
+                port=self._sucker_port,
+                coils_address=self._coils_address,
+                coils_count=self._config.sucker_coils_count,
+                pool_size=self._config.sucker_pool_size,
+                cache_ttl_s=self._config.sucker_cache_ttl_s)
+        elif self._config.sucker_client == "sync":
+            self._sucker = ModbusTCP(ip=self._sucker_ip,
+                                     port=self._sucker_port)
+        else:
+            raise ValueError(
+                f"Unknown sucker_client '{self._config.sucker_client}', expected 'sync' or 'async'"
+            )
         self._sucker_state: bool = False
 
+        # Batched status read
+        self._status_reader: JakaS12StatusReader | None = None
+        if self._config.use_robot_status:
+            self._status_reader = JakaS12StatusReader(self._robot)
+
+        # State polling
+        self._state_poller: JakaS12StatePoller | None = None
+        if self._config.use_state_polling:
+            self._state_poller = JakaS12StatePoller(
+                robot=self._robot,
+                sucker=self._sucker,
+                coils_address=self._coils_address,
+                fps=self._config.state_polling_fps,
+                status_reader=self._status_reader,
+                sdk_lock=self._sdk_lock)
+
+        # Servo streaming
+        self._servo_streamer: JakaS12ServoStreamer | None = None
+        if self._config.use_servo_streaming:
+            self._servo_streamer = JakaS12ServoStreamer(
+                robot=self._robot,
+                servo_rate_hz=self._config.servo_rate_hz,
+                sdk_lock=self._sdk_lock)
+
+        # Array-backed observation, allocated at connect time
+        self._observation: JakaS12Observation | None = None
+
     def connect(self) -> None:
 
         # Connect to arm
@@ -94,7 +143,26 @@ class JakaS12(Robot):
         logger.info(f"Successfully connected to _cameras")
 
         # Arm bus connenct
-        self.bus = JakaS12Bus(self._robot)
+        self.bus = JakaS12Bus(self._robot, sdk_lock=self._sdk_lock)
+
+        # Start background state polling
+        if self._state_poller is not None:
+            self._state_poller.start()
+
+        # Start servo streaming
+        if self._servo_streamer is not None:
+            self._servo_streamer.start()
+
+        # Compute the observation key schema once
+        if self._config.use_array_observation:
+            state_age_keys = ()
+            if self._state_poller is not None:
+                state_age_keys = tuple(self._state_poller.latest().ages())
+            self._observation = JakaS12Observation(
+                JakaS12ObservationLayout(
+                    camera_keys=tuple(self._cameras),
+                    use_EE_torque=self._status_reader is not None,
+                    state_age_keys=state_age_keys))
 
         self._is_connected = True
 
@@ -102,6 +170,14 @@ class JakaS12(Robot):
         if not self._is_connected:
             return
 
+        if self._servo_streamer is not None:
+            self._servo_streamer.stop()
+
+        if self._state_poller is not None:
+            self._state_poller.stop()
+
+        self._sucker.disconnect()
+
         if self._robot:
             try:
                 self._robot.logout()
@@ -147,8 +223,10 @@ class JakaS12(Robot):
 
     @property
     def _joint_feature(self) -> dict[str, float]:
-        joint_position = self._robot.get_joint_position()[1]
-        self._joint_position = joint_position
+        # In polling or status mode self._joint_position is refreshed by get_observation()
+        if self._state_poller is None and self._status_reader is None:
+            with self._sdk_lock:
+                self._joint_position = self._robot.get_joint_position()[1]
 
         feature = {}
         for i in range(6):
@@ -165,34 +243,37 @@ class JakaS12(Robot):
     @property
     def _cart_position_feature(self) -> dict[str, float]:
         cart_position_feature = {}
-        self._cart_positon = self._robot.get_tcp_position()[1]
+        if self._state_poller is None and self._status_reader is None:
+            with self._sdk_lock:
+                self._cart_position = self._robot.get_tcp_position()[1]
         cart_position_feature = {
-            "x": self._cart_positon[0],
-            "y": self._cart_positon[1],
-            "z": self._cart_positon[2],
-            "rx": self._cart_positon[3],
-            "ry": self._cart_positon[4],
-            "rz": self._cart_positon[5],
+            "x": self._cart_position[0],
+            "y": self._cart_position[1],
+            "z": self._cart_position[2],
+            "rx": self._cart_position[3],
+            "ry": self._cart_position[4],
+            "rz": self._cart_position[5],
         }
 
         return cart_position_feature
 
-    # TODO(Dav1nGen): The low-frequency issue needs to be fixed.
-    # @property
-    # def _EE_torque_feature(self) -> dict[str, float]:
-    #     EE_torque_feature = {}
-    #     self._EE_torque = self._robot.get_robot_status()[1][21]
-    #     # TODO(Dav1nGen): self._EE_torque = self._robot.get_robot_status()[1][21][6]??
-    #     EE_torque_feature = {
-    #         "x": self._EE_torque[0],
-    #         "y": self._EE_torque[1],
-    #         "z": self._EE_torque[2],
-    #         "rx": self._EE_torque[3],
-    #         "ry": self._EE_torque[4],
-    #         "rz": self._EE_torque[5],
-    #     }
-
-    #     return EE_torque_feature
+    # Only available with use_robot_status: the torque comes from the same
+    # get_robot_status payload as the joints and TCP pose, so it is free.
+    @property
+    def _EE_torque_feature(self) -> dict[str, float]:
+        if self._status_reader is None:
+            return {}
+
+        EE_torque_feature = {
+            "EE_torque.x": self._EE_torque[0],
+            "EE_torque.y": self._EE_torque[1],
+            "EE_torque.z": self._EE_torque[2],
+            "EE_torque.rx": self._EE_torque[3],
+            "EE_torque.ry": self._EE_torque[4],
+            "EE_torque.rz": self._EE_torque[5],
+        }
+
+        return EE_torque_feature
 
     @property
     def _cameras_feature(self) -> dict[str, dict]:
@@ -207,7 +288,8 @@ class JakaS12(Robot):
 
     @property
     def _sucker_feature(self) -> dict[str, bool]:
-        self._sucker_state = self._sucker.read(self._coils_address)
+        if self._state_poller is None:
+            self._sucker_state = self._sucker.read(self._coils_address)
         return {"sucker_state": self._sucker_state}
 
     @property
@@ -215,14 +297,22 @@ class JakaS12(Robot):
         features = {
             **self._joint_feature,
             **self._cart_position_feature,
-            # **self._EE_torque_feature,
+            **self._EE_torque_feature,
             **self._sucker_feature,
             **self._cameras_feature
         }
+        if self._state_poller is not None:
+            features.update(self._state_poller.latest().ages())
         return features
 
     def get_observation(self) -> dict[str, Any]:
 
+        state_age_feature: dict[str, float] = self._refresh_state()
+
+        # Fill the preallocated observation in place
+        if self._observation is not None:
+            return self._fill_observation(state_age_feature)
+
         # Joint feature
         joint_feature: dict[str, float] = self._joint_feature
 
@@ -231,7 +321,7 @@ class JakaS12(Robot):
             str, float] = self._cart_position_feature
 
         # EE torque feature
-        # EE_torque_feature: dict[str, float] = self._EE_torque_feature
+        EE_torque_feature: dict[str, float] = self._EE_torque_feature
 
         # Sucker feature
         sucker_feature: dict[str, bool] = self._sucker_feature
@@ -246,13 +336,62 @@ class JakaS12(Robot):
         observation_dict = {
             **joint_feature,
             **cartesian_space_position_feature,
-            # **EE_torque_feature,
+            **EE_torque_feature,
             **sucker_feature,
+            **state_age_feature,
             **camera_feature
         }
 
         return observation_dict
 
+    # Copy the latest polled or batched state instead of querying the hardware
+    # per feature, returns the staleness metadata of the polled sources
+    def _refresh_state(self) -> dict[str, float]:
+        state_age_feature: dict[str, float] = {}
+        if self._state_poller is not None:
+            snapshot = self._state_poller.latest()
+            self._joint_position = snapshot.joint_position
+            self._cart_position = snapshot.cart_position
+            self._sucker_state = snapshot.sucker_state
+            if snapshot.EE_torque is not None:
+                self._EE_torque = snapshot.EE_torque
+            state_age_feature = snapshot.ages()
+        elif self._status_reader is not None:
+            # One SDK round trip for joints, TCP pose and EE torque
+            with self._sdk_lock:
+                status = self._status_reader.refresh()
+            self._joint_position = status.joint_position
+            self._cart_position = status.cart_position
+            self._EE_torque = status.EE_torque
+
+        return state_age_feature
+
+    def _fill_observation(
+            self, state_age_feature: dict[str, float]) -> JakaS12Observation:
+        if self._state_poller is None and self._status_reader is None:
+            with self._sdk_lock:
+                self._joint_position = self._robot.get_joint_position()[1]
+                self._cart_position = self._robot.get_tcp_position()[1]
+        if self._state_poller is None:
+            self._sucker_state = self._sucker.read(self._coils_address)
+
+        observation = self._observation
+        layout = observation.layout
+        state = observation.state
+        state[layout.joint_slice] = self._joint_position
+        state[layout.cart_slice] = self._cart_position
+        if layout.EE_torque_slice is not None:
+            state[layout.EE_torque_slice] = self._EE_torque
+        state[layout.sucker_index] = self._sucker_state
+        if state_age_feature:
+            state[layout.state_age_slice] = tuple(state_age_feature.values())
+
+        # Capture images from _cameras
+        for cam_key, cam in self._cameras.items():
+            observation.set_image(cam_key, cam.async_read())
+
+        return observation
+
     @property
     def action_features(self) -> dict[str, Any]:
         return self._cartesian_space_position_diff
@@ -280,13 +419,24 @@ class JakaS12(Robot):
         #     a * b for a, b in zip(pos_diff, self._action_scale))
 
         # logger.debug(f"sent action pos diff:{scaled_pos_diff}")
-        self._robot.edg_servo_p(end_pos=pos_diff,
-                                move_mode=1,
-                                step_num=1,
-                                robot_index=0)
+        if self._servo_streamer is not None:
+            self._servo_streamer.submit(pos_diff)
+        else:
+            with self._sdk_lock:
+                self._robot.edg_servo_p(end_pos=pos_diff,
+                                        move_mode=1,
+                                        step_num=1,
+                                        robot_index=0)
 
         return self._cartesian_space_position_diff
 
+    @property
+    def servo_stats(self) -> dict | None:
+        """Deadline-miss and jitter histograms of the servo streaming thread."""
+        if self._servo_streamer is None:
+            return None
+        return self._servo_streamer.get_stats()
+
     def is_calibrated(self) -> bool:
         pass
 
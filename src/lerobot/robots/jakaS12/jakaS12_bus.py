@@ -1,3 +1,4 @@
+import threading
 from typing import Any
 from numpy import float64
 from loguru import logger
@@ -9,8 +10,10 @@ from ..robot import Robot
 
 class JakaS12Bus(RobotBusBase):
 
-    def __init__(self, jaka_robot):
+    def __init__(self, jaka_robot, sdk_lock: "threading.Lock | None" = None):
         self._robot = jaka_robot
+        # Shared with the threads polling or streaming through the same SDK handle
+        self._sdk_lock = sdk_lock if sdk_lock is not None else threading.Lock()
         self.motors = {
             "joint1": 0.0,
             "joint2": 0.0,
@@ -20,12 +23,14 @@ class JakaS12Bus(RobotBusBase):
             "joint6": 0.0,
         }
 
-        joint_positions = self._robot.get_joint_position()[1]
+        with self._sdk_lock:
+            joint_positions = self._robot.get_joint_position()[1]
         for i, key in enumerate(self.motors.keys()):
             self.motors[key] = float(joint_positions[i])
 
     def sync_read(self, dict_name: str) -> dict[str, float64]:
-        joint_positions = self._robot.get_joint_position()[1]
+        with self._sdk_lock:
+            joint_positions = self._robot.get_joint_position()[1]
 
         for i, key in enumerate(self.motors.keys()):
             self.motors[key] = float(joint_positions[i])
@@ -35,7 +40,8 @@ class JakaS12Bus(RobotBusBase):
     def sync_write(self, dict_name: str, joint_position: dict[str, float64]):
         position = tuple(joint_position.values())
         
-        self._robot.edg_servo_j(joint_pos=position,
-                  move_mode=0,
-                  step_num=100,
-                  robot_index=0)
+        with self._sdk_lock:
+            self._robot.edg_servo_j(joint_pos=position,
+                      move_mode=0,
+                      step_num=100,
+                      robot_index=0)
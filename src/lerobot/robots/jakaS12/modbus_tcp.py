@@ -36,7 +36,7 @@ class ModbusTCP:
             logger.error(f"Modbus TCP write failed: {result}")
             raise IOError(f"Failed to write to coil {coil_address}")
         else:
-            logger.info(
+            logger.debug(
                 f"Write to coil {coil_address} status {status_to_send} successfully!"
             )
 
@@ -0,0 +1,104 @@
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import numpy as np
+
+JOINT_NAMES: tuple[str, ...] = tuple(f"joint{i+1}" for i in range(6))
+CART_AXES: tuple[str, ...] = ("x", "y", "z", "rx", "ry", "rz")
+
+
+class JakaS12ObservationLayout:
+    """Fixed key schema of the JakaS12 observation, computed once at connect time.
+
+    Every scalar key maps to a slot of a flat float64 state vector laid out as
+    [joints(6), TCP pose(6), EE torque(6, optional), sucker(1), state ages(n)].
+    Both joint aliases (`jointN._joint_position` and `jointN.pos`) share a slot.
+    """
+
+    def __init__(self,
+                 camera_keys: tuple[str, ...] = (),
+                 use_EE_torque: bool = False,
+                 state_age_keys: tuple[str, ...] = ()) -> None:
+        keys: list[tuple[str, int]] = []
+
+        # Joints
+        for i, name in enumerate(JOINT_NAMES):
+            # The gym_manipulator retrieves data from obs_dict[name._joint_position]
+            keys.append((f"{name}._joint_position", i))
+            # When generating a raw dict, the gym_manipulator needs to use name.pos as the key
+            keys.append((f"{name}.pos", i))
+        self.joint_slice = slice(0, 6)
+        size = 6
+
+        # Cartesian space position
+        keys.extend((axis, size + i) for i, axis in enumerate(CART_AXES))
+        self.cart_slice = slice(size, size + 6)
+        size += 6
+
+        # EE torque
+        self.EE_torque_slice: slice | None = None
+        if use_EE_torque:
+            keys.extend((f"EE_torque.{axis}", size + i)
+                        for i, axis in enumerate(CART_AXES))
+            self.EE_torque_slice = slice(size, size + 6)
+            size += 6
+
+        # Sucker
+        keys.append(("sucker_state", size))
+        self.sucker_index: int = size
+        size += 1
+
+        # Staleness metadata
+        keys.extend((key, size + i) for i, key in enumerate(state_age_keys))
+        self.state_age_slice = slice(size, size + len(state_age_keys))
+        size += len(state_age_keys)
+
+        self.scalar_keys: tuple[tuple[str, int], ...] = tuple(keys)
+        self.index: dict[str, int] = dict(keys)
+        self.camera_keys: tuple[str, ...] = tuple(camera_keys)
+        self.size: int = size
+
+
+class JakaS12Observation(Mapping):
+    """Read-only observation view over a preallocated state vector, reused across ticks.
+
+    The robot fills `state` in place and sets the camera frames, nothing else is
+    written per tick: a scalar key is only looked up in the layout and read from
+    `state` when it is accessed. Consumers read it like a dict with the usual keys,
+    or read `state` directly (e.g. through `torch.from_numpy`) without copying.
+    The view reflects the latest tick: call `copy()` to keep a frame.
+    """
+
+    def __init__(self, layout: JakaS12ObservationLayout) -> None:
+        self.layout: JakaS12ObservationLayout = layout
+        self.state: np.ndarray = np.zeros(layout.size, dtype=np.float64)
+        self._images: dict[str, Any] = dict.fromkeys(layout.camera_keys)
+
+    def set_image(self, cam_key: str, image: Any) -> None:
+        """Set the latest frame of a camera."""
+        if cam_key not in self._images:
+            raise KeyError(f"Unknown camera '{cam_key}'")
+        self._images[cam_key] = image
+
+    def __getitem__(self, key: str) -> Any:
+        idx = self.layout.index.get(key)
+        if idx is None:
+            return self._images[key]
+        if idx == self.layout.sucker_index:
+            return bool(self.state[idx])
+        return self.state.item(idx)
+
+    def __iter__(self) -> Iterator[str]:
+        for key, _ in self.layout.scalar_keys:
+            yield key
+        yield from self._images
+
+    def __len__(self) -> int:
+        return len(self.layout.scalar_keys) + len(self._images)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.layout.index or key in self._images
+
+    def copy(self) -> dict[str, Any]:
+        """Snapshot of the observation as a plain dict."""
+        return dict(self.items())
@@ -0,0 +1,74 @@
+import time
+from dataclasses import dataclass
+
+from loguru import logger
+
+# Indices into the tuple returned by `jkrc.RC.get_robot_status()[1]` (JAKA SDK 2.x)
+STATUS_CART_POSITION_INDEX = 18
+STATUS_JOINT_POSITION_INDEX = 19
+STATUS_TORQUE_SENSOR_INDEX = 21
+
+# Index of the actual contact force values inside `torq_sensor_monitor_data`:
+# [ip, port, payload, status, errcode, actual_force(6), original_reading(6)]
+TORQUE_SENSOR_ACTUAL_FORCE_INDEX = 5
+
+
+@dataclass
+class JakaS12Status:
+    """Joint positions, TCP pose and end-effector torque taken from one status payload."""
+
+    joint_position: tuple = (0, 0, 0, 0, 0, 0)
+    cart_position: tuple = (0, 0, 0, 0, 0, 0)
+    EE_torque: tuple = (0, 0, 0, 0, 0, 0)
+    stamp: float = 0.0
+
+
+class JakaS12StatusReader:
+    """Reads the whole robot state with a single `get_robot_status` call per tick.
+
+    `refresh()` issues the SDK call and caches the decoded result, every other
+    accessor returns the cached value, so the joint, TCP and torque features of
+    one observation all come from the same payload.
+    """
+
+    def __init__(self, robot) -> None:
+        self._robot = robot
+        self._status: JakaS12Status = JakaS12Status()
+
+    @property
+    def status(self) -> JakaS12Status:
+        return self._status
+
+    def refresh(self) -> JakaS12Status:
+        ret = self._robot.get_robot_status()
+        if ret[0] != 0:
+            logger.warning(f"get_robot_status failed with error code {ret[0]}")
+            return self._status
+
+        self._status = self.decode(ret[1])
+        return self._status
+
+    @staticmethod
+    def decode(robot_status) -> JakaS12Status:
+        """Decode a `get_robot_status` payload.
+
+        Raises ValueError if the payload does not have the expected layout.
+        """
+        try:
+            torque_sensor = robot_status[STATUS_TORQUE_SENSOR_INDEX]
+            values = {
+                "joint_position": tuple(robot_status[STATUS_JOINT_POSITION_INDEX]),
+                "cart_position": tuple(robot_status[STATUS_CART_POSITION_INDEX]),
+                "EE_torque": tuple(torque_sensor[TORQUE_SENSOR_ACTUAL_FORCE_INDEX]),
+            }
+        except (IndexError, TypeError) as e:
+            raise ValueError(f"Unexpected get_robot_status layout: {e}") from e
+
+        # A shifted index would read another field, which is rarely 6 numbers
+        for name, value in values.items():
+            if len(value) != 6 or not all(
+                    isinstance(v, (int, float)) for v in value):
+                raise ValueError(f"Unexpected get_robot_status layout: "
+                                 f"{name} is {value}, expected 6 numbers")
+
+        return JakaS12Status(**values, stamp=time.perf_counter())
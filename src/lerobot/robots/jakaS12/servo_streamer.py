@@ -0,0 +1,202 @@
+import threading
+import time
+
+import numpy as np
+from loguru import logger
+
+from lerobot.utils.robot_utils import precise_sleep
+
+# Histogram bin edges, in seconds
+JITTER_BIN_EDGES = (0.0, 50e-6, 100e-6, 250e-6, 500e-6, 1e-3, 2e-3, 5e-3,
+                    10e-3, float("inf"))
+# Deadline misses are binned by how many servo periods were skipped
+MISSED_PERIODS_BIN_EDGES = (1, 2, 3, 5, 10, float("inf"))
+
+
+class JakaS12ServoStreamer:
+    """Streams incremental Cartesian servo commands to the arm at a fixed rate.
+
+    The policy posts Cartesian deltas into a single-slot mailbox with `submit()`;
+    deltas that arrive before the servo thread picks them up are summed, so no
+    motion is lost. The servo thread wakes on a fixed schedule built on
+    `precise_sleep` and spreads each delta over the servo ticks that fit in one
+    policy period (estimated from the submit rate), so a slow policy produces a
+    smooth stream instead of one jump per inference.
+
+    Every tick records its wake-up lateness. Lateness above `deadline_tolerance_s`
+    counts as a deadline miss, and when the thread falls more than a period
+    behind it skips the missed slots instead of bursting to catch up.
+
+    Servo commands hold `sdk_lock`, shared with the other threads calling the
+    SDK handle (see `JakaS12StatePoller`).
+    """
+
+    def __init__(self,
+                 robot,
+                 servo_rate_hz: float = 125.0,
+                 deadline_tolerance_s: float | None = None,
+                 policy_period_smoothing: float = 0.2,
+                 sdk_lock: "threading.Lock | None" = None) -> None:
+        self._robot = robot
+        self._sdk_lock = sdk_lock if sdk_lock is not None else threading.Lock()
+        self._period: float = 1.0 / servo_rate_hz
+        self._deadline_tolerance_s: float = (
+            deadline_tolerance_s
+            if deadline_tolerance_s is not None else self._period / 2)
+        self._smoothing: float = policy_period_smoothing
+
+        # Mailbox
+        self._mailbox_lock = threading.Lock()
+        self._mailbox: np.ndarray | None = None
+        self._last_submit_time: float | None = None
+        self._policy_period: float = self._period
+
+        # Interpolation state, only touched by the servo thread
+        self._remaining: np.ndarray = np.zeros(6)
+        self._steps_left: int = 0
+
+        # Statistics
+        self._ticks: int = 0
+        self._commands_sent: int = 0
+        self._deadline_misses: int = 0
+        self._jitter_hist: np.ndarray = np.zeros(len(JITTER_BIN_EDGES) - 1,
+                                                 dtype=np.int64)
+        self._missed_periods_hist: np.ndarray = np.zeros(
+            len(MISSED_PERIODS_BIN_EDGES) - 1, dtype=np.int64)
+        self._max_jitter: float = 0.0
+
+        # Thread
+        self._is_running: bool = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
+
+    def start(self) -> None:
+        if self._is_running:
+            return
+
+        self._is_running = True
+        self._thread = threading.Thread(target=self._run,
+                                        name="JakaS12ServoStreamer",
+                                        daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Servo streaming started at {1.0 / self._period:.1f} Hz")
+
+    def stop(self) -> None:
+        if not self._is_running:
+            return
+
+        self._is_running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+        stats = self.get_stats()
+        logger.info(
+            f"Servo streaming stopped: {stats['ticks']} ticks, "
+            f"{stats['deadline_misses']} deadline misses, "
+            f"max jitter {stats['max_jitter_s'] * 1e3:.3f} ms")
+
+    def submit(self, cart_pos_diff) -> None:
+        """Post a Cartesian delta (x, y, z, rx, ry, rz) to be streamed to the arm."""
+        delta = np.asarray(cart_pos_diff, dtype=np.float64)
+        now = time.perf_counter()
+        with self._mailbox_lock:
+            if self._last_submit_time is not None:
+                # Clamp so a pause (e.g. an episode reset) only nudges the estimate
+                interval = min(max(now - self._last_submit_time, self._period),
+                               4 * self._policy_period)
+                self._policy_period += self._smoothing * (
+                    interval - self._policy_period)
+            self._last_submit_time = now
+
+            if self._mailbox is None:
+                self._mailbox = delta.copy()
+            else:
+                self._mailbox += delta
+
+    def get_stats(self) -> dict:
+        """Deadline-miss and jitter statistics collected since `start()`."""
+        return {
+            "ticks": self._ticks,
+            "commands_sent": self._commands_sent,
+            "deadline_misses": self._deadline_misses,
+            "max_jitter_s": self._max_jitter,
+            "policy_period_s": self._policy_period,
+            "jitter_histogram": {
+                "bin_edges_s": JITTER_BIN_EDGES,
+                "counts": self._jitter_hist.tolist(),
+            },
+            "missed_periods_histogram": {
+                "bin_edges": MISSED_PERIODS_BIN_EDGES,
+                "counts": self._missed_periods_hist.tolist(),
+            },
+        }
+
+    def _take_mailbox(self) -> None:
+        with self._mailbox_lock:
+            delta, self._mailbox = self._mailbox, None
+            policy_period = self._policy_period
+        if delta is None:
+            return
+
+        # Whatever is left of the previous command is merged, not dropped
+        self._remaining += delta
+        self._steps_left = max(1, round(policy_period / self._period))
+
+    def _run(self) -> None:
+        next_deadline = time.perf_counter() + self._period
+        while self._is_running:
+            precise_sleep(next_deadline - time.perf_counter())
+            lateness = max(0.0, time.perf_counter() - next_deadline)
+            self._record_tick(lateness)
+
+            self._take_mailbox()
+            self._send_step()
+            next_deadline = self._next_deadline(next_deadline,
+                                                time.perf_counter())
+
+    def _send_step(self) -> None:
+        """Send the share of the remaining delta due this tick, if any."""
+        if self._steps_left == 0:
+            return
+
+        step = self._remaining / self._steps_left
+        self._remaining -= step
+        self._steps_left -= 1
+        try:
+            with self._sdk_lock:
+                self._robot.edg_servo_p(end_pos=tuple(step.tolist()),
+                                        move_mode=1,
+                                        step_num=1,
+                                        robot_index=0)
+            self._commands_sent += 1
+        except Exception as e:
+            logger.warning(f"Servo streaming command failed: {e}")
+
+    def _next_deadline(self, deadline: float, now: float) -> float:
+        """Deadline of the tick after the one due at `deadline`."""
+        # Skip the slots we overran instead of bursting to catch up
+        next_deadline = deadline + self._period
+        if now > next_deadline:
+            missed = int((now - next_deadline) // self._period) + 1
+            next_deadline += missed * self._period
+            self._record_miss(missed)
+        return next_deadline
+
+    def _record_tick(self, lateness: float) -> None:
+        self._ticks += 1
+        self._max_jitter = max(self._max_jitter, lateness)
+        self._jitter_hist[np.searchsorted(JITTER_BIN_EDGES, lateness,
+                                          side="right") - 1] += 1
+
+        if lateness > self._deadline_tolerance_s:
+            self._record_miss(1)
+
+    def _record_miss(self, missed_periods: int) -> None:
+        self._deadline_misses += 1
+        self._missed_periods_hist[np.searchsorted(
+            MISSED_PERIODS_BIN_EDGES, missed_periods, side="right") - 1] += 1
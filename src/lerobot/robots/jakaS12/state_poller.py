@@ -0,0 +1,180 @@
+import threading
+import time
+from dataclasses import dataclass, replace
+
+from loguru import logger
+
+from lerobot.utils.robot_utils import precise_sleep
+
+from .modbus_tcp import ModbusTCP
+from .robot_status import JakaS12StatusReader
+
+
+@dataclass
+class JakaS12StateSnapshot:
+    """Latest robot state published by `JakaS12StatePoller`.
+
+    Each source keeps the `time.perf_counter()` stamp of its last successful read,
+    so a failed read leaves the previous value in place with an ageing stamp.
+    """
+
+    joint_position: tuple = (0, 0, 0, 0, 0, 0)
+    cart_position: tuple = (0, 0, 0, 0, 0, 0)
+    sucker_state: bool = False
+    # Only populated when polling through `JakaS12StatusReader`
+    EE_torque: tuple | None = None
+    joint_stamp: float = 0.0
+    cart_stamp: float = 0.0
+    sucker_stamp: float = 0.0
+    EE_torque_stamp: float = 0.0
+
+    def ages(self, now: float | None = None) -> dict[str, float]:
+        """Seconds elapsed since each source was last refreshed."""
+        now = time.perf_counter() if now is None else now
+        ages = {
+            "state_age.joint": now - self.joint_stamp,
+            "state_age.cart": now - self.cart_stamp,
+            "state_age.sucker": now - self.sucker_stamp,
+        }
+        if self.EE_torque is not None:
+            ages["state_age.EE_torque"] = now - self.EE_torque_stamp
+        return ages
+
+
+class JakaS12StatePoller:
+    """Reads joint, TCP and sucker state at a fixed rate on a background thread.
+
+    The poller owns two snapshot buffers. Every cycle it fills the back buffer,
+    bumps a sequence counter and flips the front index, so readers never take a
+    lock: `latest()` copies the front buffer and retries if a flip happened
+    while it was copying.
+
+    The JAKA SDK handle is not documented as thread-safe, so every SDK call of
+    the poller holds `sdk_lock`, which the other threads using the same handle
+    (the control loop, the servo streamer) must hold for their calls too.
+    """
+
+    def __init__(self,
+                 robot,
+                 sucker: ModbusTCP,
+                 coils_address: int,
+                 fps: float = 100.0,
+                 status_reader: JakaS12StatusReader | None = None,
+                 sdk_lock: "threading.Lock | None" = None) -> None:
+        self._robot = robot
+        self._sdk_lock = sdk_lock if sdk_lock is not None else threading.Lock()
+        self._status_reader: JakaS12StatusReader | None = status_reader
+        self._sucker: ModbusTCP = sucker
+        self._coils_address: int = coils_address
+        self._period: float = 1.0 / fps
+
+        # Double buffer
+        self._buffers: list[JakaS12StateSnapshot] = [
+            JakaS12StateSnapshot(),
+            JakaS12StateSnapshot()
+        ]
+        self._front: int = 0
+        self._seq: int = 0
+
+        # Thread
+        self._is_running: bool = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
+
+    def start(self) -> None:
+        if self._is_running:
+            return
+
+        # Publish one snapshot synchronously so the first observation is valid
+        self._poll_once()
+
+        self._is_running = True
+        self._thread = threading.Thread(target=self._run,
+                                        name="JakaS12StatePoller",
+                                        daemon=True)
+        self._thread.start()
+        logger.info(
+            f"State polling started at {1.0 / self._period:.1f} Hz")
+
+    def stop(self) -> None:
+        if not self._is_running:
+            return
+
+        self._is_running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        logger.info("State polling stopped")
+
+    def latest(self) -> JakaS12StateSnapshot:
+        """Return a private copy of the most recently published snapshot."""
+        while True:
+            seq = self._seq
+            snapshot = replace(self._buffers[self._front])
+            if seq == self._seq:
+                return snapshot
+
+    def _run(self) -> None:
+        while self._is_running:
+            start_time = time.perf_counter()
+            self._poll_once()
+            precise_sleep(self._period - (time.perf_counter() - start_time))
+
+    def _poll_once(self) -> None:
+        front = self._buffers[self._front]
+        back = self._buffers[1 - self._front]
+
+        # Start from the published state so a failed read keeps the old value
+        back.joint_position, back.joint_stamp = front.joint_position, front.joint_stamp
+        back.cart_position, back.cart_stamp = front.cart_position, front.cart_stamp
+        back.sucker_state, back.sucker_stamp = front.sucker_state, front.sucker_stamp
+        back.EE_torque, back.EE_torque_stamp = front.EE_torque, front.EE_torque_stamp
+
+        if self._status_reader is not None:
+            self._poll_robot_status(back)
+        else:
+            self._poll_joint_and_tcp(back)
+
+        try:
+            back.sucker_state = self._sucker.read(self._coils_address)
+            back.sucker_stamp = time.perf_counter()
+        except Exception as e:
+            logger.warning(f"State polling failed to read sucker: {e}")
+
+        self._front = 1 - self._front
+        self._seq += 1
+
+    def _poll_robot_status(self, back: JakaS12StateSnapshot) -> None:
+        try:
+            with self._sdk_lock:
+                status = self._status_reader.refresh()
+        except Exception as e:
+            logger.warning(f"State polling failed to read robot status: {e}")
+            return
+
+        # refresh() keeps the previous status on failure, its stamp tells us
+        back.joint_position, back.joint_stamp = status.joint_position, status.stamp
+        back.cart_position, back.cart_stamp = status.cart_position, status.stamp
+        back.EE_torque, back.EE_torque_stamp = status.EE_torque, status.stamp
+
+    def _poll_joint_and_tcp(self, back: JakaS12StateSnapshot) -> None:
+        try:
+            with self._sdk_lock:
+                ret = self._robot.get_joint_position()
+            if ret[0] == 0:
+                back.joint_position = tuple(ret[1])
+                back.joint_stamp = time.perf_counter()
+        except Exception as e:
+            logger.warning(f"State polling failed to read joints: {e}")
+
+        try:
+            with self._sdk_lock:
+                ret = self._robot.get_tcp_position()
+            if ret[0] == 0:
+                back.cart_position = tuple(ret[1])
+                back.cart_stamp = time.perf_counter()
+        except Exception as e:
+            logger.warning(f"State polling failed to read TCP pose: {e}")
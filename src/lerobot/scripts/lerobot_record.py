@@ -87,6 +87,7 @@ from lerobot.processor import (
     RobotObservation,
     RobotProcessorPipeline,
     make_default_processors,
+    profile_pipelines,
 )
 from lerobot.processor.rename_processor import rename_stats
 from lerobot.robots import (  # noqa: F401
@@ -170,6 +171,17 @@ class DatasetRecordConfig:
     # Number of episodes to record before batch encoding videos
     # Set to 1 for immediate encoding (default behavior), or higher for batched encoding
     video_encoding_batch_size: int = 1
+    # Encode the camera frames while recording, in a worker process per camera, instead of writing them
+    # as PNG images encoded at the end of each episode. Takes precedence over video_encoding_batch_size.
+    streaming_encoding: bool = False
+    # Encode the episodes as fragmented MP4, appended to the video files by only writing their own bytes
+    # instead of remuxing the whole files
+    fragmented_videos: bool = False
+    # Save the episodes in the background while the next ones are recorded, instead of waiting for their
+    # stats, data, videos and metadata to be written between episodes
+    async_finalization: bool = False
+    # Number of episodes that can wait to be saved in the background before recording waits for them
+    max_pending_episodes: int = 2
     # Rename map for the observation to override the image and state keys
     rename_map: dict[str, str] = field(default_factory=dict)
 
@@ -192,6 +204,8 @@ class RecordConfig:
     play_sounds: bool = True
     # Resume recording on an existing dataset.
     resume: bool = False
+    # Profile every step of the processor pipelines, and write their Chrome trace to this path
+    processor_trace_path: str | None = None
 
     def __post_init__(self):
         # HACK: We parse again the cli args here to get the pretrained path if there was one.
@@ -421,6 +435,10 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 cfg.dataset.repo_id,
                 root=cfg.dataset.root,
                 batch_encoding_size=cfg.dataset.video_encoding_batch_size,
+                streaming_encoding=cfg.dataset.streaming_encoding,
+                fragmented_videos=cfg.dataset.fragmented_videos,
+                async_finalization=cfg.dataset.async_finalization,
+                max_pending_episodes=cfg.dataset.max_pending_episodes,
             )
 
             if hasattr(robot, "cameras") and len(robot.cameras) > 0:
@@ -442,6 +460,10 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 image_writer_processes=cfg.dataset.num_image_writer_processes,
                 image_writer_threads=cfg.dataset.num_image_writer_threads_per_camera * len(robot.cameras),
                 batch_encoding_size=cfg.dataset.video_encoding_batch_size,
+                streaming_encoding=cfg.dataset.streaming_encoding,
+                fragmented_videos=cfg.dataset.fragmented_videos,
+                async_finalization=cfg.dataset.async_finalization,
+                max_pending_episodes=cfg.dataset.max_pending_episodes,
             )
 
         # Load pretrained policy
@@ -465,10 +487,17 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
 
         listener, events = init_keyboard_listener()
 
-        with VideoEncodingManager(dataset):
+        pipelines = {
+            "teleop_action_processor": teleop_action_processor,
+            "robot_action_processor": robot_action_processor,
+            "robot_observation_processor": robot_observation_processor,
+            "preprocessor": preprocessor,
+            "postprocessor": postprocessor,
+        }
+        with VideoEncodingManager(dataset), profile_pipelines(cfg.processor_trace_path, pipelines):
             recorded_episodes = 0
             while recorded_episodes < cfg.dataset.num_episodes and not events["stop_recording"]:
-                log_say(f"Recording episode {dataset.num_episodes}", cfg.play_sounds)
+                log_say(f"Recording episode {dataset.next_episode_index}", cfg.play_sounds)
                 record_loop(
                     robot=robot,
                     events=events,
@@ -11,6 +11,10 @@ class JakaS12LeaderConfig(TeleoperatorConfig):
     drag_friction_compensation_gain: tuple = (80, 80, 80, 80, 80, 80)
     use_gripper: bool = False
 
+    # TCP pose sampling
+    sample_rate_hz: float = 100.0
+    pose_buffer_size: int = 1024
+
     # Other parameters
     is_block: bool = False
     joint_speed: float = 3.0
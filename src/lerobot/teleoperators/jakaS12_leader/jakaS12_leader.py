@@ -7,12 +7,14 @@ from typing import Any
 
 import numpy as np
 from lerobot.Dav1nGen_utils.fps_monitor import FPSMonitor
+from lerobot.utils.robot_utils import precise_sleep
 from loguru import logger
 
 from ..teleoperator import Teleoperator
 from ..utils import TeleopEvents
 from .config_jakaS12_leader import JakaS12LeaderConfig
 from .jaka_lib_2_3_0 import jkrc
+from .pose_buffer import PoseRingBuffer
 
 # Keyboard listener
 PYNPUT_AVAILABLE = True
@@ -44,11 +46,14 @@ class JakaS12Leader(Teleoperator):
         # Arm
         self._arm_ip: str = self._config.arm_ip
         self._drag_friction_compensation_gain: tuple = self._config.drag_friction_compensation_gain
-        self._cart_space_position: tuple = (0, 0, 0, 0, 0, 0)
-        self._last_cart_space_position: tuple = (0, 0, 0, 0, 0, 0)
-        self._cart_space_position_diff: tuple = (0, 0, 0, 0, 0, 0)
         self._robot = jkrc.RC(self._arm_ip)
 
+        # TCP pose sampling
+        self._sample_period: float = 1.0 / self._config.sample_rate_hz
+        self._pose_buffer: PoseRingBuffer = PoseRingBuffer(
+            capacity=self._config.pose_buffer_size)
+        self._last_read_cumulative: np.ndarray = np.zeros(6)
+
         # States
         self._is_connected: bool = False
         self._is_running: bool = False
@@ -124,11 +129,10 @@ class JakaS12Leader(Teleoperator):
                 "pynput not available - skipping local keyboard listener.")
             self.listener = None
 
-        # Start thread for getting joint position diff
-        self._lock = threading.Lock()
-        self._joint_position_diff_thread = threading.Thread(
-            target=self._get_cartesian_space_position_diff, daemon=True)
-        self._joint_position_diff_thread.start()
+        # Start thread for sampling the TCP pose
+        self._pose_sampler_thread = threading.Thread(
+            target=self._sample_cartesian_space_position, daemon=True)
+        self._pose_sampler_thread.start()
 
     # Disconnect to robot
     def disconnect(self) -> None:
@@ -168,12 +172,16 @@ class JakaS12Leader(Teleoperator):
             "names": names,
         }
 
-    # Get the cartesian position difference of the remote control arm in each cycle
+    # Get the cartesian position difference of the remote control arm since the previous call
     def get_action(self) -> dict[str, Any]:
-        with self._lock:
-            # self._cart_space_position_diff is a tuple
-            action_np = np.array(self._cart_space_position_diff,
-                                 dtype=np.float32)
+        # Exact motion integrated over every sample since the previous call
+        cumulative = self._pose_buffer.latest_cumulative()
+        cart_space_position_diff = cumulative - self._last_read_cumulative
+        self._last_read_cumulative = cumulative
+
+        # The follower expects rx and ry with the opposite sign
+        cart_space_position_diff[3:5] = -cart_space_position_diff[3:5]
+        action_np = cart_space_position_diff.astype(np.float32)
 
         action_names = [
             name for name in self.action_features["names"] if name != "gripper"
@@ -242,8 +250,9 @@ class JakaS12Leader(Teleoperator):
 
     # Initialize robot parameters
     def _init_parameters(self) -> None:
-        self._cart_space_position = self._robot.get_tcp_position()[1]
-        self._last_cart_space_position = self._robot.get_tcp_position()[1]
+        self._pose_buffer.push(time.perf_counter(),
+                               self._robot.get_tcp_position()[1])
+        self._last_read_cumulative = self._pose_buffer.latest_cumulative()
         logger.info(f"Initialize robot parameters {self._arm_ip} successfully")
 
     def _on_press(self, key):
@@ -255,23 +264,25 @@ class JakaS12Leader(Teleoperator):
             logger.info("ESC pressed, disconnecting.")
             self.disconnect()
 
-    # Update cartesian space position diff in each cycle
-    def _get_cartesian_space_position_diff(self) -> None:
+    # Sample the TCP pose on a fixed cadence into the ring buffer
+    def _sample_cartesian_space_position(self) -> None:
+        next_deadline = time.perf_counter() + self._sample_period
         while self._is_running:
-            self._last_cart_space_position = self._cart_space_position
-
-            time.sleep(0.01)
-            self._cart_space_position = self._robot.get_tcp_position()[1]
-
-            # Calculate cart space diff
-            cart_space_position_diff = list(
-                np.array(self._cart_space_position) -
-                np.array(self._last_cart_space_position))
-
-            for i in range(3, 5):
-                cart_space_position_diff[i] = -cart_space_position_diff[i]
-
-            # logger.debug(f"teleoperator position diff : {cart_space_position_diff}")
-            with self._lock:
-                self._cart_space_position_diff = tuple(
-                    cart_space_position_diff)
+            precise_sleep(next_deadline - time.perf_counter())
+
+            request_time = time.perf_counter()
+            ret = self._robot.get_tcp_position()
+            # Stamp the sample halfway through the round trip
+            stamp = (request_time + time.perf_counter()) / 2
+            if ret[0] == 0:
+                self._pose_buffer.push(stamp, ret[1])
+            else:
+                logger.warning(f"Failed to read TCP position: {ret[0]}")
+
+            # Keep an absolute schedule, skipping slots we overran
+            next_deadline += self._sample_period
+            now = time.perf_counter()
+            if now > next_deadline:
+                next_deadline += (
+                    (now - next_deadline) // self._sample_period +
+                    1) * self._sample_period
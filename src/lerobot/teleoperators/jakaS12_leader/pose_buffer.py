@@ -0,0 +1,65 @@
+import threading
+
+import numpy as np
+
+# TCP pose layout: x, y, z (mm) followed by rx, ry, rz (rad)
+ROTATION_SLICE = slice(3, 6)
+
+
+class PoseRingBuffer:
+    """Timestamped ring buffer of TCP poses with a running integral of the motion.
+
+    Every `push()` stores the pose, its timestamp and the cumulative motion since
+    the first sample, integrated sample by sample with rotation differences
+    wrapped to [-pi, pi). A reader only needs the cumulative value it saw last
+    time to get the exact motion since then, even if the ring wrapped around in
+    between, so no delta is lost or counted twice whatever the reader's rate.
+    """
+
+    def __init__(self, capacity: int = 1024, dim: int = 6) -> None:
+        self._capacity: int = capacity
+        self._stamps: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self._poses: np.ndarray = np.zeros((capacity, dim), dtype=np.float64)
+        self._cumulative: np.ndarray = np.zeros((capacity, dim),
+                                                dtype=np.float64)
+        self._count: int = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self._count, self._capacity)
+
+    @property
+    def count(self) -> int:
+        """Number of samples pushed since creation."""
+        return self._count
+
+    def push(self, stamp: float, pose) -> None:
+        pose = np.asarray(pose, dtype=np.float64)
+        with self._lock:
+            idx = self._count % self._capacity
+            if self._count == 0:
+                self._cumulative[idx] = 0.0
+            else:
+                prev = (self._count - 1) % self._capacity
+                step = pose - self._poses[prev]
+                step[ROTATION_SLICE] = (step[ROTATION_SLICE] + np.pi) % (
+                    2 * np.pi) - np.pi
+                np.add(self._cumulative[prev], step, out=self._cumulative[idx])
+            self._poses[idx] = pose
+            self._stamps[idx] = stamp
+            self._count += 1
+
+    def latest_cumulative(self) -> np.ndarray:
+        """Cumulative motion up to the most recent sample (a copy)."""
+        with self._lock:
+            if self._count == 0:
+                return np.zeros(self._cumulative.shape[1])
+            return self._cumulative[(self._count - 1) % self._capacity].copy()
+
+    def samples(self) -> tuple[np.ndarray, np.ndarray]:
+        """Timestamps and poses currently held, oldest first (copies)."""
+        with self._lock:
+            n = len(self)
+            order = (np.arange(self._count - n, self._count) %
+                     self._capacity)
+            return self._stamps[order], self._poses[order]
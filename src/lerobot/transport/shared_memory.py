@@ -0,0 +1,432 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team.
+# All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Named shared-memory segments to exchange transitions and parameters on a single host.
+
+Every segment starts with a 64-byte control block of uint64 counters, followed by a
+JSON header describing the tensor layout, followed by the tensor data. The creator
+writes the header length last, so a segment is only attached once it is complete.
+
+The control block also holds a random generation id and a heartbeat the creator
+updates on every write. A creator that restarts without closing its segment (e.g.
+after a crash) replaces it with a new one under the same name: once the heartbeat of
+an attached segment is stale, `is_orphaned()` reopens the name and compares the
+generation ids to tell.
+
+- `SharedTransitionRing`: a single-producer single-consumer ring of preallocated
+  transition slots. The producer only moves the write index and the consumer only
+  the read index, so no lock is needed.
+- `SharedParameterBlock`: one preallocated copy of the policy parameters, written
+  under a seqlock: the sequence number is odd while a write is in progress and
+  readers retry when it changed during their copy.
+"""
+
+import json
+import logging
+import secrets
+import time
+import warnings
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import torch
+
+from lerobot.utils.transition import Transition
+
+from .utils import transition_columns
+
+SHARED_MEMORY_VERSION = 1
+CONTROL_SIZE = 64
+ALIGNMENT = 64
+
+# Control block slots
+HEADER_LEN = 0
+CLOSED = 1
+WRITE_INDEX = 2  # transitions ring
+READ_INDEX = 3  # transitions ring
+SEQUENCE = 2  # parameters block
+GENERATION = 4
+HEARTBEAT = 5
+
+
+def _align(offset: int) -> int:
+    return offset + (-offset % ALIGNMENT)
+
+
+def _layout(
+    tensors: dict[str, tuple[torch.dtype, tuple[int, ...]]], start: int = 0
+) -> tuple[list[dict], int]:
+    """Aligned byte offsets of the given tensors, returns the entries and the total size."""
+    entries = []
+    offset = start
+    for name, (dtype, shape) in tensors.items():
+        offset = _align(offset)
+        nbytes = int(np.prod(shape, dtype=np.int64)) * torch.empty((), dtype=dtype).element_size()
+        entries.append(
+            {"name": name, "dtype": str(dtype).removeprefix("torch."), "shape": list(shape), "offset": offset}
+        )
+        offset += nbytes
+    return entries, _align(offset)
+
+
+class _SharedSegment:
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self.name = shm.name
+        self.owner = owner
+        self.control = np.ndarray((CONTROL_SIZE // 8,), dtype=np.uint64, buffer=shm.buf)
+        self.generation = int(self.control[GENERATION])
+        header_len = int(self.control[HEADER_LEN])
+        self.header = json.loads(bytes(shm.buf[CONTROL_SIZE : CONTROL_SIZE + header_len]))
+        self.data_start = _align(CONTROL_SIZE + header_len)
+        # Next time a stale segment may reopen its name
+        self._next_probe_ns = 0
+
+    @classmethod
+    def create(cls, name: str, header: dict, data_size: int) -> "_SharedSegment":
+        header_bytes = json.dumps(header).encode("utf-8")
+        size = _align(CONTROL_SIZE + len(header_bytes)) + data_size
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left over by a previous run that did not shut down cleanly
+            logging.warning(f"Replacing existing shared memory segment '{name}'")
+            stale = shared_memory.SharedMemory(name=name)
+            stale.unlink()
+            stale.close()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        # Touch every page now rather than on the first writes
+        np.ndarray((shm.size,), dtype=np.uint8, buffer=shm.buf)[:] = 0
+        control = np.ndarray((CONTROL_SIZE // 8,), dtype=np.uint64, buffer=shm.buf)
+        shm.buf[CONTROL_SIZE : CONTROL_SIZE + len(header_bytes)] = header_bytes
+        control[GENERATION] = secrets.randbits(63) + 1
+        control[HEARTBEAT] = time.time_ns()
+        # Publish the header length last, attaching before this point fails
+        control[HEADER_LEN] = len(header_bytes)
+        del control
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str, kind: str) -> "_SharedSegment | None":
+        """Attach to an existing segment, returns None if it does not exist (yet)."""
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            return None
+        # Only the creator may unlink the segment, see https://github.com/python/cpython/issues/82300
+        resource_tracker.unregister(shm._name, "shared_memory")  # noqa: SLF001
+
+        control = np.ndarray((CONTROL_SIZE // 8,), dtype=np.uint64, buffer=shm.buf)
+        ready = int(control[HEADER_LEN]) > 0 and not int(control[CLOSED])
+        del control
+        if not ready:
+            shm.close()
+            return None
+
+        segment = cls(shm, owner=False)
+        if segment.header.get("kind") != kind or segment.header.get("version") != SHARED_MEMORY_VERSION:
+            segment.close()
+            raise ValueError(
+                f"Shared memory segment '{name}' is not a version {SHARED_MEMORY_VERSION} {kind}"
+            )
+        return segment
+
+    @staticmethod
+    def _read_generation(name: str) -> int | None:
+        """Generation id of the segment currently named `name`, None if there is none."""
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            return None
+        resource_tracker.unregister(shm._name, "shared_memory")  # noqa: SLF001
+        control = np.ndarray((CONTROL_SIZE // 8,), dtype=np.uint64, buffer=shm.buf)
+        generation = int(control[GENERATION])
+        del control
+        shm.close()
+        return generation
+
+    @property
+    def is_closed(self) -> bool:
+        return bool(self.control[CLOSED])
+
+    def beat(self):
+        """Tell the attached processes that the creator is alive."""
+        self.control[HEARTBEAT] = time.time_ns()
+
+    def is_orphaned(self, stale_timeout: float) -> bool:
+        """True if the creator closed the segment, or replaced it after a restart.
+
+        Its name is only reopened when the heartbeat is older than `stale_timeout`
+        seconds, at most once every `stale_timeout` seconds.
+        """
+        if self.is_closed:
+            return True
+        now = time.time_ns()
+        stale_timeout_ns = int(stale_timeout * 1e9)
+        if now - int(self.control[HEARTBEAT]) < stale_timeout_ns or now < self._next_probe_ns:
+            return False
+        self._next_probe_ns = now + stale_timeout_ns
+        generation = self._read_generation(self.name)
+        return generation is not None and generation != self.generation
+
+    def view(self, entry: dict, offset: int = 0) -> torch.Tensor:
+        """Writable tensor backed by the segment memory."""
+        dtype = getattr(torch, entry["dtype"])
+        count = int(np.prod(entry["shape"], dtype=np.int64))
+        start = self.data_start + offset + entry["offset"]
+        return torch.frombuffer(self._shm.buf, dtype=dtype, count=count, offset=start).view(entry["shape"])
+
+    def close(self):
+        """Unmap the segment, views returned by `view()` must have been released."""
+        if self._shm is None:
+            return
+        if self.owner:
+            # Tell the other side to let go of this segment
+            self.control[CLOSED] = 1
+        del self.control
+        try:
+            self._shm.close()
+        except BufferError:
+            warnings.warn("Shared memory segment still has exported views, leaving it mapped", stacklevel=2)
+        if self.owner:
+            # An attached process sharing our resource tracker (e.g. a forked one) may have
+            # unregistered the segment, register it again so unlink() can unregister it
+            resource_tracker.register(self._shm._name, "shared_memory")  # noqa: SLF001
+            self._shm.unlink()
+        self._shm = None
+
+
+class SharedTransitionRing:
+    """Single-producer single-consumer ring of transitions in shared memory.
+
+    The slot layout is fixed by the example transition given to `create()`: every
+    pushed transition must have the same keys, shapes and dtypes.
+    """
+
+    def __init__(self, segment: _SharedSegment):
+        self._segment = segment
+        self.capacity: int = segment.header["capacity"]
+        self._slot_size: int = segment.header["slot_size"]
+        self._columns: list[dict] = segment.header["columns"]
+        self._slots: list[dict[str, torch.Tensor]] = [
+            {column["name"]: segment.view(column, i * self._slot_size) for column in self._columns}
+            for i in range(self.capacity)
+        ]
+        # Read index to publish once borrowed slots are released
+        self._borrowed: int | None = None
+
+    @classmethod
+    def create(cls, name: str, example: Transition, capacity: int) -> "SharedTransitionRing":
+        columns = {}
+        scalars = set()
+        for column, (values, is_scalar) in transition_columns([example]).items():
+            value = torch.as_tensor(values[0])
+            columns[column] = (value.dtype, tuple(value.shape))
+            if is_scalar:
+                scalars.add(column)
+
+        entries, slot_size = _layout(columns)
+        for entry in entries:
+            entry["scalar"] = entry["name"] in scalars
+        header = {
+            "kind": "transitions",
+            "version": SHARED_MEMORY_VERSION,
+            "capacity": capacity,
+            "slot_size": slot_size,
+            "columns": entries,
+        }
+        return cls(_SharedSegment.create(name, header, capacity * slot_size))
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedTransitionRing | None":
+        segment = _SharedSegment.attach(name, kind="transitions")
+        return None if segment is None else cls(segment)
+
+    @property
+    def is_closed(self) -> bool:
+        """True once the creator closed the ring."""
+        return self._segment.is_closed
+
+    def is_orphaned(self, stale_timeout: float) -> bool:
+        """True once the creator closed the ring or replaced it, see `_SharedSegment.is_orphaned`."""
+        return self._segment.is_orphaned(stale_timeout)
+
+    def __len__(self) -> int:
+        control = self._segment.control
+        return int(control[WRITE_INDEX]) - int(control[READ_INDEX])
+
+    def push(self, transition: Transition, timeout: float = 1.0) -> bool:
+        """Copy a transition into the next free slot, waiting up to `timeout` for space.
+
+        Returns False if the ring stayed full, in which case the transition is dropped.
+        """
+        control = self._segment.control
+        write_index = int(control[WRITE_INDEX])
+        deadline = time.perf_counter() + timeout
+        while write_index - int(control[READ_INDEX]) >= self.capacity:
+            if time.perf_counter() > deadline:
+                return False
+            time.sleep(0.0005)
+
+        slot = self._slots[write_index % self.capacity]
+        for column, (values, _) in transition_columns([transition]).items():
+            # Copies straight from the device the value lives on
+            slot[column].copy_(torch.as_tensor(values[0]))
+
+        # Publish the slot once it is fully written
+        control[WRITE_INDEX] = write_index + 1
+        self._segment.beat()
+        return True
+
+    def pop_all(self, max_items: int | None = None, copy: bool = True) -> list[Transition]:
+        """Return every available transition, oldest first.
+
+        With `copy`, the tensors are copied out and the slots are released right away.
+        Otherwise they are views into the slots, which stay reserved until `release()`
+        or the next `pop_all()`: consume them (e.g. add them to a replay buffer) first.
+        """
+        self.release()
+        control = self._segment.control
+        read_index = int(control[READ_INDEX])
+        available = int(control[WRITE_INDEX]) - read_index
+        if max_items is not None:
+            available = min(available, max_items)
+
+        transitions = []
+        for index in range(read_index, read_index + available):
+            slot = self._slots[index % self.capacity]
+            transition = {"state": {}, "next_state": {}}
+            for column in self._columns:
+                value = slot[column["name"]]
+                if column["scalar"]:
+                    value = value.item()
+                elif copy:
+                    value = value.clone()
+                group, _, key = column["name"].partition("/")
+                if key:
+                    transition.setdefault(group, {})[key] = value
+                else:
+                    transition[group] = value
+            transitions.append(Transition(**transition))
+
+        self._borrowed = read_index + available
+        if copy:
+            self.release()
+        return transitions
+
+    def release(self):
+        """Hand the slots of the transitions returned by `pop_all(copy=False)` back to the producer."""
+        if self._borrowed is not None:
+            self._segment.control[READ_INDEX] = self._borrowed
+            self._borrowed = None
+
+    def close(self):
+        self._slots.clear()
+        self._segment.close()
+
+
+class SharedParameterBlock:
+    """Seqlock-protected block holding one copy of a flat `{name: tensor}` parameter dict."""
+
+    def __init__(self, segment: _SharedSegment):
+        self._segment = segment
+        self._views: dict[str, torch.Tensor] = {
+            entry["name"]: segment.view(entry) for entry in segment.header["tensors"]
+        }
+        # Private copy of the block made by `read_into`, allocated by the first read
+        self._scratch: dict[str, torch.Tensor] | None = None
+
+    @classmethod
+    def create(cls, name: str, parameters: dict[str, torch.Tensor]) -> "SharedParameterBlock":
+        entries, size = _layout({key: (value.dtype, tuple(value.shape)) for key, value in parameters.items()})
+        header = {"kind": "parameters", "version": SHARED_MEMORY_VERSION, "tensors": entries}
+        return cls(_SharedSegment.create(name, header, size))
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedParameterBlock | None":
+        segment = _SharedSegment.attach(name, kind="parameters")
+        return None if segment is None else cls(segment)
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._views)
+
+    @property
+    def seq(self) -> int:
+        """Number of completed writes times two."""
+        return int(self._segment.control[SEQUENCE])
+
+    @property
+    def is_closed(self) -> bool:
+        return self._segment.is_closed
+
+    def is_orphaned(self, stale_timeout: float) -> bool:
+        """True once the creator closed the block or replaced it, see `_SharedSegment.is_orphaned`."""
+        return self._segment.is_orphaned(stale_timeout)
+
+    @torch.no_grad()
+    def write(self, parameters: dict[str, torch.Tensor]):
+        """Copy `parameters` into the block. Only one process may write."""
+        if parameters.keys() != self._views.keys():
+            raise ValueError("Parameter names differ from the ones the block was created with")
+
+        control = self._segment.control
+        control[SEQUENCE] += 1
+        for name, value in parameters.items():
+            self._views[name].copy_(value)
+        control[SEQUENCE] += 1
+        self._segment.beat()
+
+    @torch.no_grad()
+    def read_into(
+        self, targets: dict[str, torch.Tensor], last_seq: int = 0, max_retries: int = 100
+    ) -> int | None:
+        """Copy the block into `targets` (in place) if it changed since `last_seq`.
+
+        The block is first copied into a private buffer, and `targets` are only updated
+        from a consistent copy, never from one torn by a concurrent write.
+
+        Returns the sequence number of the copied version, or None if there was
+        nothing new. Raises TimeoutError, leaving `targets` untouched, if no
+        consistent copy could be made within `max_retries`.
+        """
+        if self._scratch is None:
+            self._scratch = {name: torch.empty_like(view) for name, view in self._views.items()}
+        names = [name for name in self._views if name in targets]
+        control = self._segment.control
+        for _ in range(max_retries):
+            start = int(control[SEQUENCE])
+            if start == last_seq:
+                return None
+            if start % 2:
+                # A write is in progress
+                time.sleep(0.0001)
+                continue
+
+            for name in names:
+                self._scratch[name].copy_(self._views[name])
+
+            if int(control[SEQUENCE]) == start:
+                for name in names:
+                    targets[name].copy_(self._scratch[name])
+                return start
+        raise TimeoutError(f"No consistent copy of the parameters could be read in {max_retries} attempts")
+
+    def close(self):
+        self._views.clear()
+        self._scratch = None
+        self._segment.close()
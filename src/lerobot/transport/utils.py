@@ -19,10 +19,13 @@ import io
 import json
 import logging
 import pickle  # nosec B403: Safe usage for internal serialization only
+import struct
+import warnings
 from multiprocessing.synchronize import Event as MpEvent
 from queue import Queue
 from typing import Any
 
+import numpy as np
 import torch
 
 from lerobot.transport import services_pb2
@@ -34,6 +37,13 @@ TransferState = services_pb2.TransferState  # type: ignore[attr-defined]
 CHUNK_SIZE = 2 * 1024 * 1024  # 2 MB
 MAX_MESSAGE_SIZE = 4 * 1024 * 1024  # 4 MB
 
+# Columnar transition wire format: magic, version, header length, JSON header, column buffers
+COLUMNAR_MAGIC = b"LRTC"
+COLUMNAR_VERSION = 1
+COLUMNAR_PREFIX = struct.Struct("<4sBI")
+COLUMNAR_ALIGNMENT = 64
+TRANSITION_COMPRESSIONS = (None, "lz4", "zstd")
+
 
 def bytes_buffer_size(buffer: io.BytesIO) -> int:
     buffer.seek(0, io.SEEK_END)
@@ -137,7 +147,16 @@ def bytes_to_python_object(buffer: bytes) -> Any:
     return obj
 
 
+def is_columnar_bytes(buffer: bytes) -> bool:
+    """Whether `buffer` is a columnar transition message rather than pickled transitions."""
+    return buffer[: len(COLUMNAR_MAGIC)] == COLUMNAR_MAGIC
+
+
 def bytes_to_transitions(buffer: bytes) -> list[Transition]:
+    # Both wire formats are accepted so actors can be switched independently
+    if is_columnar_bytes(buffer):
+        return columnar_bytes_to_transitions(buffer)
+
     bytes_buffer = io.BytesIO(buffer)
     bytes_buffer.seek(0)
     transitions = torch.load(bytes_buffer, weights_only=True)
@@ -150,6 +169,196 @@ def transitions_to_bytes(transitions: list[Transition]) -> bytes:
     return bytes_buffer.getvalue()
 
 
+def _compress(data: memoryview, compression: str) -> bytes:
+    if compression == "lz4":
+        import lz4.frame
+
+        return lz4.frame.compress(data)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    raise ValueError(f"Unsupported compression '{compression}', expected one of {TRANSITION_COMPRESSIONS}")
+
+
+def _decompress(data: memoryview, compression: str) -> bytes:
+    if compression == "lz4":
+        import lz4.frame
+
+        return lz4.frame.decompress(data)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unsupported compression '{compression}', expected one of {TRANSITION_COMPRESSIONS}")
+
+
+def transition_columns(transitions: list[Transition]) -> dict[str, tuple[list, bool]]:
+    """Group transition fields by column name, flagging columns made of Python scalars."""
+    first = transitions[0]
+    columns = {}
+    for group in ("state", "next_state"):
+        for key in first[group]:
+            columns[f"{group}/{key}"] = ([t[group][key] for t in transitions], False)
+    for key in ("action", "reward", "done", "truncated"):
+        if key in first:
+            values = [t[key] for t in transitions]
+            columns[key] = (values, not isinstance(values[0], torch.Tensor))
+    if first.get("complementary_info") is not None:
+        for key, value in first["complementary_info"].items():
+            values = [t["complementary_info"][key] for t in transitions]
+            columns[f"complementary_info/{key}"] = (values, not isinstance(value, torch.Tensor))
+    return columns
+
+
+def transitions_to_columnar_bytes(
+    transitions: list[Transition],
+    compression: str | None = None,
+    compression_min_bytes: int = 64 * 1024,
+    check_nan: bool = False,
+) -> bytes:
+    """Serialize transitions column by column into one contiguous message.
+
+    Each field (e.g. `state/observation.image`, `action`, `reward`) is stacked over
+    all transitions and stored as a raw tensor buffer. A JSON header records the
+    column names, dtypes, per-transition shapes and byte offsets, so the receiver
+    can rebuild tensors with `torch.frombuffer` without unpickling anything.
+    Columns of at least `compression_min_bytes` are compressed with `compression`
+    ("lz4" or "zstd") when given.
+
+    Args:
+        transitions: Transitions sharing the same keys and per-key shapes.
+        compression: Optional per-column compression codec.
+        compression_min_bytes: Smaller columns are sent uncompressed.
+        check_nan: Log a warning for every state column containing NaN values.
+    """
+    if compression not in TRANSITION_COMPRESSIONS:
+        raise ValueError(f"Unsupported compression '{compression}', expected one of {TRANSITION_COMPRESSIONS}")
+
+    header = {"version": COLUMNAR_VERSION, "num_transitions": len(transitions), "columns": []}
+    buffers = []
+    offset = 0
+    if transitions:
+        for name, (values, is_scalar) in transition_columns(transitions).items():
+            column = torch.stack([torch.as_tensor(value) for value in values])
+            # A single device-to-host copy per column
+            column = column.cpu().contiguous()
+
+            if check_nan and name.startswith("state/") and column.is_floating_point():
+                if torch.isnan(column).any():
+                    logging.warning(f"Found NaN values in transition {name.split('/', 1)[1]}")
+
+            data = memoryview(column.reshape(-1).view(torch.uint8).numpy())
+            raw_nbytes = data.nbytes
+            codec = None
+            if compression is not None and raw_nbytes >= compression_min_bytes:
+                data = memoryview(_compress(data, compression))
+                codec = compression
+
+            # Keep every column aligned so frombuffer views are aligned too
+            padding = -offset % COLUMNAR_ALIGNMENT
+            if padding:
+                buffers.append(bytes(padding))
+                offset += padding
+
+            header["columns"].append(
+                {
+                    "name": name,
+                    "dtype": str(column.dtype).removeprefix("torch."),
+                    "shape": list(column.shape[1:]),
+                    "scalar": is_scalar,
+                    "offset": offset,
+                    "nbytes": data.nbytes,
+                    "raw_nbytes": raw_nbytes,
+                    "compression": codec,
+                }
+            )
+            buffers.append(data)
+            offset += data.nbytes
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    # Pad the header so the column offsets are relative to an aligned payload start
+    header_bytes += b" " * (-(COLUMNAR_PREFIX.size + len(header_bytes)) % COLUMNAR_ALIGNMENT)
+    prefix = COLUMNAR_PREFIX.pack(COLUMNAR_MAGIC, COLUMNAR_VERSION, len(header_bytes))
+    return b"".join([prefix, header_bytes, *buffers])
+
+
+def columnar_bytes_to_columns(
+    buffer: bytes, scalars_as_lists: bool = True
+) -> tuple[int, dict[str, torch.Tensor | list]]:
+    """Decode a columnar message into `(num_transitions, {column name: stacked tensor})`.
+
+    Uncompressed columns are zero-copy, read-only views into `buffer`. Columns
+    that held Python scalars are returned as lists, unless `scalars_as_lists` is False.
+    """
+    magic, version, header_len = COLUMNAR_PREFIX.unpack_from(buffer)
+    if magic != COLUMNAR_MAGIC:
+        raise ValueError("Buffer is not a columnar transition message")
+    if version != COLUMNAR_VERSION:
+        raise ValueError(f"Unsupported columnar transition format version {version}")
+
+    payload_start = COLUMNAR_PREFIX.size + header_len
+    header = json.loads(bytes(buffer[COLUMNAR_PREFIX.size : payload_start]))
+    num_transitions = header["num_transitions"]
+    view = memoryview(buffer)
+
+    columns = {}
+    with warnings.catch_warnings():
+        # frombuffer warns about non-writable buffers, the views are only read
+        warnings.simplefilter("ignore", UserWarning)
+        for column in header["columns"]:
+            dtype = getattr(torch, column["dtype"])
+            shape = (num_transitions, *column["shape"])
+            start = payload_start + column["offset"]
+            data = view[start : start + column["nbytes"]]
+            if column["compression"] is not None:
+                data = _decompress(data, column["compression"])
+
+            if column["raw_nbytes"] == 0:
+                tensor = torch.empty(shape, dtype=dtype)
+            else:
+                tensor = torch.frombuffer(data, dtype=torch.uint8).view(dtype).reshape(shape)
+            columns[column["name"]] = tensor.tolist() if column["scalar"] and scalars_as_lists else tensor
+
+    return num_transitions, columns
+
+
+def columnar_bytes_to_transitions(buffer: bytes) -> list[Transition]:
+    """Decode a columnar message into transitions whose tensors are views of the column buffers."""
+    num_transitions, columns = columnar_bytes_to_columns(buffer)
+
+    transitions = []
+    for i in range(num_transitions):
+        transition = {"state": {}, "next_state": {}}
+        for name, column in columns.items():
+            group, _, key = name.partition("/")
+            if key:
+                transition.setdefault(group, {})[key] = column[i]
+            else:
+                transition[group] = column[i]
+        transitions.append(Transition(**transition))
+    return transitions
+
+
+def columnar_bytes_to_batch(buffer: bytes) -> tuple[int, dict[str, Any]]:
+    """Decode a columnar message into `(num_transitions, batch)` without building transitions.
+
+    The batch is laid out like a `Transition` whose values are the stacked columns, as
+    read-only tensors, e.g. `batch["state"][key]` of shape `(num_transitions, ...)`. It can
+    be stored with `ReplayBuffer.add_batch(**batch)`.
+    """
+    num_transitions, columns = columnar_bytes_to_columns(buffer, scalars_as_lists=False)
+
+    batch = {"state": {}, "next_state": {}}
+    for name, column in columns.items():
+        group, _, key = name.partition("/")
+        if key:
+            batch.setdefault(group, {})[key] = column
+        else:
+            batch[group] = column
+    return num_transitions, batch
+
+
 def grpc_channel_options(
     max_receive_message_length: int = MAX_MESSAGE_SIZE,
     max_send_message_length: int = MAX_MESSAGE_SIZE,
@@ -27,6 +27,8 @@ pytest_plugins = [
     "tests.fixtures.dataset_factories",
     "tests.fixtures.files",
     "tests.fixtures.hub",
+    "tests.fixtures.jaka_sdk",
+    "tests.fixtures.modbus_simulator",
     "tests.fixtures.optimizers",
     "tests.plugins.reachy2_sdk",
 ]
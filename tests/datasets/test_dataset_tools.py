@@ -27,6 +27,7 @@ from lerobot.datasets.dataset_tools import (
     merge_datasets,
     modify_features,
     remove_feature,
+    resample_dataset,
     split_dataset,
 )
 from lerobot.scripts.lerobot_edit_dataset import convert_dataset_to_videos
@@ -1050,6 +1051,87 @@ def test_modify_features_preserves_file_structure(sample_dataset, tmp_path):
         assert "reward" in modified_dataset.meta.features
 
 
+def test_resample_dataset(sample_dataset, tmp_path):
+    """Test resampling an image dataset keeps one frame every stride."""
+    output_dir = tmp_path / "resampled"
+
+    with (
+        patch("lerobot.datasets.lerobot_dataset.get_safe_version") as mock_get_safe_version,
+        patch("lerobot.datasets.lerobot_dataset.snapshot_download") as mock_snapshot_download,
+    ):
+        mock_get_safe_version.return_value = "v3.0"
+        mock_snapshot_download.return_value = str(output_dir)
+
+        new_dataset = resample_dataset(sample_dataset, target_fps=10, output_dir=output_dir, num_workers=2)
+
+    # 10 frames at stride 3 keep frames 0, 3, 6 and 9 of each episode
+    assert new_dataset.fps == 10
+    assert new_dataset.meta.total_episodes == 5
+    assert new_dataset.meta.total_frames == 20
+    assert len(new_dataset) == 20
+
+    item = new_dataset[5]
+    source_item = sample_dataset[13]
+    assert item["episode_index"].item() == 1
+    assert item["frame_index"].item() == 1
+    assert item["index"].item() == 5
+    assert item["timestamp"].item() == pytest.approx(0.1)
+    assert torch.equal(item["action"], source_item["action"])
+    assert torch.equal(item["observation.images.top"], source_item["observation.images.top"])
+    assert item["task"] == source_item["task"]
+
+    actions = torch.stack([sample_dataset[i]["action"] for i in range(0, 50) if i % 10 % 3 == 0])
+    stats = new_dataset.meta.stats
+    assert np.allclose(stats["action"]["mean"], actions.mean(dim=0).numpy(), atol=1e-6)
+    assert stats["observation.images.top"]["mean"].shape == (3, 1, 1)
+
+
+def test_resample_video_dataset(tmp_path, empty_lerobot_dataset_factory):
+    """Test resampling a video dataset re-encodes the kept frames at the target fps."""
+    features = {
+        "action": {"dtype": "float32", "shape": (2,), "names": None},
+        "observation.images.top": {"dtype": "video", "shape": (32, 32, 3), "names": None},
+    }
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "video_dataset", features=features, video_backend="pyav"
+    )
+    for ep_idx in range(2):
+        for frame_idx in range(9):
+            value = (ep_idx * 9 + frame_idx) * 10
+            frame = {
+                "action": np.array([ep_idx, frame_idx], dtype=np.float32),
+                "observation.images.top": np.full((32, 32, 3), value, dtype=np.uint8),
+                "task": "task",
+            }
+            dataset.add_frame(frame)
+        dataset.save_episode()
+    dataset.finalize()
+    # Resampled videos are encoded with the options of the dataset
+    dataset.meta.update_video_encoding({"vcodec": "h264", "g": 4, "preset": "ultrafast"})
+
+    output_dir = tmp_path / "resampled"
+    with (
+        patch("lerobot.datasets.lerobot_dataset.get_safe_version") as mock_get_safe_version,
+        patch("lerobot.datasets.lerobot_dataset.snapshot_download") as mock_snapshot_download,
+    ):
+        mock_get_safe_version.return_value = "v3.0"
+        mock_snapshot_download.return_value = str(output_dir)
+
+        new_dataset = resample_dataset(dataset, target_fps=10, output_dir=output_dir, num_workers=2)
+
+    assert new_dataset.meta.total_frames == 6
+    assert new_dataset.meta.info["features"]["observation.images.top"]["info"]["video.fps"] == 10
+    assert new_dataset.meta.info["features"]["observation.images.top"]["info"]["video.codec"] == "h264"
+    episode = new_dataset.meta.episodes[1]
+    assert episode["videos/observation.images.top/from_timestamp"] == pytest.approx(0.3)
+    assert episode["videos/observation.images.top/to_timestamp"] == pytest.approx(0.6)
+
+    item = new_dataset[4]
+    assert item["action"].tolist() == [1.0, 3.0]
+    # Frame 3 of the second episode, 120 / 255 with compression loss
+    assert item["observation.images.top"].mean().item() == pytest.approx(120 / 255, abs=0.03)
+
+
 def test_convert_dataset_to_videos(tmp_path):
     """Test converting lerobot/pusht_image dataset to video format."""
     from lerobot.datasets.lerobot_dataset import LeRobotDataset
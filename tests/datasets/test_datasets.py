@@ -15,8 +15,10 @@
 # limitations under the License.
 import logging
 import re
+import stat
 from itertools import chain
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -28,6 +30,7 @@ from safetensors.torch import load_file
 import lerobot
 from lerobot.configs.default import DatasetConfig
 from lerobot.configs.train import TrainPipelineConfig
+from lerobot.datasets.compute_stats import compute_image_stats
 from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.image_writer import image_array_to_pil_image
 from lerobot.datasets.lerobot_dataset import (
@@ -38,11 +41,15 @@ from lerobot.datasets.utils import (
     DEFAULT_CHUNK_SIZE,
     DEFAULT_DATA_FILE_SIZE_IN_MB,
     DEFAULT_VIDEO_FILE_SIZE_IN_MB,
+    EPISODES_DIR,
     create_branch,
     get_hf_features_from_features,
     hf_transform_to_torch,
     hw_to_dataset_features,
+    load_info,
+    load_nested_dataset,
 )
+from lerobot.datasets.video_utils import append_fragmented_video, encode_video_frames
 from lerobot.envs.factory import make_env_config
 from lerobot.policies.factory import make_policy_config
 from lerobot.robots import make_robot_from_config
@@ -792,6 +799,213 @@ def test_update_chunk_settings_video_dataset(tmp_path):
     assert dataset.meta.video_files_size_in_mb == new_video_size
 
 
+def test_streaming_encoding(tmp_path, empty_lerobot_dataset_factory):
+    """Videos encoded while recording match the frames and their stats, without temporary images."""
+    key = f"{OBS_IMAGES}.cam"
+    features = {
+        key: {"dtype": "video", "shape": (48, 64, 3), "names": ["height", "width", "channels"]},
+        "state": {"dtype": "float32", "shape": (2,), "names": None},
+    }
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "test", features=features, streaming_encoding=True, video_backend="pyav"
+    )
+    rng = np.random.default_rng(0)
+    episodes = []
+    for num_frames in (12, 7):
+        # Smooth images, so that the lossy encoding stays close to them
+        base = rng.integers(0, 256, size=(6, 8, 3), dtype=np.uint8)
+        frames = np.stack([np.kron(base, np.ones((8, 8, 1), dtype=np.uint8)) for _ in range(num_frames)])
+        for i, frame in enumerate(frames):
+            # Float frames are accepted as well
+            image = frame if i % 2 else frame.astype(np.float32) / 255
+            dataset.add_frame({key: image, "state": np.ones(2, dtype=np.float32), "task": "Dummy task"})
+        assert not dataset._get_image_file_dir(len(episodes), key).exists()
+        dataset.save_episode()
+        episodes.append(frames)
+    # The encoding worker of the camera is kept for all the episodes
+    worker = dataset._streaming_encoders[key]._process
+    assert worker.is_alive()
+
+    # A discarded episode leaves nothing behind
+    dataset.add_frame({key: frames[0], "state": np.ones(2, dtype=np.float32), "task": "Dummy task"})
+    dataset.clear_episode_buffer()
+    assert dataset._streaming_encoders[key]._process is worker
+    dataset.finalize()
+    assert not worker.is_alive()
+    assert len(list(dataset.root.glob("tmp*"))) == 0
+
+    loaded_dataset = LeRobotDataset(dataset.repo_id, root=dataset.root, video_backend="pyav")
+    assert loaded_dataset.meta.total_episodes == 2
+    assert loaded_dataset.meta.total_frames == 19
+    assert loaded_dataset.meta.info["features"][key]["info"]["video.codec"] == "av1"
+
+    episodes_stats = load_nested_dataset(dataset.root / EPISODES_DIR)
+    for ep_idx, frames in enumerate(episodes):
+        expected = compute_image_stats(frames.transpose(0, 3, 1, 2))
+        for stat in ("mean", "std", "q50"):
+            value = np.asarray(episodes_stats[ep_idx][f"stats/{key}/{stat}"]).reshape(3, 1, 1)
+            np.testing.assert_allclose(value, expected[stat], atol=1e-6)
+
+    item = loaded_dataset[12 + 3]
+    decoded = (item[key].permute(1, 2, 0).numpy() * 255).astype(np.float32)
+    assert np.abs(decoded - episodes[1][3]).mean() < 8
+
+
+@pytest.mark.parametrize("streaming_encoding", [False, True])
+def test_fragmented_videos(tmp_path, empty_lerobot_dataset_factory, streaming_encoding):
+    """Episodes are appended to fragmented videos without rewriting them and decode like other videos."""
+    key = f"{OBS_IMAGES}.cam"
+    features = {key: {"dtype": "video", "shape": (48, 64, 3), "names": ["height", "width", "channels"]}}
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "test",
+        features=features,
+        streaming_encoding=streaming_encoding,
+        fragmented_videos=True,
+        video_backend="pyav",
+    )
+    num_frames = (5, 8, 6)
+    for ep_idx, length in enumerate(num_frames):
+        for i in range(length):
+            frame = np.full((48, 64, 3), 40 * ep_idx + 4 * i, dtype=np.uint8)
+            dataset.add_frame({key: frame, "task": "Dummy task"})
+        dataset.save_episode()
+        video_path = dataset.root / dataset.meta.video_path.format(video_key=key, chunk_index=0, file_index=0)
+        if ep_idx == 1:
+            first_bytes = video_path.read_bytes()
+    dataset.finalize()
+
+    # The first episodes were left in place, only the index before them was updated
+    video_bytes = video_path.read_bytes()
+    first_moof = first_bytes.index(b"moof") - 4
+    assert video_bytes[first_moof : len(first_bytes)] == first_bytes[first_moof:]
+    assert b"sidx" in video_bytes[:first_moof]
+
+    loaded_dataset = LeRobotDataset(dataset.repo_id, root=dataset.root, video_backend="pyav")
+    assert loaded_dataset.meta.episodes[2][f"videos/{key}/to_timestamp"] == pytest.approx(19 / 30)
+    for ep_idx, length in enumerate(num_frames):
+        for i in range(length):
+            item = loaded_dataset[sum(num_frames[:ep_idx]) + i]
+            assert item[key].mean().item() * 255 == pytest.approx(40 * ep_idx + 4 * i, abs=3)
+
+
+@pytest.mark.parametrize("streaming_encoding", [False, True])
+def test_update_video_encoding(tmp_path, empty_lerobot_dataset_factory, streaming_encoding):
+    """The videos of the episodes recorded after setting the encoding options are encoded with them."""
+    key = f"{OBS_IMAGES}.cam"
+    features = {key: {"dtype": "video", "shape": (48, 64, 3), "names": ["height", "width", "channels"]}}
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "test", features=features, streaming_encoding=streaming_encoding, video_backend="pyav"
+    )
+    with pytest.raises(ValueError, match="Unknown video encoding options"):
+        dataset.meta.update_video_encoding({"codec": "h264"})
+    dataset.meta.update_video_encoding({"vcodec": "h264", "g": 4, "crf": 20, "preset": "ultrafast"})
+
+    for i in range(6):
+        dataset.add_frame({key: np.full((48, 64, 3), 20 * i, dtype=np.uint8), "task": "Dummy task"})
+    dataset.save_episode()
+    dataset.finalize()
+
+    loaded_dataset = LeRobotDataset(dataset.repo_id, root=dataset.root, video_backend="pyav")
+    assert loaded_dataset.meta.video_encoding["vcodec"] == "h264"
+    assert loaded_dataset.meta.features[key]["info"]["video.codec"] == "h264"
+    assert loaded_dataset[3][key].mean().item() * 255 == pytest.approx(60, abs=3)
+
+    dataset.meta.update_video_encoding(None)
+    assert "video_encoding" not in load_info(dataset.root)
+
+
+def test_append_fragmented_video_requires_fragmented_videos(tmp_path):
+    for name, fragmented in [("fragmented", True), ("regular", False)]:
+        imgs_dir = tmp_path / name
+        imgs_dir.mkdir()
+        for i in range(4):
+            image_array_to_pil_image(np.full((48, 64, 3), 10 * i, dtype=np.uint8)).save(
+                imgs_dir / f"frame-{i:06d}.png"
+            )
+        encode_video_frames(imgs_dir, tmp_path / f"{name}.mp4", fps=30, fragmented=fragmented)
+
+    regular_bytes = (tmp_path / "regular.mp4").read_bytes()
+    assert not append_fragmented_video(tmp_path / "fragmented.mp4", tmp_path / "regular.mp4")
+    assert not append_fragmented_video(tmp_path / "regular.mp4", tmp_path / "fragmented.mp4")
+    assert (tmp_path / "regular.mp4").read_bytes() == regular_bytes
+
+
+def test_async_finalization(tmp_path, empty_lerobot_dataset_factory):
+    """Episodes finalized in the background are saved like synchronously saved ones."""
+    names = ["height", "width", "channels"]
+    features = {
+        f"{OBS_IMAGES}.{cam}": {"dtype": "video", "shape": (32, 48, 3), "names": names}
+        for cam in ("front", "wrist")
+    }
+    features["state"] = {"dtype": "float32", "shape": (2,), "names": None}
+
+    def record(dataset):
+        futures = []
+        for ep_idx, num_frames in enumerate((4, 6, 5)):
+            assert dataset.next_episode_index == ep_idx
+            for i in range(num_frames):
+                frame = {key: np.full((32, 48, 3), 40 * ep_idx + 10 * i, dtype=np.uint8) for key in features}
+                frame["state"] = np.array([ep_idx, i], dtype=np.float32)
+                dataset.add_frame({**frame, "task": f"Task {ep_idx % 2}"})
+            futures.append(dataset.save_episode())
+        dataset.finalize()
+        return futures
+
+    sync_dataset = empty_lerobot_dataset_factory(root=tmp_path / "sync", features=features)
+    assert record(sync_dataset) == [None] * 3
+
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "async", features=features, async_finalization=True, max_pending_episodes=1
+    )
+    futures = record(dataset)
+    assert all(future.done() and future.exception() is None for future in futures)
+    assert dataset._video_encoding_pool is None
+    assert not list((dataset.root / "images").rglob("*.png"))
+
+    expected = LeRobotDataset(sync_dataset.repo_id, root=sync_dataset.root, video_backend="pyav")
+    loaded_dataset = LeRobotDataset(dataset.repo_id, root=dataset.root, video_backend="pyav")
+    assert loaded_dataset.meta.total_episodes == 3
+    assert loaded_dataset.meta.tasks.equals(expected.meta.tasks)
+    for column in ("index", "episode_index", "frame_index", "task_index", "state"):
+        torch.testing.assert_close(
+            torch.stack(list(loaded_dataset.hf_dataset[column])),
+            torch.stack(list(expected.hf_dataset[column])),
+        )
+    for ep_idx in range(3):
+        for key in ("dataset_from_index", "dataset_to_index", f"videos/{OBS_IMAGES}.wrist/to_timestamp"):
+            assert loaded_dataset.meta.episodes[ep_idx][key] == expected.meta.episodes[ep_idx][key]
+    item = loaded_dataset[4 + 2]
+    assert item[f"{OBS_IMAGES}.front"].mean().item() * 255 == pytest.approx(60, abs=3)
+
+
+def test_async_finalization_failure(tmp_path, empty_lerobot_dataset_factory):
+    features = {"state": {"dtype": "float32", "shape": (2,), "names": None}}
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "test", features=features, async_finalization=True
+    )
+
+    def add_episode():
+        for _ in range(3):
+            dataset.add_frame({"state": np.zeros(2, dtype=np.float32), "task": "Dummy task"})
+
+    add_episode()
+    dataset.save_episode().result()
+    with patch.object(dataset, "_save_episode_data", side_effect=OSError("Disk full")):
+        add_episode()
+        future = dataset.save_episode()
+        with pytest.raises(OSError, match="Disk full"):
+            future.result()
+
+    # The next episodes are not saved after the one that failed
+    add_episode()
+    with pytest.raises(OSError, match="Disk full"):
+        dataset.save_episode()
+    with pytest.raises(OSError, match="Disk full"):
+        dataset.finalize()
+    assert dataset.meta.total_episodes == 1
+    assert dataset.writer is None
+
+
 def test_episode_index_distribution(tmp_path, empty_lerobot_dataset_factory):
     """Test that all frames have correct episode indices across multiple episodes."""
     features = {"state": {"dtype": "float32", "shape": (2,), "names": None}}
@@ -1292,3 +1506,20 @@ def test_frames_in_current_file_calculation(tmp_path, empty_lerobot_dataset_fact
         frame = loaded_dataset[idx]
         expected_ep = idx // frames_per_episode
         assert frame["episode_index"].item() == expected_ep
+
+
+def test_append_fragmented_video_keeps_permissions(tmp_path):
+    for name in ("first", "second"):
+        imgs_dir = tmp_path / name
+        imgs_dir.mkdir()
+        for i in range(4):
+            image_array_to_pil_image(np.full((48, 64, 3), 10 * i, dtype=np.uint8)).save(
+                imgs_dir / f"frame-{i:06d}.png"
+            )
+        encode_video_frames(imgs_dir, tmp_path / f"{name}.mp4", fps=30, fragmented=True)
+    video_path = tmp_path / "first.mp4"
+    video_path.chmod(0o644)
+
+    # The video has no index yet, so it is rewritten with one
+    assert append_fragmented_video(tmp_path / "second.mp4", video_path)
+    assert stat.S_IMODE(video_path.stat().st_mode) == 0o644
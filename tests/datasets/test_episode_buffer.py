@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datasets
+import numpy as np
+import pytest
+import torch
+
+from lerobot.datasets.episode_buffer import EpisodeBuffer, episode_to_arrow
+from lerobot.datasets.utils import DEFAULT_FEATURES, get_hf_features_from_features
+from lerobot.utils.constants import ACTION, OBS_IMAGE, OBS_STATE
+
+FEATURES = {
+    OBS_STATE: {"dtype": "float32", "shape": (6,), "names": None},
+    ACTION: {"dtype": "float64", "shape": (2, 3), "names": None},
+    "next.reward": {"dtype": "float32", "shape": (1,), "names": None},
+    "next.done": {"dtype": "bool", "shape": (1,), "names": None},
+    "language": {"dtype": "string", "shape": (1,), "names": None},
+    OBS_IMAGE: {"dtype": "image", "shape": (8, 8, 3), "names": ["height", "width", "channels"]},
+    **DEFAULT_FEATURES,
+}
+
+
+def make_frame(i: int) -> dict:
+    return {
+        OBS_STATE: np.full(6, i, dtype=np.float32),
+        ACTION: torch.full((2, 3), float(i), dtype=torch.float64),
+        "next.reward": np.array([i / 10], dtype=np.float32),
+        "next.done": np.array([i % 2 == 0]),
+        "language": f"instruction {i}",
+    }
+
+
+def test_episode_buffer_grows():
+    buffer = EpisodeBuffer(FEATURES, episode_index=3, capacity=2)
+    for i in range(5):
+        buffer[OBS_IMAGE].append(f"frame_{i}.png")
+        buffer.add(make_frame(i), timestamp=i / 30, task="Dummy task")
+
+    assert buffer["size"] == 5
+    assert buffer["episode_index"] == 3
+    assert buffer["task"] == ["Dummy task"] * 5
+    assert set(buffer) == {"size", "task", *FEATURES}
+    np.testing.assert_array_equal(buffer["frame_index"], np.arange(5))
+    np.testing.assert_allclose(buffer["timestamp"], np.arange(5) / 30)
+    np.testing.assert_array_equal(buffer[OBS_STATE], np.arange(5)[:, None].repeat(6, axis=1))
+    np.testing.assert_array_equal(buffer[ACTION], np.arange(5)[:, None, None] * np.ones((2, 3)))
+    np.testing.assert_array_equal(buffer["next.done"][:, 0], [True, False, True, False, True])
+    assert buffer["language"] == [f"instruction {i}" for i in range(5)]
+    assert buffer[OBS_IMAGE] == [f"frame_{i}.png" for i in range(5)]
+
+
+def test_episode_buffer_rejects_different_features():
+    buffer = EpisodeBuffer(FEATURES, episode_index=0)
+    buffer.add(make_frame(0), timestamp=0, task="Dummy task")
+    frame = make_frame(1)
+    del frame[OBS_STATE]
+    with pytest.raises(ValueError, match="Missing features"):
+        buffer.add(frame, timestamp=1 / 30, task="Dummy task")
+    assert buffer.size == 1
+
+
+
+@pytest.mark.parametrize(
+    "key, value",
+    [
+        (ACTION, np.zeros((1,), dtype=np.float64)),
+        (OBS_STATE, np.float32(1.0)),
+        (OBS_STATE, torch.zeros(3)),
+    ],
+)
+def test_episode_buffer_rejects_different_shapes(key, value):
+    buffer = EpisodeBuffer(FEATURES, episode_index=0)
+    buffer.add(make_frame(0), timestamp=0, task="Dummy task")
+    frame = make_frame(1)
+    frame[key] = value
+    with pytest.raises(ValueError, match=f"The feature '{key}'"):
+        buffer.add(frame, timestamp=1 / 30, task="Dummy task")
+    assert buffer.size == 1
+
+def test_episode_to_arrow():
+    buffer = EpisodeBuffer(FEATURES, episode_index=0, capacity=4)
+    for i in range(3):
+        buffer[OBS_IMAGE].append(None)
+        buffer.add(make_frame(i), timestamp=i / 30, task="Dummy task")
+    episode = dict(buffer)
+    episode["index"] = np.arange(3)
+    episode["episode_index"] = np.zeros(3, dtype=np.int64)
+    episode["task_index"] = np.zeros(3, dtype=np.int64)
+
+    hf_features = get_hf_features_from_features(FEATURES)
+    ep_dict = {key: episode[key] for key in hf_features}
+    table = episode_to_arrow(ep_dict, hf_features)
+    expected = datasets.Dataset.from_dict(ep_dict, features=hf_features).with_format("arrow")[:]
+
+    assert table.schema == expected.schema
+    assert table.equals(expected)
+    # The numerical arrays of the episode buffer are not copied
+    state = table.column(OBS_STATE).chunk(0).values
+    assert state.buffers()[1].address == buffer[OBS_STATE].ctypes.data
+    reward = table.column("next.reward").chunk(0)
+    assert reward.buffers()[1].address == buffer["next.reward"].ctypes.data
+    action = table.column(ACTION).chunk(0).storage.values.values
+    assert action.buffers()[1].address == buffer[ACTION].ctypes.data
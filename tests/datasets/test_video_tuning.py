@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+
+import numpy as np
+import pytest
+
+from lerobot.datasets.video_tuning import (
+    EncodingTrial,
+    make_search_space,
+    pareto_frontier,
+    select_profile,
+    tune_video_encoding,
+)
+
+
+def make_trial(encode_fps, size, latency, psnr=40.0, fps=30) -> EncodingTrial:
+    return EncodingTrial(
+        "h264",
+        "veryfast",
+        2,
+        23,
+        None,
+        encode_fps=encode_fps,
+        size_kib_per_frame=size,
+        decode_latency_ms=latency,
+        psnr=psnr,
+        realtime=encode_fps >= fps,
+    )
+
+
+def test_pareto_frontier():
+    fast = make_trial(encode_fps=200, size=10, latency=5)
+    small = make_trial(encode_fps=40, size=2, latency=5)
+    dominated = make_trial(encode_fps=100, size=10, latency=6)
+    not_decodable = make_trial(encode_fps=300, size=1, latency=math.inf, psnr=0)
+    assert pareto_frontier([fast, small, dominated, not_decodable]) == [fast, small]
+
+
+def test_select_profile():
+    fast = make_trial(encode_fps=200, size=10, latency=5)
+    small = make_trial(encode_fps=40, size=2, latency=5)
+    too_slow = make_trial(encode_fps=20, size=1, latency=4)
+    too_lossy = make_trial(encode_fps=100, size=1, latency=4, psnr=25)
+    assert select_profile([fast, small, too_slow, too_lossy]) is small
+
+    # When nothing is fast and good enough, the fastest options are chosen
+    assert select_profile([too_slow, too_lossy], min_psnr=50) is too_lossy
+
+    # Options whose videos could not be decoded are never chosen
+    not_decodable = make_trial(encode_fps=300, size=1, latency=math.inf, psnr=0)
+    assert select_profile([too_slow, not_decodable], min_psnr=50) is too_slow
+    with pytest.raises(ValueError, match="could be decoded"):
+        select_profile([not_decodable])
+
+
+def test_make_search_space():
+    trials = make_search_space(codecs=["h264", "not_a_codec"], gop_sizes=[2], threads=[None, 1])
+    assert {trial.vcodec for trial in trials} == {"h264"}
+    assert len(trials) == 3 * 2 * 2
+    assert {"vcodec": "h264", "g": 2, "crf": 23, "preset": "ultrafast", "threads": 1} in [
+        trial.profile for trial in trials
+    ]
+
+
+def test_tune_video_encoding():
+    frames = np.zeros((10, 48, 64, 3), dtype=np.uint8)
+    for i in range(len(frames)):
+        frames[i, :, : 6 * (i + 1)] = 200
+    trials = [
+        EncodingTrial("h264", "ultrafast", 2, 18, 1),
+        EncodingTrial("h264", "veryfast", 5, 30, None),
+    ]
+    profile, trials = tune_video_encoding(frames, fps=30, trials=trials, backend="pyav", num_queries=4)
+
+    assert profile in [trial.profile for trial in trials]
+    for trial in trials:
+        assert trial.encode_fps > 0
+        assert trial.size_kib_per_frame > 0
+        assert 0 < trial.decode_latency_ms < math.inf
+        assert trial.psnr > 20
+    assert set(map(id, pareto_frontier(trials))) <= set(map(id, trials))
+
+
+def test_tune_video_encoding_rejects_channel_first_frames():
+    with pytest.raises(ValueError, match="Expected uint8 frames"):
+        tune_video_encoding(np.zeros((4, 3, 48, 64), dtype=np.uint8), fps=30)
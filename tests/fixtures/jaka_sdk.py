@@ -0,0 +1,37 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+# The JAKA SDK is vendored next to the robot and teleoperator code, it is only shipped with the robot
+JAKA_SDK_MODULES = [
+    "lerobot.robots.jakaS12.jaka_lib_2_3_0",
+    "lerobot.teleoperators.jakaS12_leader.jaka_lib_2_3_0",
+]
+
+
+@pytest.fixture
+def jaka_sdk(monkeypatch):
+    """Stubs the JAKA SDK so the JAKA robot and teleoperator packages can be imported without it.
+
+    `jkrc.RC` is a MagicMock: tests that talk to the arm pass their own fake SDK handle.
+    """
+    sdk = types.ModuleType("jaka_lib_2_3_0")
+    sdk.jkrc = MagicMock(name="jkrc")
+    for name in JAKA_SDK_MODULES:
+        monkeypatch.setitem(sys.modules, name, sdk)
+    return sdk
@@ -0,0 +1,109 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import socket
+import threading
+
+import pytest
+
+
+class ModbusSimulator:
+    """Local pymodbus TCP server exposing a block of coils, run on a background thread.
+
+    Stands in for the JAKA sucker I/O module so Modbus clients can be tested and
+    benchmarked without hardware. `requests` counts the PDUs the server received;
+    inspect coil state through a client.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int | None = None, num_coils: int = 64):
+        self.host = host
+        self.port = port if port is not None else _free_port()
+        self.num_coils = num_coils
+        self.requests = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._server = None
+
+    def __enter__(self) -> "ModbusSimulator":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        from pymodbus.datastore import ModbusSequentialDataBlock, ModbusServerContext
+        from pymodbus.server import ModbusTcpServer
+
+        # Data blocks are 1-based internally, coil 0 lives at block address 1
+        coils = ModbusSequentialDataBlock(1, [False] * self.num_coils)
+        # pymodbus >= 3.10 renamed slave contexts to device contexts
+        try:
+            from pymodbus.datastore import ModbusDeviceContext
+
+            context = ModbusServerContext(devices=ModbusDeviceContext(co=coils), single=True)
+        except ImportError:
+            from pymodbus.datastore import ModbusSlaveContext
+
+            context = ModbusServerContext(slaves=ModbusSlaveContext(co=coils), single=True)
+
+        def _count(is_send, pdu):
+            if not is_send:
+                self.requests += 1
+            return pdu
+
+        started = threading.Event()
+
+        async def _serve():
+            self._server = ModbusTcpServer(context, address=(self.host, self.port), trace_pdu=_count)
+            serve_task = asyncio.create_task(self._server.serve_forever())
+            # serve_forever() only returns on shutdown, wait for the listener instead
+            while not _port_open(self.host, self.port):
+                await asyncio.sleep(0.01)
+            started.set()
+            await serve_task
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_until_complete, args=(_serve(),), name="ModbusSimulator", daemon=True
+        )
+        self._thread.start()
+        if not started.wait(timeout=5.0):
+            raise RuntimeError(f"Modbus simulator did not start on {self.host}:{self.port}")
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._server.shutdown(), self._loop).result(timeout=5.0)
+        self._thread.join(timeout=5.0)
+        self._loop.close()
+        self._loop = None
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _port_open(host: str, port: int) -> bool:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        return sock.connect_ex((host, port)) == 0
+
+
+@pytest.fixture
+def modbus_simulator():
+    pytest.importorskip("pymodbus")
+    with ModbusSimulator() as simulator:
+        yield simulator
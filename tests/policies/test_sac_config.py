@@ -169,6 +169,18 @@ def test_actor_learner_config():
     assert config.policy_parameters_push_frequency == 4
 
 
+def test_actor_learner_config_transitions_compression(monkeypatch):
+    from lerobot.policies.sac import configuration_sac
+
+    with pytest.raises(ValueError, match="Unsupported transitions_compression"):
+        ActorLearnerConfig(transitions_compression="gzip")
+
+    # A missing compression package fails when the config is created, not in the actor
+    monkeypatch.setattr(configuration_sac, "is_package_available", lambda package: package != "zstandard")
+    assert ActorLearnerConfig(transitions_compression="lz4").transitions_compression == "lz4"
+    with pytest.raises(ImportError, match="lerobot\\[transitions-compression\\]"):
+        ActorLearnerConfig(transitions_compression="zstd")
+
 def test_concurrency_config():
     config = ConcurrencyConfig()
     assert config.actor == "threads"
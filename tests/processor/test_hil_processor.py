@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import torch
+import torchvision.transforms.functional as F  # noqa: N812
+
+from lerobot.processor import ImageCropResizeProcessorStep
+from lerobot.utils.constants import OBS_IMAGES, OBS_STATE
+
+CROPS = {
+    f"{OBS_IMAGES}.front": (10, 20, 200, 180),
+    f"{OBS_IMAGES}.side": (0, 0, 200, 180),
+    f"{OBS_IMAGES}.wrist": (5, 5, 100, 100),
+}
+
+
+def make_observation() -> dict[str, torch.Tensor]:
+    observation = {key: torch.rand(1, 3, 240, 320) for key in CROPS}
+    observation[f"{OBS_IMAGES}.top"] = torch.rand(1, 3, 96, 96)
+    observation[OBS_STATE] = torch.randn(1, 6)
+    return observation
+
+
+def test_image_crop_resize_matches_per_image_resize():
+    step = ImageCropResizeProcessorStep(crop_params_dict=CROPS, resize_size=(128, 128))
+    observation = make_observation()
+
+    result = step.observation(observation)
+
+    for key, image in observation.items():
+        if key == OBS_STATE:
+            assert result[key] is image
+            continue
+        expected = F.crop(image, *CROPS[key]) if key in CROPS else image
+        expected = F.resize(expected, (128, 128)).clamp(0.0, 1.0)
+        torch.testing.assert_close(result[key], expected)
+
+
+def test_image_crop_resize_output_buffers():
+    step = ImageCropResizeProcessorStep(crop_params_dict=CROPS, resize_size=(64, 64), output_buffers=2)
+
+    first = step.observation(make_observation())[f"{OBS_IMAGES}.front"]
+    second = step.observation(make_observation())[f"{OBS_IMAGES}.front"]
+    third = step.observation(make_observation())[f"{OBS_IMAGES}.front"]
+
+    # The buffers are used in turn
+    assert first.data_ptr() != second.data_ptr()
+    assert first.data_ptr() == third.data_ptr()
+
+
+def test_image_crop_resize_config():
+    step = ImageCropResizeProcessorStep(resize_size=(64, 64), device="cpu", output_buffers=3)
+    config = step.get_config()
+    assert config == {"crop_params_dict": None, "resize_size": (64, 64), "device": "cpu", "output_buffers": 3}
+    assert ImageCropResizeProcessorStep(**config).observation(make_observation())[OBS_STATE].shape == (1, 6)
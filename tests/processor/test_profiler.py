@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from dataclasses import dataclass
+
+import torch
+
+from lerobot.processor import (
+    DataProcessorPipeline,
+    IdentityProcessorStep,
+    ObservationProcessorStep,
+    PipelineProfiler,
+    TransitionKey,
+    profile_pipelines,
+)
+from lerobot.processor.converters import create_transition, identity_transition
+from lerobot.utils.constants import OBS_STATE
+
+
+@dataclass
+class DoubleObservationStep(ObservationProcessorStep):
+    def observation(self, observation):
+        return {key: value * 2 for key, value in observation.items()}
+
+    def transform_features(self, features):
+        return features
+
+
+def make_pipeline() -> DataProcessorPipeline:
+    return DataProcessorPipeline(
+        steps=[IdentityProcessorStep(), DoubleObservationStep()],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    )
+
+
+def make_transition():
+    return create_transition(observation={OBS_STATE: torch.ones(256)})
+
+
+def test_profiler_times_every_step(tmp_path):
+    pipeline = make_pipeline()
+    profiler = PipelineProfiler()
+    profiler.attach(pipeline, "env")
+
+    for _ in range(5):
+        result = pipeline(make_transition())
+    assert torch.equal(result[TransitionKey.OBSERVATION][OBS_STATE], torch.full((256,), 2.0))
+
+    summary = profiler.summary()
+    assert list(summary) == ["env/0:IdentityProcessorStep", "env/1:DoubleObservationStep"]
+    for stats in summary.values():
+        assert stats["calls"] == 5
+        assert 0 <= stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+    # Only the second step creates a tensor
+    assert summary["env/0:IdentityProcessorStep"]["mean_alloc_bytes"] == 0
+    assert summary["env/1:DoubleObservationStep"]["mean_alloc_bytes"] == 256 * 4
+
+    trace_path = tmp_path / "trace.json"
+    profiler.dump_chrome_trace(trace_path)
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    steps = [event for event in events if event["ph"] == "X"]
+    assert len(steps) == 10
+    assert steps[1]["name"] == "DoubleObservationStep"
+    assert steps[1]["ts"] >= steps[0]["ts"] + steps[0]["dur"]
+    assert [event["args"]["name"] for event in events if event["ph"] == "M"] == ["env (MainThread)"]
+
+    profiler.detach()
+    assert not pipeline.before_step_hooks and not pipeline.after_step_hooks
+
+
+def test_profile_pipelines(tmp_path):
+    pipeline = make_pipeline()
+
+    with profile_pipelines(None, {"env": pipeline}) as profiler:
+        assert profiler is None
+        assert not pipeline.before_step_hooks
+
+    trace_path = tmp_path / "trace.json"
+    with profile_pipelines(trace_path, {"env": pipeline, "missing": None}) as profiler:
+        pipeline(make_transition())
+    assert not pipeline.before_step_hooks
+    assert len(json.loads(trace_path.read_text())["traceEvents"]) == 3
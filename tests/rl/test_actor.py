@@ -135,6 +135,37 @@ def test_push_transitions_to_transport_queue():
         assert_transitions_equal(deserialized_transition, transitions[i])
 
 
+@require_package("grpc")
+def test_push_transitions_to_transport_queue_columnar():
+    from lerobot.rl.actor import push_transitions_to_transport_queue
+    from lerobot.transport.utils import COLUMNAR_MAGIC, bytes_to_transitions
+    from tests.transport.test_transport_utils import assert_transitions_equal
+
+    transitions = [
+        Transition(
+            state={OBS_STR: torch.randn(3, 64, 64), "state": torch.randn(10)},
+            action=torch.randn(5),
+            reward=torch.tensor(1.0 + i),
+            done=torch.tensor(False),
+            truncated=torch.tensor(False),
+            next_state={OBS_STR: torch.randn(3, 64, 64), "state": torch.randn(10)},
+            complementary_info={"step": torch.tensor(i)},
+        )
+        for i in range(3)
+    ]
+
+    transitions_queue = Queue()
+    push_transitions_to_transport_queue(transitions, transitions_queue, wire_format="columnar")
+
+    serialized_data = transitions_queue.get()
+    assert serialized_data.startswith(COLUMNAR_MAGIC)
+    deserialized_transitions = bytes_to_transitions(serialized_data)
+    assert len(deserialized_transitions) == len(transitions)
+    for i, deserialized_transition in enumerate(deserialized_transitions):
+        assert_transitions_equal(deserialized_transition, transitions[i])
+        assert torch.equal(deserialized_transition["complementary_info"]["step"], torch.tensor(i))
+
+
 @require_package("grpc")
 @pytest.mark.timeout(3)  # force cross-platform watchdog
 def test_transitions_stream():
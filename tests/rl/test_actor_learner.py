@@ -296,3 +296,28 @@ def test_end_to_end_parameters_flow(cfg, data_size):
     assert received_params.keys() == input_params.keys()
     for key in input_params:
         assert torch.allclose(received_params[key], input_params[key])
+
+
+def test_add_transition_batch_skips_nan_and_keeps_interventions():
+    from lerobot.rl.buffer import ReplayBuffer
+    from lerobot.rl.learner import add_transition_batch
+    from lerobot.transport.utils import transitions_to_columnar_bytes
+
+    transitions = create_test_transitions(count=4)
+    for i, transition in enumerate(transitions):
+        transition["complementary_info"] = {"is_intervention": i >= 2}
+    transitions[1]["next_state"]["state"][0] = float("nan")
+
+    replay_buffer = ReplayBuffer(capacity=8, device="cpu", state_keys=[OBS_STR, "state"])
+    offline_replay_buffer = ReplayBuffer(capacity=8, device="cpu", state_keys=[OBS_STR, "state"])
+    add_transition_batch(
+        transitions_to_columnar_bytes(transitions), replay_buffer, offline_replay_buffer, "dataset"
+    )
+
+    assert len(replay_buffer) == 3
+    kept = [transitions[i] for i in (0, 2, 3)]
+    assert torch.equal(replay_buffer.states["state"][:3], torch.stack([t["state"]["state"] for t in kept]))
+    assert torch.equal(replay_buffer.actions[:3], torch.stack([t["action"] for t in kept]))
+    # Only the interventions are also added to the offline buffer
+    assert len(offline_replay_buffer) == 2
+    assert torch.equal(offline_replay_buffer.rewards[:2], torch.tensor([3.0, 4.0]))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+
+from lerobot.rl.crop_dataset_roi import crop_lerobot_dataset, crop_resize_images
+
+CROP = (8, 16, 32, 32)
+
+
+def make_image(value: int) -> np.ndarray:
+    # Only the cropped region differs between frames
+    image = np.zeros((64, 64, 3), dtype=np.uint8)
+    image[8:40, 16:48] = value
+    return image
+
+
+@pytest.mark.parametrize("dtype", ["image", "video"])
+def test_crop_lerobot_dataset(tmp_path, empty_lerobot_dataset_factory, dtype):
+    features = {
+        "action": {"dtype": "float32", "shape": (2,), "names": None},
+        "observation.images.front": {"dtype": dtype, "shape": (64, 64, 3), "names": None},
+        "observation.images.wrist": {"dtype": dtype, "shape": (64, 64, 3), "names": None},
+    }
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "source", features=features, video_backend="pyav"
+    )
+    for ep_idx in range(2):
+        for frame_idx in range(5):
+            frame = {
+                "action": np.array([ep_idx, frame_idx], dtype=np.float32),
+                "observation.images.front": make_image(40 * frame_idx + 40),
+                "observation.images.wrist": make_image(100),
+                "task": f"task_{ep_idx}",
+            }
+            dataset.add_frame(frame)
+        dataset.save_episode()
+    dataset.finalize()
+    # Cropped videos are encoded with the options of the dataset
+    dataset.meta.update_video_encoding({"vcodec": "h264", "g": 4, "preset": "ultrafast"})
+
+    output_dir = tmp_path / "cropped"
+    with (
+        patch("lerobot.datasets.lerobot_dataset.get_safe_version") as mock_get_safe_version,
+        patch("lerobot.datasets.lerobot_dataset.snapshot_download") as mock_snapshot_download,
+    ):
+        mock_get_safe_version.return_value = "v3.0"
+        mock_snapshot_download.return_value = str(output_dir)
+
+        cropped = crop_lerobot_dataset(
+            dataset,
+            {"observation.images.front": CROP},
+            new_repo_id="dummy/cropped",
+            new_dataset_root=output_dir,
+            resize_size=(16, 16),
+            num_workers=2,
+            batch_size=3,
+        )
+
+    assert cropped.meta.total_frames == 10
+    item, source_item = cropped[7], dataset[7]
+    assert item["task"] == "task_1"
+    assert torch.equal(item["action"], source_item["action"])
+    assert item["observation.images.front"].shape == (3, 16, 16)
+    # 40 * 2 + 40 = 120 over the whole crop, with compression loss for videos
+    assert item["observation.images.front"].mean().item() == pytest.approx(120 / 255, abs=0.03)
+    assert item["observation.images.wrist"].shape == (3, 64, 64)
+    if dtype == "video":
+        assert cropped.meta.info["features"]["observation.images.front"]["info"]["video.codec"] == "h264"
+
+    front_stats = cropped.meta.stats["observation.images.front"]
+    assert front_stats["mean"].shape == (3, 1, 1)
+    assert front_stats["mean"].mean() == pytest.approx(120 / 255, abs=0.03)
+    assert np.allclose(cropped.meta.stats["action"]["mean"], dataset.meta.stats["action"]["mean"])
+
+
+def test_crop_resize_images():
+    images = torch.randint(0, 256, (4, 3, 64, 64), dtype=torch.uint8)
+    cropped = crop_resize_images(images, CROP, (32, 32))
+    assert cropped.dtype == torch.uint8
+    assert torch.equal(cropped, images[:, :, 8:40, 16:48])
@@ -47,6 +47,7 @@ def create_learner_service_stub(
     interactions_queue: Queue,
     seconds_between_pushes: int,
     queue_get_timeout: float = 0.1,
+    **service_kwargs,
 ):
     import grpc
 
@@ -62,6 +63,7 @@ def create_learner_service_stub(
         transition_queue=transitions_queue,
         interaction_message_queue=interactions_queue,
         queue_get_timeout=queue_get_timeout,
+        **service_kwargs,
     )
 
     # Create a gRPC server and add our servicer to it.
@@ -267,6 +269,73 @@ def test_stream_parameters():
     assert time_diff == pytest.approx(seconds_between_pushes, abs=0.1)
 
 
+@require_package("grpc")
+@pytest.mark.timeout(10)  # force cross-platform watchdog
+def test_stream_parameters_delta():
+    import torch
+
+    from lerobot.rl.parameter_sync import PARAMETER_SYNC_KEY, ParameterDeltaEncoder
+    from lerobot.transport import services_pb2
+    from lerobot.transport.utils import bytes_to_state_dict, state_to_bytes
+
+    shutdown_event = Event()
+    parameters_queue = Queue()
+    transitions_queue = Queue()
+    interactions_queue = Queue()
+
+    client, channel, server = create_learner_service_stub(
+        shutdown_event,
+        parameters_queue,
+        transitions_queue,
+        interactions_queue,
+        0.1,
+        parameters_sync="delta",
+    )
+
+    encoder = ParameterDeltaEncoder(delta_dtype="float32")
+
+    def push(state_dict):
+        message = encoder.encode({"policy": state_dict})
+        data = state_to_bytes(message)
+        parameters_queue.put((message[PARAMETER_SYNC_KEY], data))
+        return data
+
+    state_dict = {"weight": torch.zeros(4, 4), "bias": torch.zeros(4)}
+    sent = [push(state_dict)]
+    first_stream = client.StreamParameters(services_pb2.Empty())
+
+    first_received = []
+    for response in first_stream:
+        first_received.append(response.data)
+        break
+
+    state_dict["bias"] += 1.0
+    sent.append(push(state_dict))
+    for response in first_stream:
+        first_received.append(response.data)
+        break
+
+    # An actor connecting later starts at the keyframe, and gets the same bytes
+    second_stream = client.StreamParameters(services_pb2.Empty())
+    second_received = []
+    for response in second_stream:
+        second_received.append(response.data)
+        if len(second_received) == 2:
+            break
+
+    shutdown_event.set()
+    close_learner_service_stub(channel, server)
+
+    assert first_received == sent
+    assert second_received == sent
+    messages = [bytes_to_state_dict(data) for data in sent]
+    assert messages[0][PARAMETER_SYNC_KEY]["keyframe"]
+    assert messages[0]["tensors"].keys() == {"policy/weight", "policy/bias"}
+    assert not messages[1][PARAMETER_SYNC_KEY]["keyframe"]
+    assert messages[1]["tensors"].keys() == {"policy/bias"}
+    assert torch.equal(messages[1]["tensors"]["policy/bias"]["diff"], torch.ones(4))
+
+
 @require_package("grpc")
 @pytest.mark.timeout(3)  # force cross-platform watchdog
 def test_stream_parameters_with_shutdown():
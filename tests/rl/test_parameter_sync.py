@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+from torch import nn
+
+from lerobot.rl.parameter_sync import (
+    PARAMETER_SYNC_KEY,
+    ParameterDeltaDecoder,
+    ParameterDeltaEncoder,
+    ParameterMessageLog,
+    frozen_parameter_names,
+)
+from lerobot.transport.utils import bytes_to_state_dict, state_to_bytes
+
+
+def make_module(seed: int) -> nn.Module:
+    torch.manual_seed(seed)
+    module = nn.Sequential(nn.Linear(8, 16), nn.BatchNorm1d(16), nn.Linear(16, 4))
+    return module
+
+
+def roundtrip(message: dict) -> dict:
+    return bytes_to_state_dict(state_to_bytes(message))
+
+
+def assert_modules_close(learner: nn.Module, actor: nn.Module, atol: float):
+    for (name, expected), (_, actual) in zip(
+        learner.state_dict().items(), actor.state_dict().items(), strict=True
+    ):
+        assert torch.allclose(expected.float(), actual.float(), atol=atol), name
+
+
+@pytest.mark.parametrize(
+    "delta_dtype, atol", [("float32", 1e-6), ("float16", 1e-3), ("bfloat16", 1e-2), ("int8", 1e-2)]
+)
+def test_deltas_track_learner(delta_dtype, atol):
+    learner, actor = make_module(0), make_module(1)
+    encoder = ParameterDeltaEncoder(delta_dtype=delta_dtype, keyframe_interval=100)
+    decoder = ParameterDeltaDecoder({"policy": actor})
+    pointers = [param.data_ptr() for param in actor.parameters()]
+
+    for _ in range(10):
+        with torch.no_grad():
+            for param in learner.parameters():
+                param.add_(torch.randn_like(param) * 0.01)
+        assert decoder.apply(roundtrip(encoder.encode({"policy": learner.state_dict()})))
+        assert_modules_close(learner, actor, atol)
+
+    # Updates are applied in place
+    assert [param.data_ptr() for param in actor.parameters()] == pointers
+
+
+def test_only_changed_tensors_are_sent():
+    learner = make_module(0)
+    encoder = ParameterDeltaEncoder(keyframe_interval=100)
+
+    keyframe = encoder.encode({"policy": learner.state_dict()})
+    assert keyframe[PARAMETER_SYNC_KEY]["keyframe"]
+    assert keyframe["tensors"].keys() == {f"policy/{name}" for name in learner.state_dict()}
+
+    with torch.no_grad():
+        learner[2].weight.add_(1.0)
+    delta = encoder.encode({"policy": learner.state_dict()})
+    assert not delta[PARAMETER_SYNC_KEY]["keyframe"]
+    assert delta["tensors"].keys() == {"policy/2.weight"}
+    assert delta["tensors"]["policy/2.weight"]["diff"].dtype == torch.float16
+
+
+def test_periodic_keyframes():
+    learner = make_module(0)
+    encoder = ParameterDeltaEncoder(keyframe_interval=3)
+
+    keyframes = [encoder.encode({"policy": learner.state_dict()})[PARAMETER_SYNC_KEY]["keyframe"] for _ in range(7)]
+    assert keyframes == [True, False, False, True, False, False, True]
+
+
+def test_missed_delta_waits_for_keyframe():
+    learner, actor = make_module(0), make_module(1)
+    encoder = ParameterDeltaEncoder(delta_dtype="float32", keyframe_interval=3)
+    decoder = ParameterDeltaDecoder({"policy": actor})
+
+    messages = []
+    for _ in range(4):
+        with torch.no_grad():
+            learner[0].weight.add_(0.1)
+        messages.append(roundtrip(encoder.encode({"policy": learner.state_dict()})))
+
+    assert decoder.apply(messages[0])
+    # messages[1] is lost, messages[2] cannot be applied on top of messages[0]
+    assert not decoder.apply(messages[2])
+    assert decoder.apply(messages[3])
+    assert decoder.seq == 4
+    assert_modules_close(learner, actor, atol=0)
+
+
+def test_message_log_starts_streams_at_the_last_keyframe():
+    learner = make_module(0)
+    encoder = ParameterDeltaEncoder(delta_dtype="float32", keyframe_interval=3)
+    log = ParameterMessageLog()
+
+    messages = []
+    for _ in range(5):
+        with torch.no_grad():
+            learner[0].weight.add_(0.1)
+        message = encoder.encode({"policy": learner.state_dict()})
+        messages.append((message[PARAMETER_SYNC_KEY], state_to_bytes(message)))
+        log.add(*messages[-1])
+
+    # Messages 4 (a keyframe) and 5
+    assert log.since(None) == messages[3:]
+    assert log.since(2) == messages[3:]
+    assert log.since(4) == messages[4:]
+    assert log.since(5) == []
+
+    # Every actor gets the same bytes and reconstructs the learner
+    actor = make_module(1)
+    decoder = ParameterDeltaDecoder({"policy": actor})
+    for _, data in log.since(None):
+        assert decoder.apply(bytes_to_state_dict(data))
+    assert_modules_close(learner, actor, atol=0)
+
+
+def test_message_log_drops_delta_not_based_on_last_message():
+    log = ParameterMessageLog()
+    log.add({"seq": 1, "base_seq": 0, "keyframe": True}, b"1")
+    log.add({"seq": 3, "base_seq": 2, "keyframe": False}, b"3")
+
+    assert log.since(None) == [({"seq": 1, "base_seq": 0, "keyframe": True}, b"1")]
+
+
+def test_full_state_dict_message_is_applied():
+    learner, actor = make_module(0), make_module(1)
+    decoder = ParameterDeltaDecoder({"policy": actor})
+
+    assert decoder.apply(roundtrip({"policy": learner.state_dict()}))
+    assert_modules_close(learner, actor, atol=0)
+
+
+def test_frozen_parameter_names():
+    module = make_module(0)
+    module[0].requires_grad_(False)
+
+    assert frozen_parameter_names(module) == {"0.weight", "0.bias"}
+
+
+def test_unknown_delta_dtype():
+    with pytest.raises(ValueError, match="Unsupported delta dtype"):
+        ParameterDeltaEncoder(delta_dtype="float8")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import importlib
+import time
+
+import pytest
+
+pytest.importorskip("pymodbus")
+
+
+@pytest.fixture
+def jakaS12(jaka_sdk):
+    # The package imports the JAKA SDK, stubbed as it is only shipped with the robot
+    return importlib.import_module("lerobot.robots.jakaS12")
+
+
+@pytest.fixture
+def make_client(jakaS12, modbus_simulator):
+    clients = []
+
+    def _make(**kwargs):
+        client = jakaS12.AsyncModbusTCP(ip=modbus_simulator.host, port=modbus_simulator.port, **kwargs)
+        client.connect()
+        clients.append(client)
+        return client
+
+    yield _make
+    for client in clients:
+        client.disconnect()
+
+
+def test_write_then_read(jakaS12, make_client, modbus_simulator):
+    client = make_client(coils_address=8, cache_ttl_s=0.0)
+
+    assert client.read(8) is False
+    client.write(8, True)
+    assert client.read(8) is True
+
+    # The server really holds the value, not only the client cache
+    reference = jakaS12.ModbusTCP(ip=modbus_simulator.host, port=modbus_simulator.port)
+    reference.connect()
+    assert reference.read(8)
+    reference.disconnect()
+
+
+def test_block_read_is_cached(make_client, modbus_simulator):
+    client = make_client(coils_address=8, coils_count=4, cache_ttl_s=10.0)
+
+    client.read(8)
+    requests = modbus_simulator.requests
+    assert [client.read(address) for address in range(8, 12)] == [False] * 4
+    assert modbus_simulator.requests == requests
+
+
+def test_cache_ttl_expires(make_client, modbus_simulator):
+    client = make_client(coils_address=8, cache_ttl_s=0.0)
+
+    requests = modbus_simulator.requests
+    for _ in range(3):
+        client.read(8)
+    assert modbus_simulator.requests == requests + 3
+
+
+def test_redundant_write_is_suppressed(make_client, modbus_simulator):
+    client = make_client(coils_address=8, cache_ttl_s=10.0)
+
+    client.write(8, True)
+    requests = modbus_simulator.requests
+    client.write(8, True)
+    assert modbus_simulator.requests == requests
+
+    client.write(8, False)
+    assert modbus_simulator.requests == requests + 1
+
+
+def test_write_after_coil_changed_elsewhere(jakaS12, make_client, modbus_simulator):
+    client = make_client(coils_address=8, cache_ttl_s=0.05)
+    client.write(8, True)
+
+    # Another client (or the controller itself) resets the coil
+    other = jakaS12.ModbusTCP(ip=modbus_simulator.host, port=modbus_simulator.port)
+    other.connect()
+    other.write(8, False)
+    time.sleep(0.1)
+
+    # Once the cache expired, writing the same value again reaches the device
+    client.write(8, True)
+    assert other.read(8)
+    other.disconnect()
+
+def test_concurrent_reads_are_coalesced(make_client, modbus_simulator):
+    client = make_client(coils_address=8, coils_count=2, pool_size=4, cache_ttl_s=0.0)
+
+    async def _read_many():
+        return await asyncio.gather(*(client.read_coils_async(8, 2) for _ in range(8)))
+
+    requests = modbus_simulator.requests
+    results = asyncio.run_coroutine_threadsafe(_read_many(), client._loop).result(timeout=5.0)
+    assert results == [[False, False]] * 8
+    assert modbus_simulator.requests == requests + 1
+
+
+def test_connect_failure_raises(jakaS12):
+    client = jakaS12.AsyncModbusTCP(
+        ip="127.0.0.1",
+        port=1,
+        timeout_s=0.1,
+        max_retries=1,
+        reconnect_delay_s=0.01,
+        reconnect_delay_max_s=0.01,
+    )
+    with pytest.raises(ConnectionError):
+        client.connect()
+    assert not client.is_connected
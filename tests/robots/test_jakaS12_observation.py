@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+
+import numpy as np
+import pytest
+
+AXES = ["x", "y", "z", "rx", "ry", "rz"]
+STATE_AGE_KEYS = ("state_age.joint", "state_age.cart", "state_age.sucker")
+
+
+@pytest.fixture
+def observation(jaka_sdk):
+    return importlib.import_module("lerobot.robots.jakaS12.observation")
+
+
+def make_observation(observation, use_EE_torque=True):
+    layout = observation.JakaS12ObservationLayout(
+        camera_keys=("wrist", "head"), use_EE_torque=use_EE_torque, state_age_keys=STATE_AGE_KEYS
+    )
+    return observation.JakaS12Observation(layout)
+
+
+def test_layout_index(observation):
+    layout = observation.JakaS12ObservationLayout(
+        camera_keys=("wrist",), use_EE_torque=True, state_age_keys=STATE_AGE_KEYS
+    )
+
+    for i in range(6):
+        # Both joint aliases share a slot
+        assert layout.index[f"joint{i + 1}._joint_position"] == i
+        assert layout.index[f"joint{i + 1}.pos"] == i
+        assert layout.index[AXES[i]] == 6 + i
+        assert layout.index[f"EE_torque.{AXES[i]}"] == 12 + i
+    assert layout.sucker_index == layout.index["sucker_state"] == 18
+    assert [layout.index[key] for key in STATE_AGE_KEYS] == [19, 20, 21]
+    assert layout.size == 22
+
+    assert (layout.joint_slice, layout.cart_slice) == (slice(0, 6), slice(6, 12))
+    assert layout.EE_torque_slice == slice(12, 18)
+    assert layout.state_age_slice == slice(19, 22)
+    # Every slot is used by a key
+    assert sorted(set(layout.index.values())) == list(range(layout.size))
+
+
+def test_layout_without_EE_torque(observation):
+    layout = observation.JakaS12ObservationLayout()
+
+    assert layout.EE_torque_slice is None
+    assert not any(key.startswith("EE_torque") for key in layout.index)
+    assert layout.sucker_index == layout.index["sucker_state"] == 12
+    assert layout.state_age_slice == slice(13, 13)
+    assert layout.size == 13
+
+
+def test_observation_reads_state(observation):
+    obs = make_observation(observation)
+    layout = obs.layout
+
+    obs.state[layout.joint_slice] = np.arange(6) / 10
+    obs.state[layout.cart_slice] = np.arange(6) + 100
+    obs.state[layout.EE_torque_slice] = -np.arange(6)
+    obs.state[layout.sucker_index] = 1
+    obs.state[layout.state_age_slice] = (0.01, 0.02, 0.03)
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    obs.set_image("wrist", image)
+
+    assert obs["joint3._joint_position"] == obs["joint3.pos"] == pytest.approx(0.2)
+    assert obs["rz"] == 105.0
+    assert obs["EE_torque.y"] == -1.0
+    assert obs["sucker_state"] is True
+    assert obs["state_age.cart"] == 0.02
+    assert obs["wrist"] is image
+    assert obs["head"] is None
+    assert isinstance(obs["x"], float)
+
+    # Values are read when accessed, so the view follows the state filled in place
+    obs.state[layout.index["x"]] = -5.0
+    obs.state[layout.sucker_index] = 0
+    assert obs["x"] == -5.0
+    assert obs["sucker_state"] is False
+
+
+def test_observation_keys(observation):
+    obs = make_observation(observation, use_EE_torque=False)
+
+    keys = list(obs)
+    assert keys[:4] == ["joint1._joint_position", "joint1.pos", "joint2._joint_position", "joint2.pos"]
+    assert keys[12:18] == AXES
+    assert keys[18:] == ["sucker_state", *STATE_AGE_KEYS, "wrist", "head"]
+    assert len(obs) == len(keys) == len(set(keys))
+    assert "wrist" in obs and "sucker_state" in obs and "EE_torque.x" not in obs
+    with pytest.raises(KeyError):
+        obs["EE_torque.x"]
+
+
+def test_observation_is_read_only(observation):
+    obs = make_observation(observation)
+
+    with pytest.raises(TypeError):
+        obs["x"] = 1.0
+    with pytest.raises(KeyError):
+        obs.set_image("front", None)
+
+    obs.state[obs.layout.index["x"]] = 1.0
+    frame = obs.copy()
+    assert type(frame) is dict
+    assert list(frame) == list(obs)
+    obs.state[obs.layout.index["x"]] = 2.0
+    assert frame["x"] == 1.0
+
+
+def test_observation_to_transition(observation):
+    # The processor package imports the robots, and thus the JAKA SDK
+    converters = importlib.import_module("lerobot.processor.converters")
+    obs = make_observation(observation)
+    obs.state[obs.layout.index["y"]] = 3.0
+
+    transition = converters.observation_to_transition(obs)
+    transition_observation = transition[converters.TransitionKey.OBSERVATION]
+    assert transition_observation == obs.copy()
+    # Processor steps can update the observation of the transition
+    transition_observation["y"] = 4.0
+    assert obs["y"] == 3.0
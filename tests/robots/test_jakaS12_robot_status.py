@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+
+import pytest
+
+JOINT_POSITION = (0.1, -0.2, 0.3, -0.4, 0.5, -0.6)
+CART_POSITION = (350.0, -120.0, 410.0, 3.1, 0.02, -1.5)
+EE_TORQUE = (1.5, -2.5, 3.5, 0.1, -0.2, 0.3)
+
+
+@pytest.fixture
+def robot_status(jaka_sdk):
+    return importlib.import_module("lerobot.robots.jakaS12.robot_status")
+
+
+def make_robot_status() -> tuple:
+    """Synthetic `get_robot_status()[1]` payload of the JAKA SDK 2.x, with a value for every field."""
+    return (
+        0,  # errcode
+        0,  # inpos
+        1,  # powered_on
+        1,  # enabled
+        100,  # rapidrate
+        [0, 0],  # protective_stop, emergency_stop
+        [0.0] * 6,  # dout
+        [0.0] * 6,  # tio_dout
+        [0.0] * 6,  # extio
+        [0.0] * 6,  # tio_din
+        [0.0] * 6,  # din
+        [0.0] * 6,  # ain
+        [0.0] * 6,  # tio_ain
+        [0.0] * 6,  # aout
+        0,  # current_tool_id
+        0,  # current_user_id
+        0,  # on_soft_limit
+        0,  # emergency_stop
+        list(CART_POSITION),  # cartesian pose of the TCP
+        list(JOINT_POSITION),  # joint positions
+        [[0.0] * 6 for _ in range(6)],  # robot_monitor_data
+        # torq_sensor_monitor_data: ip, port, payload, status, errcode, actual force, original reading
+        ["10.5.5.100", 10000, [0.5, [0.0, 0.0, 20.0]], 1, 0, list(EE_TORQUE), [0.0] * 6],
+        0,  # is_socket_connect
+        [0, 0, 0],  # gripper data
+        0,  # drag_status
+    )
+
+
+def test_decode(robot_status):
+    payload = make_robot_status()
+    assert payload[robot_status.STATUS_CART_POSITION_INDEX] == list(CART_POSITION)
+    assert payload[robot_status.STATUS_JOINT_POSITION_INDEX] == list(JOINT_POSITION)
+
+    status = robot_status.JakaS12StatusReader.decode(payload)
+    assert status.joint_position == JOINT_POSITION
+    assert status.cart_position == CART_POSITION
+    assert status.EE_torque == EE_TORQUE
+    assert status.stamp > 0
+
+
+@pytest.mark.parametrize(
+    "layout_change",
+    ["truncated", "shifted", "torque_sensor_changed"],
+)
+def test_decode_rejects_another_layout(robot_status, layout_change):
+    payload = list(make_robot_status())
+    if layout_change == "truncated":
+        payload = payload[: robot_status.STATUS_TORQUE_SENSOR_INDEX]
+    elif layout_change == "shifted":
+        payload.insert(robot_status.STATUS_CART_POSITION_INDEX - 1, 0)
+    else:
+        payload[robot_status.STATUS_TORQUE_SENSOR_INDEX] = ["10.5.5.100", 10000, list(EE_TORQUE)]
+
+    with pytest.raises(ValueError, match="Unexpected get_robot_status layout"):
+        robot_status.JakaS12StatusReader.decode(tuple(payload))
+
+
+class FakeRobot:
+    def __init__(self):
+        self.ret = (0, make_robot_status())
+
+    def get_robot_status(self):
+        return self.ret
+
+
+def test_refresh_keeps_the_last_status_on_error(robot_status):
+    robot = FakeRobot()
+    reader = robot_status.JakaS12StatusReader(robot)
+
+    status = reader.refresh()
+    assert status.joint_position == JOINT_POSITION
+    assert reader.status is status
+
+    robot.ret = (-1,)
+    assert reader.refresh() is status
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import time
+
+import numpy as np
+import pytest
+
+SERVO_RATE_HZ = 100.0
+PERIOD = 1 / SERVO_RATE_HZ
+
+
+@pytest.fixture
+def servo_streamer(jaka_sdk):
+    return importlib.import_module("lerobot.robots.jakaS12.servo_streamer")
+
+
+class FakeRobot:
+    """Records the Cartesian sub-steps sent with `edg_servo_p`."""
+
+    def __init__(self):
+        self.steps = []
+
+    def edg_servo_p(self, end_pos, move_mode, step_num, robot_index):
+        assert move_mode == 1 and step_num == 1
+        self.steps.append(end_pos)
+        return (0,)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def perf_counter(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(servo_streamer, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(servo_streamer, "time", clock)
+    return clock
+
+
+def make_streamer(servo_streamer, robot, **kwargs):
+    return servo_streamer.JakaS12ServoStreamer(robot, servo_rate_hz=SERVO_RATE_HZ, **kwargs)
+
+
+def run_ticks(streamer, num_ticks):
+    for _ in range(num_ticks):
+        streamer._take_mailbox()
+        streamer._send_step()
+
+
+def test_deltas_submitted_between_ticks_are_summed(servo_streamer, clock):
+    robot = FakeRobot()
+    streamer = make_streamer(servo_streamer, robot)
+
+    streamer.submit((1, 0, 0, 0, 0, 0))
+    streamer.submit((0, 2, 0, 0, 0, 0.5))
+    run_ticks(streamer, 1)
+
+    # The policy period is not estimated yet, so the whole delta is sent at once
+    np.testing.assert_allclose(robot.steps, [(1, 2, 0, 0, 0, 0.5)])
+
+
+def test_policy_period_estimate(servo_streamer, clock):
+    streamer = make_streamer(servo_streamer, FakeRobot(), policy_period_smoothing=0.5)
+
+    for _ in range(20):
+        streamer.submit((0,) * 6)
+        clock.now += 4 * PERIOD
+    assert streamer.get_stats()["policy_period_s"] == pytest.approx(4 * PERIOD, rel=1e-4)
+
+    # A pause, like an episode reset, counts as 4 policy periods at most
+    clock.now += 10.0
+    streamer.submit((0,) * 6)
+    assert streamer.get_stats()["policy_period_s"] == pytest.approx(10 * PERIOD, rel=1e-4)
+
+
+def test_delta_is_spread_over_the_policy_period(servo_streamer, clock):
+    robot = FakeRobot()
+    streamer = make_streamer(servo_streamer, robot, policy_period_smoothing=1.0)
+    delta = np.array([4.0, -8.0, 2.0, 0.4, -0.2, 0.1])
+
+    streamer.submit((0,) * 6)
+    clock.now += 4 * PERIOD
+    streamer.submit(delta)
+    run_ticks(streamer, 6)
+
+    # Nothing is sent before the delta, and nothing once it is streamed
+    assert len(robot.steps) == 4
+    np.testing.assert_allclose(robot.steps, [delta / 4] * 4)
+    np.testing.assert_allclose(np.sum(robot.steps, axis=0), delta)
+
+
+def test_new_delta_merges_with_the_remaining_one(servo_streamer, clock):
+    robot = FakeRobot()
+    streamer = make_streamer(servo_streamer, robot, policy_period_smoothing=1.0)
+    first = np.array([4.0, 0, 0, 0, 0, 1.0])
+    second = np.array([-1.0, 3.0, 0, 0, 0, 0])
+
+    streamer.submit((0,) * 6)
+    clock.now += 4 * PERIOD
+    streamer.submit(first)
+    run_ticks(streamer, 2)
+    clock.now += 4 * PERIOD
+    streamer.submit(second)
+    run_ticks(streamer, 10)
+
+    assert len(robot.steps) == 2 + 4
+    np.testing.assert_allclose(np.sum(robot.steps, axis=0), first + second)
+
+
+def test_overrun_skips_the_missed_slots(servo_streamer):
+    streamer = make_streamer(servo_streamer, FakeRobot())
+    deadline = 10.0
+
+    # On time: the next tick is one period later, nothing is missed
+    assert streamer._next_deadline(deadline, deadline + 0.5 * PERIOD) == pytest.approx(deadline + PERIOD)
+    assert streamer.get_stats()["deadline_misses"] == 0
+
+    # The tick ended 2.5 periods late: the next slots are skipped instead of sent in a burst
+    next_deadline = streamer._next_deadline(deadline, deadline + 3.5 * PERIOD)
+    assert next_deadline == pytest.approx(deadline + 4 * PERIOD)
+    stats = streamer.get_stats()
+    assert stats["deadline_misses"] == 1
+    # The 3 skipped periods fall in the [3, 5) bin
+    assert stats["missed_periods_histogram"]["counts"] == [0, 0, 1, 0, 0]
+
+
+def test_late_tick_is_a_deadline_miss(servo_streamer):
+    streamer = make_streamer(servo_streamer, FakeRobot())
+
+    streamer._record_tick(0.1 * PERIOD)
+    streamer._record_tick(0.9 * PERIOD)
+    stats = streamer.get_stats()
+    assert stats["ticks"] == 2
+    assert stats["deadline_misses"] == 1
+    assert stats["max_jitter_s"] == pytest.approx(0.9 * PERIOD)
+    assert sum(stats["jitter_histogram"]["counts"]) == 2
+
+
+def test_streaming_thread_sends_the_whole_delta(servo_streamer):
+    robot = FakeRobot()
+    streamer = servo_streamer.JakaS12ServoStreamer(robot, servo_rate_hz=500.0)
+    deltas = [np.array([1.0, -2.0, 0.5, 0.0, 0.1, -0.1]) * (i + 1) for i in range(5)]
+
+    streamer.start()
+    for delta in deltas:
+        streamer.submit(delta)
+        time.sleep(0.01)
+    deadline = time.perf_counter() + 2.0
+    while streamer._steps_left > 0 or streamer._mailbox is not None:
+        assert time.perf_counter() < deadline, "The servo thread did not send the deltas"
+        time.sleep(0.01)
+    streamer.stop()
+
+    np.testing.assert_allclose(np.sum(robot.steps, axis=0), np.sum(deltas, axis=0))
+    assert streamer.get_stats()["commands_sent"] == len(robot.steps)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def state_poller(jaka_sdk):
+    return importlib.import_module("lerobot.robots.jakaS12.state_poller")
+
+
+class FakeSucker:
+    def __init__(self):
+        self.state = False
+
+    def read(self, address):
+        return self.state
+
+
+class FakeStatusReader:
+    """Returns a new status, whose joint positions count the refreshes, at every refresh."""
+
+    def __init__(self, status_cls, robot):
+        self._status_cls = status_cls
+        self._robot = robot
+        self.refreshes = 0
+
+    def refresh(self):
+        self._robot.get_robot_status()
+        self.refreshes += 1
+        value = float(self.refreshes)
+        return self._status_cls(
+            joint_position=(value,) * 6, cart_position=(-value,) * 6, EE_torque=(0.0,) * 6, stamp=value
+        )
+
+
+class FakeRobot:
+    """SDK handle checking that its calls hold the SDK lock."""
+
+    def __init__(self, sdk_lock, fail=False):
+        self.sdk_lock = sdk_lock
+        self.fail = fail
+        self.calls = 0
+
+    def _call(self, value):
+        assert self.sdk_lock.locked(), "SDK called without holding the SDK lock"
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("SDK call failed")
+        return (0, value)
+
+    def get_robot_status(self):
+        return self._call(None)
+
+    def get_joint_position(self):
+        return self._call((1.0, 2.0, 3.0, 4.0, 5.0, 6.0))
+
+    def get_tcp_position(self):
+        return self._call((10.0, 20.0, 30.0, 0.1, 0.2, 0.3))
+
+
+def make_poller(state_poller, robot, sdk_lock, status_reader=None):
+    return state_poller.JakaS12StatePoller(
+        robot=robot,
+        sucker=FakeSucker(),
+        coils_address=8,
+        status_reader=status_reader,
+        sdk_lock=sdk_lock,
+    )
+
+
+def test_poll_joint_and_tcp_holds_sdk_lock(state_poller):
+    sdk_lock = threading.Lock()
+    robot = FakeRobot(sdk_lock)
+    poller = make_poller(state_poller, robot, sdk_lock)
+
+    poller._poll_once()
+    snapshot = poller.latest()
+    assert robot.calls == 2
+    assert snapshot.joint_position == (1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
+    assert snapshot.cart_position == (10.0, 20.0, 30.0, 0.1, 0.2, 0.3)
+    assert snapshot.joint_stamp > 0 and snapshot.cart_stamp > 0
+    assert not sdk_lock.locked()
+
+
+def test_failed_read_keeps_previous_state(state_poller):
+    sdk_lock = threading.Lock()
+    robot = FakeRobot(sdk_lock)
+    poller = make_poller(state_poller, robot, sdk_lock)
+    poller._poll_once()
+    previous = poller.latest()
+
+    robot.fail = True
+    poller._poll_once()
+    snapshot = poller.latest()
+    assert snapshot.joint_position == previous.joint_position
+    assert snapshot.joint_stamp == previous.joint_stamp
+    assert snapshot.sucker_stamp > previous.sucker_stamp
+    assert not sdk_lock.locked()
+
+
+def test_poll_robot_status(state_poller):
+    sdk_lock = threading.Lock()
+    robot = FakeRobot(sdk_lock)
+    status_cls = importlib.import_module("lerobot.robots.jakaS12.robot_status").JakaS12Status
+    poller = make_poller(state_poller, robot, sdk_lock, FakeStatusReader(status_cls, robot))
+
+    for _ in range(3):
+        poller._poll_once()
+    snapshot = poller.latest()
+    assert snapshot.joint_position == (3.0,) * 6
+    assert snapshot.cart_position == (-3.0,) * 6
+    assert snapshot.joint_stamp == snapshot.EE_torque_stamp == 3.0
+    assert "state_age.EE_torque" in snapshot.ages()
+
+
+def test_latest_retries_when_a_snapshot_is_published_while_copying(state_poller, monkeypatch):
+    sdk_lock = threading.Lock()
+    robot = FakeRobot(sdk_lock)
+    status_cls = importlib.import_module("lerobot.robots.jakaS12.robot_status").JakaS12Status
+    poller = make_poller(state_poller, robot, sdk_lock, FakeStatusReader(status_cls, robot))
+    poller._poll_once()
+
+    copies = []
+    replace = state_poller.replace
+
+    def replace_while_polling(snapshot):
+        copy = replace(snapshot)
+        copies.append(copy)
+        if len(copies) == 1:
+            # The poller publishes a new snapshot while the first one is being copied
+            poller._poll_once()
+        return copy
+
+    monkeypatch.setattr(state_poller, "replace", replace_while_polling)
+    snapshot = poller.latest()
+
+    assert len(copies) == 2
+    assert copies[0].joint_position == (1.0,) * 6
+    assert snapshot is copies[1]
+    assert snapshot.joint_position == (2.0,) * 6
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def jakaS12_leader(jaka_sdk):
+    return importlib.import_module("lerobot.teleoperators.jakaS12_leader")
+
+
+@pytest.fixture
+def pose_buffer(jakaS12_leader):
+    return importlib.import_module("lerobot.teleoperators.jakaS12_leader.pose_buffer")
+
+
+def test_cumulative_motion(pose_buffer):
+    buffer = pose_buffer.PoseRingBuffer(capacity=8)
+    np.testing.assert_array_equal(buffer.latest_cumulative(), np.zeros(6))
+
+    buffer.push(0.0, (100, 200, 300, 0.1, 0.2, 0.3))
+    np.testing.assert_array_equal(buffer.latest_cumulative(), np.zeros(6))
+    buffer.push(0.01, (101, 198, 300, 0.15, 0.2, 0.25))
+    buffer.push(0.02, (103, 199, 305, 0.2, 0.1, 0.3))
+    np.testing.assert_allclose(buffer.latest_cumulative(), (3, -1, 5, 0.1, -0.1, 0.0), atol=1e-12)
+
+
+@pytest.mark.parametrize("direction", [1, -1])
+def test_rotation_wraps_across_pi(pose_buffer, direction):
+    buffer = pose_buffer.PoseRingBuffer(capacity=8)
+    # rz crosses +pi (or -pi) in small steps, its reported angle jumps by -2pi (or +2pi)
+    angles = [direction * (np.pi - 0.1), direction * (np.pi - 0.02), direction * (-np.pi + 0.05)]
+    for i, angle in enumerate(angles):
+        buffer.push(i * 0.01, (0, 0, 0, angle, 0, 0))
+
+    cumulative = buffer.latest_cumulative()
+    assert cumulative[3] == pytest.approx(direction * 0.15)
+    # Positions are not wrapped
+    buffer.push(0.03, (10, 0, 0, angles[-1], 0, 0))
+    assert buffer.latest_cumulative()[0] == 10
+
+
+def test_reads_since_last_read_survive_ring_wrap_around(pose_buffer):
+    buffer = pose_buffer.PoseRingBuffer(capacity=4)
+    rng = np.random.default_rng(0)
+    poses = np.cumsum(rng.uniform(-1, 1, size=(30, 6)) * [1, 1, 1, 0.1, 0.1, 0.1], axis=0)
+
+    last_read = buffer.latest_cumulative()
+    total = np.zeros(6)
+    for i, pose in enumerate(poses):
+        buffer.push(i * 0.01, pose)
+        # Read at an irregular, slower rate than the samples, more than `capacity` samples apart
+        if i % 7 == 6:
+            cumulative = buffer.latest_cumulative()
+            total += cumulative - last_read
+            last_read = cumulative
+    total += buffer.latest_cumulative() - last_read
+
+    np.testing.assert_allclose(total, poses[-1] - poses[0], atol=1e-9)
+    assert buffer.count == 30
+    assert len(buffer) == 4
+
+    stamps, held = buffer.samples()
+    np.testing.assert_allclose(stamps, np.arange(26, 30) * 0.01)
+    np.testing.assert_array_equal(held, poses[-4:])
+
+
+def test_get_action_returns_motion_since_last_read(jakaS12_leader):
+    leader = jakaS12_leader.JakaS12Leader(jakaS12_leader.JakaS12LeaderConfig(pose_buffer_size=4))
+    names = ["x", "y", "z", "rx", "ry", "rz"]
+    leader._pose_buffer.push(0.0, (100, 200, 300, 0.1, 0.2, 0.3))
+    leader._last_read_cumulative = leader._pose_buffer.latest_cumulative()
+
+    for i in range(1, 6):
+        pose = (100 + i, 200 - 2 * i, 300, 0.1 + 0.01 * i, 0.2 + 0.02 * i, 0.3 + 0.03 * i)
+        leader._pose_buffer.push(i * 0.01, pose)
+    action = leader.get_action()
+
+    diff = action["cart_pos_diff_dict"]
+    assert list(diff) == names
+    assert all(isinstance(value, np.float32) for value in diff.values())
+    # rx and ry are sent with the opposite sign, the positions and rz as they are
+    np.testing.assert_allclose([diff[name] for name in names], (5, -10, 0, -0.05, -0.1, 0.15), atol=1e-5)
+    assert "gripper" not in action
+
+    # Nothing moved since the previous read
+    action = leader.get_action()
+    np.testing.assert_array_equal(list(action["cart_pos_diff_dict"].values()), np.zeros(6))
+
+    leader._pose_buffer.push(0.06, (105, 190, 301, 0.15, 0.3, 0.45))
+    diff = leader.get_action()["cart_pos_diff_dict"]
+    np.testing.assert_allclose([diff[name] for name in names], (0, 0, 1, 0, 0, 0), atol=1e-5)
+
+
+def test_get_action_with_gripper(jakaS12_leader):
+    leader = jakaS12_leader.JakaS12Leader(jakaS12_leader.JakaS12LeaderConfig(use_gripper=True))
+    action = leader.get_action()
+    assert list(action["cart_pos_diff_dict"]) == ["x", "y", "z", "rx", "ry", "rz"]
+    assert action["gripper"] == 0
@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing
+import os
+import time
+import uuid
+
+import pytest
+import torch
+from torch import nn
+
+from lerobot.rl.shared_memory_transport import ActorSharedMemoryTransport, LearnerSharedMemoryTransport
+from lerobot.transport.shared_memory import SharedParameterBlock, SharedTransitionRing
+from lerobot.utils.transition import Transition
+
+
+@pytest.fixture
+def segment_name():
+    return f"lerobot_test_{uuid.uuid4().hex[:8]}"
+
+
+def make_transition(i: int) -> Transition:
+    return Transition(
+        state={"image": torch.full((3, 8, 8), float(i)), "state": torch.randn(4)},
+        action=torch.randn(2),
+        reward=float(i),
+        done=i % 2 == 0,
+        truncated=False,
+        next_state={"image": torch.rand(3, 8, 8), "state": torch.randn(4)},
+        complementary_info={"discrete_penalty": torch.tensor([0.5])},
+    )
+
+
+def consume_rewards(name: str, count: int, results):
+    ring = None
+    while ring is None:
+        ring = SharedTransitionRing.attach(name)
+    rewards = []
+    while len(rewards) < count:
+        rewards.extend(transition["reward"] for transition in ring.pop_all())
+    ring.close()
+    results.put(rewards)
+
+
+def push_rewards_and_crash(name: str, rewards: list[int]):
+    actor = ActorSharedMemoryTransport(name, transition_slots=8, modules={})
+    actor.push_transitions([make_transition(i) for i in rewards])
+    # Exit without closing the ring, like a crashed actor
+    os._exit(0)
+
+
+def push_parameters_and_crash(name: str, value: float):
+    learner = LearnerSharedMemoryTransport(name)
+    parameters = {"weight": torch.full((2, 4), value), "bias": torch.full((2,), value)}
+    learner.push_parameters({"policy": parameters})
+    os._exit(0)
+
+
+def run_and_wait(target, *args):
+    process = multiprocessing.get_context("spawn").Process(target=target, args=args)
+    process.start()
+    process.join(timeout=60.0)
+    assert process.exitcode == 0
+
+
+def test_transition_ring_roundtrip(segment_name):
+    transitions = [make_transition(i) for i in range(3)]
+    ring = SharedTransitionRing.create(segment_name, example=transitions[0], capacity=4)
+    reader = SharedTransitionRing.attach(segment_name)
+
+    for transition in transitions:
+        assert ring.push(transition)
+    assert len(reader) == 3
+
+    received = reader.pop_all()
+    assert len(reader) == 0
+    for original, transition in zip(transitions, received, strict=True):
+        for key in ("state", "next_state"):
+            for name, value in original[key].items():
+                assert torch.equal(transition[key][name], value)
+        assert torch.equal(transition["action"], original["action"])
+        assert transition["reward"] == original["reward"]
+        assert transition["done"] is original["done"]
+        assert torch.equal(
+            transition["complementary_info"]["discrete_penalty"],
+            original["complementary_info"]["discrete_penalty"],
+        )
+
+    reader.close()
+    ring.close()
+
+
+def test_transition_ring_full(segment_name):
+    ring = SharedTransitionRing.create(segment_name, example=make_transition(0), capacity=2)
+
+    assert ring.push(make_transition(0))
+    assert ring.push(make_transition(1))
+    assert not ring.push(make_transition(2), timeout=0.01)
+
+    # Borrowed slots are only handed back on release
+    borrowed = ring.pop_all(copy=False)
+    assert [transition["reward"] for transition in borrowed] == [0.0, 1.0]
+    assert not ring.push(make_transition(2), timeout=0.01)
+    ring.release()
+    assert ring.push(make_transition(2))
+    borrowed.clear()
+    ring.close()
+
+
+def test_transition_ring_across_processes(segment_name):
+    count = 50
+    ring = SharedTransitionRing.create(segment_name, example=make_transition(0), capacity=4)
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    consumer = context.Process(target=consume_rewards, args=(segment_name, count, results))
+    consumer.start()
+
+    # The ring is smaller than the stream, the producer has to wait for the consumer
+    for i in range(count):
+        assert ring.push(make_transition(i), timeout=30.0)
+
+    assert results.get(timeout=30.0) == [float(i) for i in range(count)]
+    consumer.join()
+    ring.close()
+
+
+def test_parameter_block(segment_name):
+    block = SharedParameterBlock.create(segment_name, {"weight": torch.zeros(2, 3), "bias": torch.zeros(2)})
+    reader = SharedParameterBlock.attach(segment_name)
+    targets = {"weight": torch.empty(2, 3), "bias": torch.empty(2)}
+
+    # Nothing written yet
+    assert reader.read_into(targets) is None
+
+    block.write({"weight": torch.ones(2, 3), "bias": torch.full((2,), 2.0)})
+    seq = reader.read_into(targets)
+    assert seq == block.seq
+    assert torch.equal(targets["weight"], torch.ones(2, 3))
+    assert torch.equal(targets["bias"], torch.full((2,), 2.0))
+    assert reader.read_into(targets, last_seq=seq) is None
+
+    with pytest.raises(ValueError, match="Parameter names differ"):
+        block.write({"weight": torch.ones(2, 3)})
+
+    block.close()
+    assert reader.is_closed
+    reader.close()
+    assert SharedParameterBlock.attach(segment_name) is None
+
+
+
+def test_parameter_block_read_interrupted_by_writes(segment_name):
+    block = SharedParameterBlock.create(segment_name, {"weight": torch.zeros(2, 3), "bias": torch.zeros(2)})
+    reader = SharedParameterBlock.attach(segment_name)
+    targets = {"weight": torch.empty(2, 3), "bias": torch.empty(2)}
+    block.write({"weight": torch.ones(2, 3), "bias": torch.ones(2)})
+    seq = reader.read_into(targets)
+
+    class WrittenDuringCopy:
+        """Stands for the private copy of the weight, the learner writes while it is made."""
+
+        def copy_(self, view):
+            block.write({"weight": torch.full((2, 3), 3.0), "bias": torch.full((2,), 3.0)})
+
+    block.write({"weight": torch.full((2, 3), 2.0), "bias": torch.full((2,), 2.0)})
+    reader._scratch["weight"] = WrittenDuringCopy()
+    with pytest.raises(TimeoutError):
+        reader.read_into(targets, last_seq=seq, max_retries=3)
+    # The torn copies never reach the targets
+    assert torch.equal(targets["weight"], torch.ones(2, 3))
+    assert torch.equal(targets["bias"], torch.ones(2))
+
+    reader.close()
+    block.close()
+
+def test_shared_memory_transport(segment_name):
+    torch.manual_seed(0)
+    learner_module, actor_module = nn.Linear(4, 2), nn.Linear(4, 2)
+    learner = LearnerSharedMemoryTransport(segment_name)
+    actor = ActorSharedMemoryTransport(segment_name, transition_slots=8, modules={"policy": actor_module})
+
+    # Nothing published yet
+    assert not actor.update_parameters()
+    assert learner.pop_transitions() == []
+
+    learner.push_parameters({"policy": learner_module.state_dict()})
+    assert actor.update_parameters()
+    assert not actor.update_parameters()
+    assert torch.equal(actor_module.weight, learner_module.weight)
+
+    actor.push_transitions([make_transition(i) for i in range(3)])
+    assert [transition["reward"] for transition in learner.pop_transitions()] == [0.0, 1.0, 2.0]
+
+    # Transitions pushed right before the actor stops are not lost
+    actor.push_transitions([make_transition(3)])
+    actor.close()
+    assert [transition["reward"] for transition in learner.pop_transitions()] == [3.0]
+    learner.close()
+
+
+def test_learner_attaches_to_restarted_actor_ring(segment_name):
+    learner = LearnerSharedMemoryTransport(segment_name, stale_timeout=0.05)
+    run_and_wait(push_rewards_and_crash, segment_name, [0, 1, 2])
+    assert [transition["reward"] for transition in learner.pop_transitions()] == [0.0, 1.0, 2.0]
+
+    # The actor is restarted, its new ring replaces the one it left behind
+    actor = ActorSharedMemoryTransport(segment_name, transition_slots=8, modules={})
+    actor.push_transitions([make_transition(i) for i in (3, 4)])
+    time.sleep(0.1)
+    assert [transition["reward"] for transition in learner.pop_transitions()] == [3.0, 4.0]
+
+    actor.push_transitions([make_transition(5)])
+    assert [transition["reward"] for transition in learner.pop_transitions()] == [5.0]
+    actor.close()
+    learner.close()
+
+
+def test_actor_attaches_to_restarted_learner_block(segment_name):
+    actor_module = nn.Linear(4, 2)
+    actor = ActorSharedMemoryTransport(
+        segment_name, transition_slots=8, modules={"policy": actor_module}, stale_timeout=0.05
+    )
+    run_and_wait(push_parameters_and_crash, segment_name, 1.0)
+    assert actor.update_parameters()
+    assert torch.equal(actor_module.weight, torch.ones(2, 4))
+
+    # The learner is restarted, its new block replaces the one it left behind
+    learner = LearnerSharedMemoryTransport(segment_name)
+    learner.push_parameters({"policy": {"weight": torch.full((2, 4), 2.0), "bias": torch.full((2,), 2.0)}})
+    time.sleep(0.1)
+    assert actor.update_parameters()
+    assert torch.equal(actor_module.weight, torch.full((2, 4), 2.0))
+    assert not actor.update_parameters()
+    actor.close()
+    learner.close()
@@ -18,6 +18,7 @@ import io
 from multiprocessing import Event, Queue
 from pickle import UnpicklingError
 
+import numpy as np
 import pytest
 import torch
 
@@ -551,6 +552,118 @@ def test_transitions_to_bytes_multiple_transitions():
         assert_transitions_equal(original, reconstructed_item)
 
 
+def make_columnar_transitions(num_transitions: int) -> list[Transition]:
+    return [
+        Transition(
+            state={"image": torch.rand(3, 32, 32), "state": torch.randn(10)},
+            action=torch.randn(5),
+            reward=torch.tensor(float(i)),
+            done=torch.tensor(i == num_transitions - 1),
+            truncated=False,
+            next_state={"image": torch.rand(3, 32, 32), "state": torch.randn(10)},
+            complementary_info={"discrete_penalty": torch.tensor([0.5]), "is_intervention": i % 2 == 0},
+        )
+        for i in range(num_transitions)
+    ]
+
+
+@require_package("grpc")
+def test_transitions_to_columnar_bytes_roundtrip():
+    from lerobot.transport.utils import (
+        COLUMNAR_MAGIC,
+        bytes_to_transitions,
+        columnar_bytes_to_transitions,
+        transitions_to_columnar_bytes,
+    )
+
+    transitions = make_columnar_transitions(4)
+    data = transitions_to_columnar_bytes(transitions)
+    assert data.startswith(COLUMNAR_MAGIC)
+
+    # bytes_to_transitions detects the format on its own
+    for reconstructed in (columnar_bytes_to_transitions(data), bytes_to_transitions(data)):
+        assert len(reconstructed) == len(transitions)
+        for original, reconstructed_item in zip(transitions, reconstructed, strict=True):
+            assert_transitions_equal(original, reconstructed_item)
+            assert reconstructed_item["truncated"] is False
+            info = reconstructed_item["complementary_info"]
+            assert torch.equal(info["discrete_penalty"], original["complementary_info"]["discrete_penalty"])
+            assert info["is_intervention"] == original["complementary_info"]["is_intervention"]
+
+
+@require_package("grpc")
+def test_transitions_to_columnar_bytes_is_zero_copy():
+    from lerobot.transport.utils import columnar_bytes_to_columns, transitions_to_columnar_bytes
+
+    data = transitions_to_columnar_bytes(make_columnar_transitions(3))
+    num_transitions, columns = columnar_bytes_to_columns(data)
+
+    assert num_transitions == 3
+    image = columns["state/image"]
+    assert image.shape == (3, 3, 32, 32)
+    # The column is a view into the received message, not a copy
+    message_start = np.frombuffer(data, dtype=np.uint8).ctypes.data
+    assert message_start <= image.data_ptr() < message_start + len(data)
+
+
+@require_package("grpc")
+def test_columnar_bytes_to_batch():
+    from lerobot.transport.utils import columnar_bytes_to_batch, transitions_to_columnar_bytes
+
+    transitions = make_columnar_transitions(4)
+    num_transitions, batch = columnar_bytes_to_batch(transitions_to_columnar_bytes(transitions))
+
+    assert num_transitions == 4
+    assert torch.equal(batch["state"]["image"], torch.stack([t["state"]["image"] for t in transitions]))
+    next_states = torch.stack([t["next_state"]["state"] for t in transitions])
+    assert torch.equal(batch["next_state"]["state"], next_states)
+    assert torch.equal(batch[ACTION], torch.stack([t[ACTION] for t in transitions]))
+    # The columns of Python scalars are tensors too
+    assert torch.equal(batch["reward"], torch.arange(4.0))
+    assert torch.equal(batch["truncated"], torch.zeros(4, dtype=torch.bool))
+    is_intervention = batch["complementary_info"]["is_intervention"]
+    assert torch.equal(is_intervention, torch.tensor([True, False, True, False]))
+    assert batch["complementary_info"]["discrete_penalty"].shape == (4, 1)
+
+@require_package("grpc")
+def test_transitions_to_columnar_bytes_empty_list():
+    from lerobot.transport.utils import bytes_to_transitions, transitions_to_columnar_bytes
+
+    assert bytes_to_transitions(transitions_to_columnar_bytes([])) == []
+
+
+@pytest.mark.parametrize("compression", ["lz4", "zstd"])
+@require_package("grpc")
+def test_transitions_to_columnar_bytes_compression(compression):
+    from lerobot.transport.utils import (
+        bytes_to_transitions,
+        columnar_bytes_to_columns,
+        transitions_to_columnar_bytes,
+    )
+
+    pytest.importorskip({"lz4": "lz4", "zstd": "zstandard"}[compression])
+
+    transitions = make_columnar_transitions(4)
+    for t in transitions:
+        # Compressible images
+        t["state"]["image"].zero_()
+    data = transitions_to_columnar_bytes(transitions, compression=compression, compression_min_bytes=1024)
+    assert len(data) < len(transitions_to_columnar_bytes(transitions))
+
+    reconstructed = bytes_to_transitions(data)
+    for original, reconstructed_item in zip(transitions, reconstructed, strict=True):
+        assert_transitions_equal(original, reconstructed_item)
+    assert columnar_bytes_to_columns(data)[1]["state/image"].shape == (4, 3, 32, 32)
+
+
+@require_package("grpc")
+def test_transitions_to_columnar_bytes_unknown_compression():
+    from lerobot.transport.utils import transitions_to_columnar_bytes
+
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        transitions_to_columnar_bytes(make_columnar_transitions(1), compression="gzip")
+
+
 @require_package("grpc")
 def test_receive_bytes_in_chunks_unknown_state():
     from lerobot.transport.utils import receive_bytes_in_chunks
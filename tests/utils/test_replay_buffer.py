@@ -21,9 +21,18 @@ import pytest
 import torch
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
-from lerobot.rl.buffer import BatchTransition, ReplayBuffer, random_crop_vectorized
+from lerobot.rl.buffer import (
+    BatchTransition,
+    DevicePrefetcher,
+    ReplayBuffer,
+    SumTree,
+    concatenate_batch_transitions,
+    random_crop_vectorized,
+    split_batch_transitions,
+)
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, OBS_STATE, OBS_STR, REWARD
 from tests.fixtures.constants import DUMMY_REPO_ID
+from tests.utils import require_cuda
 
 
 def state_dims() -> list[str]:
@@ -468,6 +477,99 @@ def test_from_lerobot_dataset(tmp_path):
         )
 
 
+def test_from_lerobot_dataset_matches_transitions(tmp_path):
+    ds, replay_buffer = create_dataset_from_replay_buffer(tmp_path)
+    converted = ReplayBuffer.from_lerobot_dataset(
+        ds, state_keys=list(state_dims()), device="cpu", capacity=replay_buffer.capacity, use_drq=False
+    )
+
+    # The transitions added one by one, like the buffer was filled before the column by column loading
+    transitions = ReplayBuffer._lerobotdataset_to_transitions(ds, state_keys=list(state_dims()))
+    expected = create_empty_replay_buffer()
+    for transition in transitions:
+        expected.add(
+            state=transition["state"],
+            action=transition[ACTION],
+            reward=transition["reward"],
+            next_state=transition["next_state"],
+            done=transition["done"],
+            truncated=False,
+        )
+
+    size = len(transitions)
+    assert len(converted) == len(expected) == size
+    for key in state_dims():
+        torch.testing.assert_close(converted.states[key][:size], expected.states[key][:size])
+        torch.testing.assert_close(converted.next_states[key][:size], expected.next_states[key][:size])
+    assert torch.equal(converted.actions[:size], expected.actions[:size])
+    assert torch.equal(converted.rewards[:size], expected.rewards[:size])
+    assert torch.equal(converted.dones[:size], expected.dones[:size])
+    assert torch.equal(converted.truncateds[:size], expected.truncateds[:size])
+    assert not converted.truncateds[:size].any()
+
+def test_from_lerobot_dataset_decodes_in_batches(tmp_path, monkeypatch):
+    from lerobot.rl import buffer as buffer_module
+
+    ds, replay_buffer = create_dataset_from_replay_buffer(tmp_path)
+    whole = ReplayBuffer.from_lerobot_dataset(
+        ds, state_keys=list(state_dims()), device="cpu", use_drq=False, image_storage_dtype=torch.uint8
+    )
+
+    decoded_lengths = []
+    decode = ReplayBuffer._decode_dataset_frames
+
+    def decode_and_record(*args):
+        frames = decode(*args)
+        decoded_lengths.append(len(frames))
+        return frames
+
+    monkeypatch.setattr(buffer_module, "DATASET_DECODING_BATCH_SIZE", 2)
+    monkeypatch.setattr(ReplayBuffer, "_decode_dataset_frames", staticmethod(decode_and_record))
+    batched = ReplayBuffer.from_lerobot_dataset(
+        ds, state_keys=list(state_dims()), device="cpu", use_drq=False, image_storage_dtype=torch.uint8
+    )
+
+    assert max(decoded_lengths) <= 2
+    assert sum(decoded_lengths) == len(replay_buffer)
+    assert len(batched) == len(whole)
+    for key in state_dims():
+        assert torch.equal(batched.states[key], whole.states[key])
+        assert torch.equal(batched.next_states[key], whole.next_states[key])
+    assert torch.equal(batched.actions, whole.actions)
+    assert torch.equal(batched.dones, whole.dones)
+
+
+def test_from_lerobot_dataset_cache(tmp_path):
+    ds, replay_buffer = create_dataset_from_replay_buffer(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    converted = ReplayBuffer.from_lerobot_dataset(
+        ds, state_keys=list(state_dims()), device="cpu", use_drq=False, cache_dir=cache_dir
+    )
+    assert len(list(cache_dir.glob("*.pt"))) == 1
+
+    cached = ReplayBuffer.from_lerobot_dataset(
+        ds, state_keys=list(state_dims()), device="cpu", use_drq=False, cache_dir=cache_dir
+    )
+    assert len(cached) == len(converted) == len(replay_buffer)
+    for key in state_dims():
+        assert torch.equal(cached.states[key], converted.states[key])
+        assert torch.equal(cached.next_states[key], converted.next_states[key])
+    assert torch.equal(cached.actions, converted.actions)
+    assert torch.equal(cached.dones, converted.dones)
+
+    # A different storage layout gets its own cache entry
+    ReplayBuffer.from_lerobot_dataset(
+        ds,
+        state_keys=list(state_dims()),
+        device="cpu",
+        use_drq=False,
+        cache_dir=cache_dir,
+        image_storage_dtype=torch.uint8,
+    )
+    assert len(list(cache_dir.glob("*.pt"))) == 2
+
+
 def test_buffer_sample_alignment():
     # Initialize buffer
     buffer = ReplayBuffer(capacity=100, device="cpu", state_keys=["state_value"], storage_device="cpu")
@@ -679,3 +781,417 @@ def test_async_iterator_multiple_iterations():
 
     # Ensure iterator can be disposed without blocking
     del iterator
+
+
+def _populate_sequential_buffer(
+    num_transitions: int, capacity: int = 16, done_at: int | None = None, **kwargs
+) -> ReplayBuffer:
+    buffer = ReplayBuffer(capacity=capacity, device="cpu", state_keys=[OBS_STATE], **kwargs)
+    for i in range(num_transitions):
+        buffer.add(
+            state={OBS_STATE: torch.tensor([float(i)])},
+            action=torch.tensor([0.0]),
+            reward=float(i),
+            next_state={OBS_STATE: torch.tensor([float(i + 1)])},
+            done=i == done_at,
+            truncated=False,
+        )
+    return buffer
+
+
+def test_sum_tree_samples_proportionally():
+    tree = SumTree(5)
+    tree.update(torch.arange(5), torch.tensor([1.0, 0.0, 3.0, 0.0, 6.0]))
+    assert tree.total == pytest.approx(10.0)
+    assert tree.min == pytest.approx(1.0)
+
+    indices, priorities = tree.sample(1000)
+    counts = torch.bincount(indices, minlength=5)
+    # Stratified sampling: each of the 1000 segments of the total lands in a single leaf
+    assert counts.tolist() == [100, 0, 300, 0, 600]
+    assert torch.equal(priorities, torch.tensor([1.0, 0.0, 3.0, 0.0, 6.0], dtype=torch.float64)[indices])
+
+
+def test_prioritized_sample_has_weights_and_indices():
+    buffer = _populate_sequential_buffer(8, prioritized=True)
+    batch = buffer.sample(4)
+
+    assert batch["weight"].shape == (4,)
+    # All transitions start with the same priority
+    assert torch.allclose(batch["weight"], torch.ones(4))
+    assert torch.equal(batch["reward"], batch["index"].float())
+
+
+def test_update_priorities_changes_sampling():
+    buffer = _populate_sequential_buffer(8, prioritized=True, priority_alpha=1.0, priority_beta=1.0)
+    buffer.update_priorities(torch.arange(8), torch.tensor([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 9.0]))
+
+    batch = buffer.sample(8)
+    assert (batch["index"] == 7).sum() >= 7
+    # The most sampled transition gets the smallest weight
+    assert batch["weight"][batch["index"] == 7].max() < 1.0
+
+    with pytest.raises(RuntimeError):
+        _populate_sequential_buffer(2).update_priorities(torch.tensor([0]), torch.tensor([1.0]))
+
+
+def test_prioritized_memory_optimized_skips_newest_transition():
+    buffer = _populate_sequential_buffer(4, prioritized=True, optimize_memory=True)
+    # The newest transition has no next state yet, even with a huge TD error
+    buffer.update_priorities(torch.tensor([3]), torch.tensor([1e6]))
+    for _ in range(10):
+        assert (buffer.sample(4)["index"] != 3).all()
+
+    buffer.add(
+        state={OBS_STATE: torch.tensor([4.0])},
+        action=torch.tensor([0.0]),
+        reward=4.0,
+        next_state=None,
+        done=False,
+        truncated=False,
+    )
+    # Once its next state is stored, it keeps the priority it got in the meantime: it holds all but
+    # about 3 of the ~3984 priority mass, the other transitions are only seldom sampled
+    indices = torch.cat([buffer.sample(4)["index"] for _ in range(50)])
+    assert (indices == 3).float().mean() >= 0.95
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_n_step_returns(optimize_memory):
+    gamma = 0.5
+    buffer = _populate_sequential_buffer(
+        10, done_at=4, n_step=3, gamma=gamma, optimize_memory=optimize_memory, prioritized=True
+    )
+    buffer.update_priorities(torch.arange(10), torch.ones(10))
+    batch = buffer.sample(10)
+
+    for i, idx in enumerate(batch["index"].tolist()):
+        # Steps stop at the end of the episode and at the newest transition
+        steps = min(3, 4 - idx + 1) if idx <= 4 else min(3, 9 - idx + 1 - int(optimize_memory))
+        expected_return = sum(gamma**k * (idx + k) for k in range(steps))
+        last = idx + steps - 1
+        assert batch["reward"][i].item() == pytest.approx(expected_return)
+        assert batch["discount"][i].item() == pytest.approx(gamma**steps)
+        assert batch["done"][i].item() == float(last == 4)
+        assert batch["next_state"][OBS_STATE][i].item() == last + 1
+
+
+def test_n_step_one_keeps_one_step_batches():
+    batch = _populate_sequential_buffer(4).sample(2)
+    assert "discount" not in batch
+    assert "weight" not in batch
+
+
+def test_concatenate_prioritized_with_uniform_batches():
+    prioritized = _populate_sequential_buffer(4, prioritized=True, n_step=2).sample(2)
+    uniform = _populate_sequential_buffer(4, n_step=2).sample(3)
+    batch = concatenate_batch_transitions(prioritized, uniform)
+
+    assert batch["weight"].shape == (5,)
+    assert torch.equal(batch["weight"][2:], torch.ones(3))
+    assert batch["discount"].shape == (5,)
+    assert batch["index"].shape == (2,)
+
+    with pytest.raises(ValueError):
+        concatenate_batch_transitions(
+            _populate_sequential_buffer(4, n_step=2).sample(2), _populate_sequential_buffer(4).sample(2)
+        )
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_uint8_image_storage(optimize_memory):
+    buffer = ReplayBuffer(
+        capacity=4,
+        device="cpu",
+        state_keys=state_dims(),
+        use_drq=False,
+        optimize_memory=optimize_memory,
+        image_storage_dtype=torch.uint8,
+    )
+    states = [create_dummy_state() for _ in range(5)]
+    for state, next_state in zip(states[:-1], states[1:], strict=True):
+        buffer.add(state, create_dummy_action(), 1.0, next_state, False, False)
+
+    assert buffer.states[OBS_IMAGE].dtype == torch.uint8
+    assert buffer.states[OBS_STATE].dtype == torch.float32
+
+    batch = buffer.sample(3)
+    for key in ("state", "next_state"):
+        images = batch[key][OBS_IMAGE]
+        assert images.dtype == torch.float32
+        assert images.min() >= 0.0 and images.max() <= 1.0
+
+    # Every sampled image is one of the stored ones, up to the 8-bit quantization
+    stored = torch.stack([s[OBS_IMAGE] for s in states])
+    for image in batch["state"][OBS_IMAGE]:
+        assert (stored - image).abs().amax(dim=(1, 2, 3)).min() <= 0.5 / 255 + 1e-6
+
+
+def test_uint8_image_storage_uses_less_memory():
+    float_buffer = create_empty_replay_buffer()
+    uint8_buffer = ReplayBuffer(10, "cpu", state_dims(), image_storage_dtype=torch.uint8)
+    for buffer in (float_buffer, uint8_buffer):
+        buffer.add(create_dummy_state(), create_dummy_action(), 1.0, create_dummy_state(), False, False)
+
+    float_images = get_tensor_memory_consumption(float_buffer.states[OBS_IMAGE])
+    assert get_tensor_memory_consumption(uint8_buffer.states[OBS_IMAGE]) * 4 == float_images
+
+
+def test_device_prefetch_iterator_matches_sample():
+    buffer = _populate_sequential_buffer(8, prioritized=True, n_step=2)
+    iterator = buffer.get_iterator(batch_size=4, device_prefetch=True, queue_size=2)
+
+    for _ in range(5):
+        batch = next(iterator)
+        assert torch.equal(batch["state"][OBS_STATE], batch["index"].float())
+        assert batch["done"].dtype == torch.float32
+        assert batch["weight"].shape == (4,)
+        assert batch["discount"].shape == (4,)
+
+    # Ensure iterator can be disposed without blocking
+    iterator.close()
+
+
+def test_device_prefetcher_surfaces_errors(monkeypatch):
+    buffer = _populate_sequential_buffer(4)
+
+    def broken_sample_columns(batch_size, num_batches=1):
+        raise RuntimeError("broken storage")
+
+    monkeypatch.setattr(buffer, "_sample_columns", broken_sample_columns)
+    prefetcher = DevicePrefetcher(buffer, batch_size=2)
+    with pytest.raises(RuntimeError, match="broken storage"):
+        next(prefetcher)
+    prefetcher.close()
+
+
+@require_cuda
+def test_device_prefetcher_cuda_uint8_images():
+    buffer = ReplayBuffer(
+        capacity=8, device="cuda", state_keys=state_dims(), use_drq=True, image_storage_dtype=torch.uint8
+    )
+    for _ in range(8):
+        buffer.add(create_dummy_state(), create_dummy_action(), 1.0, create_dummy_state(), False, False)
+
+    prefetcher = DevicePrefetcher(buffer, batch_size=4, num_slots=3)
+    assert prefetcher.use_cuda
+    for _ in range(6):
+        batch = next(prefetcher)
+        images = batch["state"][OBS_IMAGE]
+        assert images.is_cuda and images.dtype == torch.float32
+        assert images.shape == (4, 3, 84, 84)
+        assert batch["action"].is_cuda
+    prefetcher.close()
+
+
+def _add_sequential_transitions(buffer: ReplayBuffer, start: int, count: int):
+    for i in range(start, start + count):
+        buffer.add(
+            state={OBS_STATE: torch.tensor([float(i)])},
+            action=torch.tensor([0.0]),
+            reward=float(i),
+            next_state={OBS_STATE: torch.tensor([float(i + 1)])},
+            done=False,
+            truncated=False,
+            complementary_info={"discrete_penalty": torch.tensor([float(i)])},
+        )
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_storage_dir_reopens_buffer(tmp_path, optimize_memory):
+    kwargs = {"capacity": 8, "device": "cpu", "state_keys": [OBS_STATE], "optimize_memory": optimize_memory}
+    buffer = ReplayBuffer(storage_dir=tmp_path, **kwargs)
+    _add_sequential_transitions(buffer, 0, 11)
+    buffer.flush()
+    del buffer
+
+    reopened = ReplayBuffer(storage_dir=tmp_path, prioritized=True, **kwargs)
+    assert len(reopened) == 8
+    assert reopened.position == 3
+    assert reopened.rewards.tolist() == [8.0, 9.0, 10.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+    assert reopened.complementary_info["discrete_penalty"].flatten().tolist() == reopened.rewards.tolist()
+
+    batch = reopened.sample(4)
+    assert torch.equal(batch["state"][OBS_STATE], batch["reward"])
+    assert torch.equal(batch["next_state"][OBS_STATE], batch["reward"] + 1)
+    # The newest transition has no next state yet with optimize_memory
+    assert optimize_memory != (reopened.sample(64)["index"] == 2).any()
+
+
+def test_storage_dir_keeps_last_flush_after_crash(tmp_path):
+    kwargs = {"capacity": 16, "device": "cpu", "state_keys": [OBS_STATE]}
+    buffer = ReplayBuffer(storage_dir=tmp_path, persist_interval=4, **kwargs)
+    _add_sequential_transitions(buffer, 0, 6)
+    # Simulate a crash: the transitions added after the last automatic flush are not recorded
+    del buffer
+
+    reopened = ReplayBuffer(storage_dir=tmp_path, **kwargs)
+    assert len(reopened) == 4
+    assert reopened.rewards[:4].tolist() == [0.0, 1.0, 2.0, 3.0]
+
+    with pytest.raises(ValueError):
+        ReplayBuffer(storage_dir=tmp_path, capacity=32, device="cpu", state_keys=[OBS_STATE])
+
+
+def _pool_images(state: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+    """A stand-in frozen encoder: one feature per image channel."""
+    return {OBS_IMAGE: state[OBS_IMAGE].mean(dim=(2, 3), keepdim=True)}
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_feature_encoder_stores_features(optimize_memory):
+    buffer = ReplayBuffer(
+        capacity=8,
+        device="cpu",
+        state_keys=state_dims(),
+        use_drq=False,
+        optimize_memory=optimize_memory,
+        feature_encoder=_pool_images,
+    )
+    states = [create_dummy_state() for _ in range(6)]
+    for state, next_state in zip(states[:-1], states[1:], strict=True):
+        buffer.add(state, create_dummy_action(), 1.0, next_state, False, False)
+
+    assert buffer.feature_keys == [OBS_IMAGE]
+    batch = buffer.sample(4)
+    for state_name, feature_name in [
+        ("state", "observation_feature"),
+        ("next_state", "next_observation_feature"),
+    ]:
+        features = batch[feature_name][OBS_IMAGE]
+        assert features.shape == (4, 3, 1, 1)
+        torch.testing.assert_close(features, _pool_images(batch[state_name])[OBS_IMAGE])
+
+
+def test_feature_encoder_without_images(tmp_path):
+    buffer = ReplayBuffer(
+        capacity=8,
+        device="cpu",
+        state_keys=state_dims(),
+        feature_encoder=_pool_images,
+        keep_encoded_images=False,
+    )
+    for _ in range(4):
+        buffer.add(create_dummy_state(), create_dummy_action(), 1.0, create_dummy_state(), False, False)
+
+    assert OBS_IMAGE not in buffer.states
+    batch = buffer.sample(2)
+    assert list(batch["state"]) == [OBS_STATE]
+    assert batch["observation_feature"][OBS_IMAGE].shape == (2, 3, 1, 1)
+    with pytest.raises(ValueError):
+        buffer.to_lerobot_dataset(DUMMY_REPO_ID, root=tmp_path / "dataset")
+
+
+def test_from_lerobot_dataset_with_feature_encoder(tmp_path):
+    ds, replay_buffer = create_dataset_from_replay_buffer(tmp_path)
+
+    converted = ReplayBuffer.from_lerobot_dataset(
+        ds, state_keys=list(state_dims()), device="cpu", use_drq=False, feature_encoder=_pool_images
+    )
+    size = len(replay_buffer)
+    expected = _pool_images({OBS_IMAGE: converted.states[OBS_IMAGE][:size]})[OBS_IMAGE]
+    torch.testing.assert_close(converted.features[OBS_IMAGE][:size], expected)
+    expected_next = _pool_images({OBS_IMAGE: converted.next_states[OBS_IMAGE][:size]})[OBS_IMAGE]
+    torch.testing.assert_close(converted.next_features[OBS_IMAGE][:size], expected_next)
+
+    # Batches of buffers storing features concatenate their features too
+    batch = concatenate_batch_transitions(converted.sample(2), converted.sample(3))
+    assert batch["observation_feature"][OBS_IMAGE].shape == (5, 3, 1, 1)
+    with pytest.raises(ValueError):
+        concatenate_batch_transitions(converted.sample(2), replay_buffer.sample(2))
+
+
+@pytest.mark.parametrize("device_prefetch", [False, True])
+def test_sample_several_batches_at_once(device_prefetch):
+    buffer = _populate_sequential_buffer(8, prioritized=True, n_step=2)
+    iterator = buffer.get_iterator(
+        batch_size=4, async_prefetch=False, device_prefetch=device_prefetch, num_batches=3
+    )
+    batch = next(iterator)
+    iterator.close()
+    assert len(batch["action"]) == 12
+
+    batches = split_batch_transitions(batch, 3)
+    assert len(batches) == 3
+    for i, part in enumerate(batches):
+        assert part["state"][OBS_STATE].shape == (4,)
+        assert torch.equal(part["state"][OBS_STATE], part["index"].float())
+        assert part["discount"].shape == part["weight"].shape == (4,)
+        # Views into the sampled batch
+        assert part["reward"].data_ptr() == batch["reward"][i * 4 :].data_ptr()
+
+
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_add_batch_matches_add(optimize_memory):
+    transitions = [
+        {
+            "state": {OBS_STATE: torch.full((1, 2), float(i))},
+            "action": torch.full((3,), float(i)),
+            "reward": float(i),
+            "next_state": {OBS_STATE: torch.full((1, 2), float(i + 1))},
+            "done": i == 4,
+            "truncated": False,
+            "complementary_info": {"discrete_penalty": torch.tensor([i / 10])},
+        }
+        for i in range(7)
+    ]
+    kwargs = {"state_keys": [OBS_STATE], "prioritized": True, "optimize_memory": optimize_memory}
+    expected = ReplayBuffer(capacity=5, device="cpu", **kwargs)
+    for transition in transitions:
+        expected.add(**transition)
+
+    # The second batch wraps around the end of the storage
+    buffer = ReplayBuffer(capacity=5, device="cpu", **kwargs)
+    for batch in (transitions[:3], transitions[3:]):
+        buffer.add_batch(
+            state={OBS_STATE: torch.stack([t["state"][OBS_STATE] for t in batch])},
+            action=torch.stack([t["action"] for t in batch]),
+            reward=torch.tensor([t["reward"] for t in batch]),
+            next_state={OBS_STATE: torch.stack([t["next_state"][OBS_STATE] for t in batch])},
+            done=torch.tensor([t["done"] for t in batch]),
+            truncated=torch.tensor([t["truncated"] for t in batch]),
+            complementary_info={
+                "discrete_penalty": torch.stack([t["complementary_info"]["discrete_penalty"] for t in batch])
+            },
+        )
+
+    assert buffer.position == expected.position == 2
+    assert len(buffer) == len(expected) == 5
+    assert torch.equal(buffer.states[OBS_STATE], expected.states[OBS_STATE])
+    assert torch.equal(buffer.next_states[OBS_STATE], expected.next_states[OBS_STATE])
+    assert torch.equal(buffer.actions, expected.actions)
+    assert torch.equal(buffer.rewards, expected.rewards)
+    assert torch.equal(buffer.dones, expected.dones)
+    assert torch.equal(buffer.truncateds, expected.truncateds)
+    assert torch.equal(
+        buffer.complementary_info["discrete_penalty"], expected.complementary_info["discrete_penalty"]
+    )
+    # The newest transition is pending the same way with optimize_memory
+    assert torch.equal(buffer.priority_tree._sums, expected.priority_tree._sums)
+
+def test_prioritized_batches_sampled_at_once_span_the_buffer():
+    buffer = _populate_sequential_buffer(1000, capacity=1000, prioritized=True)
+    batch = buffer.sample(64, num_batches=4)
+    for part in split_batch_transitions(batch, 4):
+        # Each batch is stratified over all the transitions, not over a quarter of them
+        # The first and last of the 64 strata of 1000 / 64 transitions
+        assert part["index"].min() <= 15
+        assert part["index"].max() >= 984
+
+def test_concatenate_then_split_batches():
+    online = _populate_sequential_buffer(8, prioritized=True)
+    offline = _populate_sequential_buffer(8)
+    offline.states[OBS_STATE] += 100
+
+    batch = concatenate_batch_transitions(
+        online.sample(2, num_batches=3), offline.sample(3, num_batches=3), num_splits=3
+    )
+    for part in split_batch_transitions(batch, 3):
+        # Each batch holds its online samples followed by its offline ones
+        states = part["state"][OBS_STATE]
+        assert states.shape == (5,)
+        assert (states[:2] < 100).all() and (states[2:] >= 100).all()
+        assert torch.equal(states[:2], part["index"].float())
+        assert part["weight"][2:].eq(1.0).all()